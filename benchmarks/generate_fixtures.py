@@ -0,0 +1,166 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Generate JSON-RPC response fixtures for the protobuf parsing benchmarks
+
+The fixtures follow testnet `get_transactions`, `get_account_transactions`, `get_events` and `get_account`
+response format; transactions are peer to peer transfers signed by deterministic local accounts, so that
+regenerating fixtures produces same files.
+
+Run: `python benchmarks/generate_fixtures.py`
+"""
+
+import hashlib
+import json
+import os
+import typing
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from libra import LocalAccount, chain_ids, libra_types, script_codec, stdlib, txnmetadata, utils
+
+FIXTURES_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+CHAIN_ID: int = int(chain_ids.TESTNET.value)
+START_VERSION: int = 3_300_000
+TIMESTAMP_USECS: int = 1_601_492_912_847_973
+TRANSACTIONS: int = 50
+
+
+def account(seed: int) -> LocalAccount:
+    return LocalAccount(Ed25519PrivateKey.from_private_bytes(seed.to_bytes(32, "big")))
+
+
+def event_key(counter: int, address: str) -> str:
+    return counter.to_bytes(8, "little").hex() + address
+
+
+def user_transaction(
+    version: int, sender: LocalAccount, receiver: LocalAccount, seq: int, amount: int
+) -> typing.Dict[str, typing.Any]:  # pyre-ignore
+    sender_address = sender.account_address.to_hex()
+    receiver_address = receiver.account_address.to_hex()
+    metadata = txnmetadata.general_metadata(None, utils.sub_address(version.to_bytes(8, "big")))
+    script = script_codec.encode_peer_to_peer_with_metadata_script("Coin1", receiver_address, amount, metadata)
+    raw_txn = libra_types.RawTransaction(
+        sender=sender.account_address,
+        sequence_number=seq,
+        payload=libra_types.TransactionPayload__Script(libra_types.Script.lcs_deserialize(script)),
+        max_gas_amount=1_000_000,
+        gas_unit_price=0,
+        gas_currency_code="Coin1",
+        expiration_timestamp_secs=TIMESTAMP_USECS // 1_000_000 + 30,
+        chain_id=chain_ids.TESTNET,
+    )
+    signed = sender.sign(raw_txn)
+    amount_json = {"amount": amount, "currency": "Coin1"}
+    event_data = {
+        "amount": amount_json,
+        "sender": sender_address,
+        "receiver": receiver_address,
+        "metadata": metadata.hex(),
+    }
+    return {
+        "version": version,
+        "transaction": {
+            "type": "user",
+            "sender": sender_address,
+            "signature_scheme": "Scheme::Ed25519",
+            "signature": signed.authenticator.signature.value.hex(),
+            "public_key": sender.public_key_bytes.hex(),
+            "sequence_number": seq,
+            "chain_id": CHAIN_ID,
+            "max_gas_amount": raw_txn.max_gas_amount,
+            "gas_unit_price": raw_txn.gas_unit_price,
+            "gas_currency": "Coin1",
+            "expiration_timestamp_secs": raw_txn.expiration_timestamp_secs,
+            "script_hash": hashlib.sha3_256(stdlib.PEER_TO_PEER_WITH_METADATA_CODE).hexdigest(),
+            "script_bytes": script.hex(),
+            "script": {
+                "type": "peer_to_peer_with_metadata",
+                "receiver": receiver_address,
+                "amount": amount,
+                "currency": "Coin1",
+                "metadata": metadata.hex(),
+                "metadata_signature": "",
+            },
+        },
+        "hash": utils.transaction_hash(signed),
+        "bytes": "00" + signed.lcs_serialize().hex(),
+        "events": [
+            {
+                "key": event_key(3, sender_address),
+                "sequence_number": seq,
+                "transaction_version": version,
+                "data": dict(event_data, type="sentpayment"),
+            },
+            {
+                "key": event_key(2, receiver_address),
+                "sequence_number": version - START_VERSION,
+                "transaction_version": version,
+                "data": dict(event_data, type="receivedpayment"),
+            },
+        ],
+        "vm_status": {"type": "executed"},
+        "gas_used": 475,
+    }
+
+
+def response(result: typing.Any, version: int) -> typing.Dict[str, typing.Any]:  # pyre-ignore
+    return {
+        "libra_chain_id": CHAIN_ID,
+        "libra_ledger_version": version,
+        "libra_ledger_timestampusec": TIMESTAMP_USECS,
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": result,
+    }
+
+
+def main() -> None:
+    senders = [account(i + 1) for i in range(4)]
+    receiver = account(100)
+    txns = [
+        user_transaction(START_VERSION + i, senders[i % len(senders)], receiver, i // len(senders), 1_000 + i)
+        for i in range(TRANSACTIONS)
+    ]
+    last_version = START_VERSION + TRANSACTIONS
+    receiver_address = receiver.account_address.to_hex()
+    fixtures = {
+        "get_transactions": txns,
+        "get_account_transactions": [
+            txn for txn in txns if txn["transaction"]["sender"] == txns[0]["transaction"]["sender"]
+        ],
+        "get_events": [txn["events"][1] for txn in txns],
+        "get_account": {
+            "address": receiver_address,
+            "balances": [{"amount": sum(1_000 + i for i in range(TRANSACTIONS)), "currency": "Coin1"}],
+            "sequence_number": 0,
+            "authentication_key": receiver.auth_key.hex(),
+            "sent_events_key": event_key(3, receiver_address),
+            "received_events_key": event_key(2, receiver_address),
+            "delegated_key_rotation_capability": False,
+            "delegated_withdrawal_capability": False,
+            "is_frozen": False,
+            "role": {
+                "type": "parent_vasp",
+                "human_name": "No. 100 VASP",
+                "base_url": "http://localhost:8080",
+                "expiration_time": 18446744073709551615,
+                "compliance_key": receiver.public_key_bytes.hex(),
+                "compliance_key_rotation_events_key": event_key(0, receiver_address),
+                "base_url_rotation_events_key": event_key(1, receiver_address),
+                "num_children": 0,
+            },
+        },
+    }
+
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    for method, result in fixtures.items():
+        with open(os.path.join(FIXTURES_DIR, f"{method}.json"), "w") as f:
+            json.dump(response(result, last_version), f)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
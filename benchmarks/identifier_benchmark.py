@@ -0,0 +1,39 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmark bech32 account identifier encoding and decoding, and intent identifier decoding
+
+Run: `python benchmarks/identifier_benchmark.py [count]`
+"""
+
+import secrets
+import sys
+import timeit
+
+from libra import identifier
+
+
+def main(count: int) -> None:
+    address = secrets.token_hex(16)
+    accounts = [(address, secrets.token_bytes(8)) for _ in range(count)]
+    encoded = identifier.encode_accounts(accounts, identifier.LBR)
+
+    def report(name: str, fn) -> None:  # pyre-ignore
+        secs = min(timeit.repeat(fn, number=1, repeat=3))
+        print(f"{name:<20} {count / secs:>12,.0f} ops/sec")
+
+    report("encode_account", lambda: [identifier.encode_account(a, s, identifier.LBR) for a, s in accounts])
+    report("encode_accounts", lambda: identifier.encode_accounts(accounts, identifier.LBR))
+    report("decode_account", lambda: [identifier.decode_account(e, identifier.LBR) for e in encoded])
+    report("decode_accounts", lambda: identifier.decode_accounts(encoded, identifier.LBR))
+
+    intents = [identifier.encode_intent(e, "Coin1", i) for i, e in enumerate(encoded)]
+    identifier._decode_intent_cached.cache_clear()
+    report("decode_intent", lambda: [identifier.decode_intent(i, identifier.LBR) for i in intents])
+    # 10 distinct intents scanned repeatedly, all cache hits
+    repeated = intents[:10] * (count // 10)
+    report("decode_intents (hit)", lambda: identifier.decode_intents(repeated, identifier.LBR))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
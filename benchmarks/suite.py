@@ -0,0 +1,305 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""SDK benchmark suite: hot path throughput, import time and import memory
+
+Run all benchmarks and print results:
+
+    python benchmarks/suite.py
+
+Save results, and compare a later run with saved results (exits with status 1 if any benchmark regressed
+more than the threshold):
+
+    python benchmarks/suite.py --save benchmarks/results/baseline.json
+    python benchmarks/suite.py --compare benchmarks/results/baseline.json --threshold 0.1
+
+Throughput benchmarks report operations per second (higher is better), import benchmarks run a fresh
+interpreter per measurement and report milliseconds or KiB allocated (lower is better).
+The protobuf parsing and client replay benchmarks use JSON-RPC responses recorded in `benchmarks/fixtures`, see
+`benchmarks/generate_fixtures.py`; client replay benchmarks measure `jsonrpc.Client` overhead end-to-end with
+`jsonrpc.ReplayTransport` instead of network.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+import typing
+
+from libra import LocalAccount, chain_ids, identifier, jsonrpc, libra_types, lcs, serde_binary, txnmetadata, utils
+from libra.jsonrpc import client as jsonrpc_client
+
+FIXTURES_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+OPS_PER_SEC = "ops/sec"
+MILLISECONDS = "ms"
+KIB = "KiB"
+
+# unit => higher value is better
+UNITS: typing.Dict[str, bool] = {OPS_PER_SEC: True, MILLISECONDS: False, KIB: False}
+
+
+class Benchmark(typing.NamedTuple):
+    name: str
+    unit: str
+    run: typing.Callable[[int], float]
+
+
+BENCHMARKS: typing.List[Benchmark] = []
+
+
+def benchmark(name: str, unit: str = OPS_PER_SEC):  # pyre-ignore
+    def register(fn: typing.Callable[[int], float]) -> typing.Callable[[int], float]:
+        BENCHMARKS.append(Benchmark(name, unit, fn))
+        return fn
+
+    return register
+
+
+def ops_per_sec(fn: typing.Callable[[], typing.Any], count: int, repeat: int = 5) -> float:  # pyre-ignore
+    return count / min(timeit.repeat(fn, number=count, repeat=repeat))
+
+
+def load_fixture(method: str) -> typing.Any:  # pyre-ignore
+    with open(os.path.join(FIXTURES_DIR, f"{method}.json")) as f:
+        return json.load(f)["result"]
+
+
+def signed_transaction() -> typing.Tuple[LocalAccount, libra_types.RawTransaction, libra_types.SignedTransaction]:
+    account = LocalAccount.generate()
+    raw_txn = libra_types.RawTransaction(
+        sender=account.account_address,
+        sequence_number=12,
+        payload=libra_types.TransactionPayload__Script(
+            libra_types.Script.lcs_deserialize(
+                bytes.fromhex(load_fixture("get_transactions")[0]["transaction"]["script_bytes"])
+            )
+        ),
+        max_gas_amount=1_000_000,
+        gas_unit_price=0,
+        gas_currency_code="Coin1",
+        expiration_timestamp_secs=1_601_492_942,
+        chain_id=chain_ids.TESTNET,
+    )
+    return (account, raw_txn, account.sign(raw_txn))
+
+
+@benchmark("lcs_serialize_signed_transaction")
+def bench_lcs_serialize_signed_transaction(count: int) -> float:
+    _, _, txn = signed_transaction()
+    return ops_per_sec(lambda: lcs.serialize(txn, libra_types.SignedTransaction), count)
+
+
+@benchmark("lcs_serialize_into_signed_transaction")
+def bench_lcs_serialize_into_signed_transaction(count: int) -> float:
+    _, _, txn = signed_transaction()
+    buffer = bytearray()
+
+    def serialize_into() -> None:
+        del buffer[:]
+        lcs.serialize_into(txn, libra_types.SignedTransaction, buffer)
+
+    return ops_per_sec(serialize_into, count)
+
+
+@benchmark("lcs_deserialize_signed_transaction")
+def bench_lcs_deserialize_signed_transaction(count: int) -> float:
+    _, _, txn = signed_transaction()
+    data = txn.lcs_serialize()
+    return ops_per_sec(lambda: lcs.deserialize(data, libra_types.SignedTransaction), count)
+
+
+@benchmark("lcs_deserialize_stream_signed_transactions")
+def bench_lcs_deserialize_stream_signed_transactions(count: int) -> float:
+    _, _, txn = signed_transaction()
+    data = txn.lcs_serialize() * 1000
+    return ops_per_sec(lambda: list(lcs.deserialize_stream(data, libra_types.SignedTransaction)), 1) * 1000
+
+
+@benchmark("lcs_serialize_metadata")
+def bench_lcs_serialize_metadata(count: int) -> float:
+    metadata = libra_types.Metadata.lcs_deserialize(txnmetadata.general_metadata(b"\x01" * 8, b"\x02" * 8, 3))
+    return ops_per_sec(lambda: lcs.serialize(metadata, libra_types.Metadata), count)
+
+
+@benchmark("lcs_deserialize_metadata")
+def bench_lcs_deserialize_metadata(count: int) -> float:
+    data = txnmetadata.general_metadata(b"\x01" * 8, b"\x02" * 8, 3)
+    return ops_per_sec(lambda: lcs.deserialize(data, libra_types.Metadata), count)
+
+
+@benchmark("lcs_serialize_account_address")
+def bench_lcs_serialize_account_address(count: int) -> float:
+    address = utils.account_address("f72589b71ff4f8d139674a3f7369c69b")
+    return ops_per_sec(lambda: lcs.serialize(address, libra_types.AccountAddress), count)
+
+
+@benchmark("lcs_deserialize_account_address")
+def bench_lcs_deserialize_account_address(count: int) -> float:
+    data = bytes.fromhex("f72589b71ff4f8d139674a3f7369c69b")
+    return ops_per_sec(lambda: lcs.deserialize(data, libra_types.AccountAddress), count)
+
+
+@benchmark("transaction_hash")
+def bench_transaction_hash(count: int) -> float:
+    _, _, txn = signed_transaction()
+    return ops_per_sec(lambda: utils.transaction_hash(txn), count)
+
+
+@benchmark("local_account_sign")
+def bench_local_account_sign(count: int) -> float:
+    account, raw_txn, _ = signed_transaction()
+    return ops_per_sec(lambda: account.sign(raw_txn), count)
+
+
+@benchmark("bech32_encode_account")
+def bench_bech32_encode_account(count: int) -> float:
+    return ops_per_sec(
+        lambda: identifier.encode_account("f72589b71ff4f8d139674a3f7369c69b", b"\x01" * 8, identifier.TLB), count
+    )
+
+
+@benchmark("bech32_decode_account")
+def bench_bech32_decode_account(count: int) -> float:
+    encoded = identifier.encode_account("f72589b71ff4f8d139674a3f7369c69b", b"\x01" * 8, identifier.TLB)
+    return ops_per_sec(lambda: identifier.decode_account(encoded, identifier.TLB), count)
+
+
+def bench_parse_list(method: str, factory: typing.Callable[[], typing.Any], count: int) -> float:  # pyre-ignore
+    result = load_fixture(method)
+    parse = jsonrpc_client._parse_list(factory)
+    return ops_per_sec(lambda: parse(result), max(1, count // len(result))) * len(result)
+
+
+@benchmark("protobuf_parse_transactions")
+def bench_protobuf_parse_transactions(count: int) -> float:
+    return bench_parse_list("get_transactions", lambda: jsonrpc.Transaction(), count)
+
+
+@benchmark("protobuf_parse_events")
+def bench_protobuf_parse_events(count: int) -> float:
+    return bench_parse_list("get_events", lambda: jsonrpc.Event(), count)
+
+
+@benchmark("protobuf_parse_account")
+def bench_protobuf_parse_account(count: int) -> float:
+    result = load_fixture("get_account")
+    parse = jsonrpc_client._parse_obj(lambda: jsonrpc.Account())
+    return ops_per_sec(lambda: parse(result), count)
+
+
+def replay_client(method: str, params: typing.List[typing.Any]) -> jsonrpc.Client:  # pyre-ignore
+    with open(os.path.join(FIXTURES_DIR, f"{method}.json")) as f:
+        record = jsonrpc.Record({"method": method, "params": params}, f.read())
+    return jsonrpc.Client("replay", transport=jsonrpc.ReplayTransport([record]))
+
+
+@benchmark("client_replay_get_transactions")
+def bench_client_replay_get_transactions(count: int) -> float:
+    client = replay_client("get_transactions", [0, 50, True])
+    return ops_per_sec(lambda: client.get_transactions(0, 50, True), max(1, count // 50)) * 50
+
+
+@benchmark("client_replay_get_account")
+def bench_client_replay_get_account(count: int) -> float:
+    address = load_fixture("get_account")["address"]
+    client = replay_client("get_account", [address])
+    return ops_per_sec(lambda: client.get_account(address), count)
+
+
+IMPORT_SCRIPT = """
+import time, tracemalloc
+if %(trace)s:
+    tracemalloc.start()
+start = time.perf_counter()
+import %(modules)s
+secs = time.perf_counter() - start
+print(tracemalloc.get_traced_memory()[0] / 1024 if %(trace)s else secs * 1000)
+"""
+
+
+def run_import(modules: str, trace: bool, repeat: int = 5) -> float:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    script = IMPORT_SCRIPT % {"modules": modules, "trace": trace}
+    return min(
+        float(subprocess.run([sys.executable, "-c", script], env=env, stdout=subprocess.PIPE, check=True).stdout)
+        for _ in range(repeat if not trace else 1)
+    )
+
+
+for modules in ["libra", "libra.identifier", "libra.jsonrpc", "libra.stdlib", "libra.jsonrpc, libra.stdlib"]:
+    benchmark(f"import_time[{modules}]", MILLISECONDS)(lambda _, modules=modules: run_import(modules, False))
+for modules in ["libra.identifier", "libra.jsonrpc, libra.stdlib"]:
+    benchmark(f"import_memory[{modules}]", KIB)(lambda _, modules=modules: run_import(modules, True))
+
+
+def run(
+    count: int, pattern: typing.Optional[str] = None
+) -> typing.Dict[str, typing.Dict[str, typing.Any]]:  # pyre-ignore
+    results = {}
+    for bench in BENCHMARKS:
+        if pattern and pattern not in bench.name:
+            continue
+        value = bench.run(count)
+        results[bench.name] = {"value": round(value, 1), "unit": bench.unit}
+        print(f"{bench.name:<40} {value:>14,.1f} {bench.unit}", flush=True)
+    return results
+
+
+def compare(
+    results: typing.Dict[str, typing.Dict[str, typing.Any]],  # pyre-ignore
+    baseline: typing.Dict[str, typing.Dict[str, typing.Any]],  # pyre-ignore
+    threshold: float,
+) -> typing.List[str]:
+    """print changes against baseline results, returns names of benchmarks regressed more than threshold"""
+
+    regressions = []
+    print(f"\n{'benchmark':<40} {'baseline':>14} {'current':>14} {'change':>8}")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base, value = baseline[name]["value"], result["value"]
+        change = (value - base) / base if base else 0.0
+        regressed = -change > threshold if UNITS[result["unit"]] else change > threshold
+        if regressed:
+            regressions.append(name)
+        flag = " REGRESSION" if regressed else ""
+        print(f"{name:<40} {base:>14,.1f} {value:>14,.1f} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    args = argparse.ArgumentParser(description="Libra client SDK benchmarks")
+    args.add_argument("--count", type=int, default=1000, help="operations per measurement")
+    args.add_argument("--filter", help="only run benchmarks whose name contains the given string")
+    args.add_argument("--save", help="save results into given JSON file")
+    args.add_argument("--compare", help="compare results with given saved results JSON file")
+    args.add_argument("--threshold", type=float, default=0.1, help="regression threshold, default 0.1 (10%%)")
+    args.add_argument("--profile-lcs", action="store_true", help="print LCS time per type (slows down LCS benchmarks)")
+    opts = args.parse_args(argv)
+
+    if opts.profile_lcs:
+        with serde_binary.Profiler() as profiler:
+            results = run(opts.count, opts.filter)
+        print("\n" + profiler.format_report(limit=30))
+    else:
+        results = run(opts.count, opts.filter)
+    if opts.save:
+        os.makedirs(os.path.dirname(os.path.abspath(opts.save)), exist_ok=True)
+        with open(opts.save, "w") as f:
+            env = {"python": platform.python_version(), "platform": platform.platform(), "count": opts.count}
+            json.dump(dict(env, results=results), f, indent=2)
+            f.write("\n")
+    if opts.compare:
+        with open(opts.compare) as f:
+            baseline = json.load(f)["results"]
+        if compare(results, baseline, opts.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
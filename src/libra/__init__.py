@@ -1,8 +1,68 @@
 # Copyright (c) The Libra Core Contributors
 # SPDX-License-Identifier: Apache-2.0
 
-"""Python client sdk library for the [Libra](https://libra.org) blockchain network."""
+"""Python client sdk library for the [Libra](https://libra.org) blockchain network.
 
-from .utils import InvalidAccountAddressError, InvalidSubAddressError
-from .auth_key import AuthKey
-from .local_account import LocalAccount
+Sub-modules and the names exported by this module are imported on first access (PEP 562), so that
+`import libra` is cheap and using e.g. only `libra.identifier` does not import the JSON-RPC client
+(`requests`, `protobuf`) or the generated `stdlib` module.
+"""
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .utils import InvalidAccountAddressError, InvalidSubAddressError  # noqa: F401
+    from .auth_key import AuthKey  # noqa: F401
+    from .local_account import LocalAccount  # noqa: F401
+
+
+# exported name => sub-module defines it
+_EXPORTS: typing.Dict[str, str] = {
+    "InvalidAccountAddressError": "utils",
+    "InvalidSubAddressError": "utils",
+    "AuthKey": "auth_key",
+    "LocalAccount": "local_account",
+}
+
+_SUBMODULES: typing.List[str] = [
+    "auth_key",
+    "chain_ids",
+    "columnar",
+    "identifier",
+    "jsonrpc",
+    "lcs",
+    "libra_types",
+    "local_account",
+    "mocknet",
+    "pipeline",
+    "script_codec",
+    "serde_binary",
+    "serde_types",
+    "stdlib",
+    "subaddress",
+    "testnet",
+    "txnmetadata",
+    "utils",
+]
+
+# sub-modules left out of `from libra import *`: testing networks and the transaction pipeline are not part of the
+# client API, and importing them loads the JSON-RPC client and the generated stdlib
+_NOT_ALL: typing.List[str] = ["mocknet", "pipeline", "testnet"]
+
+__all__: typing.List[str] = sorted(_EXPORTS) + [name for name in sorted(_SUBMODULES) if name not in _NOT_ALL]
+
+
+def __getattr__(name: str) -> typing.Any:  # pyre-ignore
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(_EXPORTS) | set(_SUBMODULES))
@@ -0,0 +1,228 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Columnar export of JSON-RPC transactions and events into NumPy arrays.
+
+Converts pages of transactions / events into one NumPy array per field, ready for building
+analytics data frames without converting protobuf messages row by row:
+
+```python
+from libra import columnar, testnet
+import pandas
+
+client = testnet.create_client()
+txns = columnar.get_transactions(client, 0, 1000)
+df = pandas.DataFrame({"version": txns.version, "currency": txns.currency.values()})
+```
+
+`get_transactions` and `get_events` parse the JSON-RPC response result directly, no `jsonrpc.Transaction` or
+`jsonrpc.Event` object is created. `transactions_to_columns` and `events_to_columns` accept JSON result
+objects or `jsonrpc` objects.
+
+Field types:
+
+* integer fields: `numpy.uint64` array, 0 for absent values.
+* account address fields: `numpy.uint8` array with shape `(n, 16)`, all zero bytes for absent values.
+* string enum fields (types, currency codes): `Categorical`, empty string for absent values.
+"""
+
+import dataclasses
+import typing
+
+import numpy as np
+
+from . import jsonrpc, utils
+
+
+@dataclasses.dataclass
+class Categorical:
+    """Categorical column: `categories[codes[i]]` is the value of row i"""
+
+    codes: np.ndarray
+    categories: typing.List[str]
+
+    @staticmethod
+    def from_values(values: typing.Iterable[str]) -> "Categorical":
+        index: typing.Dict[str, int] = {}
+        codes = [index.setdefault(value, len(index)) for value in values]
+        return Categorical(codes=np.array(codes, dtype=np.int32), categories=list(index))
+
+    @staticmethod
+    def concat(columns: typing.Sequence["Categorical"]) -> "Categorical":
+        index: typing.Dict[str, int] = {}
+        codes = [np.array([], dtype=np.int32)]
+        for col in columns:
+            remap = np.array([index.setdefault(c, len(index)) for c in col.categories], dtype=np.int32)
+            codes.append(remap[col.codes])
+        return Categorical(codes=np.concatenate(codes), categories=list(index))
+
+    def values(self) -> typing.List[str]:
+        return [self.categories[code] for code in self.codes]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+Column = typing.Union[np.ndarray, Categorical]
+
+_ZERO_ADDRESS: bytes = b"\x00" * utils.ACCOUNT_ADDRESS_LEN
+
+
+def _field(obj: typing.Any, path: typing.Sequence[str]) -> typing.Any:  # pyre-ignore
+    for name in path:
+        if obj is None:
+            return None
+        obj = obj.get(name) if isinstance(obj, dict) else getattr(obj, name)
+    return obj
+
+
+def _u64_column(values: typing.List[typing.Any]) -> np.ndarray:  # pyre-ignore
+    return np.array([int(v) if v else 0 for v in values], dtype=np.uint64)
+
+
+def _address_bytes(value: typing.Optional[str]) -> bytes:
+    if not value:
+        return _ZERO_ADDRESS
+    ret = bytes.fromhex(value)
+    if len(ret) != utils.ACCOUNT_ADDRESS_LEN:
+        raise ValueError(f"invalid account address: {value}")
+    return ret
+
+
+def _address_column(values: typing.List[typing.Optional[str]]) -> np.ndarray:
+    buf = b"".join([_address_bytes(v) for v in values])
+    return np.frombuffer(buf, dtype=np.uint8).reshape((len(values), utils.ACCOUNT_ADDRESS_LEN))
+
+
+def _categorical_column(values: typing.List[typing.Optional[str]]) -> Categorical:
+    return Categorical.from_values(v or "" for v in values)
+
+
+_COLUMN_BUILDERS: typing.Dict[str, typing.Callable[[typing.List[typing.Any]], Column]] = {  # pyre-ignore
+    "u64": _u64_column,
+    "address": _address_column,
+    "categorical": _categorical_column,
+}
+
+# column name => (field path, column type)
+ColumnSpecs = typing.Dict[str, typing.Tuple[typing.Tuple[str, ...], str]]
+
+JsonObject = typing.Dict[str, typing.Any]  # pyre-ignore
+
+
+def _to_columns(rows: typing.Sequence[typing.Any], specs: ColumnSpecs) -> typing.Dict[str, Column]:  # pyre-ignore
+    return {name: _COLUMN_BUILDERS[kind]([_field(row, path) for row in rows]) for name, (path, kind) in specs.items()}
+
+
+def _concat(columns: typing.Sequence[Column]) -> Column:
+    if columns and isinstance(columns[0], Categorical):
+        return Categorical.concat(columns)  # pyre-ignore
+    return np.concatenate(columns)
+
+
+TRANSACTION_COLUMNS: ColumnSpecs = {
+    "version": (("version",), "u64"),
+    "gas_used": (("gas_used",), "u64"),
+    "vm_status": (("vm_status", "type"), "categorical"),
+    "type": (("transaction", "type"), "categorical"),
+    "sender": (("transaction", "sender"), "address"),
+    "sequence_number": (("transaction", "sequence_number"), "u64"),
+    "gas_currency": (("transaction", "gas_currency"), "categorical"),
+    "script_type": (("transaction", "script", "type"), "categorical"),
+    "receiver": (("transaction", "script", "receiver"), "address"),
+    "amount": (("transaction", "script", "amount"), "u64"),
+    "currency": (("transaction", "script", "currency"), "categorical"),
+}
+
+
+@dataclasses.dataclass
+class TransactionColumns:
+    """Columns of transactions, see `TRANSACTION_COLUMNS` for the source field of each column"""
+
+    version: np.ndarray
+    gas_used: np.ndarray
+    vm_status: Categorical
+    type: Categorical
+    sender: np.ndarray
+    sequence_number: np.ndarray
+    gas_currency: Categorical
+    script_type: Categorical
+    receiver: np.ndarray
+    amount: np.ndarray
+    currency: Categorical
+
+    @staticmethod
+    def concat(pages: typing.Sequence["TransactionColumns"]) -> "TransactionColumns":
+        if not pages:
+            return transactions_to_columns([])
+        return TransactionColumns(
+            **{name: _concat([getattr(page, name) for page in pages]) for name in TRANSACTION_COLUMNS}
+        )
+
+    def __len__(self) -> int:
+        return len(self.version)
+
+
+EVENT_COLUMNS: ColumnSpecs = {
+    "transaction_version": (("transaction_version",), "u64"),
+    "sequence_number": (("sequence_number",), "u64"),
+    "key": (("key",), "categorical"),
+    "type": (("data", "type"), "categorical"),
+    "amount": (("data", "amount", "amount"), "u64"),
+    "currency": (("data", "amount", "currency"), "categorical"),
+    "sender": (("data", "sender"), "address"),
+    "receiver": (("data", "receiver"), "address"),
+}
+
+
+@dataclasses.dataclass
+class EventColumns:
+    """Columns of events, see `EVENT_COLUMNS` for the source field of each column"""
+
+    transaction_version: np.ndarray
+    sequence_number: np.ndarray
+    key: Categorical
+    type: Categorical
+    amount: np.ndarray
+    currency: Categorical
+    sender: np.ndarray
+    receiver: np.ndarray
+
+    @staticmethod
+    def concat(pages: typing.Sequence["EventColumns"]) -> "EventColumns":
+        if not pages:
+            return events_to_columns([])
+        return EventColumns(**{name: _concat([getattr(page, name) for page in pages]) for name in EVENT_COLUMNS})
+
+    def __len__(self) -> int:
+        return len(self.transaction_version)
+
+
+def transactions_to_columns(
+    txns: typing.Optional[typing.Sequence[typing.Union[JsonObject, jsonrpc.Transaction]]],
+) -> TransactionColumns:
+    """convert JSON-RPC transaction JSON objects or `jsonrpc.Transaction` list into `TransactionColumns`"""
+
+    return TransactionColumns(**_to_columns(txns or [], TRANSACTION_COLUMNS))
+
+
+def events_to_columns(
+    events: typing.Optional[typing.Sequence[typing.Union[JsonObject, jsonrpc.Event]]],
+) -> EventColumns:
+    """convert JSON-RPC event JSON objects or `jsonrpc.Event` list into `EventColumns`"""
+
+    return EventColumns(**_to_columns(events or [], EVENT_COLUMNS))
+
+
+def get_transactions(client: jsonrpc.Client, start_version: int, limit: int) -> TransactionColumns:
+    """same with `jsonrpc.Client#get_transactions`, but returns `TransactionColumns`"""
+
+    params = [int(start_version), int(limit), False]
+    return client.execute("get_transactions", params, transactions_to_columns)
+
+
+def get_events(client: jsonrpc.Client, event_stream_key: str, start: int, limit: int) -> EventColumns:
+    """same with `jsonrpc.Client#get_events`, but returns `EventColumns`"""
+
+    params = [event_stream_key, int(start), int(limit)]
+    return client.execute("get_events", params, events_to_columns)
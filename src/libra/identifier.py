@@ -16,6 +16,7 @@ print(identifier.HRPS[chain_ids.PREMAINNET.to_int()])
 """
 
 
+import functools
 import typing
 from urllib import parse
 from typing import List
@@ -41,6 +42,10 @@ LIBRA_ZERO_SUBADDRESS: bytes = b"\0" * LIBRA_SUBADDRESS_SIZE
 _BECH32_CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
 _BECH32_SEPARATOR = "1"
 _BECH32_CHECKSUM_CHAR_SIZE = 6
+# character => 5-bit value lookup table for decoding
+_BECH32_CHAR_VALUES: typing.Dict[str, int] = {c: i for i, c in enumerate(_BECH32_CHARSET)}
+# precomputed checksum state after processing expanded HRP of Libra HRPs, see `_bech32_hrp_state`
+_BECH32_HRP_STATES: typing.Dict[str, int] = {}
 
 # LIBRA constants
 _LIBRA_HRP: List[str] = [LBR, TLB, PLB]
@@ -95,16 +100,62 @@ def decode_intent(encoded_intent_identifier: str, hrp: str) -> Intent:
     3. amount
 
     InvalidIntentIdentifierError is raised if given identifier is invalid
+
+    Recently decoded intent identifiers are cached (see `DECODE_INTENT_CACHE_SIZE`), a new `Intent` object is
+    returned for every call.
+    """
+
+    return Intent(*_decode_intent_cached(encoded_intent_identifier, hrp))
+
+
+def decode_intents(encoded_intent_identifiers: typing.Iterable[str], hrp: str) -> typing.List[Intent]:
+    """Decode Libra intent identifiers with human readable prefix(hrp)
+
+    Same with calling `decode_intent` for each identifier, raises InvalidIntentIdentifierError for the first
+    invalid one.
+    """
+
+    decode = _decode_intent_cached
+    return [Intent(*decode(encoded, hrp)) for encoded in encoded_intent_identifiers]
+
+
+# max number of recently decoded intent identifiers cached by `decode_intent`
+DECODE_INTENT_CACHE_SIZE = 4096
+
+_INTENT_SCHEME = "libra://"
+
+IntentFields = typing.Tuple[libra_types.AccountAddress, typing.Optional[bytes], str, int]
+
+
+@functools.lru_cache(maxsize=DECODE_INTENT_CACHE_SIZE)
+def _decode_intent_cached(encoded_intent_identifier: str, hrp: str) -> IntentFields:
+    return _decode_intent(encoded_intent_identifier, hrp)
+
+
+def _decode_intent(encoded_intent_identifier: str, hrp: str) -> IntentFields:
+    """single pass parser of `libra://<account identifier>?c=<currency code>&am=<amount>`
+
+    Follows `urllib.parse.urlparse` and `urllib.parse.parse_qs` rules: scheme is case insensitive, fragment is
+    ignored, query parameters without value are ignored, and parameter name / value are percent-decoded.
     """
 
-    result = parse.urlparse(encoded_intent_identifier)
-    if result.scheme != "libra":
+    if encoded_intent_identifier[: len(_INTENT_SCHEME)].lower() != _INTENT_SCHEME:
+        scheme = encoded_intent_identifier.partition(":")[0]
         raise InvalidIntentIdentifierError(
-            f"Unknown intent identifier scheme {result.scheme} " f"in {encoded_intent_identifier}"
+            f"Unknown intent identifier scheme {scheme} " f"in {encoded_intent_identifier}"
         )
 
-    account_identifier = result.netloc
-    params = parse.parse_qs(result.query)
+    rest = encoded_intent_identifier[len(_INTENT_SCHEME) :].partition("#")[0]
+    location, _, query = rest.partition("?")
+    account_identifier = location.partition("/")[0]
+
+    params: typing.Dict[str, typing.List[str]] = {}
+    for field in query.split("&"):
+        name, _, value = field.partition("=")
+        if "%" in field or "+" in field:
+            name, value = parse.unquote_plus(name), parse.unquote_plus(value)
+        if value:
+            params.setdefault(name, []).append(value)
 
     amount = _decode_param("amount", params, "am", lambda am: int(am))
     currency_code = _decode_param("currency code", params, "c", lambda c: str(c))
@@ -114,12 +165,7 @@ def decode_intent(encoded_intent_identifier: str, hrp: str) -> Intent:
     except ValueError as e:
         raise InvalidIntentIdentifierError(f"decode account identifier failed: {e}:")
 
-    return Intent(
-        account_address=utils.account_address(account_address),
-        sub_address=sub_address,
-        currency_code=currency_code,
-        amount=amount,
-    )
+    return (account_address, sub_address, currency_code, amount)
 
 
 def _decode_param(name, params, field, convert):  # pyre-ignore
@@ -175,6 +221,31 @@ def decode_account(encoded_address: str, hrp: str) -> typing.Tuple[libra_types.A
     return (address, None)
 
 
+def encode_accounts(
+    accounts: typing.Iterable[
+        typing.Tuple[typing.Union[libra_types.AccountAddress, str], typing.Union[str, bytes, None]]
+    ],
+    hrp: str,
+) -> typing.List[str]:
+    """Encode (onchain address, subaddress) pairs with human readable prefix(hrp) into bech32 format
+
+    Same with calling `encode_account` for each pair, raises ValueError for the first invalid pair.
+    """
+
+    return [encode_account(onchain_addr, subaddr, hrp) for onchain_addr, subaddr in accounts]
+
+
+def decode_accounts(
+    encoded_addresses: typing.Iterable[str], hrp: str
+) -> typing.List[typing.Tuple[libra_types.AccountAddress, typing.Optional[bytes]]]:
+    """Decode bech32 encoded account identifiers with human readable prefix(hrp)
+
+    Same with calling `decode_account` for each encoded address, raises ValueError for the first invalid one.
+    """
+
+    return [decode_account(encoded_address, hrp) for encoded_address in encoded_addresses]
+
+
 ######################################################################################
 
 # Bech32 implementation for Libra human readable addresses based on
@@ -212,11 +283,7 @@ def bech32_address_encode(hrp: str, address_bytes: bytes, subaddress_bytes: typi
     subaddress_final_bytes = subaddress_bytes if subaddress_bytes is not None else LIBRA_ZERO_SUBADDRESS
     total_bytes = address_bytes + subaddress_final_bytes
 
-    five_bit_data = _convertbits(total_bytes, 8, 5, True)
-    # check base conversion
-    if five_bit_data is None:
-        raise Bech32Error("Error converting bytes to base32")
-    return _bech32_encode(hrp, [encoding_version] + five_bit_data)
+    return _bech32_encode(hrp, [encoding_version] + _address_to_five_bit(total_bytes))
 
 
 def bech32_address_decode(expected_hrp: str, bech32: str) -> typing.Tuple[int, bytes, bytes]:
@@ -248,36 +315,27 @@ def bech32_address_decode(expected_hrp: str, bech32: str) -> typing.Tuple[int, b
         raise Bech32Error(f"Non-expected Bech32 separator: {bech32[3]}")
 
     # check characters after separator in Bech32 alphabet
-    if not all(x in _BECH32_CHARSET for x in bech32[4:]):
+    char_values = _BECH32_CHAR_VALUES
+    values = [char_values.get(x, -1) for x in bech32[4:]]
+    if -1 in values:
         raise Bech32Error(f"Invalid Bech32 characters detected: {bech32}")
     hrp = bech32[:3]
 
     # version is defined by the index of the Bech32 character after separator
-    address_version = _BECH32_CHARSET.find(bech32[4])
+    address_version = values[0]
     # check valid version
     if address_version != _LIBRA_BECH32_VERSION:
         raise Bech32Error(f"Version mismatch. Expected {_LIBRA_BECH32_VERSION}, " f"but received {address_version}")
 
-    # we've already checked that all characters are in the correct alphabet,
-    # thus, this will always succeed
-    data = [_BECH32_CHARSET.find(x) for x in bech32[5:]]
-
     # check Bech32 checksum
-    if not _bech32_verify_checksum(hrp, [address_version] + data):
+    if not _bech32_verify_checksum(hrp, values):
         raise Bech32Error(f"Bech32 checksum validation failed: {bech32}")
 
-    decoded_data = _convertbits(data[:-_BECH32_CHECKSUM_CHAR_SIZE], 5, 8, False)
+    decoded_data = _five_bit_to_address(values[1:-_BECH32_CHECKSUM_CHAR_SIZE])
     # check base conversion
     if decoded_data is None:
         raise Bech32Error("Error converting bytes from base32")
 
-    length_data = len(decoded_data)
-    # extra check about the expected output (sub)address size in bytes
-    if length_data != _LIBRA_ADDRESS_SIZE + LIBRA_SUBADDRESS_SIZE:
-        raise Bech32Error(
-            f"Expected {_LIBRA_ADDRESS_SIZE + LIBRA_SUBADDRESS_SIZE} bytes after decoding, but got: {length_data}"
-        )
-
     return (
         address_version,
         bytes(decoded_data[:_LIBRA_ADDRESS_SIZE]),
@@ -285,15 +343,20 @@ def bech32_address_decode(expected_hrp: str, bech32: str) -> typing.Tuple[int, b
     )
 
 
-def _bech32_polymod(values: typing.Iterable[int]) -> int:
-    """Internal function that computes the Bech32 checksum."""
-    generator = [0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3]
-    chk = 1
+_BECH32_GENERATOR = [0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3]
+# XOR of generator values selected by each possible top 5 bits of the checksum state
+_BECH32_GENERATOR_TABLE: typing.List[int] = [0] * 32
+for _top in range(32):
+    for _i in range(5):
+        if (_top >> _i) & 1:
+            _BECH32_GENERATOR_TABLE[_top] ^= _BECH32_GENERATOR[_i]
+
+
+def _bech32_polymod(values: typing.Iterable[int], chk: int = 1) -> int:
+    """Internal function that computes the Bech32 checksum, starting from the given checksum state."""
+    table = _BECH32_GENERATOR_TABLE
     for value in values:
-        top = chk >> 25
-        chk = (chk & 0x1FFFFFF) << 5 ^ value
-        for i in range(5):
-            chk ^= generator[i] if ((top >> i) & 1) else 0
+        chk = ((chk & 0x1FFFFFF) << 5 ^ value) ^ table[chk >> 25]
     return chk
 
 
@@ -302,24 +365,54 @@ def _bech32_hrp_expand(hrp: str) -> typing.List[int]:
     return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
 
 
+def _bech32_hrp_state(hrp: str) -> int:
+    """Checksum state after processing the expanded HRP, precomputed for Libra HRPs."""
+    state = _BECH32_HRP_STATES.get(hrp)
+    if state is None:
+        state = _bech32_polymod(_bech32_hrp_expand(hrp))
+    return state
+
+
 def _bech32_verify_checksum(hrp: str, data: typing.Iterable[int]) -> bool:
     """Verify a checksum given HRP and converted data characters."""
-    return _bech32_polymod(_bech32_hrp_expand(hrp) + list(data)) == 1
+    return _bech32_polymod(data, _bech32_hrp_state(hrp)) == 1
 
 
-def _bech32_create_checksum(hrp: str, data: typing.Iterable[int]) -> typing.List[int]:
+def _bech32_create_checksum(hrp: str, data: typing.List[int]) -> typing.List[int]:
     """Compute the checksum values given HRP and data."""
-    values = _bech32_hrp_expand(hrp) + list(data)
-    polymod = _bech32_polymod(values + [0, 0, 0, 0, 0, 0]) ^ 1
+    polymod = _bech32_polymod(data + [0, 0, 0, 0, 0, 0], _bech32_hrp_state(hrp)) ^ 1
     return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
 
 
-def _bech32_encode(hrp: str, data: typing.Iterable[int]) -> str:
+def _bech32_encode(hrp: str, data: typing.List[int]) -> str:
     """Compute a Bech32 string given HRP and data values."""
-    combined = list(data) + _bech32_create_checksum(hrp, data)
+    combined = data + _bech32_create_checksum(hrp, data)
     return hrp + _BECH32_SEPARATOR + "".join([_BECH32_CHARSET[d] for d in combined])
 
 
+# LIBRA address and subaddress bytes are converted into 39 5-bit values, with 3 bits zero padding
+_LIBRA_ADDRESS_FIVE_BIT_SIZE = 39
+_LIBRA_ADDRESS_PADDING_BITS = _LIBRA_ADDRESS_FIVE_BIT_SIZE * 5 - (_LIBRA_ADDRESS_SIZE + LIBRA_SUBADDRESS_SIZE) * 8
+
+
+def _address_to_five_bit(data: bytes) -> typing.List[int]:
+    """Same with `_convertbits(data, 8, 5, True)` for the fixed size of address and subaddress bytes."""
+    acc = int.from_bytes(data, "big") << _LIBRA_ADDRESS_PADDING_BITS
+    return [(acc >> shift) & 31 for shift in range(_LIBRA_ADDRESS_FIVE_BIT_SIZE * 5 - 5, -1, -5)]
+
+
+def _five_bit_to_address(data: typing.List[int]) -> typing.Optional[bytes]:
+    """Same with `_convertbits(data, 5, 8, False)`, returns None if data size is not expected or padding is not zero."""
+    if len(data) != _LIBRA_ADDRESS_FIVE_BIT_SIZE:
+        return None
+    acc = 0
+    for value in data:
+        acc = (acc << 5) | value
+    if acc & ((1 << _LIBRA_ADDRESS_PADDING_BITS) - 1):
+        return None
+    return (acc >> _LIBRA_ADDRESS_PADDING_BITS).to_bytes(_LIBRA_ADDRESS_SIZE + LIBRA_SUBADDRESS_SIZE, "big")
+
+
 def _convertbits(
     data: typing.Iterable[int], from_bits: int, to_bits: int, pad: bool
 ) -> typing.Optional[typing.List[int]]:
@@ -343,3 +436,6 @@ def _convertbits(
     elif bits >= from_bits or ((acc << (to_bits - bits)) & maxv):
         return None
     return ret
+
+
+_BECH32_HRP_STATES.update({hrp: _bech32_polymod(_bech32_hrp_expand(hrp)) for hrp in _LIBRA_HRP})
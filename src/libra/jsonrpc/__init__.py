@@ -24,6 +24,8 @@ from .client import (
     Client,
     State,
     Retry,
+    ClientHook,
+    RpcCall,
     # Exceptions
     JsonRpcError,
     NetworkError,
@@ -35,6 +37,16 @@ from .client import (
     WaitForTransactionTimeout,
     AccountNotFoundError,
 )
+from .transport import (
+    Transport,
+    RequestsTransport,
+    RecordingTransport,
+    ReplayTransport,
+    Record,
+    RecordNotFoundError,
+)
+from .metrics import MetricsCollector, Histogram
+from .sequence import SequenceNumberAllocator, is_sequence_number_error, SEQUENCE_NUMBER_ERROR_CODES
 from .libra_jsonrpc_types_pb2 import (
     Amount,
     Metadata,
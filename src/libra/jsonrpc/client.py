@@ -6,6 +6,8 @@ import time
 import copy
 import dataclasses
 import google.protobuf.json_format as parser
+import json
+import logging
 import requests
 import threading
 import typing
@@ -13,13 +15,13 @@ import typing
 from .. import libra_types, utils
 from . import libra_jsonrpc_types_pb2 as rpc
 from . import constants
+from .transport import Transport, RequestsTransport, DEFAULT_CONNECT_TIMEOUT_SECS, DEFAULT_TIMEOUT_SECS
 
-
-DEFAULT_CONNECT_TIMEOUT_SECS: float = 5.0
-DEFAULT_TIMEOUT_SECS: float = 30.0
 DEFAULT_WAIT_FOR_TRANSACTION_TIMEOUT_SECS: float = 5.0
 DEFAULT_WAIT_FOR_TRANSACTION_WAIT_DURATION_SECS: float = 0.2
 
+logger: logging.Logger = logging.getLogger(__name__)
+
 
 class JsonRpcError(Exception):
     pass
@@ -70,7 +72,10 @@ class Retry:
     delay_secs: float
     exception: typing.Type[Exception]
 
-    def execute(self, fn: typing.Callable):  # pyre-ignore
+    # pyre-ignore
+    def execute(self, fn: typing.Callable, on_retry: typing.Optional[typing.Callable[[Exception, int], None]] = None):
+        """call fn until it succeeds or max_retries reached, `on_retry(error, tries)` is called before each retry"""
+
         tries = 0
         while tries < self.max_retries:
             tries += 1
@@ -78,12 +83,58 @@ class Retry:
                 return fn()
             except self.exception as e:
                 if tries < self.max_retries:
+                    if on_retry:
+                        on_retry(e, tries)
                     # simplest backoff strategy: tries * delay
                     time.sleep(self.delay_secs * tries)
                 else:
                     raise e
 
 
+@dataclasses.dataclass
+class RpcCall:
+    """A JSON-RPC request sent by `Client`, passed to `ClientHook` callbacks
+
+    Timings are `time.perf_counter` seconds: `start` is reset after `pre_request` hooks return, right before
+    sending the request, `network_secs` is the time waiting for the transport to return the response body,
+    `parse_secs` is the time decoding the response JSON and parsing the result.
+    """
+
+    method: str
+    request: typing.Dict[str, typing.Any]  # pyre-ignore
+    start: float = dataclasses.field(default_factory=time.perf_counter)
+    network_secs: float = 0.0
+    parse_secs: float = 0.0
+    response_bytes: int = 0
+
+    @property
+    def request_bytes(self) -> int:
+        return len(json.dumps(self.request))
+
+    def elapsed_secs(self) -> float:
+        return time.perf_counter() - self.start
+
+
+class ClientHook:
+    """Callbacks of `Client` JSON-RPC requests, override the methods needed
+
+    Hooks are called in the thread executing the request, and should return quickly.
+    Exceptions raised by hooks are logged and ignored, they never replace the request result or error.
+    """
+
+    def pre_request(self, call: RpcCall) -> None:
+        """called before sending the request"""
+
+    def post_response(self, call: RpcCall) -> None:
+        """called after the response result is parsed successfully"""
+
+    def on_error(self, call: RpcCall, error: Exception) -> None:
+        """called when the request fails, before the error is raised (or retried)"""
+
+    def on_retry(self, method: str, error: Exception, tries: int) -> None:
+        """called before `Client.execute` retries the method call after `tries` failed tries"""
+
+
 class Client:
     """Libra JSON-RPC API client
 
@@ -96,13 +147,25 @@ class Client:
         session: typing.Optional[requests.Session] = None,
         timeout: typing.Optional[typing.Tuple[float, float]] = None,
         retry: typing.Optional[Retry] = None,
+        transport: typing.Optional[Transport] = None,
+        hooks: typing.Optional[typing.List[ClientHook]] = None,
     ) -> None:
+        """Create client connects to `server_url`
+
+        Requests are sent by `RequestsTransport` with given `session` and `timeout` unless `transport` is provided.
+        `hooks` are called for every JSON-RPC request, see `ClientHook` and `MetricsCollector`.
+        """
+
         self._url: str = server_url
-        self._session: requests.Session = session or requests.Session()
         self._timeout: typing.Tuple[float, float] = timeout or (DEFAULT_CONNECT_TIMEOUT_SECS, DEFAULT_TIMEOUT_SECS)
+        self._transport: Transport = transport or RequestsTransport(server_url, session, self._timeout)
         self._last_known_server_state: State = State(chain_id=-1, version=-1, timestamp_usecs=-1)
         self._lock = threading.Lock()
         self._retry: Retry = retry or Retry(5, 0.2, StaleResponseError)
+        self._hooks: typing.List[ClientHook] = list(hooks or [])
+
+    def add_hook(self, hook: ClientHook) -> None:
+        self._hooks.append(hook)
 
     # high level functions
 
@@ -402,8 +465,12 @@ class Client:
         Should only be called by get methods.
         """
 
+        def on_retry(error: Exception, tries: int) -> None:
+            self._call_hooks("on_retry", method, error, tries)
+
         return self._retry.execute(
-            lambda: self.execute_without_retry(method, params, result_parser, ignore_stale_response)
+            lambda: self.execute_without_retry(method, params, result_parser, ignore_stale_response),
+            on_retry if self._hooks else None,
         )
 
     # pyre-ignore
@@ -433,38 +500,73 @@ class Client:
             "method": method,
             "params": params or [],
         }
+        if not self._hooks:
+            return self._parse_response(self._send(request), result_parser, ignore_stale_response)
+
+        call = RpcCall(method, request)
+        self._call_hooks("pre_request", call)
+        # timings exclude the pre_request hooks
+        call.start = time.perf_counter()
+        try:
+            body = self._send(request)
+            call.network_secs = call.elapsed_secs()
+            call.response_bytes = len(body)
+            result = self._parse_response(body, result_parser, ignore_stale_response)
+            call.parse_secs = call.elapsed_secs() - call.network_secs
+        except Exception as e:
+            self._call_hooks("on_error", call, e)
+            raise
+        self._call_hooks("post_response", call)
+        return result
+
+    def _call_hooks(self, callback: str, *args: typing.Any) -> None:  # pyre-ignore
+        for hook in self._hooks:
+            try:
+                getattr(hook, callback)(*args)
+            except Exception:
+                logger.exception("%s.%s failed", type(hook).__name__, callback)
+
+    def _send(self, request: typing.Dict[str, typing.Any]) -> str:  # pyre-ignore
+        try:
+            return self._transport.send(request)
+        except requests.RequestException as e:
+            raise NetworkError(f"Error in connecting to server: {e}\nPlease retry...")
+
+    # pyre-ignore
+    def _parse_response(
+        self,
+        body: str,
+        result_parser: typing.Optional[typing.Callable] = None,  # pyre-ignore
+        ignore_stale_response: typing.Optional[bool] = None,
+    ):
         try:
-            response = self._session.post(self._url, json=request, timeout=self._timeout)
-            response.raise_for_status()
-            json = response.json()
+            response = json.loads(body)
 
             # check stable response before check jsonrpc error
             try:
                 self.update_last_known_state(
-                    json.get("libra_chain_id"),
-                    json.get("libra_ledger_version"),
-                    json.get("libra_ledger_timestampusec"),
+                    response.get("libra_chain_id"),
+                    response.get("libra_ledger_version"),
+                    response.get("libra_ledger_timestampusec"),
                 )
             except StaleResponseError as e:
                 if not ignore_stale_response:
                     raise e
 
-            if "error" in json:
-                err = json["error"]
+            if "error" in response:
+                err = response["error"]
                 raise JsonRpcError(f"{err}")
 
-            if "result" in json:
+            if "result" in response:
                 if result_parser:
-                    return result_parser(json["result"])
+                    return result_parser(response["result"])
                 return
 
-            raise InvalidServerResponse(f"No error or result in response: {response.text}")
-        except requests.RequestException as e:
-            raise NetworkError(f"Error in connecting to server: {e}\nPlease retry...")
+            raise InvalidServerResponse(f"No error or result in response: {body}")
         except ValueError as e:
-            raise InvalidServerResponse(f"Parse response as json failed: {e}, response: {response.text}")
+            raise InvalidServerResponse(f"Parse response as json failed: {e}, response: {body}")
         except parser.ParseError as e:
-            raise InvalidServerResponse(f"Parse result failed: {e}, response: {response.text}")
+            raise InvalidServerResponse(f"Parse result failed: {e}, response: {body}")
 
 
 def _parse_obj(factory):  # pyre-ignore
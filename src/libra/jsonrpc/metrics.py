@@ -0,0 +1,186 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Per JSON-RPC method request metrics of `Client`, exported in Prometheus text format.
+
+```python
+metrics = jsonrpc.MetricsCollector()
+client = jsonrpc.Client(url, hooks=[metrics])
+client.get_metadata()
+
+print(metrics.to_prometheus())
+print(metrics.latency("get_metadata").quantile(0.99))
+```
+
+For each method, `MetricsCollector` keeps a latency histogram (seconds from sending the request to the
+result parsed or the error raised), and counts requests, errors by exception type, retries, request and
+response bytes, and seconds spent waiting on the transport (network) vs. decoding the response (parse).
+"""
+
+import bisect
+import collections
+import threading
+import typing
+
+from .client import ClientHook, RpcCall
+
+# Prometheus client default histogram buckets, in seconds
+DEFAULT_BUCKETS: typing.Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+DEFAULT_PREFIX: str = "libra_jsonrpc_client"
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds, not thread-safe"""
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets: typing.List[float] = sorted(buckets)
+        # counts[i] is the number of observations in (buckets[i-1], buckets[i]], the last one is (buckets[-1], +Inf)
+        self.counts: typing.List[int] = [0] * (len(self.buckets) + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> typing.List[int]:
+        ret, total = [], 0
+        for count in self.counts:
+            total += count
+            ret.append(total)
+        return ret
+
+    def quantile(self, q: float) -> float:
+        """estimate the q-quantile (0 <= q <= 1) by linear interpolation in its bucket, like Prometheus
+        `histogram_quantile`; returns the largest bucket bound if the quantile falls in the +Inf bucket,
+        returns 0.0 if there is no observation.
+        """
+
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        cumulative = self.cumulative_counts()
+        index = bisect.bisect_left(cumulative, rank)
+        if index >= len(self.buckets):
+            return self.buckets[-1]
+        lower = self.buckets[index - 1] if index > 0 else 0.0
+        below = cumulative[index - 1] if index > 0 else 0
+        if self.counts[index] == 0:
+            return lower
+        return lower + (self.buckets[index] - lower) * (rank - below) / self.counts[index]
+
+
+class _MethodMetrics:
+    def __init__(self, buckets: typing.Sequence[float]) -> None:
+        self.latency: Histogram = Histogram(buckets)
+        self.requests: int = 0
+        self.errors: typing.Dict[str, int] = collections.defaultdict(int)
+        self.retries: int = 0
+        self.request_bytes: int = 0
+        self.response_bytes: int = 0
+        self.network_secs: float = 0.0
+        self.parse_secs: float = 0.0
+
+
+class MetricsCollector(ClientHook):
+    """Collects per method metrics as a `Client` hook, thread-safe; one collector can be shared by clients"""
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._buckets = buckets
+        self._methods: typing.Dict[str, _MethodMetrics] = {}
+        self._lock = threading.Lock()
+
+    def post_response(self, call: RpcCall) -> None:
+        self._observe(call, None)
+
+    def on_error(self, call: RpcCall, error: Exception) -> None:
+        self._observe(call, type(error).__name__)
+
+    def on_retry(self, method: str, error: Exception, tries: int) -> None:
+        with self._lock:
+            self._method(method).retries += 1
+
+    def methods(self) -> typing.List[str]:
+        with self._lock:
+            return sorted(self._methods)
+
+    def latency(self, method: str) -> Histogram:
+        """a copy of the method's latency histogram"""
+
+        with self._lock:
+            ret = Histogram(self._buckets)
+            m = self._methods.get(method)
+            if m is not None:
+                ret.counts, ret.sum, ret.count = list(m.latency.counts), m.latency.sum, m.latency.count
+            return ret
+
+    def reset(self) -> None:
+        with self._lock:
+            self._methods.clear()
+
+    def to_prometheus(self, prefix: str = DEFAULT_PREFIX) -> str:
+        """export metrics in Prometheus text exposition format"""
+
+        lines = []
+
+        def metric(name: str, typ: str, doc: str) -> str:
+            lines.append(f"# HELP {prefix}_{name} {doc}")
+            lines.append(f"# TYPE {prefix}_{name} {typ}")
+            return f"{prefix}_{name}"
+
+        with self._lock:
+            methods = sorted(self._methods.items())
+
+            name = metric("request_duration_seconds", "histogram", "JSON-RPC request latency in seconds.")
+            for method, m in methods:
+                cumulative = m.latency.cumulative_counts()
+                for bound, count in zip(m.latency.buckets, cumulative):
+                    lines.append(f'{name}_bucket{{method="{method}",le="{_format(bound)}"}} {count}')
+                lines.append(f'{name}_bucket{{method="{method}",le="+Inf"}} {cumulative[-1]}')
+                lines.append(f'{name}_sum{{method="{method}"}} {_format(m.latency.sum)}')
+                lines.append(f'{name}_count{{method="{method}"}} {m.latency.count}')
+
+            counters = [
+                ("requests_total", "JSON-RPC requests sent.", lambda m: m.requests),
+                ("retries_total", "JSON-RPC method calls retried.", lambda m: m.retries),
+                ("request_bytes_total", "JSON-RPC request bytes sent.", lambda m: m.request_bytes),
+                ("response_bytes_total", "JSON-RPC response bytes received.", lambda m: m.response_bytes),
+                ("network_seconds_total", "Seconds waiting for JSON-RPC responses.", lambda m: m.network_secs),
+                ("parse_seconds_total", "Seconds decoding JSON-RPC responses.", lambda m: m.parse_secs),
+            ]
+            for counter, doc, value in counters:
+                name = metric(counter, "counter", doc)
+                for method, m in methods:
+                    lines.append(f'{name}{{method="{method}"}} {_format(value(m))}')
+
+            name = metric("errors_total", "counter", "JSON-RPC requests failed, by exception type.")
+            for method, m in methods:
+                for error, count in sorted(m.errors.items()):
+                    lines.append(f'{name}{{method="{method}",error="{error}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def _observe(self, call: RpcCall, error: typing.Optional[str]) -> None:
+        elapsed = call.elapsed_secs()
+        request_bytes = call.request_bytes
+        with self._lock:
+            m = self._method(call.method)
+            m.latency.observe(elapsed)
+            m.requests += 1
+            m.request_bytes += request_bytes
+            m.response_bytes += call.response_bytes
+            m.network_secs += call.network_secs
+            m.parse_secs += call.parse_secs
+            if error:
+                m.errors[error] += 1
+
+    def _method(self, method: str) -> _MethodMetrics:
+        m = self._methods.get(method)
+        if m is None:
+            m = self._methods[method] = _MethodMetrics(self._buckets)
+        return m
+
+
+def _format(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
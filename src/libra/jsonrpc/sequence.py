@@ -0,0 +1,195 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Local sequence number allocation for submitting many transactions from the same sender account.
+
+Calling `Client.get_account_sequence` before every transaction costs a round trip per transaction, and
+concurrent workers may get the same sequence number. `SequenceNumberAllocator` loads the sequence number of
+an account once, and then allocates sequence numbers locally:
+
+```python
+allocator = jsonrpc.SequenceNumberAllocator(client)
+
+with allocator.allocation(account.account_address) as seq:
+    txn = account.sign(create_raw_transaction(seq))
+    client.submit(txn)
+client.wait_for_transaction(txn)
+allocator.confirm(account.account_address, seq)
+```
+
+When a transaction expires, or the server rejects a transaction because of its sequence number, the
+following transactions will not be executed either, so the allocator resynchronizes the account's sequence
+number from the server (`get_account`) and drops all pending sequence numbers.
+
+All methods are thread-safe. In asyncio code, use `allocate_async` and `resync_async`: they run the network
+calls in the event loop's default executor, instead of blocking the event loop.
+"""
+
+import asyncio
+import contextlib
+import dataclasses
+import heapq
+import threading
+import typing
+
+from .. import libra_types, utils
+from .client import Client, JsonRpcError, TransactionExpired
+
+
+# JSON-RPC submit error VM status codes of invalid sequence number
+SEQUENCE_NUMBER_ERROR_CODES: typing.List[str] = ["SEQUENCE_NUMBER_TOO_OLD", "SEQUENCE_NUMBER_TOO_NEW"]
+
+Address = typing.Union[libra_types.AccountAddress, str]
+
+
+def is_sequence_number_error(error: BaseException) -> bool:
+    """Returns True if the error means the account's local sequence number is out of sync
+
+    Which is `TransactionExpired`, or `JsonRpcError` with one of `SEQUENCE_NUMBER_ERROR_CODES`.
+    """
+
+    if isinstance(error, TransactionExpired):
+        return True
+    if isinstance(error, JsonRpcError):
+        message = str(error)
+        return any(code in message for code in SEQUENCE_NUMBER_ERROR_CODES)
+    return False
+
+
+@dataclasses.dataclass
+class _AccountSequence:
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+    # None before loading sequence number from server
+    next: typing.Optional[int] = None
+    pending: typing.Set[int] = dataclasses.field(default_factory=set)
+    # min heap of released sequence numbers, reused before allocating new ones
+    released: typing.List[int] = dataclasses.field(default_factory=list)
+
+
+class SequenceNumberAllocator:
+    """SequenceNumberAllocator allocates sequence numbers of sender accounts locally"""
+
+    def __init__(self, client: Client) -> None:
+        self._client: Client = client
+        self._lock = threading.Lock()
+        self._accounts: typing.Dict[str, _AccountSequence] = {}
+
+    def allocate(self, address: Address) -> int:
+        """Allocates next sequence number of the account
+
+        Loads the sequence number from the server with the first call for the account; raises
+        `AccountNotFoundError` if the account does not exist.
+        The allocated sequence number is pending until it is confirmed or released.
+        """
+
+        account = self._account(address)
+        with account.lock:
+            if account.next is None:
+                account.next = self._client.get_account_sequence(address)
+            return self._allocate_loaded(account)
+
+    async def allocate_async(self, address: Address) -> int:
+        """Same with `allocate`, but does not block the event loop when loading sequence number from server
+
+        Allocates in the event loop thread only if the sequence number is loaded and the account lock is free,
+        otherwise waits for `allocate` in the default executor.
+        """
+
+        account = self._account(address)
+        if account.next is not None and account.lock.acquire(blocking=False):
+            try:
+                return self._allocate_loaded(account)
+            finally:
+                account.lock.release()
+        return await asyncio.get_running_loop().run_in_executor(None, self.allocate, address)
+
+    def confirm(self, address: Address, seq: int) -> None:
+        """Confirms the transaction of the sequence number is executed, it is no longer pending"""
+
+        account = self._account(address)
+        with account.lock:
+            account.pending.discard(seq)
+
+    def release(self, address: Address, seq: int) -> None:
+        """Releases a pending sequence number of a transaction that is not submitted
+
+        The sequence number will be allocated again by the next `allocate` call. Does nothing if the sequence
+        number is not pending, e.g. it was dropped by `resync`.
+        """
+
+        account = self._account(address)
+        with account.lock:
+            if seq in account.pending:
+                account.pending.remove(seq)
+                heapq.heappush(account.released, seq)
+
+    def resync(self, address: Address) -> int:
+        """Reloads the account sequence number from the server, drops pending and released sequence numbers
+
+        Returns the account sequence number, which is the next allocated sequence number.
+        """
+
+        account = self._account(address)
+        with account.lock:
+            account.next = self._client.get_account_sequence(address)
+            account.pending.clear()
+            account.released.clear()
+            return account.next
+
+    async def resync_async(self, address: Address) -> int:
+        """Same with `resync`, but does not block the event loop"""
+
+        return await asyncio.get_running_loop().run_in_executor(None, self.resync, address)
+
+    def handle_error(self, address: Address, error: BaseException) -> bool:
+        """Resyncs the account sequence number if the error is a sequence number error
+
+        Returns True if resynchronized, see `is_sequence_number_error`.
+        """
+
+        if is_sequence_number_error(error):
+            self.resync(address)
+            return True
+        return False
+
+    def pending(self, address: Address) -> typing.List[int]:
+        """Returns pending sequence numbers of the account in ascending order"""
+
+        account = self._account(address)
+        with account.lock:
+            return sorted(account.pending)
+
+    @contextlib.contextmanager
+    def allocation(self, address: Address) -> typing.Iterator[int]:
+        """Allocates a sequence number for creating and submitting a transaction within the `with` block
+
+        If the block raises a sequence number error, the account is resynchronized; if the block raises other
+        errors, the sequence number is released. The error is re-raised in both cases.
+        """
+
+        seq = self.allocate(address)
+        try:
+            yield seq
+        except BaseException as e:
+            if not self.handle_error(address, e):
+                self.release(address, seq)
+            raise
+
+    def _allocate_loaded(self, account: _AccountSequence) -> int:
+        """allocates a sequence number of an account with loaded sequence number, the account lock is held"""
+
+        if account.released:
+            seq = heapq.heappop(account.released)
+        else:
+            seq = typing.cast(int, account.next)
+            account.next = seq + 1
+        account.pending.add(seq)
+        return seq
+
+    def _account(self, address: Address) -> _AccountSequence:
+        key = utils.account_address_hex(address)
+        account = self._accounts.get(key)
+        if account is None:
+            with self._lock:
+                account = self._accounts.setdefault(key, _AccountSequence())
+        return account
@@ -0,0 +1,131 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Transports send JSON-RPC requests for `Client`, and return the raw response body.
+
+`Client` uses `RequestsTransport` (HTTP POST with `requests`) by default. `RecordingTransport` wraps another
+transport and saves every request and response into a JSON lines file; `ReplayTransport` loads the file and
+returns the recorded responses without network, so that client overhead (response JSON decoding, protobuf
+parsing) can be measured and tested in isolation:
+
+```python
+# record
+client = jsonrpc.Client(url, transport=jsonrpc.RecordingTransport(jsonrpc.RequestsTransport(url), "rec.jsonl"))
+client.get_transactions(0, 100)
+
+# replay
+client = jsonrpc.Client(url, transport=jsonrpc.ReplayTransport.load("rec.jsonl"))
+client.get_transactions(0, 100)
+```
+
+A transport raises `requests.RequestException` or `NetworkError` when the request can't be sent or the server
+responses with an HTTP error, `Client` converts `requests.RequestException` into `NetworkError`.
+"""
+
+import json
+import threading
+import typing
+
+import requests
+
+DEFAULT_CONNECT_TIMEOUT_SECS: float = 5.0
+DEFAULT_TIMEOUT_SECS: float = 30.0
+
+Request = typing.Dict[str, typing.Any]  # pyre-ignore
+
+
+class Record(typing.NamedTuple):
+    request: Request
+    response: str
+
+
+class RecordNotFoundError(Exception):
+    pass
+
+
+class Transport:
+    """Sends a JSON-RPC request object, returns response body"""
+
+    def send(self, request: Request) -> str:
+        raise NotImplementedError()
+
+
+class RequestsTransport(Transport):
+    """HTTP POST request to the server url with `requests.Session`
+
+    `timeout` is the (connect, read) timeout seconds, defaults to
+    (`DEFAULT_CONNECT_TIMEOUT_SECS`, `DEFAULT_TIMEOUT_SECS`).
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        session: typing.Optional[requests.Session] = None,
+        timeout: typing.Optional[typing.Tuple[float, float]] = None,
+    ) -> None:
+        self._url: str = server_url
+        self._session: requests.Session = session or requests.Session()
+        self._timeout: typing.Tuple[float, float] = timeout or (DEFAULT_CONNECT_TIMEOUT_SECS, DEFAULT_TIMEOUT_SECS)
+
+    def send(self, request: Request) -> str:
+        response = self._session.post(self._url, json=request, timeout=self._timeout)
+        response.raise_for_status()
+        return response.text
+
+
+def request_key(request: Request) -> str:
+    """Key for matching a recorded response: method and params, request id is ignored"""
+
+    return json.dumps([request.get("method"), request.get("params")], sort_keys=True)
+
+
+class RecordingTransport(Transport):
+    """Sends requests with given transport, and appends request and response as a JSON line into the file
+
+    Failed requests are not recorded.
+    """
+
+    def __init__(self, transport: Transport, path: str) -> None:
+        self._transport = transport
+        self._path = path
+        self._lock = threading.Lock()
+
+    def send(self, request: Request) -> str:
+        response = self._transport.send(request)
+        line = json.dumps(Record(request, response)._asdict())
+        with self._lock:
+            with open(self._path, "a") as f:
+                f.write(line + "\n")
+        return response
+
+
+class ReplayTransport(Transport):
+    """Returns recorded responses of the same method and params
+
+    Responses recorded for the same method and params are returned in the recorded order, then the last one is
+    returned for all following requests, so that a client polling a recorded state ends at the latest state.
+    Raises `RecordNotFoundError` if there is no recorded response for the request.
+    """
+
+    @staticmethod
+    def load(path: str) -> "ReplayTransport":
+        with open(path) as f:
+            return ReplayTransport([Record(**json.loads(line)) for line in f if line.strip()])
+
+    def __init__(self, records: typing.Iterable[Record]) -> None:
+        self._responses: typing.Dict[str, typing.List[str]] = {}
+        for record in records:
+            self._responses.setdefault(request_key(record.request), []).append(record.response)
+        self._next: typing.Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def send(self, request: Request) -> str:
+        key = request_key(request)
+        responses = self._responses.get(key)
+        if not responses:
+            raise RecordNotFoundError(f"no recorded response for request: {key}")
+        with self._lock:
+            index = self._next.get(key, 0)
+            if index + 1 < len(responses):
+                self._next[key] = index + 1
+        return responses[index]
@@ -4,6 +4,8 @@
 import dataclasses
 import collections
 import io
+import mmap
+import threading
 import typing
 from copy import copy
 from typing import get_type_hints
@@ -16,16 +18,41 @@ MAX_U32 = (1 << 32) - 1
 MAX_CONTAINER_DEPTH = 500
 
 
+def uleb128(value: int) -> bytes:
+    """encode an unsigned int as LCS uleb128 bytes, used for length and variant index prefixes"""
+
+    if value < 0x80:
+        return bytes((value,))
+    ret = bytearray()
+    while value >= 0x80:
+        ret.append((value & 0x7F) | 0x80)
+        value >>= 7
+    ret.append(value)
+    return bytes(ret)
+
+
 class LcsSerializer(sb.BinarySerializer):
-    def __init__(self):
-        super().__init__(output=io.BytesIO(), container_depth_budget=MAX_CONTAINER_DEPTH)
+    """LCS serializer appends to `output` (a new `bytearray` by default).
+
+    A serializer can be reused for serializing many values: `reset` clears the output and the container depth
+    budget; `serialize_into` serializes into a caller owned `bytearray`.
+    """
+
+    def __init__(self, output: typing.Optional[bytearray] = None):
+        super().__init__(output=bytearray() if output is None else output, container_depth_budget=MAX_CONTAINER_DEPTH)
+
+    def reset(self, output: typing.Optional[bytearray] = None):
+        if output is None:
+            del self.output[:]
+        else:
+            self.output = output
+        self.container_depth_budget = MAX_CONTAINER_DEPTH
 
     def serialize_u32_as_uleb128(self, value: int):
         while value >= 0x80:
-            b = (value & 0x7F) | 0x80
-            self.output.write(b.to_bytes(1, "little", signed=False))
+            self.output.append((value & 0x7F) | 0x80)
             value >>= 7
-        self.output.write(value.to_bytes(1, "little", signed=False))
+        self.output.append(value)
 
     def serialize_len(self, value: int):
         if value > MAX_LENGTH:
@@ -40,22 +67,19 @@ class LcsSerializer(sb.BinarySerializer):
     def sort_map_entries(self, offsets: typing.List[int]):
         if len(offsets) < 1:
             return
-        buf = self.output.getbuffer()
-        offsets.append(len(buf))
+        offsets.append(len(self.output))
         slices = []
         for i in range(1, len(offsets)):
-            slices.append(bytes(buf[offsets[i - 1] : offsets[i]]))
-        buf.release()
+            slices.append(bytes(self.output[offsets[i - 1] : offsets[i]]))
         slices.sort()
-        self.output.seek(offsets[0])
-        for s in slices:
-            self.output.write(s)
-        assert offsets[-1] == len(self.output.getbuffer())
+        self.output[offsets[0] :] = b"".join(slices)
+        assert offsets[-1] == len(self.output)
 
 
 class LcsDeserializer(sb.BinaryDeserializer):
     def __init__(self, content):
-        super().__init__(input=io.BytesIO(content), container_depth_budget=MAX_CONTAINER_DEPTH)
+        input = content if isinstance(content, (io.BytesIO, sb.BufferReader)) else io.BytesIO(content)
+        super().__init__(input=input, container_depth_budget=MAX_CONTAINER_DEPTH)
 
     def deserialize_uleb128_as_u32(self) -> int:
         value = 0
@@ -88,13 +112,93 @@ class LcsDeserializer(sb.BinaryDeserializer):
             raise st.DeserializationError("Serialized keys in a map must be ordered by increasing lexicographic order")
 
 
+# reusable serializer per thread, taken out while in use so nested calls create their own serializer
+_SERIALIZERS = threading.local()
+
+
 def serialize(obj: typing.Any, obj_type) -> bytes:
-    serializer = LcsSerializer()
-    serializer.serialize_any(obj, obj_type)
-    return serializer.get_buffer()
+    serializer = _SERIALIZERS.__dict__.pop("serializer", None) or LcsSerializer()
+    try:
+        serializer.serialize_any(obj, obj_type)
+        return serializer.get_buffer()
+    finally:
+        serializer.reset()
+        _SERIALIZERS.serializer = serializer
+
+
+def serialize_into(obj: typing.Any, obj_type, buffer: bytearray) -> int:
+    """Append LCS bytes of obj to buffer, returns number of bytes appended.
+
+    Reusing one buffer for serializing many values avoids allocating an output buffer and copying the result
+    per value. The buffer is restored to its original length if serialization fails.
+    """
+
+    serializer = _SERIALIZERS.__dict__.pop("serializer", None) or LcsSerializer()
+    output = serializer.output
+    start = len(buffer)
+    serializer.reset(output=buffer)
+    try:
+        serializer.serialize_any(obj, obj_type)
+    except BaseException:
+        del buffer[start:]
+        raise
+    finally:
+        # give the serializer back its own output, so that it never writes into the caller's buffer again
+        serializer.reset(output=output)
+        _SERIALIZERS.serializer = serializer
+    return len(buffer) - start
 
 
 def deserialize(content: bytes, obj_type) -> typing.Tuple[typing.Any, bytes]:
     deserializer = LcsDeserializer(content)
     value = deserializer.deserialize_any(obj_type)
     return value, deserializer.get_remaining_buffer()
+
+
+def deserialize_stream(source, obj_type) -> typing.Iterator[typing.Any]:
+    """Lazily deserialize concatenated LCS values of the same type.
+
+    `source` is a file path, a binary file object (memory mapped when possible, starting at the current
+    position), or a buffer (`bytes`, `bytearray`, `memoryview`, `mmap.mmap`). Values are decoded in place at
+    a moving offset, the remaining input is never copied. When the iteration ends, a seekable file object is
+    positioned right after the last value yielded, i.e. at the start of the next (or the invalid) record.
+
+    Raises `serde_types.DeserializationError` with the record offset if a record is invalid or truncated.
+    """
+
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            yield from deserialize_stream(f, obj_type)
+        return
+
+    file, mapped, offset = None, None, 0
+    if not isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        file = source
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            source, offset = mapped, file.tell()
+        except (OSError, ValueError):  # e.g. in-memory, pipe or empty file
+            source = file.read()
+
+    # io.BytesIO shares the bytes object until it is modified, and reads faster than BufferReader
+    reader = io.BytesIO(source) if isinstance(source, bytes) else sb.BufferReader(source, offset)
+    deserializer = LcsDeserializer(reader)
+    end = memoryview(source).nbytes
+    # the file position matches this reader offset: the start offset when mapped, otherwise the end of input
+    file_offset = end if mapped is None else offset
+    consumed = reader.tell()
+    try:
+        while consumed < end:
+            try:
+                value = deserializer.deserialize_any(obj_type)
+            except st.DeserializationError as e:
+                raise st.DeserializationError(f"Invalid record at offset {consumed}", *e.args)
+            consumed = reader.tell()
+            yield value
+    finally:
+        if file is not None and file.seekable():
+            file.seek(consumed - file_offset, io.SEEK_CUR)
+        if isinstance(reader, sb.BufferReader):
+            reader.release()
+        if mapped is not None:
+            mapped.close()
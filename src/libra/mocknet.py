@@ -0,0 +1,599 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Provides an in-memory stand-in for a Libra full node JSON-RPC service, for testing clients offline.
+
+```python
+
+from libra import mocknet, LocalAccount
+
+# start a local JSON-RPC server on a random port, with 10ms latency and 10% stale responses
+with mocknet.FullNode(faults=mocknet.Faults(latency_secs=0.01, stale_rate=0.1, seed=1)) as node:
+    client = node.create_client()
+
+    account = LocalAccount.generate()
+    node.ledger.mint(account.account_address, 1_000_000, "Coin1")
+    print(client.get_account(account.account_address))
+
+```
+
+`Ledger` implements `get_metadata`, `get_currencies`, `get_account`, `get_account_transaction`,
+`get_account_transactions`, `get_transactions`, `get_events` and `submit` against in-memory account states.
+Submitted transactions are validated (chain id, expiration, sequence number and optionally signature),
+and executed in sequence number order: peer to peer transfer scripts move balances and emit sent / received
+payment events, other scripts only increase the sender's sequence number; write set and module payloads fail
+with `miscellaneous_error` VM status. There is no gas charge.
+
+`FullNode` serves a `Ledger` over HTTP JSON-RPC (including batch requests) on localhost, and injects
+latency, stale responses and errors configured by `Faults`; `FullNode.handle` serves requests in-process.
+"""
+
+import dataclasses
+import hashlib
+import http.server
+import json
+import random
+import threading
+import time
+import typing
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+
+from . import chain_ids, jsonrpc, libra_types, script_codec, stdlib, utils
+from .jsonrpc import constants
+
+CHAIN_ID: libra_types.ChainId = chain_ids.TESTING
+CURRENCIES: typing.List[str] = ["Coin1", "Coin2", "LBR"]
+
+# Move abort codes of peer to peer transfer failures: reason << 8 | category
+ABORT_CODE_INSUFFICIENT_BALANCE: int = 10 << 8 | 8  # LibraAccount::EINSUFFICIENT_BALANCE, LIMIT_EXCEEDED
+ABORT_CODE_PAYEE_DOES_NOT_EXIST: int = 17 << 8 | 5  # LibraAccount::EPAYEE_DOES_NOT_EXIST, NOT_PUBLISHED
+
+# JSON-RPC error codes
+INVALID_REQUEST: int = -32600
+METHOD_NOT_FOUND: int = -32601
+INVALID_PARAMS: int = -32602
+SERVER_ERROR: int = -32000
+VM_VALIDATION_ERROR: int = -32001
+MEMPOOL_ERROR: int = -32002
+
+Address = typing.Union[libra_types.AccountAddress, bytes, str]
+JsonObject = typing.Dict[str, typing.Any]  # pyre-ignore
+
+
+class RpcError(Exception):
+    """JSON-RPC error response"""
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+    def to_json(self) -> JsonObject:
+        return {"code": self.code, "message": self.message}
+
+
+def vm_validation_error(status: str) -> RpcError:
+    return RpcError(VM_VALIDATION_ERROR, f"Server error: VM Validation error: {status}")
+
+
+def event_key(counter: int, address: str) -> str:
+    return counter.to_bytes(8, "little").hex() + address
+
+
+@dataclasses.dataclass
+class _Account:
+    address: str
+    authentication_key: str
+    role: JsonObject
+    sequence_number: int = 0
+    balances: typing.Dict[str, int] = dataclasses.field(default_factory=dict)
+
+    @property
+    def received_events_key(self) -> str:
+        return event_key(0, self.address)
+
+    @property
+    def sent_events_key(self) -> str:
+        return event_key(1, self.address)
+
+    def to_json(self) -> JsonObject:
+        return {
+            "address": self.address,
+            "balances": [{"amount": amount, "currency": currency} for currency, amount in self.balances.items()],
+            "sequence_number": self.sequence_number,
+            "authentication_key": self.authentication_key,
+            "sent_events_key": self.sent_events_key,
+            "received_events_key": self.received_events_key,
+            "delegated_key_rotation_capability": False,
+            "delegated_withdrawal_capability": False,
+            "is_frozen": False,
+            "role": self.role,
+        }
+
+
+class Ledger:
+    """In-memory ledger state and JSON-RPC methods, thread-safe
+
+    With `auto_commit` (default), submitted transactions are executed immediately when all previous
+    transactions of the sender are executed; otherwise they stay in mempool until `commit` is called.
+    With `auto_create_accounts` (default), transaction senders and payees are created on first use, instead of
+    rejecting or aborting the transaction.
+    The ledger timestamp follows `clock` (default `time.time`), and moves forward by at least 1 microsecond
+    for each version.
+    """
+
+    def __init__(
+        self,
+        chain_id: libra_types.ChainId = CHAIN_ID,
+        currencies: typing.Optional[typing.List[str]] = None,
+        auto_commit: bool = True,
+        auto_create_accounts: bool = True,
+        verify_signatures: bool = False,
+        clock: typing.Callable[[], float] = time.time,
+    ) -> None:
+        self.chain_id: int = chain_id.to_int()
+        self.currencies: typing.List[str] = currencies or CURRENCIES
+        self.auto_commit = auto_commit
+        self.auto_create_accounts = auto_create_accounts
+        self.verify_signatures = verify_signatures
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._accounts: typing.Dict[str, _Account] = {}
+        self._mempool: typing.Dict[typing.Tuple[str, int], libra_types.SignedTransaction] = {}
+        self._events: typing.Dict[str, typing.List[JsonObject]] = {}
+        self._timestamps: typing.List[int] = []
+        self._transactions: typing.List[JsonObject] = []
+        # sender account address => executed transactions of the sender, indexed by sequence number
+        self._account_transactions: typing.Dict[str, typing.List[JsonObject]] = {}
+        self._append_transaction({"type": constants.TRANSACTION_DATA_WRITE_SET}, [])
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return len(self._transactions) - 1
+
+    def state(self, version: typing.Optional[int] = None) -> typing.Tuple[int, int, int]:
+        """Returns (chain id, version, timestamp usecs) of given or latest version"""
+
+        with self._lock:
+            version = self.version if version is None else max(0, min(version, self.version))
+            return (self.chain_id, version, self._timestamps[version])
+
+    def create_account(
+        self, address: Address, auth_key: typing.Optional[bytes] = None, role: str = constants.ACCOUNT_ROLE_UNKNOWN
+    ) -> None:
+        """Create account with zero balances, the authentication key defaults to zero prefix and the address"""
+
+        address = utils.account_address_hex(utils.account_address(address))
+        auth_key_hex = auth_key.hex() if auth_key else "00" * utils.ACCOUNT_ADDRESS_LEN + address
+        with self._lock:
+            if address not in self._accounts:
+                balances = {currency: 0 for currency in self.currencies}
+                self._accounts[address] = _Account(address, auth_key_hex, {"type": role}, balances=balances)
+
+    def mint(self, address: Address, amount: int, currency: str) -> None:
+        """Add amount to the account balance, creates the account if it does not exist"""
+
+        self.create_account(address)
+        with self._lock:
+            balances = self._accounts[utils.account_address_hex(utils.account_address(address))].balances
+            balances[currency] = balances.get(currency, 0) + amount
+
+    def submit(self, txn: typing.Union[libra_types.SignedTransaction, str]) -> None:
+        """Validate and add signed transaction into mempool, raises RpcError for invalid transaction"""
+
+        if isinstance(txn, str):
+            try:
+                txn = libra_types.SignedTransaction.lcs_deserialize(bytes.fromhex(txn))
+            except Exception as e:
+                raise RpcError(INVALID_PARAMS, f"Invalid params: invalid signed transaction: {e}")
+
+        raw_txn = txn.raw_txn
+        sender = raw_txn.sender.to_hex()
+        public_key = txn.authenticator.public_key.value
+        with self._lock:
+            if raw_txn.chain_id.to_int() != self.chain_id:
+                raise vm_validation_error("BAD_CHAIN_ID")
+            if raw_txn.expiration_timestamp_secs * 1_000_000 <= self._timestamps[-1]:
+                raise vm_validation_error("TRANSACTION_EXPIRED")
+            if sender not in self._accounts:
+                if not self.auto_create_accounts:
+                    raise vm_validation_error("SENDING_ACCOUNT_DOES_NOT_EXIST")
+                self.create_account(sender, utils.hash(public_key, b"\x00"))
+            account = self._accounts[sender]
+            if self.verify_signatures:
+                self._verify_signature(account, txn)
+            seq = int(raw_txn.sequence_number)
+            if seq < account.sequence_number:
+                raise vm_validation_error("SEQUENCE_NUMBER_TOO_OLD")
+            if (sender, seq) in self._mempool:
+                raise RpcError(MEMPOOL_ERROR, "Mempool submission error: transaction already exists")
+            self._mempool[(sender, seq)] = txn
+            if self.auto_commit:
+                self._commit_account(account)
+
+    def commit(self) -> int:
+        """Execute all executable transactions in mempool, returns number of transactions executed"""
+
+        with self._lock:
+            version = self.version
+            for account in [self._accounts[sender] for sender, _ in list(self._mempool)]:
+                self._commit_account(account)
+            return self.version - version
+
+    def execute(self, method: str, params: typing.List[typing.Any]) -> typing.Any:  # pyre-ignore
+        """Execute JSON-RPC method, returns JSON result, raises RpcError"""
+
+        fn = getattr(self, f"_rpc_{method}", None)
+        if fn is None:
+            raise RpcError(METHOD_NOT_FOUND, f"Method not found: {method}")
+        try:
+            with self._lock:
+                return fn(*params)
+        except (TypeError, ValueError, utils.InvalidAccountAddressError) as e:
+            raise RpcError(INVALID_PARAMS, f"Invalid params: {e}")
+
+    # JSON-RPC methods
+
+    def _rpc_get_metadata(self, version: typing.Optional[int] = None) -> JsonObject:
+        chain_id, version, timestamp = self.state(version)
+        return {"version": version, "timestamp": timestamp, "chain_id": chain_id}
+
+    def _rpc_get_currencies(self) -> typing.List[JsonObject]:
+        return [
+            {
+                "code": code,
+                "scaling_factor": 1_000_000,
+                "fractional_part": 100,
+                "to_lbr_exchange_rate": 1.0,
+                "mint_events_key": event_key(i * 5, utils.CORE_CODE_ADDRESS),
+                "burn_events_key": event_key(i * 5 + 1, utils.CORE_CODE_ADDRESS),
+                "preburn_events_key": event_key(i * 5 + 2, utils.CORE_CODE_ADDRESS),
+                "cancel_burn_events_key": event_key(i * 5 + 3, utils.CORE_CODE_ADDRESS),
+                "exchange_rate_update_events_key": event_key(i * 5 + 4, utils.CORE_CODE_ADDRESS),
+            }
+            for i, code in enumerate(self.currencies)
+        ]
+
+    def _rpc_get_account(self, address: str) -> typing.Optional[JsonObject]:
+        account = self._accounts.get(utils.account_address_hex(address))
+        return account.to_json() if account else None
+
+    def _rpc_get_account_transaction(
+        self, address: str, seq: int, include_events: bool = False
+    ) -> typing.Optional[JsonObject]:
+        txns = self._rpc_get_account_transactions(address, seq, 1, include_events)
+        return txns[0] if txns else None
+
+    def _rpc_get_account_transactions(
+        self, address: str, seq: int, limit: int, include_events: bool = False
+    ) -> typing.List[JsonObject]:
+        txns = self._account_transactions.get(utils.account_address_hex(address), [])
+        start = max(0, int(seq))
+        return [self._transaction_json(txn, include_events) for txn in txns[start : start + int(limit)]]
+
+    def _rpc_get_transactions(self, start: int, limit: int, include_events: bool = False) -> typing.List[JsonObject]:
+        txns = self._transactions[int(start) : int(start) + int(limit)]
+        return [self._transaction_json(txn, include_events) for txn in txns]
+
+    def _rpc_get_events(self, key: str, start: int, limit: int) -> typing.List[JsonObject]:
+        return self._events.get(key, [])[int(start) : int(start) + int(limit)]
+
+    def _rpc_submit(self, txn: str) -> None:
+        self.submit(txn)
+
+    # execution
+
+    def _verify_signature(self, account: _Account, txn: libra_types.SignedTransaction) -> None:
+        public_key = txn.authenticator.public_key.value
+        if utils.hash(public_key, b"\x00").hex() != account.authentication_key:
+            raise vm_validation_error("INVALID_AUTH_KEY")
+        try:
+            Ed25519PublicKey.from_public_bytes(public_key).verify(
+                txn.authenticator.signature.value, utils.raw_transaction_signing_msg(txn.raw_txn)
+            )
+        except (InvalidSignature, ValueError):
+            raise vm_validation_error("INVALID_SIGNATURE")
+
+    def _commit_account(self, account: _Account) -> None:
+        while True:
+            txn = self._mempool.pop((account.address, account.sequence_number), None)
+            if txn is None:
+                return
+            if txn.raw_txn.expiration_timestamp_secs * 1_000_000 <= self._next_timestamp():
+                continue
+            self._execute(account, txn)
+
+    def _execute(self, sender: _Account, txn: libra_types.SignedTransaction) -> None:
+        raw_txn = txn.raw_txn
+        version = len(self._transactions)
+        events: typing.List[JsonObject] = []
+        payload = raw_txn.payload
+        if isinstance(payload, libra_types.TransactionPayload__Script):
+            script_fields, vm_status = self._execute_script(sender, payload.value, version, events)
+        else:
+            # write set and module payloads are not supported
+            script_fields = {"script_hash": "", "script_bytes": "", "script": {"type": constants.SCRIPT_UNKNOWN}}
+            vm_status = {"type": constants.VM_STATUS_MISC_ERROR}
+
+        sender.sequence_number += 1
+        signed_bytes = txn.lcs_serialize()
+        transaction = {
+            "type": constants.TRANSACTION_DATA_USER,
+            "sender": sender.address,
+            "signature_scheme": "Scheme::Ed25519",
+            "signature": txn.authenticator.signature.value.hex(),
+            "public_key": txn.authenticator.public_key.value.hex(),
+            "sequence_number": int(raw_txn.sequence_number),
+            "chain_id": raw_txn.chain_id.to_int(),
+            "max_gas_amount": int(raw_txn.max_gas_amount),
+            "gas_unit_price": int(raw_txn.gas_unit_price),
+            "gas_currency": raw_txn.gas_currency_code,
+            "expiration_timestamp_secs": int(raw_txn.expiration_timestamp_secs),
+            **script_fields,
+        }
+        self._append_transaction(
+            transaction,
+            events,
+            hash=script_codec.signed_transaction_hash(signed_bytes),
+            bytes="00" + signed_bytes.hex(),
+            vm_status=vm_status,
+        )
+
+    def _execute_script(
+        self, sender: _Account, script: libra_types.Script, version: int, events: typing.List[JsonObject]
+    ) -> typing.Tuple[JsonObject, JsonObject]:
+        """executes the script, appends emitted events; returns (script fields of transaction JSON, VM status)"""
+
+        vm_status = {"type": constants.VM_STATUS_EXECUTED}
+        script_bytes = script.lcs_serialize()
+        script_json = {
+            "type": constants.SCRIPT_UNKNOWN,
+            "code": script.code.hex(),
+            "arguments": [str(arg) for arg in script.args],
+            "type_arguments": [utils.type_tag_to_str(tag) for tag in script.ty_args],
+        }
+        try:
+            call = script_codec.decode_script(script_bytes)
+        except ValueError:
+            call = None
+        if isinstance(call, stdlib.ScriptCall__PeerToPeerWithMetadata):
+            currency = utils.type_tag_to_str(call.currency)
+            amount = int(call.amount)
+            receiver = call.payee.to_hex()
+            script_json = {
+                "type": "peer_to_peer_with_metadata",
+                "receiver": receiver,
+                "amount": amount,
+                "currency": currency,
+                "metadata": call.metadata.hex(),
+                "metadata_signature": call.metadata_signature.hex(),
+            }
+            if receiver not in self._accounts and self.auto_create_accounts:
+                self.create_account(receiver)
+            if receiver not in self._accounts:
+                vm_status = self._move_abort(ABORT_CODE_PAYEE_DOES_NOT_EXIST)
+            elif sender.balances.get(currency, 0) < amount:
+                vm_status = self._move_abort(ABORT_CODE_INSUFFICIENT_BALANCE)
+            else:
+                payee = self._accounts[receiver]
+                sender.balances[currency] -= amount
+                payee.balances[currency] = payee.balances.get(currency, 0) + amount
+                data = {
+                    "amount": {"amount": amount, "currency": currency},
+                    "sender": sender.address,
+                    "receiver": receiver,
+                    "metadata": call.metadata.hex(),
+                }
+                events.append(self._emit(sender.sent_events_key, version, constants.EVENT_DATA_SENT_PAYMENT, data))
+                events.append(
+                    self._emit(payee.received_events_key, version, constants.EVENT_DATA_RECEIVED_PAYMENT, data)
+                )
+
+        script_fields = {
+            "script_hash": hashlib.sha3_256(script.code).hexdigest(),
+            "script_bytes": script_bytes.hex(),
+            "script": script_json,
+        }
+        return (script_fields, vm_status)
+
+    def _append_transaction(
+        self, transaction: JsonObject, events: typing.List[JsonObject], **fields: typing.Any  # pyre-ignore
+    ) -> None:
+        self._timestamps.append(self._next_timestamp())
+        txn = {
+            "version": len(self._transactions),
+            "transaction": transaction,
+            "hash": "",
+            "bytes": "",
+            "events": events,
+            "vm_status": {"type": constants.VM_STATUS_EXECUTED},
+            "gas_used": 0,
+        }
+        txn.update(fields)
+        self._transactions.append(txn)
+        if "sender" in transaction:
+            self._account_transactions.setdefault(transaction["sender"], []).append(txn)
+
+    def _next_timestamp(self) -> int:
+        now = int(self._clock() * 1_000_000)
+        return max(now, self._timestamps[-1] + 1) if self._timestamps else now
+
+    def _emit(self, key: str, version: int, typ: str, data: JsonObject) -> JsonObject:
+        events = self._events.setdefault(key, [])
+        event = {
+            "key": key,
+            "sequence_number": len(events),
+            "transaction_version": version,
+            "data": dict(data, type=typ),
+        }
+        events.append(event)
+        return event
+
+    def _move_abort(self, code: int) -> JsonObject:
+        return {
+            "type": constants.VM_STATUS_MOVE_ABORT,
+            "location": f"{utils.CORE_CODE_ADDRESS}::LibraAccount",
+            "abort_code": code,
+        }
+
+    def _transaction_json(self, txn: JsonObject, include_events: bool) -> JsonObject:
+        return txn if include_events else dict(txn, events=[])
+
+
+@dataclasses.dataclass
+class Faults:
+    """Latency, stale response and error injection of `FullNode` requests
+
+    Rates are probabilities of each HTTP request, drawn from a random generator seeded by `seed`, so that a
+    sequential client gets same faults in every run.
+    A stale response has ledger version (and the timestamp of the version) `stale_versions` behind the latest
+    ledger version in response, the response result is not affected.
+    """
+
+    latency_secs: float = 0.0
+    latency_jitter_secs: float = 0.0
+    stale_rate: float = 0.0
+    stale_versions: int = 1
+    http_error_rate: float = 0.0
+    jsonrpc_error_rate: float = 0.0
+    seed: typing.Optional[int] = None
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        status, response = self.server.node.handle_http(body)  # pyre-ignore
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format: str, *args: typing.Any) -> None:  # pyre-ignore
+        pass
+
+
+class FullNode:
+    """Serves a `Ledger` JSON-RPC service with fault injection
+
+    Call `start` (or use it as a context manager) to serve HTTP requests on `url`; `handle` serves a
+    JSON-RPC request object in-process without HTTP.
+    """
+
+    def __init__(
+        self,
+        ledger: typing.Optional[Ledger] = None,
+        faults: typing.Optional[Faults] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.ledger: Ledger = ledger or Ledger()
+        self.faults: Faults = faults or Faults()
+        self._address: typing.Tuple[str, int] = (host, port)
+        self._random = random.Random(self.faults.seed)
+        self._random_lock = threading.Lock()
+        self._server: typing.Optional[http.server.ThreadingHTTPServer] = None
+        self._thread: typing.Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("full node is not started")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def create_client(self, **kwargs: typing.Any) -> jsonrpc.Client:  # pyre-ignore
+        """create a jsonrpc.Client connects to this full node, kwargs are passed to jsonrpc.Client"""
+
+        return jsonrpc.Client(self.url, **kwargs)
+
+    def start(self) -> "FullNode":
+        server = http.server.ThreadingHTTPServer(self._address, _Handler)
+        server.daemon_threads = True
+        server.node = self  # pyre-ignore
+        self._server = server
+        self._thread = threading.Thread(target=server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FullNode":
+        return self.start()
+
+    def __exit__(self, *args: typing.Any) -> None:  # pyre-ignore
+        self.stop()
+
+    def handle_http(self, body: bytes) -> typing.Tuple[int, bytes]:
+        """Handle HTTP request body, returns (HTTP status code, response body)"""
+
+        latency, http_error, jsonrpc_error, stale = self._draw_faults()
+        if latency > 0:
+            time.sleep(latency)
+        if http_error:
+            return (503, b"Service Unavailable")
+        try:
+            request = json.loads(body)
+        except ValueError as e:
+            return (200, json.dumps(self._response(None, RpcError(-32700, f"Parse error: {e}"), stale)).encode())
+        if isinstance(request, list):
+            response = [self._handle(req, jsonrpc_error, stale) for req in request]
+        else:
+            response = self._handle(request, jsonrpc_error, stale)
+        return (200, json.dumps(response).encode())
+
+    def handle(self, request: typing.Union[JsonObject, typing.List[JsonObject]]) -> typing.Any:  # pyre-ignore
+        """Handle JSON-RPC request object or batch request list in-process, HTTP error is not injected"""
+
+        _, _, jsonrpc_error, stale = self._draw_faults()
+        if isinstance(request, list):
+            return [self._handle(req, jsonrpc_error, stale) for req in request]
+        return self._handle(request, jsonrpc_error, stale)
+
+    def _draw_faults(self) -> typing.Tuple[float, bool, bool, bool]:
+        faults = self.faults
+        with self._random_lock:
+            rand = self._random.random
+            jitter = faults.latency_jitter_secs * rand() if faults.latency_jitter_secs else 0.0
+            http_error = faults.http_error_rate > 0 and rand() < faults.http_error_rate
+            jsonrpc_error = faults.jsonrpc_error_rate > 0 and rand() < faults.jsonrpc_error_rate
+            stale = faults.stale_rate > 0 and rand() < faults.stale_rate
+        return (faults.latency_secs + jitter, http_error, jsonrpc_error, stale)
+
+    def _handle(self, request: JsonObject, jsonrpc_error: bool, stale: bool) -> JsonObject:
+        request_id = request.get("id") if isinstance(request, dict) else None
+        if jsonrpc_error:
+            return self._response(request_id, RpcError(SERVER_ERROR, "Server error: injected failure"), stale)
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return self._response(request_id, RpcError(INVALID_REQUEST, "Invalid Request"), stale)
+        try:
+            result = self.ledger.execute(request["method"], request.get("params") or [])
+        except RpcError as e:
+            return self._response(request_id, e, stale)
+        return self._response(request_id, result, stale)
+
+    def _response(self, request_id: typing.Any, result: typing.Any, stale: bool) -> JsonObject:  # pyre-ignore
+        chain_id, version, timestamp = self.ledger.state()
+        if stale:
+            chain_id, version, timestamp = self.ledger.state(version - self.faults.stale_versions)
+        response = {
+            "libra_chain_id": chain_id,
+            "libra_ledger_version": version,
+            "libra_ledger_timestampusec": timestamp,
+            "jsonrpc": "2.0",
+            "id": request_id,
+        }
+        if isinstance(result, RpcError):
+            response["error"] = result.to_json()
+        else:
+            response["result"] = result
+        return response
@@ -0,0 +1,383 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Pipelined transaction submission and confirmation.
+
+`jsonrpc.Client#submit` followed by `jsonrpc.Client#wait_for_transaction` handles one transaction at a time.
+`TransactionPipeline` signs and submits a stream of transactions with bounded concurrency, and confirms all
+in-flight transactions of a sender account with one `get_account_transactions` call per polling round:
+
+```python
+from libra import chain_ids, pipeline, script_codec
+
+txn_pipeline = pipeline.TransactionPipeline(client, chain_ids.TESTNET)
+requests = (
+    pipeline.TransactionRequest(sender, script_codec.encode_peer_to_peer_with_metadata_script("Coin1", payee, 100))
+    for payee in payees
+)
+for result in txn_pipeline.run(requests):
+    if result.error:
+        print(f"payment failed: {result.error}")
+```
+
+Results are reported in completion order by the `run` iterator, the `run_async` async iterator, and the
+optional `callback`.
+
+Sequence numbers are allocated by `jsonrpc.SequenceNumberAllocator`. The sequence number of an expired
+transaction is released and allocated again, while sequence numbers of other in-flight transactions are kept;
+the account sequence number is resynchronized from the server when a transaction is rejected for its sequence
+number.
+"""
+
+import asyncio
+import bisect
+import dataclasses
+import queue
+import threading
+import time
+import typing
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from . import jsonrpc, libra_types, script_codec
+from .local_account import LocalAccount
+
+DEFAULT_MAX_IN_FLIGHT: int = 100
+DEFAULT_SUBMIT_WORKERS: int = 8
+DEFAULT_POLL_INTERVAL_SECS: float = 0.2
+DEFAULT_MAX_GAS_AMOUNT: int = 1_000_000
+DEFAULT_GAS_UNIT_PRICE: int = 0
+DEFAULT_GAS_CURRENCY_CODE: str = "Coin1"
+DEFAULT_TRANSACTION_EXPIRATION_SECS: int = 30
+# max number of transactions of a sender account queried by one polling call
+MAX_POLL_LIMIT: int = 1000
+
+
+@dataclasses.dataclass
+class TransactionRequest:
+    """A transaction to be signed and submitted by `TransactionPipeline`
+
+    `payload` is a `libra_types.Script`, LCS bytes of a script (e.g. created by `script_codec` encoders), or
+    a `libra_types.RawTransaction`. A raw transaction is signed as it is, other fields are ignored and no
+    sequence number is allocated for it.
+    `expiration_secs` is the transaction expiration time relative to the time of signing.
+    """
+
+    sender: LocalAccount
+    payload: typing.Union[libra_types.Script, bytes, libra_types.RawTransaction]
+    gas_currency_code: str = DEFAULT_GAS_CURRENCY_CODE
+    max_gas_amount: int = DEFAULT_MAX_GAS_AMOUNT
+    gas_unit_price: int = DEFAULT_GAS_UNIT_PRICE
+    expiration_secs: int = DEFAULT_TRANSACTION_EXPIRATION_SECS
+
+
+@dataclasses.dataclass
+class TransactionResult:
+    """Result of a `TransactionRequest`
+
+    `error` is None if the transaction is executed successfully, otherwise it is the error raised by signing
+    or submitting the transaction, or one of `jsonrpc.TransactionExecutionFailed`, `jsonrpc.TransactionExpired`,
+    `jsonrpc.TransactionHashMismatchError`.
+    `transaction` is the on-chain transaction if the transaction is found on chain.
+    """
+
+    request: TransactionRequest
+    sequence_number: typing.Optional[int] = None
+    hash: typing.Optional[str] = None
+    transaction: typing.Optional[jsonrpc.Transaction] = None
+    error: typing.Optional[Exception] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+class TransactionPipeline:
+    """TransactionPipeline signs, submits and confirms transactions concurrently"""
+
+    def __init__(
+        self,
+        client: jsonrpc.Client,
+        chain_id: typing.Union[libra_types.ChainId, int],
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        submit_workers: int = DEFAULT_SUBMIT_WORKERS,
+        poll_interval_secs: float = DEFAULT_POLL_INTERVAL_SECS,
+        allocator: typing.Optional[jsonrpc.SequenceNumberAllocator] = None,
+        callback: typing.Optional[typing.Callable[[TransactionResult], None]] = None,
+    ) -> None:
+        """
+        `max_in_flight` bounds the number of transactions that are submitted but not completed,
+        `submit_workers` is the number of threads signing and submitting transactions.
+        `callback` is called with each result, in the thread consuming the `run` iterator.
+        """
+
+        self._client = client
+        self._chain_id: int = chain_id.to_int() if isinstance(chain_id, libra_types.ChainId) else chain_id
+        self._max_in_flight = max_in_flight
+        self._submit_workers = submit_workers
+        self._poll_interval_secs = poll_interval_secs
+        self._allocator: jsonrpc.SequenceNumberAllocator = allocator or jsonrpc.SequenceNumberAllocator(client)
+        self._callback = callback
+        self._senders: typing.Dict[LocalAccount, typing.Tuple[bytes, str, bytes]] = {}
+
+    def run(self, requests: typing.Iterable[TransactionRequest]) -> typing.Iterator[TransactionResult]:
+        """Submits given transactions, yields results in completion order
+
+        `requests` is consumed lazily as in-flight transactions complete, hence it can be an unbounded stream.
+        Stopping the iteration early stops submitting new transactions.
+        """
+
+        return _Run(self, requests).results()
+
+    async def run_async(self, requests: typing.Iterable[TransactionRequest]) -> typing.AsyncIterator[TransactionResult]:
+        """Same with `run`, but yields results as an async iterator without blocking the event loop"""
+
+        loop = asyncio.get_running_loop()
+        run = _Run(self, requests)
+        results = run.results()
+        # held while `next(results)` runs in the executor
+        running = threading.Lock()
+
+        def next_result() -> typing.Optional[TransactionResult]:
+            with running:
+                return next(results, None)
+
+        try:
+            while True:
+                result = await loop.run_in_executor(None, next_result)
+                if result is None:
+                    return
+                yield result
+        finally:
+            # e.g. cancelled while waiting for the next result: stop first, which also wakes up the `next` call.
+            # Closing the generator while `next` is running raises ValueError, it is closed by garbage collection
+            # once `next` returns.
+            run.stop()
+            if running.acquire(blocking=False):
+                try:
+                    results.close()
+                finally:
+                    running.release()
+
+    def _submit(self, request: TransactionRequest, result: TransactionResult) -> typing.Tuple[str, int, int]:
+        """signs and submits the transaction, returns (sender address hex, sequence number, expiration)"""
+
+        payload = request.payload
+        if isinstance(payload, libra_types.RawTransaction):
+            address = payload.sender.to_hex()
+            seq, expiration = int(payload.sequence_number), int(payload.expiration_timestamp_secs)
+            self._sign_and_submit(request.sender, payload.lcs_serialize(), result)
+            result.sequence_number = seq
+            return (address, seq, expiration)
+
+        address_bytes, address, _ = self._sender(request.sender)
+        script = payload.lcs_serialize() if isinstance(payload, libra_types.Script) else payload
+        with self._allocator.allocation(address) as seq:
+            expiration = int(time.time()) + request.expiration_secs
+            raw_txn = script_codec.encode_raw_transaction(
+                address_bytes,
+                seq,
+                script,
+                request.max_gas_amount,
+                request.gas_unit_price,
+                request.gas_currency_code,
+                expiration,
+                self._chain_id,
+            )
+            result.sequence_number = seq
+            self._sign_and_submit(request.sender, raw_txn, result)
+        return (address, seq, expiration)
+
+    def _sign_and_submit(self, sender: LocalAccount, raw_txn: bytes, result: TransactionResult) -> None:
+        _, _, public_key = self._sender(sender)
+        signature = sender.private_key.sign(script_codec.raw_transaction_signing_msg(raw_txn))
+        signed_txn = script_codec.encode_signed_transaction(raw_txn, public_key, signature)
+        result.hash = script_codec.signed_transaction_hash(signed_txn)
+        self._client.submit(signed_txn.hex())
+
+    def _sender(self, sender: LocalAccount) -> typing.Tuple[bytes, str, bytes]:
+        """(account address bytes, account address hex, public key bytes), cached for each `LocalAccount`"""
+
+        ret = self._senders.get(sender)
+        if ret is None:
+            address = sender.account_address
+            ret = self._senders.setdefault(sender, (address.to_bytes(), address.to_hex(), sender.public_key_bytes))
+        return ret
+
+
+@dataclasses.dataclass
+class _InFlight:
+    result: TransactionResult
+    sequence_number: int
+    expiration_timestamp_secs: int
+
+
+# marks the end of results in the results queue
+_DONE = object()
+
+
+class _Run:
+    """state of one `TransactionPipeline#run` call"""
+
+    def __init__(self, pipeline: TransactionPipeline, requests: typing.Iterable[TransactionRequest]) -> None:
+        self._pipeline = pipeline
+        self._requests = requests
+        self._results: queue.Queue = queue.Queue()
+        self._slots = threading.BoundedSemaphore(pipeline._max_in_flight)
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        # sender account address => transaction hash => in-flight transaction; keyed by hash as a sequence
+        # number can be allocated again (e.g. after resync) while a transaction of it is still in flight
+        self._in_flight: typing.Dict[str, typing.Dict[str, _InFlight]] = {}
+        self._outstanding = 0
+        self._feeding = True
+        self._executor = ThreadPoolExecutor(pipeline._submit_workers)
+        # submit tasks not completed yet, cancelled by `stop`
+        self._futures: typing.Set[Future] = set()
+
+    def results(self) -> typing.Iterator[TransactionResult]:
+        threading.Thread(target=self._feed, daemon=True).start()
+        threading.Thread(target=self._poll, daemon=True).start()
+        try:
+            while True:
+                item = self._results.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                if self._pipeline._callback is not None:
+                    self._pipeline._callback(item)
+                yield item
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """stops submitting transactions: cancels queued submit tasks, and wakes up the `results` consumer"""
+
+        with self._lock:
+            self._stopped.set()
+            futures = list(self._futures)
+        for future in futures:
+            future.cancel()
+        self._executor.shutdown(wait=False)
+        self._results.put(_DONE)
+
+    def _feed(self) -> None:
+        try:
+            for request in self._requests:
+                while not self._slots.acquire(timeout=self._pipeline._poll_interval_secs):
+                    if self._stopped.is_set():
+                        return
+                with self._lock:
+                    if self._stopped.is_set():
+                        return
+                    self._outstanding += 1
+                    future = self._executor.submit(self._submit, request)
+                    self._futures.add(future)
+                # called immediately if the future is done already, hence not holding the lock
+                future.add_done_callback(self._discard_future)
+        except Exception as e:
+            self._results.put(e)
+        finally:
+            with self._lock:
+                self._feeding = False
+                done = self._outstanding == 0
+            if done:
+                self._results.put(_DONE)
+
+    def _discard_future(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+    def _submit(self, request: TransactionRequest) -> None:
+        if self._stopped.is_set():
+            return
+        result = TransactionResult(request=request)
+        try:
+            address, seq, expiration = self._pipeline._submit(request, result)
+        except Exception as e:
+            result.error = e
+            self._complete(result)
+            return
+        with self._lock:
+            self._in_flight.setdefault(address, {})[typing.cast(str, result.hash)] = _InFlight(result, seq, expiration)
+
+    def _poll(self) -> None:
+        while not self._stopped.wait(self._pipeline._poll_interval_secs):
+            with self._lock:
+                accounts = [(address, dict(txns)) for address, txns in self._in_flight.items() if txns]
+            for address, txns in accounts:
+                try:
+                    self._poll_account(address, txns)
+                except Exception as e:
+                    # keep polling transient errors, until the transaction is expired by local clock
+                    now = time.time()
+                    for key, txn in txns.items():
+                        if txn.expiration_timestamp_secs < now:
+                            self._finish(address, key, e)
+
+    def _poll_account(self, address: str, txns: typing.Dict[str, _InFlight]) -> None:
+        client = self._pipeline._client
+        allocator = self._pipeline._allocator
+        seqs = sorted({txn.sequence_number for txn in txns.values()})
+        executed: typing.Dict[int, jsonrpc.Transaction] = {}
+        # in-flight sequence numbers can span more than one page, skip the gaps between pages
+        i = 0
+        while i < len(seqs):
+            start = seqs[i]
+            limit = min(seqs[-1] - start + 1, MAX_POLL_LIMIT)
+            for txn in client.get_account_transactions(address, start, limit):
+                executed[txn.transaction.sequence_number] = txn
+            i = bisect.bisect_left(seqs, start + limit, i)
+        timestamp_usecs = client.get_last_known_state().timestamp_usecs
+        for key, in_flight in sorted(txns.items(), key=lambda item: item[1].sequence_number):
+            seq, result = in_flight.sequence_number, in_flight.result
+            txn = executed.get(seq)
+            error: typing.Optional[Exception] = None
+            if txn is not None:
+                result.transaction = txn
+                allocator.confirm(address, seq)
+                if txn.hash != result.hash:
+                    error = jsonrpc.TransactionHashMismatchError(f"expected hash {result.hash}, but got {txn.hash}")
+                elif txn.vm_status.type != jsonrpc.VM_STATUS_EXECUTED:
+                    error = jsonrpc.TransactionExecutionFailed(f"VM status: {txn.vm_status}")
+            elif in_flight.expiration_timestamp_secs * 1_000_000 <= timestamp_usecs:
+                error = jsonrpc.TransactionExpired(
+                    f"latest server ledger timestamp_usecs {timestamp_usecs}, "
+                    f"transaction expires at {in_flight.expiration_timestamp_secs}"
+                )
+            else:
+                continue
+            if self._finish(address, key, error) and isinstance(error, jsonrpc.TransactionExpired):
+                self._release(address, seq)
+
+    def _release(self, address: str, seq: int) -> None:
+        """releases the sequence number of an expired transaction, unless another transaction of it is in flight
+
+        In-flight transactions of higher sequence numbers keep their sequence numbers, they are executed once
+        the released sequence number is allocated again, or expire.
+        """
+
+        with self._lock:
+            if any(txn.sequence_number == seq for txn in self._in_flight[address].values()):
+                return
+        self._pipeline._allocator.release(address, seq)
+
+    def _finish(self, address: str, key: str, error: typing.Optional[Exception]) -> bool:
+        """completes the in-flight transaction, returns False if it is already completed"""
+
+        with self._lock:
+            txn = self._in_flight[address].pop(key, None)
+        if txn is None:
+            return False
+        txn.result.error = error
+        self._complete(txn.result)
+        return True
+
+    def _complete(self, result: TransactionResult) -> None:
+        self._slots.release()
+        self._results.put(result)
+        with self._lock:
+            self._outstanding -= 1
+            done = not self._feeding and self._outstanding == 0
+        if done:
+            self._results.put(_DONE)
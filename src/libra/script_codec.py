@@ -0,0 +1,530 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Precompiled LCS encoders and decoders for the most commonly used transaction scripts.
+
+`stdlib` builds a `libra_types.Script` object graph for every call, which is then serialized by the
+reflective LCS serializer. The encoders in this module write the same bytes directly from the
+arguments: the script code, its length prefix and the argument variant tags are constant, and are
+precompiled into byte templates at import time.
+
+All functions in this module produce output byte-identical to the generic path, for example:
+
+```python
+from libra import script_codec, stdlib, utils
+
+script_bytes = script_codec.encode_peer_to_peer_with_metadata_script("Coin1", payee, 1_000_000)
+assert script_bytes == stdlib.encode_peer_to_peer_with_metadata_script(
+    utils.currency_code("Coin1"), payee, 1_000_000, b"", b""
+).lcs_serialize()
+```
+
+`decode_script` recognizes a known script from LCS bytes (or hex-encoded string) by a short fingerprint
+of the script code, and decodes the script arguments directly from the bytes, without going through the
+reflective LCS deserializer. `decode_scripts` and `peer_to_peer_table` apply it to many transactions
+at once, optionally spreading batches of transactions across a `concurrent.futures.Executor`
+(e.g. `ProcessPoolExecutor`) for backfilling large ranges of ledger transactions.
+
+"""
+
+from concurrent.futures import Executor, Future
+import collections
+import dataclasses
+import hashlib
+import itertools
+import struct
+import typing
+
+from . import libra_types, serde_types, stdlib, utils
+from .lcs import uleb128
+
+if typing.TYPE_CHECKING:
+    # imported on first use, so that encoding scripts does not import the JSON-RPC client
+    from . import jsonrpc  # noqa: F401
+
+
+_U64 = struct.Struct("<Q")
+_RAW_TXN_GAS = struct.Struct("<QQ")
+
+# TransactionArgument variant indexes
+_ARG_U64 = b"\x01"
+_ARG_ADDRESS = b"\x03"
+_ARG_U8_VECTOR = b"\x04"
+_ARG_BOOL_FALSE = b"\x05\x00"
+_ARG_BOOL_TRUE = b"\x05\x01"
+
+# TransactionPayload__Script variant index
+_PAYLOAD_SCRIPT = b"\x01"
+
+# TransactionAuthenticator__Ed25519 variant index
+_AUTHENTICATOR_ED25519 = b"\x00"
+
+
+def _u64(value: int) -> bytes:
+    try:
+        return _U64.pack(value)
+    except struct.error:
+        raise serde_types.SerializationError("Wrong Value for the type", value, serde_types.uint64)
+
+
+def _gas(max_gas_amount: int, gas_unit_price: int) -> bytes:
+    try:
+        return _RAW_TXN_GAS.pack(max_gas_amount, gas_unit_price)
+    except struct.error:
+        _u64(max_gas_amount)
+        _u64(gas_unit_price)
+        raise
+
+
+def _u8(value: int) -> bytes:
+    try:
+        return bytes((value,))
+    except (ValueError, TypeError):
+        raise serde_types.SerializationError("Wrong Value for the type", value, serde_types.uint8)
+
+
+def _script_prefix(code: bytes, ty_args_len: int) -> bytes:
+    return uleb128(len(code)) + code + uleb128(ty_args_len)
+
+
+def _type_tag_lcs(tag: typing.Union[str, libra_types.TypeTag]) -> bytes:
+    if isinstance(tag, str):
+        return utils.currency_code_lcs(tag)
+    return tag.lcs_serialize()
+
+
+def _address_bytes(addr: typing.Union[libra_types.AccountAddress, bytes, str]) -> bytes:
+    if isinstance(addr, bytes) and len(addr) == utils.ACCOUNT_ADDRESS_LEN:
+        return addr
+    return utils.account_address(addr).to_bytes()
+
+
+def _u8_vector_arg(value: bytes) -> bytes:
+    return _ARG_U8_VECTOR + uleb128(len(value)) + value
+
+
+_PEER_TO_PEER_WITH_METADATA_PREFIX: bytes = _script_prefix(stdlib.PEER_TO_PEER_WITH_METADATA_CODE, 1)
+_CREATE_CHILD_VASP_ACCOUNT_PREFIX: bytes = _script_prefix(stdlib.CREATE_CHILD_VASP_ACCOUNT_CODE, 1)
+_ROTATE_DUAL_ATTESTATION_INFO_PREFIX: bytes = _script_prefix(stdlib.ROTATE_DUAL_ATTESTATION_INFO_CODE, 0)
+
+
+def encode_peer_to_peer_with_metadata_script(
+    currency: typing.Union[str, libra_types.TypeTag],
+    payee: typing.Union[libra_types.AccountAddress, bytes, str],
+    amount: int,
+    metadata: bytes = b"",
+    metadata_signature: bytes = b"",
+) -> bytes:
+    """LCS bytes of `stdlib.encode_peer_to_peer_with_metadata_script` result
+
+    `currency` can be currency code string or `libra_types.TypeTag`.
+    """
+
+    return b"".join(
+        (
+            _PEER_TO_PEER_WITH_METADATA_PREFIX,
+            _type_tag_lcs(currency),
+            b"\x04",  # 4 args
+            _ARG_ADDRESS,
+            _address_bytes(payee),
+            _ARG_U64,
+            _u64(amount),
+            _u8_vector_arg(metadata),
+            _u8_vector_arg(metadata_signature),
+        )
+    )
+
+
+def encode_create_child_vasp_account_script(
+    coin_type: typing.Union[str, libra_types.TypeTag],
+    child_address: typing.Union[libra_types.AccountAddress, bytes, str],
+    auth_key_prefix: bytes,
+    add_all_currencies: bool,
+    child_initial_balance: int,
+) -> bytes:
+    """LCS bytes of `stdlib.encode_create_child_vasp_account_script` result
+
+    `coin_type` can be currency code string or `libra_types.TypeTag`.
+    """
+
+    return b"".join(
+        (
+            _CREATE_CHILD_VASP_ACCOUNT_PREFIX,
+            _type_tag_lcs(coin_type),
+            b"\x04",  # 4 args
+            _ARG_ADDRESS,
+            _address_bytes(child_address),
+            _u8_vector_arg(auth_key_prefix),
+            _ARG_BOOL_TRUE if add_all_currencies else _ARG_BOOL_FALSE,
+            _ARG_U64,
+            _u64(child_initial_balance),
+        )
+    )
+
+
+def encode_rotate_dual_attestation_info_script(new_url: bytes, new_key: bytes) -> bytes:
+    """LCS bytes of `stdlib.encode_rotate_dual_attestation_info_script` result"""
+
+    return b"".join(
+        (
+            _ROTATE_DUAL_ATTESTATION_INFO_PREFIX,
+            b"\x02",  # 2 args
+            _u8_vector_arg(new_url),
+            _u8_vector_arg(new_key),
+        )
+    )
+
+
+def encode_raw_transaction(
+    sender: typing.Union[libra_types.AccountAddress, bytes, str],
+    sequence_number: int,
+    script: bytes,
+    max_gas_amount: int,
+    gas_unit_price: int,
+    gas_currency_code: str,
+    expiration_timestamp_secs: int,
+    chain_id: typing.Union[libra_types.ChainId, int],
+) -> bytes:
+    """LCS bytes of `libra_types.RawTransaction` with `libra_types.TransactionPayload__Script` payload
+
+    `script` is LCS bytes of `libra_types.Script`, e.g. created by `encode_peer_to_peer_with_metadata_script`.
+    """
+
+    chain_id_int = chain_id.to_int() if isinstance(chain_id, libra_types.ChainId) else chain_id
+    currency = gas_currency_code.encode()
+    return b"".join(
+        (
+            _address_bytes(sender),
+            _u64(sequence_number),
+            _PAYLOAD_SCRIPT,
+            script,
+            _gas(max_gas_amount, gas_unit_price),
+            uleb128(len(currency)),
+            currency,
+            _u64(expiration_timestamp_secs),
+            _u8(chain_id_int),
+        )
+    )
+
+
+# same with `utils.libra_hash_seed(b"RawTransaction")`, utils imports this module, hence can't be called here
+_RAW_TRANSACTION_HASH_SEED: bytes = hashlib.sha3_256(b"LIBRA::RawTransaction").digest()
+
+
+def raw_transaction_signing_msg(raw_txn: bytes) -> bytes:
+    """same with `utils.raw_transaction_signing_msg`, but takes `encode_raw_transaction` result"""
+
+    return _RAW_TRANSACTION_HASH_SEED + raw_txn
+
+
+def encode_signed_transaction(raw_txn: bytes, public_key: bytes, signature: bytes) -> bytes:
+    """LCS bytes of `utils.create_signed_transaction` result, from `encode_raw_transaction` result
+
+    The hex-encoded result can be passed to `jsonrpc.Client#submit` directly.
+    """
+
+    return b"".join(
+        (
+            raw_txn,
+            _AUTHENTICATOR_ED25519,
+            uleb128(len(public_key)),
+            public_key,
+            uleb128(len(signature)),
+            signature,
+        )
+    )
+
+
+# same with `utils.libra_hash_seed(b"Transaction")`
+_TRANSACTION_HASH_SEED: bytes = hashlib.sha3_256(b"LIBRA::Transaction").digest()
+_TRANSACTION_USER_TRANSACTION = b"\x00"
+
+
+def signed_transaction_hash(signed_txn: bytes) -> str:
+    """same with `utils.transaction_hash`, but takes `encode_signed_transaction` result"""
+
+    return hashlib.sha3_256(_TRANSACTION_HASH_SEED + _TRANSACTION_USER_TRANSACTION + signed_txn).hexdigest()
+
+
+# Script code fingerprint: (code length, last bytes of code), see `stdlib.find_script_code`; a matched
+# fingerprint is always confirmed by comparing the full script code.
+_FINGERPRINT_TAIL_SIZE: int = stdlib.SCRIPT_FINGERPRINT_TAIL_SIZE
+
+ScriptDecoder = typing.Callable[[libra_types.Script], stdlib.ScriptCall]
+ScriptIndex = typing.Dict[typing.Tuple[int, bytes], typing.Tuple[bytes, ScriptDecoder]]
+
+# known scripts found so far, the stdlib script modules are imported on first use
+_SCRIPT_INDEX: ScriptIndex = {}
+
+
+def _find_indexed_script(code_len: int, code_tail: bytes) -> typing.Optional[typing.Tuple[bytes, ScriptDecoder]]:
+    key = (code_len, code_tail)
+    script = _SCRIPT_INDEX.get(key)
+    if script is None:
+        code = stdlib.find_script_code(code_len, code_tail)
+        if code is None:
+            return None
+        script = _SCRIPT_INDEX[key] = (code, stdlib.SCRIPT_DECODER_MAP[code])
+    return script
+
+
+def _read_uleb128(data: bytes, offset: int) -> typing.Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return (value, offset)
+        shift += 7
+        if shift > 28:
+            raise serde_types.DeserializationError("Overflow while parsing uleb128-encoded uint32 value")
+
+
+def _skip_type_tag(data: bytes, offset: int) -> int:
+    variant, offset = _read_uleb128(data, offset)
+    if variant <= 5:  # primitive types
+        return offset
+    if variant == 6:  # vector
+        return _skip_type_tag(data, offset)
+    if variant == 7:  # struct
+        offset += utils.ACCOUNT_ADDRESS_LEN
+        for _ in range(2):  # module and name identifiers
+            length, offset = _read_uleb128(data, offset)
+            offset += length
+        type_params_len, offset = _read_uleb128(data, offset)
+        for _ in range(type_params_len):
+            offset = _skip_type_tag(data, offset)
+        return offset
+    raise serde_types.DeserializationError("Unexpected variant index", variant)
+
+
+def _read_type_tag(data: bytes, offset: int) -> typing.Tuple[libra_types.TypeTag, int]:
+    end = _skip_type_tag(data, offset)
+    if end > len(data):
+        raise serde_types.DeserializationError("Input is too short")
+    tag_bytes = data[offset:end]
+    code = utils.currency_code_from_lcs(tag_bytes)
+    if code is not None:
+        return (utils.currency_code(code), end)
+    return (libra_types.TypeTag.lcs_deserialize(tag_bytes), end)
+
+
+def _read_bytes(data: bytes, offset: int, length: int) -> typing.Tuple[bytes, int]:
+    end = offset + length
+    if end > len(data):
+        raise serde_types.DeserializationError("Input is too short")
+    return (data[offset:end], end)
+
+
+def _read_argument(data: bytes, offset: int) -> typing.Tuple[libra_types.TransactionArgument, int]:
+    variant, offset = _read_uleb128(data, offset)
+    if variant == 0:
+        value, offset = _read_bytes(data, offset, 1)
+        return (libra_types.TransactionArgument__U8(value=serde_types.uint8(value[0])), offset)
+    if variant == 1:
+        value, offset = _read_bytes(data, offset, 8)
+        return (libra_types.TransactionArgument__U64(value=serde_types.uint64(_U64.unpack(value)[0])), offset)
+    if variant == 2:
+        value, offset = _read_bytes(data, offset, 16)
+        u128 = serde_types.uint128(int.from_bytes(value, "little", signed=False))
+        return (libra_types.TransactionArgument__U128(value=u128), offset)
+    if variant == 3:
+        value, offset = _read_bytes(data, offset, utils.ACCOUNT_ADDRESS_LEN)
+        return (libra_types.TransactionArgument__Address(value=libra_types.AccountAddress.from_bytes(value)), offset)
+    if variant == 4:
+        length, offset = _read_uleb128(data, offset)
+        value, offset = _read_bytes(data, offset, length)
+        return (libra_types.TransactionArgument__U8Vector(value=value), offset)
+    if variant == 5:
+        value, offset = _read_bytes(data, offset, 1)
+        if value[0] > 1:
+            raise serde_types.DeserializationError("Unexpected boolean value:", value[0])
+        return (libra_types.TransactionArgument__Bool(value=value[0] == 1), offset)
+    raise serde_types.DeserializationError("Unexpected variant index", variant)
+
+
+def find_script(data: bytes) -> typing.Tuple[bytes, ScriptDecoder, int]:
+    """recognize known script from LCS bytes of `libra_types.Script`
+
+    Returns tuple of (script code, stdlib decoder function, offset of type arguments in data).
+
+    Raises ValueError if the script code is unknown.
+    """
+
+    try:
+        code_len, offset = _read_uleb128(data, 0)
+    except IndexError:
+        raise serde_types.DeserializationError("Input is too short")
+    end = offset + code_len
+    script = _find_indexed_script(code_len, data[max(offset, end - _FINGERPRINT_TAIL_SIZE) : end])
+    if script is not None:
+        code, decoder = script
+        if data[offset:end] == code:
+            return (code, decoder, end)
+    raise ValueError("Unknown script bytecode")
+
+
+def decode_script(data: typing.Union[bytes, str]) -> stdlib.ScriptCall:
+    """same with `stdlib.decode_script(libra_types.Script.lcs_deserialize(data))`, but faster
+
+    `data` is LCS bytes or hex-encoded string of `libra_types.Script`, e.g. `jsonrpc.TransactionData#script_bytes`.
+    Only the type arguments and arguments are decoded; the decoded script code is the shared `stdlib` constant.
+
+    Raises ValueError if the script code is unknown, raises `serde_types.DeserializationError` if
+    data is invalid.
+    """
+
+    if isinstance(data, str):
+        data = bytes.fromhex(data)
+
+    code, decoder, offset = find_script(data)
+    return _decode_script(data, code, decoder, offset)
+
+
+def _decode_script(data: bytes, code: bytes, decoder: ScriptDecoder, offset: int) -> stdlib.ScriptCall:
+    try:
+        ty_args_len, offset = _read_uleb128(data, offset)
+        ty_args = []
+        for _ in range(ty_args_len):
+            tag, offset = _read_type_tag(data, offset)
+            ty_args.append(tag)
+        args_len, offset = _read_uleb128(data, offset)
+        args = []
+        for _ in range(args_len):
+            arg, offset = _read_argument(data, offset)
+            args.append(arg)
+    except IndexError:
+        raise serde_types.DeserializationError("Input is too short")
+    if offset != len(data):
+        raise serde_types.DeserializationError("Some input bytes were not read")
+
+    return decoder(libra_types.Script(code=code, ty_args=ty_args, args=args))
+
+
+DEFAULT_DECODE_BATCH_SIZE: int = 1000
+DEFAULT_DECODE_MAX_PENDING_BATCHES: int = 16
+
+ScriptSource = typing.Union[str, bytes, "jsonrpc.Transaction", "jsonrpc.TransactionData"]
+
+
+def _script_bytes(txn: ScriptSource) -> typing.Union[str, bytes]:
+    if isinstance(txn, (str, bytes)):
+        return txn
+
+    from . import jsonrpc
+
+    if isinstance(txn, jsonrpc.Transaction):
+        return txn.transaction.script_bytes
+    if isinstance(txn, jsonrpc.TransactionData):
+        return txn.script_bytes
+
+    raise TypeError(f"unknown transaction type: {txn}")
+
+
+def _decode_batch(batch: typing.List[typing.Union[str, bytes]]) -> typing.List[typing.Optional[stdlib.ScriptCall]]:
+    # group by script code fingerprint, so that each script decoder is called for its transactions in a row
+    groups = collections.defaultdict(list)
+    for i, data in enumerate(batch):
+        if not data:
+            continue
+        data = bytes.fromhex(data) if isinstance(data, str) else data
+        try:
+            code, decoder, offset = find_script(data)
+        except ValueError:
+            continue
+        groups[code].append((i, data, offset))
+
+    ret = [None] * len(batch)
+    for code, items in groups.items():
+        decoder = stdlib.SCRIPT_DECODER_MAP[code]
+        for i, data, offset in items:
+            ret[i] = _decode_script(data, code, decoder, offset)
+    return ret
+
+
+def _batches(items: typing.Iterable[ScriptSource], batch_size: int) -> typing.Iterator[typing.List[ScriptSource]]:
+    it = iter(items)
+    while True:
+        batch = list(itertools.islice(it, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def decode_scripts(
+    txns: typing.Iterable[ScriptSource],
+    executor: typing.Optional[Executor] = None,
+    batch_size: int = DEFAULT_DECODE_BATCH_SIZE,
+) -> typing.Iterator[typing.Optional[stdlib.ScriptCall]]:
+    """decode script of each given transaction, yields results in the same order as given transactions
+
+    Accepts `jsonrpc.Transaction`, `jsonrpc.TransactionData`, or script bytes (LCS bytes or hex-encoded string)
+    as `utils.decode_transaction_script` does.
+    Yields None for the transaction that has no script (e.g. block metadata transaction) or unknown script code,
+    so that non-payment transactions can be skipped when indexing all ledger transactions.
+
+    Given transactions are decoded in batches of `batch_size`. When `executor` is provided, batches are
+    decoded by the executor, with a bounded number of pending batches, hence `txns` can be an iterator of
+    an unbounded stream of transactions. Use `concurrent.futures.ProcessPoolExecutor` for CPU parallelism.
+
+    Raises `serde_types.DeserializationError` if a known script's bytes are invalid.
+    """
+
+    batches = (list(map(_script_bytes, batch)) for batch in _batches(txns, batch_size))
+    if executor is None:
+        for batch in batches:
+            yield from _decode_batch(batch)
+        return
+
+    pending: typing.Deque[Future] = collections.deque()
+    for batch in batches:
+        pending.append(executor.submit(_decode_batch, batch))
+        if len(pending) >= DEFAULT_DECODE_MAX_PENDING_BATCHES:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+@dataclasses.dataclass
+class PeerToPeerTable:
+    """Columns of peer to peer transfer transactions, one row per transaction"""
+
+    version: typing.List[int]
+    sender: typing.List[str]
+    payee: typing.List[str]
+    amount: typing.List[int]
+    currency: typing.List[str]
+    metadata: typing.List[bytes]
+
+    def __len__(self) -> int:
+        return len(self.version)
+
+
+def peer_to_peer_table(
+    txns: typing.Iterable["jsonrpc.Transaction"],
+    executor: typing.Optional[Executor] = None,
+    batch_size: int = DEFAULT_DECODE_BATCH_SIZE,
+) -> PeerToPeerTable:
+    """decode peer to peer with metadata script transactions into `PeerToPeerTable`
+
+    Transactions that are not peer to peer transfers, or whose currency type argument is not a currency code
+    struct tag, are skipped. Addresses are hex-encoded strings.
+    See `decode_scripts` for `executor` and `batch_size`.
+    """
+
+    table = PeerToPeerTable(version=[], sender=[], payee=[], amount=[], currency=[], metadata=[])
+    txns_it, scripts_it = itertools.tee(txns)
+    for txn, script in zip(txns_it, decode_scripts(scripts_it, executor, batch_size)):
+        if not isinstance(script, stdlib.ScriptCall__PeerToPeerWithMetadata):
+            continue
+        if not isinstance(script.currency, libra_types.TypeTag__Struct):
+            continue
+        table.version.append(txn.version)
+        table.sender.append(txn.transaction.sender)
+        table.payee.append(script.payee.to_hex())
+        table.amount.append(int(script.amount))
+        table.currency.append(script.currency.to_currency_code())
+        table.metadata.append(script.metadata)
+    return table
@@ -10,11 +10,99 @@ Note: This internal module is currently only meant to share code between the LCS
 import dataclasses
 import collections
 import io
+import struct
+import threading
+import time
 import typing
 from typing import get_type_hints
 
 from libra import serde_types as st
 
+# little-endian fixed-width integer packers
+_BOOL = struct.Struct("<?")
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_I8 = struct.Struct("<b")
+_I16 = struct.Struct("<h")
+_I32 = struct.Struct("<i")
+_I64 = struct.Struct("<q")
+
+# struct format characters of fixed-width integer types, bool is excluded for validating its value on deserialization
+_FIXED_WIDTH_FORMATS: typing.Dict[typing.Any, str] = {
+    st.uint8: "B",
+    st.uint16: "H",
+    st.uint32: "I",
+    st.uint64: "Q",
+    st.int8: "b",
+    st.int16: "h",
+    st.int32: "i",
+    st.int64: "q",
+}
+
+
+class FixedWidthRun(typing.NamedTuple):
+    """Consecutive fixed-width integer fields (or tuple items) encoded by one `struct.Struct` call"""
+
+    packer: struct.Struct
+    names: typing.Tuple[str, ...]
+    types: typing.Tuple[typing.Any, ...]
+
+    def wrong_value_error(self, values: typing.Sequence[typing.Any]) -> st.SerializationError:
+        """error for values failed to pack, reporting the first value out of range of its type"""
+
+        for value, value_type in zip(values, self.types):
+            try:
+                struct.pack("<" + _FIXED_WIDTH_FORMATS[value_type], value)
+            except struct.error:
+                return st.SerializationError("Wrong Value for the type", value, value_type)
+        return st.SerializationError("Wrong Value for the type", tuple(values), self.types)
+
+
+# dataclass type => layout of its fields: FixedWidthRun or (field name, field type)
+_STRUCT_LAYOUTS: typing.Dict[typing.Any, typing.List[typing.Union[FixedWidthRun, typing.Tuple[str, typing.Any]]]] = {}
+# tuple type => FixedWidthRun of all items, or None if not all items are fixed-width integers
+_TUPLE_RUNS: typing.Dict[typing.Any, typing.Optional[FixedWidthRun]] = {}
+
+
+def struct_layout(obj_type) -> typing.List[typing.Union[FixedWidthRun, typing.Tuple[str, typing.Any]]]:
+    """Fields of a dataclass type in order, consecutive fixed-width integer fields are grouped into a
+    `FixedWidthRun` (cached per type)."""
+
+    layout = _STRUCT_LAYOUTS.get(obj_type)
+    if layout is None:
+        types = get_type_hints(obj_type)
+        groups = []
+        for field in dataclasses.fields(obj_type):
+            field_type = types[field.name]
+            if field_type not in _FIXED_WIDTH_FORMATS:
+                groups.append((field.name, field_type))
+            elif groups and isinstance(groups[-1], list):
+                groups[-1].append((field.name, field_type))
+            else:
+                groups.append([(field.name, field_type)])
+        layout = [_fixed_width_run(group) if isinstance(group, list) else group for group in groups]
+        _STRUCT_LAYOUTS[obj_type] = layout
+    return layout
+
+
+def tuple_run(obj_type) -> typing.Optional[FixedWidthRun]:
+    """`FixedWidthRun` of a tuple type if all items are fixed-width integers, e.g. `AccountAddress` bytes"""
+
+    if obj_type not in _TUPLE_RUNS:
+        types = getattr(obj_type, "__args__")
+        if all(t in _FIXED_WIDTH_FORMATS for t in types):
+            _TUPLE_RUNS[obj_type] = _fixed_width_run([(str(i), t) for i, t in enumerate(types)])
+        else:
+            _TUPLE_RUNS[obj_type] = None
+    return _TUPLE_RUNS[obj_type]
+
+
+def _fixed_width_run(fields: typing.List[typing.Tuple[str, typing.Any]]) -> FixedWidthRun:
+    packer = struct.Struct("<" + "".join(_FIXED_WIDTH_FORMATS[t] for _, t in fields))
+    return FixedWidthRun(packer, tuple(name for name, _ in fields), tuple(t for _, t in fields))
+
 
 @dataclasses.dataclass
 class BinarySerializer:
@@ -24,12 +112,12 @@ class BinarySerializer:
     index, and how they sort map entries (or not).
     """
 
-    output: io.BytesIO
+    output: bytearray
     container_depth_budget: typing.Optional[int]
 
     def serialize_bytes(self, value: bytes):
         self.serialize_len(len(value))
-        self.output.write(value)
+        self.output += value
 
     def serialize_str(self, value: str):
         self.serialize_bytes(value.encode())
@@ -38,37 +126,64 @@ class BinarySerializer:
         pass
 
     def serialize_bool(self, value: st.bool):
-        self.output.write(int(value).to_bytes(1, "little", signed=False))
+        # struct packs any truthy value as true
+        if not isinstance(value, bool):
+            raise st.SerializationError("Wrong Value for the type", value, st.bool)
+        self.output += _BOOL.pack(value)
 
     def serialize_u8(self, value: st.uint8):
-        self.output.write(int(value).to_bytes(1, "little", signed=False))
+        try:
+            self.output += _U8.pack(value)
+        except struct.error:
+            raise st.SerializationError("Wrong Value for the type", value, st.uint8)
 
     def serialize_u16(self, value: st.uint16):
-        self.output.write(int(value).to_bytes(2, "little", signed=False))
+        try:
+            self.output += _U16.pack(value)
+        except struct.error:
+            raise st.SerializationError("Wrong Value for the type", value, st.uint16)
 
     def serialize_u32(self, value: st.uint32):
-        self.output.write(int(value).to_bytes(4, "little", signed=False))
+        try:
+            self.output += _U32.pack(value)
+        except struct.error:
+            raise st.SerializationError("Wrong Value for the type", value, st.uint32)
 
     def serialize_u64(self, value: st.uint64):
-        self.output.write(int(value).to_bytes(8, "little", signed=False))
+        try:
+            self.output += _U64.pack(value)
+        except struct.error:
+            raise st.SerializationError("Wrong Value for the type", value, st.uint64)
 
     def serialize_u128(self, value: st.uint128):
-        self.output.write(int(value).to_bytes(16, "little", signed=False))
+        self.output += int(value).to_bytes(16, "little", signed=False)
 
     def serialize_i8(self, value: st.uint8):
-        self.output.write(int(value).to_bytes(1, "little", signed=True))
+        try:
+            self.output += _I8.pack(value)
+        except struct.error:
+            raise st.SerializationError("Wrong Value for the type", value, st.int8)
 
     def serialize_i16(self, value: st.uint16):
-        self.output.write(int(value).to_bytes(2, "little", signed=True))
+        try:
+            self.output += _I16.pack(value)
+        except struct.error:
+            raise st.SerializationError("Wrong Value for the type", value, st.int16)
 
     def serialize_i32(self, value: st.uint32):
-        self.output.write(int(value).to_bytes(4, "little", signed=True))
+        try:
+            self.output += _I32.pack(value)
+        except struct.error:
+            raise st.SerializationError("Wrong Value for the type", value, st.int32)
 
     def serialize_i64(self, value: st.uint64):
-        self.output.write(int(value).to_bytes(8, "little", signed=True))
+        try:
+            self.output += _I64.pack(value)
+        except struct.error:
+            raise st.SerializationError("Wrong Value for the type", value, st.int64)
 
     def serialize_i128(self, value: st.uint128):
-        self.output.write(int(value).to_bytes(16, "little", signed=True))
+        self.output += int(value).to_bytes(16, "little", signed=True)
 
     def serialize_f32(self, value: st.float32):
         raise NotImplementedError
@@ -80,10 +195,10 @@ class BinarySerializer:
         raise NotImplementedError
 
     def get_buffer_offset(self) -> int:
-        return len(self.output.getbuffer())
+        return len(self.output)
 
     def get_buffer(self) -> bytes:
-        return self.output.getvalue()
+        return bytes(self.output)
 
     def increase_container_depth(self):
         if self.container_depth_budget is not None:
@@ -140,15 +255,22 @@ class BinarySerializer:
                     self.serialize_any(item, item_type)
 
             elif getattr(obj_type, "__origin__") == tuple:  # Tuple
-                for i in range(len(obj)):
-                    self.serialize_any(obj[i], types[i])
+                run = tuple_run(obj_type)
+                if run is not None:
+                    try:
+                        self.output += run.packer.pack(*obj)
+                    except struct.error:
+                        raise run.wrong_value_error(obj)
+                else:
+                    for i in range(len(obj)):
+                        self.serialize_any(obj[i], types[i])
 
             elif getattr(obj_type, "__origin__") == typing.Union:  # Option
                 assert len(types) == 2 and types[1] == type(None)
                 if obj is None:
-                    self.output.write(b"\x00")
+                    self.output.append(0)
                 else:
-                    self.output.write(b"\x01")
+                    self.output.append(1)
                     self.serialize_any(obj, types[0])
 
             elif getattr(obj_type, "__origin__") == dict:  # Map
@@ -181,16 +303,48 @@ class BinarySerializer:
                 raise st.SerializationError("Wrong Value for the type", obj, obj_type)
 
             # Content of struct or variant
-            fields = dataclasses.fields(obj_type)
-            types = get_type_hints(obj_type)
+            values = obj.__dict__
             self.increase_container_depth()
-            for field in fields:
-                field_value = obj.__dict__[field.name]
-                field_type = types[field.name]
-                self.serialize_any(field_value, field_type)
+            for field in struct_layout(obj_type):
+                if isinstance(field, FixedWidthRun):
+                    run_values = [values[name] for name in field.names]
+                    try:
+                        self.output += field.packer.pack(*run_values)
+                    except struct.error:
+                        raise field.wrong_value_error(run_values)
+                else:
+                    self.serialize_any(values[field[0]], field[1])
             self.decrease_container_depth()
 
 
+class BufferReader:
+    """Read-only `io.BytesIO` replacement reading from a buffer (`bytes`, `memoryview`, `mmap.mmap` etc.) at a
+    moving offset, without copying the buffer.
+    """
+
+    def __init__(self, buffer, offset: int = 0):
+        self._view = memoryview(buffer)
+        self._offset = offset
+
+    def read(self, length: int) -> bytes:
+        value = self._view[self._offset : self._offset + length].tobytes()
+        self._offset += len(value)
+        return value
+
+    def tell(self) -> int:
+        return self._offset
+
+    def seek(self, offset: int) -> int:
+        self._offset = offset
+        return offset
+
+    def getbuffer(self) -> memoryview:
+        return self._view
+
+    def release(self):
+        self._view.release()
+
+
 @dataclasses.dataclass
 class BinaryDeserializer:
     """Deserialization primitives for binary formats (abstract class).
@@ -270,6 +424,10 @@ class BinaryDeserializer:
     def deserialize_char(self) -> st.char:
         raise NotImplementedError
 
+    def deserialize_run(self, run: FixedWidthRun) -> typing.List[typing.Any]:
+        values = run.packer.unpack(self.read(run.packer.size))
+        return [typ(value) for typ, value in zip(run.types, values)]
+
     def get_buffer_offset(self) -> int:
         return self.input.tell()
 
@@ -338,6 +496,9 @@ class BinaryDeserializer:
                 return result
 
             elif getattr(obj_type, "__origin__") == tuple:  # Tuple
+                run = tuple_run(obj_type)
+                if run is not None:
+                    return tuple(self.deserialize_run(run))
                 result = []
                 for i in range(len(types)):
                     item = self.deserialize_any(types[i])
@@ -381,13 +542,12 @@ class BinaryDeserializer:
             # handle structs
             if dataclasses.is_dataclass(obj_type):
                 values = []
-                fields = dataclasses.fields(obj_type)
-                typing_hints = get_type_hints(obj_type)
                 self.increase_container_depth()
-                for field in fields:
-                    field_type = typing_hints[field.name]
-                    field_value = self.deserialize_any(field_type)
-                    values.append(field_value)
+                for field in struct_layout(obj_type):
+                    if isinstance(field, FixedWidthRun):
+                        values.extend(self.deserialize_run(field))
+                    else:
+                        values.append(self.deserialize_any(field[1]))
                 self.decrease_container_depth()
                 return obj_type(*values)
 
@@ -401,3 +561,137 @@ class BinaryDeserializer:
 
             else:
                 raise st.DeserializationError("Unexpected type", obj_type)
+
+
+@dataclasses.dataclass
+class TypeProfile:
+    """Profile of `serialize_any` / `deserialize_any` calls of one type.
+
+    `bytes` and `total_secs` include nested values (e.g. struct fields), `self_secs` excludes time spent in
+    nested values.
+    """
+
+    operation: str
+    type_name: str
+    calls: int = 0
+    bytes: int = 0
+    total_secs: float = 0.0
+    self_secs: float = 0.0
+
+
+class Profiler:
+    """Counts calls, bytes and time per type of all `BinarySerializer.serialize_any` and
+    `BinaryDeserializer.deserialize_any` calls (in all threads) while started.
+
+    Starting a profiler replaces `serialize_any` and `deserialize_any` methods with instrumented versions, and
+    stopping it restores the original methods, so there is no overhead when no profiler is started.
+    Only one profiler can be started at a time.
+
+    ```python
+    with serde_binary.Profiler() as profiler:
+        lcs.serialize(txn, libra_types.SignedTransaction)
+    print(profiler.format_report())
+    ```
+    """
+
+    _started: typing.Optional["Profiler"] = None
+
+    def __init__(self):
+        self._profiles: typing.Dict[typing.Tuple[str, typing.Any], TypeProfile] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def start(self) -> "Profiler":
+        if Profiler._started is not None:
+            raise RuntimeError("another profiler is started")
+        Profiler._started = self
+        profiler = self
+
+        def serialize_any(serializer, obj, obj_type):
+            return profiler._call("serialize", obj_type, serializer, _SERIALIZE_ANY, (obj, obj_type))
+
+        def deserialize_any(deserializer, obj_type):
+            return profiler._call("deserialize", obj_type, deserializer, _DESERIALIZE_ANY, (obj_type,))
+
+        BinarySerializer.serialize_any = serialize_any
+        BinaryDeserializer.deserialize_any = deserialize_any
+        return self
+
+    def stop(self):
+        if Profiler._started is self:
+            BinarySerializer.serialize_any = _SERIALIZE_ANY
+            BinaryDeserializer.deserialize_any = _DESERIALIZE_ANY
+            Profiler._started = None
+
+    def __enter__(self) -> "Profiler":
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def reset(self):
+        with self._lock:
+            self._profiles.clear()
+
+    def report(self, operation: typing.Optional[str] = None) -> typing.List[TypeProfile]:
+        """Returns profiles of the given operation ("serialize" or "deserialize", default both), sorted by
+        self time descending."""
+
+        with self._lock:
+            profiles = [dataclasses.replace(p) for p in self._profiles.values()]
+        if operation is not None:
+            profiles = [p for p in profiles if p.operation == operation]
+        return sorted(profiles, key=lambda p: p.self_secs, reverse=True)
+
+    def format_report(self, operation: typing.Optional[str] = None, limit: typing.Optional[int] = None) -> str:
+        lines = [f"{'operation':<12} {'type':<48} {'calls':>10} {'bytes':>12} {'total ms':>10} {'self ms':>10}"]
+        for p in self.report(operation)[:limit]:
+            lines.append(
+                f"{p.operation:<12} {p.type_name:<48} {p.calls:>10} {p.bytes:>12} "
+                f"{p.total_secs * 1000:>10.3f} {p.self_secs * 1000:>10.3f}"
+            )
+        return "\n".join(lines)
+
+    def _call(self, operation: str, obj_type, instance, fn, args):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        offset = instance.get_buffer_offset()
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return fn(instance, *args)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            size = instance.get_buffer_offset() - offset
+            key = (operation, obj_type)
+            with self._lock:
+                profile = self._profiles.get(key)
+                if profile is None:
+                    profile = self._profiles[key] = TypeProfile(operation, type_name(obj_type))
+                profile.calls += 1
+                profile.bytes += size
+                profile.total_secs += elapsed
+                profile.self_secs += elapsed - nested
+
+
+def type_name(obj_type) -> str:
+    """Short type name for reports, e.g. `Sequence[TransactionArgument]`, `Tuple[uint8 * 16]`"""
+
+    if hasattr(obj_type, "__origin__"):
+        args = getattr(obj_type, "__args__")
+        origin = getattr(obj_type, "__origin__")
+        if origin == typing.Union and len(args) == 2 and args[1] == type(None):
+            return f"Optional[{type_name(args[0])}]"
+        name = {collections.abc.Sequence: "Sequence", tuple: "Tuple", dict: "Dict"}.get(origin, str(origin))
+        if len(args) > 2 and len(set(args)) == 1:  # fixed size array
+            return f"{name}[{type_name(args[0])} * {len(args)}]"
+        return f"{name}[{', '.join(type_name(arg) for arg in args)}]"
+    return getattr(obj_type, "__name__", str(obj_type))
+
+
+_SERIALIZE_ANY = BinarySerializer.serialize_any
+_DESERIALIZE_ANY = BinaryDeserializer.deserialize_any
@@ -0,0 +1,92 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import libra_types
+from libra.libra_types import Script, TypeTag
+from libra.stdlib import ScriptCall
+
+
+@dataclass(frozen=True)
+class ScriptCall__AddCurrencyToAccount(ScriptCall):
+    """# Summary
+    Adds a zero `Currency` balance to the sending `account`.
+
+    This will enable `account` to
+    send, receive, and hold `Libra::Libra<Currency>` coins. This transaction can be
+    successfully sent by any account that is allowed to hold balances
+    (e.g., VASP, Designated Dealer).
+
+    # Technical Description
+    After the successful execution of this transaction the sending account will have a
+    `LibraAccount::Balance<Currency>` resource with zero balance published under it. Only
+    accounts that can hold balances can send this transaction, the sending account cannot
+    already have a `LibraAccount::Balance<Currency>` published under it.
+
+    # Parameters
+    | Name       | Type      | Description                                                                                                                                         |
+    | ------     | ------    | -------------                                                                                                                                       |
+    | `Currency` | Type      | The Move type for the `Currency` being added to the sending account of the transaction. `Currency` must be an already-registered currency on-chain. |
+    | `account`  | `&signer` | The signer of the sending account of the transaction.                                                                                               |
+
+    # Common Abort Conditions
+    | Error Category              | Error Reason                             | Description                                                                |
+    | ----------------            | --------------                           | -------------                                                              |
+    | `Errors::NOT_PUBLISHED`     | `Libra::ECURRENCY_INFO`                  | The `Currency` is not a registered currency on-chain.                      |
+    | `Errors::INVALID_ARGUMENT`  | `LibraAccount::EROLE_CANT_STORE_BALANCE` | The sending `account`'s role does not permit balances.                     |
+    | `Errors::ALREADY_PUBLISHED` | `LibraAccount::EADD_EXISTING_CURRENCY`   | A balance for `Currency` is already published under the sending `account`. |
+
+    # Related Scripts
+    * `Script::create_child_vasp_account`
+    * `Script::create_parent_vasp_account`
+    * `Script::peer_to_peer_with_metadata`
+    """
+
+    currency: libra_types.TypeTag
+
+
+def encode_add_currency_to_account_script(currency: TypeTag) -> Script:
+    """# Summary
+    Adds a zero `Currency` balance to the sending `account`.
+
+    This will enable `account` to
+    send, receive, and hold `Libra::Libra<Currency>` coins. This transaction can be
+    successfully sent by any account that is allowed to hold balances
+    (e.g., VASP, Designated Dealer).
+
+    # Technical Description
+    After the successful execution of this transaction the sending account will have a
+    `LibraAccount::Balance<Currency>` resource with zero balance published under it. Only
+    accounts that can hold balances can send this transaction, the sending account cannot
+    already have a `LibraAccount::Balance<Currency>` published under it.
+
+    # Parameters
+    | Name       | Type      | Description                                                                                                                                         |
+    | ------     | ------    | -------------                                                                                                                                       |
+    | `Currency` | Type      | The Move type for the `Currency` being added to the sending account of the transaction. `Currency` must be an already-registered currency on-chain. |
+    | `account`  | `&signer` | The signer of the sending account of the transaction.                                                                                               |
+
+    # Common Abort Conditions
+    | Error Category              | Error Reason                             | Description                                                                |
+    | ----------------            | --------------                           | -------------                                                              |
+    | `Errors::NOT_PUBLISHED`     | `Libra::ECURRENCY_INFO`                  | The `Currency` is not a registered currency on-chain.                      |
+    | `Errors::INVALID_ARGUMENT`  | `LibraAccount::EROLE_CANT_STORE_BALANCE` | The sending `account`'s role does not permit balances.                     |
+    | `Errors::ALREADY_PUBLISHED` | `LibraAccount::EADD_EXISTING_CURRENCY`   | A balance for `Currency` is already published under the sending `account`. |
+
+    # Related Scripts
+    * `Script::create_child_vasp_account`
+    * `Script::create_parent_vasp_account`
+    * `Script::peer_to_peer_with_metadata`
+    """
+    return Script(
+        code=ADD_CURRENCY_TO_ACCOUNT_CODE,
+        ty_args=[currency],
+        args=[],
+    )
+
+
+def decode_add_currency_to_account_script(script: Script) -> ScriptCall:
+    return ScriptCall__AddCurrencyToAccount(
+        currency=script.ty_args[0],
+    )
+
+
+ADD_CURRENCY_TO_ACCOUNT_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x06\x01\x00\x02\x03\x02\x06\x04\x08\x02\x05\x0a\x07\x07\x11\x1a\x08\x2b\x10\x00\x00\x00\x01\x00\x01\x01\x01\x00\x02\x01\x06\x0c\x00\x01\x09\x00\x0c\x4c\x69\x62\x72\x61\x41\x63\x63\x6f\x75\x6e\x74\x0c\x61\x64\x64\x5f\x63\x75\x72\x72\x65\x6e\x63\x79\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x00\x01\x03\x0b\x00\x38\x00\x02"
@@ -0,0 +1,112 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import libra_types
+from libra.libra_types import Script, AccountAddress, TransactionArgument__Address
+from libra.stdlib import ScriptCall, decode_address_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__AddRecoveryRotationCapability(ScriptCall):
+    """# Summary
+    Stores the sending accounts ability to rotate its authentication key with a designated recovery
+    account.
+
+    Both the sending and recovery accounts need to belong to the same VASP and
+    both be VASP accounts. After this transaction both the sending account and the
+    specified recovery account can rotate the sender account's authentication key.
+
+    # Technical Description
+    Adds the `LibraAccount::KeyRotationCapability` for the sending account
+    (`to_recover_account`) to the `RecoveryAddress::RecoveryAddress` resource under
+    `recovery_address`. After this transaction has been executed successfully the account at
+    `recovery_address` and the `to_recover_account` may rotate the authentication key of
+    `to_recover_account` (the sender of this transaction).
+
+    The sending account of this transaction (`to_recover_account`) must not have previously given away its unique key
+    rotation capability, and must be a VASP account. The account at `recovery_address`
+    must also be a VASP account belonging to the same VASP as the `to_recover_account`.
+    Additionally the account at `recovery_address` must have already initialized itself as
+    a recovery account address using the `Script::create_recovery_address` transaction script.
+
+    The sending account's (`to_recover_account`) key rotation capability is
+    removed in this transaction and stored in the `RecoveryAddress::RecoveryAddress`
+    resource stored under the account at `recovery_address`.
+
+    # Parameters
+    | Name                 | Type      | Description                                                                                                |
+    | ------               | ------    | -------------                                                                                              |
+    | `to_recover_account` | `&signer` | The signer reference of the sending account of this transaction.                                           |
+    | `recovery_address`   | `address` | The account address where the `to_recover_account`'s `LibraAccount::KeyRotationCapability` will be stored. |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                               | Description                                                                                     |
+    | ----------------           | --------------                                             | -------------                                                                                   |
+    | `Errors::INVALID_STATE`    | `LibraAccount::EKEY_ROTATION_CAPABILITY_ALREADY_EXTRACTED` | `to_recover_account` has already delegated/extracted its `LibraAccount::KeyRotationCapability`. |
+    | `Errors::NOT_PUBLISHED`    | `RecoveryAddress::ERECOVERY_ADDRESS`                       | `recovery_address` does not have a `RecoveryAddress` resource published under it.               |
+    | `Errors::INVALID_ARGUMENT` | `RecoveryAddress::EINVALID_KEY_ROTATION_DELEGATION`        | `to_recover_account` and `recovery_address` do not belong to the same VASP.                     |
+
+    # Related Scripts
+    * `Script::create_recovery_address`
+    * `Script::rotate_authentication_key_with_recovery_address`
+    """
+
+    recovery_address: libra_types.AccountAddress
+
+
+def encode_add_recovery_rotation_capability_script(recovery_address: AccountAddress) -> Script:
+    """# Summary
+    Stores the sending accounts ability to rotate its authentication key with a designated recovery
+    account.
+
+    Both the sending and recovery accounts need to belong to the same VASP and
+    both be VASP accounts. After this transaction both the sending account and the
+    specified recovery account can rotate the sender account's authentication key.
+
+    # Technical Description
+    Adds the `LibraAccount::KeyRotationCapability` for the sending account
+    (`to_recover_account`) to the `RecoveryAddress::RecoveryAddress` resource under
+    `recovery_address`. After this transaction has been executed successfully the account at
+    `recovery_address` and the `to_recover_account` may rotate the authentication key of
+    `to_recover_account` (the sender of this transaction).
+
+    The sending account of this transaction (`to_recover_account`) must not have previously given away its unique key
+    rotation capability, and must be a VASP account. The account at `recovery_address`
+    must also be a VASP account belonging to the same VASP as the `to_recover_account`.
+    Additionally the account at `recovery_address` must have already initialized itself as
+    a recovery account address using the `Script::create_recovery_address` transaction script.
+
+    The sending account's (`to_recover_account`) key rotation capability is
+    removed in this transaction and stored in the `RecoveryAddress::RecoveryAddress`
+    resource stored under the account at `recovery_address`.
+
+    # Parameters
+    | Name                 | Type      | Description                                                                                                |
+    | ------               | ------    | -------------                                                                                              |
+    | `to_recover_account` | `&signer` | The signer reference of the sending account of this transaction.                                           |
+    | `recovery_address`   | `address` | The account address where the `to_recover_account`'s `LibraAccount::KeyRotationCapability` will be stored. |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                               | Description                                                                                     |
+    | ----------------           | --------------                                             | -------------                                                                                   |
+    | `Errors::INVALID_STATE`    | `LibraAccount::EKEY_ROTATION_CAPABILITY_ALREADY_EXTRACTED` | `to_recover_account` has already delegated/extracted its `LibraAccount::KeyRotationCapability`. |
+    | `Errors::NOT_PUBLISHED`    | `RecoveryAddress::ERECOVERY_ADDRESS`                       | `recovery_address` does not have a `RecoveryAddress` resource published under it.               |
+    | `Errors::INVALID_ARGUMENT` | `RecoveryAddress::EINVALID_KEY_ROTATION_DELEGATION`        | `to_recover_account` and `recovery_address` do not belong to the same VASP.                     |
+
+    # Related Scripts
+    * `Script::create_recovery_address`
+    * `Script::rotate_authentication_key_with_recovery_address`
+    """
+    return Script(
+        code=ADD_RECOVERY_ROTATION_CAPABILITY_CODE,
+        ty_args=[],
+        args=[TransactionArgument__Address(value=recovery_address)],
+    )
+
+
+def decode_add_recovery_rotation_capability_script(script: Script) -> ScriptCall:
+    return ScriptCall__AddRecoveryRotationCapability(
+        recovery_address=decode_address_argument(script.args[0]),
+    )
+
+
+ADD_RECOVERY_ROTATION_CAPABILITY_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x06\x01\x00\x04\x02\x04\x04\x03\x08\x0a\x05\x12\x0f\x07\x21\x6b\x08\x8c\x01\x10\x00\x00\x00\x01\x00\x02\x01\x00\x00\x03\x00\x01\x00\x01\x04\x02\x03\x00\x01\x06\x0c\x01\x08\x00\x02\x08\x00\x05\x00\x02\x06\x0c\x05\x0c\x4c\x69\x62\x72\x61\x41\x63\x63\x6f\x75\x6e\x74\x0f\x52\x65\x63\x6f\x76\x65\x72\x79\x41\x64\x64\x72\x65\x73\x73\x15\x4b\x65\x79\x52\x6f\x74\x61\x74\x69\x6f\x6e\x43\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x1f\x65\x78\x74\x72\x61\x63\x74\x5f\x6b\x65\x79\x5f\x72\x6f\x74\x61\x74\x69\x6f\x6e\x5f\x63\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x17\x61\x64\x64\x5f\x72\x6f\x74\x61\x74\x69\x6f\x6e\x5f\x63\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x04\x03\x05\x0b\x00\x11\x00\x0a\x01\x11\x01\x02"
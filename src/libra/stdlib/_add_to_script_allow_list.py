@@ -0,0 +1,102 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra.libra_types import Script, TransactionArgument__U64, TransactionArgument__U8Vector
+from libra.stdlib import ScriptCall, decode_u64_argument, decode_u8vector_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__AddToScriptAllowList(ScriptCall):
+    """# Summary
+    Adds a script hash to the transaction allowlist.
+
+    This transaction
+    can only be sent by the Libra Root account. Scripts with this hash can be
+    sent afterward the successful execution of this script.
+
+    # Technical Description
+
+    The sending account (`lr_account`) must be the Libra Root account. The script allow
+    list must not already hold the script `hash` being added. The `sliding_nonce` must be
+    a valid nonce for the Libra Root account. After this transaction has executed
+    successfully a reconfiguration will be initiated, and the on-chain config
+    `LibraTransactionPublishingOption::LibraTransactionPublishingOption`'s
+    `script_allow_list` field will contain the new script `hash` and transactions
+    with this `hash` can be successfully sent to the network.
+
+    # Parameters
+    | Name            | Type         | Description                                                                                     |
+    | ------          | ------       | -------------                                                                                   |
+    | `lr_account`    | `&signer`    | The signer reference of the sending account of this transaction. Must be the Libra Root signer. |
+    | `hash`          | `vector<u8>` | The hash of the script to be added to the script allowlist.                                     |
+    | `sliding_nonce` | `u64`        | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                      |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                                           | Description                                                                                |
+    | ----------------           | --------------                                                         | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`                                         | A `SlidingNonce` resource is not published under `lr_account`.                             |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_OLD`                                         | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_NEW`                                         | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_ALREADY_RECORDED`                                | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::REQUIRES_ADDRESS` | `CoreAddresses::ELIBRA_ROOT`                                           | The sending account is not the Libra Root account.                                         |
+    | `Errors::REQUIRES_ROLE`    | `Roles::ELIBRA_ROOT`                                                   | The sending account is not the Libra Root account.                                         |
+    | `Errors::INVALID_ARGUMENT` | `LibraTransactionPublishingOption::EINVALID_SCRIPT_HASH`               | The script `hash` is an invalid length.                                                    |
+    | `Errors::INVALID_ARGUMENT` | `LibraTransactionPublishingOption::EALLOWLIST_ALREADY_CONTAINS_SCRIPT` | The on-chain allowlist already contains the script `hash`.                                 |
+    """
+
+    hash: bytes
+    sliding_nonce: st.uint64
+
+
+def encode_add_to_script_allow_list_script(hash: bytes, sliding_nonce: st.uint64) -> Script:
+    """# Summary
+    Adds a script hash to the transaction allowlist.
+
+    This transaction
+    can only be sent by the Libra Root account. Scripts with this hash can be
+    sent afterward the successful execution of this script.
+
+    # Technical Description
+
+    The sending account (`lr_account`) must be the Libra Root account. The script allow
+    list must not already hold the script `hash` being added. The `sliding_nonce` must be
+    a valid nonce for the Libra Root account. After this transaction has executed
+    successfully a reconfiguration will be initiated, and the on-chain config
+    `LibraTransactionPublishingOption::LibraTransactionPublishingOption`'s
+    `script_allow_list` field will contain the new script `hash` and transactions
+    with this `hash` can be successfully sent to the network.
+
+    # Parameters
+    | Name            | Type         | Description                                                                                     |
+    | ------          | ------       | -------------                                                                                   |
+    | `lr_account`    | `&signer`    | The signer reference of the sending account of this transaction. Must be the Libra Root signer. |
+    | `hash`          | `vector<u8>` | The hash of the script to be added to the script allowlist.                                     |
+    | `sliding_nonce` | `u64`        | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                      |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                                           | Description                                                                                |
+    | ----------------           | --------------                                                         | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`                                         | A `SlidingNonce` resource is not published under `lr_account`.                             |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_OLD`                                         | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_NEW`                                         | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_ALREADY_RECORDED`                                | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::REQUIRES_ADDRESS` | `CoreAddresses::ELIBRA_ROOT`                                           | The sending account is not the Libra Root account.                                         |
+    | `Errors::REQUIRES_ROLE`    | `Roles::ELIBRA_ROOT`                                                   | The sending account is not the Libra Root account.                                         |
+    | `Errors::INVALID_ARGUMENT` | `LibraTransactionPublishingOption::EINVALID_SCRIPT_HASH`               | The script `hash` is an invalid length.                                                    |
+    | `Errors::INVALID_ARGUMENT` | `LibraTransactionPublishingOption::EALLOWLIST_ALREADY_CONTAINS_SCRIPT` | The on-chain allowlist already contains the script `hash`.                                 |
+    """
+    return Script(
+        code=ADD_TO_SCRIPT_ALLOW_LIST_CODE,
+        ty_args=[],
+        args=[TransactionArgument__U8Vector(value=hash), TransactionArgument__U64(value=sliding_nonce)],
+    )
+
+
+def decode_add_to_script_allow_list_script(script: Script) -> ScriptCall:
+    return ScriptCall__AddToScriptAllowList(
+        hash=decode_u8vector_argument(script.args[0]),
+        sliding_nonce=decode_u64_argument(script.args[1]),
+    )
+
+
+ADD_TO_SCRIPT_ALLOW_LIST_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x05\x01\x00\x04\x03\x04\x0a\x05\x0e\x10\x07\x1e\x5d\x08\x7b\x10\x00\x00\x00\x01\x00\x02\x00\x01\x00\x01\x03\x02\x01\x00\x02\x06\x0c\x0a\x02\x00\x02\x06\x0c\x03\x03\x06\x0c\x0a\x02\x03\x20\x4c\x69\x62\x72\x61\x54\x72\x61\x6e\x73\x61\x63\x74\x69\x6f\x6e\x50\x75\x62\x6c\x69\x73\x68\x69\x6e\x67\x4f\x70\x74\x69\x6f\x6e\x0c\x53\x6c\x69\x64\x69\x6e\x67\x4e\x6f\x6e\x63\x65\x18\x61\x64\x64\x5f\x74\x6f\x5f\x73\x63\x72\x69\x70\x74\x5f\x61\x6c\x6c\x6f\x77\x5f\x6c\x69\x73\x74\x15\x72\x65\x63\x6f\x72\x64\x5f\x6e\x6f\x6e\x63\x65\x5f\x6f\x72\x5f\x61\x62\x6f\x72\x74\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x03\x01\x07\x0a\x00\x0a\x02\x11\x01\x0b\x00\x0b\x01\x11\x00\x02"
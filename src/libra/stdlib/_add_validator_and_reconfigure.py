@@ -0,0 +1,141 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra import libra_types
+from libra.libra_types import (
+    Script,
+    AccountAddress,
+    TransactionArgument__U64,
+    TransactionArgument__Address,
+    TransactionArgument__U8Vector,
+)
+from libra.stdlib import ScriptCall, decode_u64_argument, decode_address_argument, decode_u8vector_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__AddValidatorAndReconfigure(ScriptCall):
+    """# Summary
+    Adds a validator account to the validator set, and triggers a
+    reconfiguration of the system to admit the account to the validator set for the system.
+
+    This
+    transaction can only be successfully called by the Libra Root account.
+
+    # Technical Description
+    This script adds the account at `validator_address` to the validator set.
+    This transaction emits a `LibraConfig::NewEpochEvent` event and triggers a
+    reconfiguration. Once the reconfiguration triggered by this script's
+    execution has been performed, the account at the `validator_address` is
+    considered to be a validator in the network.
+
+    This transaction script will fail if the `validator_address` address is already in the validator set
+    or does not have a `ValidatorConfig::ValidatorConfig` resource already published under it.
+
+    # Parameters
+    | Name                | Type         | Description                                                                                                                        |
+    | ------              | ------       | -------------                                                                                                                      |
+    | `lr_account`        | `&signer`    | The signer reference of the sending account of this transaction. Must be the Libra Root signer.                                    |
+    | `sliding_nonce`     | `u64`        | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                                                         |
+    | `validator_name`    | `vector<u8>` | ASCII-encoded human name for the validator. Must match the human name in the `ValidatorConfig::ValidatorConfig` for the validator. |
+    | `validator_address` | `address`    | The validator account address to be added to the validator set.                                                                    |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                  | Description                                                                                                                               |
+    | ----------------           | --------------                                | -------------                                                                                                                             |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`                | A `SlidingNonce` resource is not published under `lr_account`.                                                                            |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_OLD`                | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not.                                                |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_NEW`                | The `sliding_nonce` is too far in the future.                                                                                             |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_ALREADY_RECORDED`       | The `sliding_nonce` has been previously recorded.                                                                                         |
+    | `Errors::REQUIRES_ADDRESS` | `CoreAddresses::ELIBRA_ROOT`                  | The sending account is not the Libra Root account.                                                                                        |
+    | `Errors::REQUIRES_ROLE`    | `Roles::ELIBRA_ROOT`                          | The sending account is not the Libra Root account.                                                                                        |
+    | 0                          | 0                                             | The provided `validator_name` does not match the already-recorded human name for the validator.                                           |
+    | `Errors::INVALID_ARGUMENT` | `LibraSystem::EINVALID_PROSPECTIVE_VALIDATOR` | The validator to be added does not have a `ValidatorConfig::ValidatorConfig` resource published under it, or its `config` field is empty. |
+    | `Errors::INVALID_ARGUMENT` | `LibraSystem::EALREADY_A_VALIDATOR`           | The `validator_address` account is already a registered validator.                                                                        |
+    | `Errors::INVALID_STATE`    | `LibraConfig::EINVALID_BLOCK_TIME`            | An invalid time value was encountered in reconfiguration. Unlikely to occur.                                                              |
+
+    # Related Scripts
+    * `Script::create_validator_account`
+    * `Script::create_validator_operator_account`
+    * `Script::register_validator_config`
+    * `Script::remove_validator_and_reconfigure`
+    * `Script::set_validator_operator`
+    * `Script::set_validator_operator_with_nonce_admin`
+    * `Script::set_validator_config_and_reconfigure`
+    """
+
+    sliding_nonce: st.uint64
+    validator_name: bytes
+    validator_address: libra_types.AccountAddress
+
+
+def encode_add_validator_and_reconfigure_script(
+    sliding_nonce: st.uint64, validator_name: bytes, validator_address: AccountAddress
+) -> Script:
+    """# Summary
+    Adds a validator account to the validator set, and triggers a
+    reconfiguration of the system to admit the account to the validator set for the system.
+
+    This
+    transaction can only be successfully called by the Libra Root account.
+
+    # Technical Description
+    This script adds the account at `validator_address` to the validator set.
+    This transaction emits a `LibraConfig::NewEpochEvent` event and triggers a
+    reconfiguration. Once the reconfiguration triggered by this script's
+    execution has been performed, the account at the `validator_address` is
+    considered to be a validator in the network.
+
+    This transaction script will fail if the `validator_address` address is already in the validator set
+    or does not have a `ValidatorConfig::ValidatorConfig` resource already published under it.
+
+    # Parameters
+    | Name                | Type         | Description                                                                                                                        |
+    | ------              | ------       | -------------                                                                                                                      |
+    | `lr_account`        | `&signer`    | The signer reference of the sending account of this transaction. Must be the Libra Root signer.                                    |
+    | `sliding_nonce`     | `u64`        | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                                                         |
+    | `validator_name`    | `vector<u8>` | ASCII-encoded human name for the validator. Must match the human name in the `ValidatorConfig::ValidatorConfig` for the validator. |
+    | `validator_address` | `address`    | The validator account address to be added to the validator set.                                                                    |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                  | Description                                                                                                                               |
+    | ----------------           | --------------                                | -------------                                                                                                                             |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`                | A `SlidingNonce` resource is not published under `lr_account`.                                                                            |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_OLD`                | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not.                                                |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_NEW`                | The `sliding_nonce` is too far in the future.                                                                                             |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_ALREADY_RECORDED`       | The `sliding_nonce` has been previously recorded.                                                                                         |
+    | `Errors::REQUIRES_ADDRESS` | `CoreAddresses::ELIBRA_ROOT`                  | The sending account is not the Libra Root account.                                                                                        |
+    | `Errors::REQUIRES_ROLE`    | `Roles::ELIBRA_ROOT`                          | The sending account is not the Libra Root account.                                                                                        |
+    | 0                          | 0                                             | The provided `validator_name` does not match the already-recorded human name for the validator.                                           |
+    | `Errors::INVALID_ARGUMENT` | `LibraSystem::EINVALID_PROSPECTIVE_VALIDATOR` | The validator to be added does not have a `ValidatorConfig::ValidatorConfig` resource published under it, or its `config` field is empty. |
+    | `Errors::INVALID_ARGUMENT` | `LibraSystem::EALREADY_A_VALIDATOR`           | The `validator_address` account is already a registered validator.                                                                        |
+    | `Errors::INVALID_STATE`    | `LibraConfig::EINVALID_BLOCK_TIME`            | An invalid time value was encountered in reconfiguration. Unlikely to occur.                                                              |
+
+    # Related Scripts
+    * `Script::create_validator_account`
+    * `Script::create_validator_operator_account`
+    * `Script::register_validator_config`
+    * `Script::remove_validator_and_reconfigure`
+    * `Script::set_validator_operator`
+    * `Script::set_validator_operator_with_nonce_admin`
+    * `Script::set_validator_config_and_reconfigure`
+    """
+    return Script(
+        code=ADD_VALIDATOR_AND_RECONFIGURE_CODE,
+        ty_args=[],
+        args=[
+            TransactionArgument__U64(value=sliding_nonce),
+            TransactionArgument__U8Vector(value=validator_name),
+            TransactionArgument__Address(value=validator_address),
+        ],
+    )
+
+
+def decode_add_validator_and_reconfigure_script(script: Script) -> ScriptCall:
+    return ScriptCall__AddValidatorAndReconfigure(
+        sliding_nonce=decode_u64_argument(script.args[0]),
+        validator_name=decode_u8vector_argument(script.args[1]),
+        validator_address=decode_address_argument(script.args[2]),
+    )
+
+
+ADD_VALIDATOR_AND_RECONFIGURE_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x05\x01\x00\x06\x03\x06\x0f\x05\x15\x18\x07\x2d\x5c\x08\x89\x01\x10\x00\x00\x00\x01\x00\x02\x01\x03\x00\x01\x00\x02\x04\x02\x03\x00\x00\x05\x04\x01\x00\x02\x06\x0c\x03\x00\x01\x05\x01\x0a\x02\x02\x06\x0c\x05\x04\x06\x0c\x03\x0a\x02\x05\x02\x01\x03\x0b\x4c\x69\x62\x72\x61\x53\x79\x73\x74\x65\x6d\x0c\x53\x6c\x69\x64\x69\x6e\x67\x4e\x6f\x6e\x63\x65\x0f\x56\x61\x6c\x69\x64\x61\x74\x6f\x72\x43\x6f\x6e\x66\x69\x67\x15\x72\x65\x63\x6f\x72\x64\x5f\x6e\x6f\x6e\x63\x65\x5f\x6f\x72\x5f\x61\x62\x6f\x72\x74\x0e\x67\x65\x74\x5f\x68\x75\x6d\x61\x6e\x5f\x6e\x61\x6d\x65\x0d\x61\x64\x64\x5f\x76\x61\x6c\x69\x64\x61\x74\x6f\x72\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x05\x06\x12\x0a\x00\x0a\x01\x11\x00\x0a\x03\x11\x01\x0b\x02\x21\x0c\x04\x0b\x04\x03\x0e\x0b\x00\x01\x06\x00\x00\x00\x00\x00\x00\x00\x00\x27\x0b\x00\x0a\x03\x11\x02\x02"
@@ -0,0 +1,139 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra import libra_types
+from libra.libra_types import Script, TypeTag, AccountAddress, TransactionArgument__U64, TransactionArgument__Address
+from libra.stdlib import ScriptCall, decode_u64_argument, decode_address_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__Burn(ScriptCall):
+    """# Summary
+    Burns all coins held in the preburn resource at the specified
+    preburn address and removes them from the system.
+
+    The sending account must
+    be the Treasury Compliance account.
+    The account that holds the preburn resource will normally be a Designated
+    Dealer, but there are no enforced requirements that it be one.
+
+    # Technical Description
+    This transaction permanently destroys all the coins of `Token` type
+    stored in the `Libra::Preburn<Token>` resource published under the
+    `preburn_address` account address.
+
+    This transaction will only succeed if the sending `account` has a
+    `Libra::BurnCapability<Token>`, and a `Libra::Preburn<Token>` resource
+    exists under `preburn_address`, with a non-zero `to_burn` field. After the successful execution
+    of this transaction the `total_value` field in the
+    `Libra::CurrencyInfo<Token>` resource published under `0xA550C18` will be
+    decremented by the value of the `to_burn` field of the preburn resource
+    under `preburn_address` immediately before this transaction, and the
+    `to_burn` field of the preburn resource will have a zero value.
+
+    ## Events
+    The successful execution of this transaction will emit a `Libra::BurnEvent` on the event handle
+    held in the `Libra::CurrencyInfo<Token>` resource's `burn_events` published under
+    `0xA550C18`.
+
+    # Parameters
+    | Name              | Type      | Description                                                                                                                  |
+    | ------            | ------    | -------------                                                                                                                |
+    | `Token`           | Type      | The Move type for the `Token` currency being burned. `Token` must be an already-registered currency on-chain.                |
+    | `tc_account`      | `&signer` | The signer reference of the sending account of this transaction, must have a burn capability for `Token` published under it. |
+    | `sliding_nonce`   | `u64`     | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                                                   |
+    | `preburn_address` | `address` | The address where the coins to-be-burned are currently held.                                                                 |
+
+    # Common Abort Conditions
+    | Error Category                | Error Reason                            | Description                                                                                           |
+    | ----------------              | --------------                          | -------------                                                                                         |
+    | `Errors::NOT_PUBLISHED`       | `SlidingNonce::ESLIDING_NONCE`          | A `SlidingNonce` resource is not published under `account`.                                           |
+    | `Errors::INVALID_ARGUMENT`    | `SlidingNonce::ENONCE_TOO_OLD`          | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not.            |
+    | `Errors::INVALID_ARGUMENT`    | `SlidingNonce::ENONCE_TOO_NEW`          | The `sliding_nonce` is too far in the future.                                                         |
+    | `Errors::INVALID_ARGUMENT`    | `SlidingNonce::ENONCE_ALREADY_RECORDED` | The `sliding_nonce` has been previously recorded.                                                     |
+    | `Errors::REQUIRES_CAPABILITY` | `Libra::EBURN_CAPABILITY`               | The sending `account` does not have a `Libra::BurnCapability<Token>` published under it.              |
+    | `Errors::NOT_PUBLISHED`       | `Libra::EPREBURN`                       | The account at `preburn_address` does not have a `Libra::Preburn<Token>` resource published under it. |
+    | `Errors::INVALID_STATE`       | `Libra::EPREBURN_EMPTY`                 | The `Libra::Preburn<Token>` resource is empty (has a value of 0).                                     |
+    | `Errors::NOT_PUBLISHED`       | `Libra::ECURRENCY_INFO`                 | The specified `Token` is not a registered currency on-chain.                                          |
+
+    # Related Scripts
+    * `Script::burn_txn_fees`
+    * `Script::cancel_burn`
+    * `Script::preburn`
+    """
+
+    token: libra_types.TypeTag
+    sliding_nonce: st.uint64
+    preburn_address: libra_types.AccountAddress
+
+
+def encode_burn_script(token: TypeTag, sliding_nonce: st.uint64, preburn_address: AccountAddress) -> Script:
+    """# Summary
+    Burns all coins held in the preburn resource at the specified
+    preburn address and removes them from the system.
+
+    The sending account must
+    be the Treasury Compliance account.
+    The account that holds the preburn resource will normally be a Designated
+    Dealer, but there are no enforced requirements that it be one.
+
+    # Technical Description
+    This transaction permanently destroys all the coins of `Token` type
+    stored in the `Libra::Preburn<Token>` resource published under the
+    `preburn_address` account address.
+
+    This transaction will only succeed if the sending `account` has a
+    `Libra::BurnCapability<Token>`, and a `Libra::Preburn<Token>` resource
+    exists under `preburn_address`, with a non-zero `to_burn` field. After the successful execution
+    of this transaction the `total_value` field in the
+    `Libra::CurrencyInfo<Token>` resource published under `0xA550C18` will be
+    decremented by the value of the `to_burn` field of the preburn resource
+    under `preburn_address` immediately before this transaction, and the
+    `to_burn` field of the preburn resource will have a zero value.
+
+    ## Events
+    The successful execution of this transaction will emit a `Libra::BurnEvent` on the event handle
+    held in the `Libra::CurrencyInfo<Token>` resource's `burn_events` published under
+    `0xA550C18`.
+
+    # Parameters
+    | Name              | Type      | Description                                                                                                                  |
+    | ------            | ------    | -------------                                                                                                                |
+    | `Token`           | Type      | The Move type for the `Token` currency being burned. `Token` must be an already-registered currency on-chain.                |
+    | `tc_account`      | `&signer` | The signer reference of the sending account of this transaction, must have a burn capability for `Token` published under it. |
+    | `sliding_nonce`   | `u64`     | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                                                   |
+    | `preburn_address` | `address` | The address where the coins to-be-burned are currently held.                                                                 |
+
+    # Common Abort Conditions
+    | Error Category                | Error Reason                            | Description                                                                                           |
+    | ----------------              | --------------                          | -------------                                                                                         |
+    | `Errors::NOT_PUBLISHED`       | `SlidingNonce::ESLIDING_NONCE`          | A `SlidingNonce` resource is not published under `account`.                                           |
+    | `Errors::INVALID_ARGUMENT`    | `SlidingNonce::ENONCE_TOO_OLD`          | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not.            |
+    | `Errors::INVALID_ARGUMENT`    | `SlidingNonce::ENONCE_TOO_NEW`          | The `sliding_nonce` is too far in the future.                                                         |
+    | `Errors::INVALID_ARGUMENT`    | `SlidingNonce::ENONCE_ALREADY_RECORDED` | The `sliding_nonce` has been previously recorded.                                                     |
+    | `Errors::REQUIRES_CAPABILITY` | `Libra::EBURN_CAPABILITY`               | The sending `account` does not have a `Libra::BurnCapability<Token>` published under it.              |
+    | `Errors::NOT_PUBLISHED`       | `Libra::EPREBURN`                       | The account at `preburn_address` does not have a `Libra::Preburn<Token>` resource published under it. |
+    | `Errors::INVALID_STATE`       | `Libra::EPREBURN_EMPTY`                 | The `Libra::Preburn<Token>` resource is empty (has a value of 0).                                     |
+    | `Errors::NOT_PUBLISHED`       | `Libra::ECURRENCY_INFO`                 | The specified `Token` is not a registered currency on-chain.                                          |
+
+    # Related Scripts
+    * `Script::burn_txn_fees`
+    * `Script::cancel_burn`
+    * `Script::preburn`
+    """
+    return Script(
+        code=BURN_CODE,
+        ty_args=[token],
+        args=[TransactionArgument__U64(value=sliding_nonce), TransactionArgument__Address(value=preburn_address)],
+    )
+
+
+def decode_burn_script(script: Script) -> ScriptCall:
+    return ScriptCall__Burn(
+        token=script.ty_args[0],
+        sliding_nonce=decode_u64_argument(script.args[0]),
+        preburn_address=decode_address_argument(script.args[1]),
+    )
+
+
+BURN_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x06\x01\x00\x04\x03\x04\x0b\x04\x0f\x02\x05\x11\x11\x07\x22\x2e\x08\x50\x10\x00\x00\x00\x01\x01\x02\x00\x01\x00\x00\x03\x02\x01\x01\x01\x01\x04\x02\x06\x0c\x03\x00\x02\x06\x0c\x05\x03\x06\x0c\x03\x05\x01\x09\x00\x05\x4c\x69\x62\x72\x61\x0c\x53\x6c\x69\x64\x69\x6e\x67\x4e\x6f\x6e\x63\x65\x15\x72\x65\x63\x6f\x72\x64\x5f\x6e\x6f\x6e\x63\x65\x5f\x6f\x72\x5f\x61\x62\x6f\x72\x74\x04\x62\x75\x72\x6e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x03\x01\x07\x0a\x00\x0a\x01\x11\x00\x0b\x00\x0a\x02\x38\x00\x02"
@@ -0,0 +1,104 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import libra_types
+from libra.libra_types import Script, TypeTag
+from libra.stdlib import ScriptCall
+
+
+@dataclass(frozen=True)
+class ScriptCall__BurnTxnFees(ScriptCall):
+    """# Summary
+    Burns the transaction fees collected in the `CoinType` currency so that the
+    Libra association may reclaim the backing coins off-chain.
+
+    May only be sent
+    by the Treasury Compliance account.
+
+    # Technical Description
+    Burns the transaction fees collected in `CoinType` so that the
+    association may reclaim the backing coins. Once this transaction has executed
+    successfully all transaction fees that will have been collected in
+    `CoinType` since the last time this script was called with that specific
+    currency. Both `balance` and `preburn` fields in the
+    `TransactionFee::TransactionFee<CoinType>` resource published under the `0xB1E55ED`
+    account address will have a value of 0 after the successful execution of this script.
+
+    ## Events
+    The successful execution of this transaction will emit a `Libra::BurnEvent` on the event handle
+    held in the `Libra::CurrencyInfo<CoinType>` resource's `burn_events` published under
+    `0xA550C18`.
+
+    # Parameters
+    | Name         | Type      | Description                                                                                                                                         |
+    | ------       | ------    | -------------                                                                                                                                       |
+    | `CoinType`   | Type      | The Move type for the `CoinType` being added to the sending account of the transaction. `CoinType` must be an already-registered currency on-chain. |
+    | `tc_account` | `&signer` | The signer reference of the sending account of this transaction. Must be the Treasury Compliance account.                                           |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                          | Description                                                 |
+    | ----------------           | --------------                        | -------------                                               |
+    | `Errors::REQUIRES_ADDRESS` | `CoreAddresses::ETREASURY_COMPLIANCE` | The sending account is not the Treasury Compliance account. |
+    | `Errors::NOT_PUBLISHED`    | `TransactionFee::ETRANSACTION_FEE`    | `CoinType` is not an accepted transaction fee currency.     |
+    | `Errors::INVALID_ARGUMENT` | `Libra::ECOIN`                        | The collected fees in `CoinType` are zero.                  |
+
+    # Related Scripts
+    * `Script::burn`
+    * `Script::cancel_burn`
+    """
+
+    coin_type: libra_types.TypeTag
+
+
+def encode_burn_txn_fees_script(coin_type: TypeTag) -> Script:
+    """# Summary
+    Burns the transaction fees collected in the `CoinType` currency so that the
+    Libra association may reclaim the backing coins off-chain.
+
+    May only be sent
+    by the Treasury Compliance account.
+
+    # Technical Description
+    Burns the transaction fees collected in `CoinType` so that the
+    association may reclaim the backing coins. Once this transaction has executed
+    successfully all transaction fees that will have been collected in
+    `CoinType` since the last time this script was called with that specific
+    currency. Both `balance` and `preburn` fields in the
+    `TransactionFee::TransactionFee<CoinType>` resource published under the `0xB1E55ED`
+    account address will have a value of 0 after the successful execution of this script.
+
+    ## Events
+    The successful execution of this transaction will emit a `Libra::BurnEvent` on the event handle
+    held in the `Libra::CurrencyInfo<CoinType>` resource's `burn_events` published under
+    `0xA550C18`.
+
+    # Parameters
+    | Name         | Type      | Description                                                                                                                                         |
+    | ------       | ------    | -------------                                                                                                                                       |
+    | `CoinType`   | Type      | The Move type for the `CoinType` being added to the sending account of the transaction. `CoinType` must be an already-registered currency on-chain. |
+    | `tc_account` | `&signer` | The signer reference of the sending account of this transaction. Must be the Treasury Compliance account.                                           |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                          | Description                                                 |
+    | ----------------           | --------------                        | -------------                                               |
+    | `Errors::REQUIRES_ADDRESS` | `CoreAddresses::ETREASURY_COMPLIANCE` | The sending account is not the Treasury Compliance account. |
+    | `Errors::NOT_PUBLISHED`    | `TransactionFee::ETRANSACTION_FEE`    | `CoinType` is not an accepted transaction fee currency.     |
+    | `Errors::INVALID_ARGUMENT` | `Libra::ECOIN`                        | The collected fees in `CoinType` are zero.                  |
+
+    # Related Scripts
+    * `Script::burn`
+    * `Script::cancel_burn`
+    """
+    return Script(
+        code=BURN_TXN_FEES_CODE,
+        ty_args=[coin_type],
+        args=[],
+    )
+
+
+def decode_burn_txn_fees_script(script: Script) -> ScriptCall:
+    return ScriptCall__BurnTxnFees(
+        coin_type=script.ty_args[0],
+    )
+
+
+BURN_TXN_FEES_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x06\x01\x00\x02\x03\x02\x06\x04\x08\x02\x05\x0a\x07\x07\x11\x19\x08\x2a\x10\x00\x00\x00\x01\x00\x01\x01\x01\x00\x02\x01\x06\x0c\x00\x01\x09\x00\x0e\x54\x72\x61\x6e\x73\x61\x63\x74\x69\x6f\x6e\x46\x65\x65\x09\x62\x75\x72\x6e\x5f\x66\x65\x65\x73\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x00\x01\x03\x0b\x00\x38\x00\x02"
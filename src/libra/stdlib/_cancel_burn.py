@@ -0,0 +1,126 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import libra_types
+from libra.libra_types import Script, TypeTag, AccountAddress, TransactionArgument__Address
+from libra.stdlib import ScriptCall, decode_address_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__CancelBurn(ScriptCall):
+    """# Summary
+    Cancels and returns all coins held in the preburn area under
+    `preburn_address` and returns the funds to the `preburn_address`'s balance.
+
+    Can only be successfully sent by an account with Treasury Compliance role.
+
+    # Technical Description
+    Cancels and returns all coins held in the `Libra::Preburn<Token>` resource under the `preburn_address` and
+    return the funds to the `preburn_address` account's `LibraAccount::Balance<Token>`.
+    The transaction must be sent by an `account` with a `Libra::BurnCapability<Token>`
+    resource published under it. The account at `preburn_address` must have a
+    `Libra::Preburn<Token>` resource published under it, and its value must be nonzero. The transaction removes
+    the entire balance held in the `Libra::Preburn<Token>` resource, and returns it back to the account's
+    `LibraAccount::Balance<Token>` under `preburn_address`. Due to this, the account at
+    `preburn_address` must already have a balance in the `Token` currency published
+    before this script is called otherwise the transaction will fail.
+
+    ## Events
+    The successful execution of this transaction will emit:
+    * A `Libra::CancelBurnEvent` on the event handle held in the `Libra::CurrencyInfo<Token>`
+    resource's `burn_events` published under `0xA550C18`.
+    * A `LibraAccount::ReceivedPaymentEvent` on the `preburn_address`'s
+    `LibraAccount::LibraAccount` `received_events` event handle with both the `payer` and `payee`
+    being `preburn_address`.
+
+    # Parameters
+    | Name              | Type      | Description                                                                                                                          |
+    | ------            | ------    | -------------                                                                                                                        |
+    | `Token`           | Type      | The Move type for the `Token` currenty that burning is being cancelled for. `Token` must be an already-registered currency on-chain. |
+    | `account`         | `&signer` | The signer reference of the sending account of this transaction, must have a burn capability for `Token` published under it.         |
+    | `preburn_address` | `address` | The address where the coins to-be-burned are currently held.                                                                         |
+
+    # Common Abort Conditions
+    | Error Category                | Error Reason                                     | Description                                                                                           |
+    | ----------------              | --------------                                   | -------------                                                                                         |
+    | `Errors::REQUIRES_CAPABILITY` | `Libra::EBURN_CAPABILITY`                        | The sending `account` does not have a `Libra::BurnCapability<Token>` published under it.              |
+    | `Errors::NOT_PUBLISHED`       | `Libra::EPREBURN`                                | The account at `preburn_address` does not have a `Libra::Preburn<Token>` resource published under it. |
+    | `Errors::NOT_PUBLISHED`       | `Libra::ECURRENCY_INFO`                          | The specified `Token` is not a registered currency on-chain.                                          |
+    | `Errors::INVALID_ARGUMENT`    | `LibraAccount::ECOIN_DEPOSIT_IS_ZERO`            | The value held in the preburn resource was zero.                                                      |
+    | `Errors::INVALID_ARGUMENT`    | `LibraAccount::EPAYEE_CANT_ACCEPT_CURRENCY_TYPE` | The account at `preburn_address` doesn't have a balance resource for `Token`.                         |
+    | `Errors::LIMIT_EXCEEDED`      | `LibraAccount::EDEPOSIT_EXCEEDS_LIMITS`          | The depositing of the funds held in the prebun area would exceed the `account`'s account limits.      |
+    | `Errors::INVALID_STATE`       | `DualAttestation::EPAYEE_COMPLIANCE_KEY_NOT_SET` | The `account` does not have a compliance key set on it but dual attestion checking was performed.     |
+
+    # Related Scripts
+    * `Script::burn_txn_fees`
+    * `Script::burn`
+    * `Script::preburn`
+    """
+
+    token: libra_types.TypeTag
+    preburn_address: libra_types.AccountAddress
+
+
+def encode_cancel_burn_script(token: TypeTag, preburn_address: AccountAddress) -> Script:
+    """# Summary
+    Cancels and returns all coins held in the preburn area under
+    `preburn_address` and returns the funds to the `preburn_address`'s balance.
+
+    Can only be successfully sent by an account with Treasury Compliance role.
+
+    # Technical Description
+    Cancels and returns all coins held in the `Libra::Preburn<Token>` resource under the `preburn_address` and
+    return the funds to the `preburn_address` account's `LibraAccount::Balance<Token>`.
+    The transaction must be sent by an `account` with a `Libra::BurnCapability<Token>`
+    resource published under it. The account at `preburn_address` must have a
+    `Libra::Preburn<Token>` resource published under it, and its value must be nonzero. The transaction removes
+    the entire balance held in the `Libra::Preburn<Token>` resource, and returns it back to the account's
+    `LibraAccount::Balance<Token>` under `preburn_address`. Due to this, the account at
+    `preburn_address` must already have a balance in the `Token` currency published
+    before this script is called otherwise the transaction will fail.
+
+    ## Events
+    The successful execution of this transaction will emit:
+    * A `Libra::CancelBurnEvent` on the event handle held in the `Libra::CurrencyInfo<Token>`
+    resource's `burn_events` published under `0xA550C18`.
+    * A `LibraAccount::ReceivedPaymentEvent` on the `preburn_address`'s
+    `LibraAccount::LibraAccount` `received_events` event handle with both the `payer` and `payee`
+    being `preburn_address`.
+
+    # Parameters
+    | Name              | Type      | Description                                                                                                                          |
+    | ------            | ------    | -------------                                                                                                                        |
+    | `Token`           | Type      | The Move type for the `Token` currenty that burning is being cancelled for. `Token` must be an already-registered currency on-chain. |
+    | `account`         | `&signer` | The signer reference of the sending account of this transaction, must have a burn capability for `Token` published under it.         |
+    | `preburn_address` | `address` | The address where the coins to-be-burned are currently held.                                                                         |
+
+    # Common Abort Conditions
+    | Error Category                | Error Reason                                     | Description                                                                                           |
+    | ----------------              | --------------                                   | -------------                                                                                         |
+    | `Errors::REQUIRES_CAPABILITY` | `Libra::EBURN_CAPABILITY`                        | The sending `account` does not have a `Libra::BurnCapability<Token>` published under it.              |
+    | `Errors::NOT_PUBLISHED`       | `Libra::EPREBURN`                                | The account at `preburn_address` does not have a `Libra::Preburn<Token>` resource published under it. |
+    | `Errors::NOT_PUBLISHED`       | `Libra::ECURRENCY_INFO`                          | The specified `Token` is not a registered currency on-chain.                                          |
+    | `Errors::INVALID_ARGUMENT`    | `LibraAccount::ECOIN_DEPOSIT_IS_ZERO`            | The value held in the preburn resource was zero.                                                      |
+    | `Errors::INVALID_ARGUMENT`    | `LibraAccount::EPAYEE_CANT_ACCEPT_CURRENCY_TYPE` | The account at `preburn_address` doesn't have a balance resource for `Token`.                         |
+    | `Errors::LIMIT_EXCEEDED`      | `LibraAccount::EDEPOSIT_EXCEEDS_LIMITS`          | The depositing of the funds held in the prebun area would exceed the `account`'s account limits.      |
+    | `Errors::INVALID_STATE`       | `DualAttestation::EPAYEE_COMPLIANCE_KEY_NOT_SET` | The `account` does not have a compliance key set on it but dual attestion checking was performed.     |
+
+    # Related Scripts
+    * `Script::burn_txn_fees`
+    * `Script::burn`
+    * `Script::preburn`
+    """
+    return Script(
+        code=CANCEL_BURN_CODE,
+        ty_args=[token],
+        args=[TransactionArgument__Address(value=preburn_address)],
+    )
+
+
+def decode_cancel_burn_script(script: Script) -> ScriptCall:
+    return ScriptCall__CancelBurn(
+        token=script.ty_args[0],
+        preburn_address=decode_address_argument(script.args[0]),
+    )
+
+
+CANCEL_BURN_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x06\x01\x00\x02\x03\x02\x06\x04\x08\x02\x05\x0a\x08\x07\x12\x19\x08\x2b\x10\x00\x00\x00\x01\x00\x01\x01\x01\x00\x02\x02\x06\x0c\x05\x00\x01\x09\x00\x0c\x4c\x69\x62\x72\x61\x41\x63\x63\x6f\x75\x6e\x74\x0b\x63\x61\x6e\x63\x65\x6c\x5f\x62\x75\x72\x6e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x00\x01\x04\x0b\x00\x0a\x01\x38\x00\x02"
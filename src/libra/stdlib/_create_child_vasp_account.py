@@ -0,0 +1,174 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra import libra_types
+from libra.libra_types import (
+    Script,
+    TypeTag,
+    AccountAddress,
+    TransactionArgument__Bool,
+    TransactionArgument__U64,
+    TransactionArgument__Address,
+    TransactionArgument__U8Vector,
+)
+from libra.stdlib import (
+    ScriptCall,
+    decode_bool_argument,
+    decode_u64_argument,
+    decode_address_argument,
+    decode_u8vector_argument,
+)
+
+
+@dataclass(frozen=True)
+class ScriptCall__CreateChildVaspAccount(ScriptCall):
+    """# Summary
+    Creates a Child VASP account with its parent being the sending account of the transaction.
+
+    The sender of the transaction must be a Parent VASP account.
+
+    # Technical Description
+    Creates a `ChildVASP` account for the sender `parent_vasp` at `child_address` with a balance of
+    `child_initial_balance` in `CoinType` and an initial authentication key of
+    `auth_key_prefix | child_address`.
+
+    If `add_all_currencies` is true, the child address will have a zero balance in all available
+    currencies in the system.
+
+    The new account will be a child account of the transaction sender, which must be a
+    Parent VASP account. The child account will be recorded against the limit of
+    child accounts of the creating Parent VASP account.
+
+    ## Events
+    Successful execution with a `child_initial_balance` greater than zero will emit:
+    * A `LibraAccount::SentPaymentEvent` with the `payer` field being the Parent VASP's address,
+    and payee field being `child_address`. This is emitted on the Parent VASP's
+    `LibraAccount::LibraAccount` `sent_events` handle.
+    * A `LibraAccount::ReceivedPaymentEvent` with the  `payer` field being the Parent VASP's address,
+    and payee field being `child_address`. This is emitted on the new Child VASPS's
+    `LibraAccount::LibraAccount` `received_events` handle.
+
+    # Parameters
+    | Name                    | Type         | Description                                                                                                                                 |
+    | ------                  | ------       | -------------                                                                                                                               |
+    | `CoinType`              | Type         | The Move type for the `CoinType` that the child account should be created with. `CoinType` must be an already-registered currency on-chain. |
+    | `parent_vasp`           | `&signer`    | The signer reference of the sending account. Must be a Parent VASP account.                                                                 |
+    | `child_address`         | `address`    | Address of the to-be-created Child VASP account.                                                                                            |
+    | `auth_key_prefix`       | `vector<u8>` | The authentication key prefix that will be used initially for the newly created account.                                                    |
+    | `add_all_currencies`    | `bool`       | Whether to publish balance resources for all known currencies when the account is created.                                                  |
+    | `child_initial_balance` | `u64`        | The initial balance in `CoinType` to give the child account when it's created.                                                              |
+
+    # Common Abort Conditions
+    | Error Category              | Error Reason                                             | Description                                                                              |
+    | ----------------            | --------------                                           | -------------                                                                            |
+    | `Errors::INVALID_ARGUMENT`  | `LibraAccount::EMALFORMED_AUTHENTICATION_KEY`            | The `auth_key_prefix` was not of length 32.                                              |
+    | `Errors::REQUIRES_ROLE`     | `Roles::EPARENT_VASP`                                    | The sending account wasn't a Parent VASP account.                                        |
+    | `Errors::ALREADY_PUBLISHED` | `Roles::EROLE_ID`                                        | The `child_address` address is already taken.                                            |
+    | `Errors::LIMIT_EXCEEDED`    | `VASP::ETOO_MANY_CHILDREN`                               | The sending account has reached the maximum number of allowed child accounts.            |
+    | `Errors::NOT_PUBLISHED`     | `Libra::ECURRENCY_INFO`                                  | The `CoinType` is not a registered currency on-chain.                                    |
+    | `Errors::INVALID_STATE`     | `LibraAccount::EWITHDRAWAL_CAPABILITY_ALREADY_EXTRACTED` | The withdrawal capability for the sending account has already been extracted.            |
+    | `Errors::NOT_PUBLISHED`     | `LibraAccount::EPAYER_DOESNT_HOLD_CURRENCY`              | The sending account doesn't have a balance in `CoinType`.                                |
+    | `Errors::LIMIT_EXCEEDED`    | `LibraAccount::EINSUFFICIENT_BALANCE`                    | The sending account doesn't have at least `child_initial_balance` of `CoinType` balance. |
+    | `Errors::INVALID_ARGUMENT`  | `LibraAccount::ECANNOT_CREATE_AT_VM_RESERVED`            | The `child_address` is the reserved address 0x0.                                         |
+
+    # Related Scripts
+    * `Script::create_parent_vasp_account`
+    * `Script::add_currency_to_account`
+    * `Script::rotate_authentication_key`
+    * `Script::add_recovery_rotation_capability`
+    * `Script::create_recovery_address`
+    """
+
+    coin_type: libra_types.TypeTag
+    child_address: libra_types.AccountAddress
+    auth_key_prefix: bytes
+    add_all_currencies: st.bool
+    child_initial_balance: st.uint64
+
+
+def encode_create_child_vasp_account_script(
+    coin_type: TypeTag,
+    child_address: AccountAddress,
+    auth_key_prefix: bytes,
+    add_all_currencies: st.bool,
+    child_initial_balance: st.uint64,
+) -> Script:
+    """# Summary
+    Creates a Child VASP account with its parent being the sending account of the transaction.
+
+    The sender of the transaction must be a Parent VASP account.
+
+    # Technical Description
+    Creates a `ChildVASP` account for the sender `parent_vasp` at `child_address` with a balance of
+    `child_initial_balance` in `CoinType` and an initial authentication key of
+    `auth_key_prefix | child_address`.
+
+    If `add_all_currencies` is true, the child address will have a zero balance in all available
+    currencies in the system.
+
+    The new account will be a child account of the transaction sender, which must be a
+    Parent VASP account. The child account will be recorded against the limit of
+    child accounts of the creating Parent VASP account.
+
+    ## Events
+    Successful execution with a `child_initial_balance` greater than zero will emit:
+    * A `LibraAccount::SentPaymentEvent` with the `payer` field being the Parent VASP's address,
+    and payee field being `child_address`. This is emitted on the Parent VASP's
+    `LibraAccount::LibraAccount` `sent_events` handle.
+    * A `LibraAccount::ReceivedPaymentEvent` with the  `payer` field being the Parent VASP's address,
+    and payee field being `child_address`. This is emitted on the new Child VASPS's
+    `LibraAccount::LibraAccount` `received_events` handle.
+
+    # Parameters
+    | Name                    | Type         | Description                                                                                                                                 |
+    | ------                  | ------       | -------------                                                                                                                               |
+    | `CoinType`              | Type         | The Move type for the `CoinType` that the child account should be created with. `CoinType` must be an already-registered currency on-chain. |
+    | `parent_vasp`           | `&signer`    | The signer reference of the sending account. Must be a Parent VASP account.                                                                 |
+    | `child_address`         | `address`    | Address of the to-be-created Child VASP account.                                                                                            |
+    | `auth_key_prefix`       | `vector<u8>` | The authentication key prefix that will be used initially for the newly created account.                                                    |
+    | `add_all_currencies`    | `bool`       | Whether to publish balance resources for all known currencies when the account is created.                                                  |
+    | `child_initial_balance` | `u64`        | The initial balance in `CoinType` to give the child account when it's created.                                                              |
+
+    # Common Abort Conditions
+    | Error Category              | Error Reason                                             | Description                                                                              |
+    | ----------------            | --------------                                           | -------------                                                                            |
+    | `Errors::INVALID_ARGUMENT`  | `LibraAccount::EMALFORMED_AUTHENTICATION_KEY`            | The `auth_key_prefix` was not of length 32.                                              |
+    | `Errors::REQUIRES_ROLE`     | `Roles::EPARENT_VASP`                                    | The sending account wasn't a Parent VASP account.                                        |
+    | `Errors::ALREADY_PUBLISHED` | `Roles::EROLE_ID`                                        | The `child_address` address is already taken.                                            |
+    | `Errors::LIMIT_EXCEEDED`    | `VASP::ETOO_MANY_CHILDREN`                               | The sending account has reached the maximum number of allowed child accounts.            |
+    | `Errors::NOT_PUBLISHED`     | `Libra::ECURRENCY_INFO`                                  | The `CoinType` is not a registered currency on-chain.                                    |
+    | `Errors::INVALID_STATE`     | `LibraAccount::EWITHDRAWAL_CAPABILITY_ALREADY_EXTRACTED` | The withdrawal capability for the sending account has already been extracted.            |
+    | `Errors::NOT_PUBLISHED`     | `LibraAccount::EPAYER_DOESNT_HOLD_CURRENCY`              | The sending account doesn't have a balance in `CoinType`.                                |
+    | `Errors::LIMIT_EXCEEDED`    | `LibraAccount::EINSUFFICIENT_BALANCE`                    | The sending account doesn't have at least `child_initial_balance` of `CoinType` balance. |
+    | `Errors::INVALID_ARGUMENT`  | `LibraAccount::ECANNOT_CREATE_AT_VM_RESERVED`            | The `child_address` is the reserved address 0x0.                                         |
+
+    # Related Scripts
+    * `Script::create_parent_vasp_account`
+    * `Script::add_currency_to_account`
+    * `Script::rotate_authentication_key`
+    * `Script::add_recovery_rotation_capability`
+    * `Script::create_recovery_address`
+    """
+    return Script(
+        code=CREATE_CHILD_VASP_ACCOUNT_CODE,
+        ty_args=[coin_type],
+        args=[
+            TransactionArgument__Address(value=child_address),
+            TransactionArgument__U8Vector(value=auth_key_prefix),
+            TransactionArgument__Bool(value=add_all_currencies),
+            TransactionArgument__U64(value=child_initial_balance),
+        ],
+    )
+
+
+def decode_create_child_vasp_account_script(script: Script) -> ScriptCall:
+    return ScriptCall__CreateChildVaspAccount(
+        coin_type=script.ty_args[0],
+        child_address=decode_address_argument(script.args[0]),
+        auth_key_prefix=decode_u8vector_argument(script.args[1]),
+        add_all_currencies=decode_bool_argument(script.args[2]),
+        child_initial_balance=decode_u64_argument(script.args[3]),
+    )
+
+
+CREATE_CHILD_VASP_ACCOUNT_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x08\x01\x00\x02\x02\x02\x04\x03\x06\x16\x04\x1c\x04\x05\x20\x23\x07\x43\x7b\x08\xbe\x01\x10\x06\xce\x01\x04\x00\x00\x00\x01\x01\x00\x00\x02\x00\x01\x01\x01\x00\x03\x02\x03\x00\x00\x04\x04\x01\x01\x01\x00\x05\x03\x01\x00\x00\x06\x02\x06\x04\x06\x0c\x05\x0a\x02\x01\x00\x01\x06\x0c\x01\x08\x00\x05\x06\x08\x00\x05\x03\x0a\x02\x0a\x02\x05\x06\x0c\x05\x0a\x02\x01\x03\x01\x09\x00\x0c\x4c\x69\x62\x72\x61\x41\x63\x63\x6f\x75\x6e\x74\x12\x57\x69\x74\x68\x64\x72\x61\x77\x43\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x19\x63\x72\x65\x61\x74\x65\x5f\x63\x68\x69\x6c\x64\x5f\x76\x61\x73\x70\x5f\x61\x63\x63\x6f\x75\x6e\x74\x1b\x65\x78\x74\x72\x61\x63\x74\x5f\x77\x69\x74\x68\x64\x72\x61\x77\x5f\x63\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x08\x70\x61\x79\x5f\x66\x72\x6f\x6d\x1b\x72\x65\x73\x74\x6f\x72\x65\x5f\x77\x69\x74\x68\x64\x72\x61\x77\x5f\x63\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x0a\x02\x01\x00\x01\x01\x05\x03\x19\x0a\x00\x0a\x01\x0b\x02\x0a\x03\x38\x00\x0a\x04\x06\x00\x00\x00\x00\x00\x00\x00\x00\x24\x03\x0a\x05\x16\x0b\x00\x11\x01\x0c\x05\x0e\x05\x0a\x01\x0a\x04\x07\x00\x07\x00\x38\x01\x0b\x05\x11\x03\x05\x18\x0b\x00\x01\x02"
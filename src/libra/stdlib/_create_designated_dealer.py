@@ -0,0 +1,156 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra import libra_types
+from libra.libra_types import (
+    Script,
+    TypeTag,
+    AccountAddress,
+    TransactionArgument__Bool,
+    TransactionArgument__U64,
+    TransactionArgument__Address,
+    TransactionArgument__U8Vector,
+)
+from libra.stdlib import (
+    ScriptCall,
+    decode_bool_argument,
+    decode_u64_argument,
+    decode_address_argument,
+    decode_u8vector_argument,
+)
+
+
+@dataclass(frozen=True)
+class ScriptCall__CreateDesignatedDealer(ScriptCall):
+    """# Summary
+    Creates a Designated Dealer account with the provided information, and initializes it with
+    default mint tiers.
+
+    The transaction can only be sent by the Treasury Compliance account.
+
+    # Technical Description
+    Creates an account with the Designated Dealer role at `addr` with authentication key
+    `auth_key_prefix` | `addr` and a 0 balance of type `Currency`. If `add_all_currencies` is true,
+    0 balances for all available currencies in the system will also be added. This can only be
+    invoked by an account with the TreasuryCompliance role.
+
+    At the time of creation the account is also initialized with default mint tiers of (500_000,
+    5000_000, 50_000_000, 500_000_000), and preburn areas for each currency that is added to the
+    account.
+
+    # Parameters
+    | Name                 | Type         | Description                                                                                                                                         |
+    | ------               | ------       | -------------                                                                                                                                       |
+    | `Currency`           | Type         | The Move type for the `Currency` that the Designated Dealer should be initialized with. `Currency` must be an already-registered currency on-chain. |
+    | `tc_account`         | `&signer`    | The signer reference of the sending account of this transaction. Must be the Treasury Compliance account.                                           |
+    | `sliding_nonce`      | `u64`        | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                                                                          |
+    | `addr`               | `address`    | Address of the to-be-created Designated Dealer account.                                                                                             |
+    | `auth_key_prefix`    | `vector<u8>` | The authentication key prefix that will be used initially for the newly created account.                                                            |
+    | `human_name`         | `vector<u8>` | ASCII-encoded human name for the Designated Dealer.                                                                                                 |
+    | `add_all_currencies` | `bool`       | Whether to publish preburn, balance, and tier info resources for all known (SCS) currencies or just `Currency` when the account is created.         |
+
+
+    # Common Abort Conditions
+    | Error Category              | Error Reason                            | Description                                                                                |
+    | ----------------            | --------------                          | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`     | `SlidingNonce::ESLIDING_NONCE`          | A `SlidingNonce` resource is not published under `tc_account`.                             |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_TOO_OLD`          | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_TOO_NEW`          | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_ALREADY_RECORDED` | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::REQUIRES_ADDRESS`  | `CoreAddresses::ETREASURY_COMPLIANCE`   | The sending account is not the Treasury Compliance account.                                |
+    | `Errors::REQUIRES_ROLE`     | `Roles::ETREASURY_COMPLIANCE`           | The sending account is not the Treasury Compliance account.                                |
+    | `Errors::NOT_PUBLISHED`     | `Libra::ECURRENCY_INFO`                 | The `Currency` is not a registered currency on-chain.                                      |
+    | `Errors::ALREADY_PUBLISHED` | `Roles::EROLE_ID`                       | The `addr` address is already taken.                                                       |
+
+    # Related Scripts
+    * `Script::tiered_mint`
+    * `Script::peer_to_peer_with_metadata`
+    * `Script::rotate_dual_attestation_info`
+    """
+
+    currency: libra_types.TypeTag
+    sliding_nonce: st.uint64
+    addr: libra_types.AccountAddress
+    auth_key_prefix: bytes
+    human_name: bytes
+    add_all_currencies: st.bool
+
+
+def encode_create_designated_dealer_script(
+    currency: TypeTag,
+    sliding_nonce: st.uint64,
+    addr: AccountAddress,
+    auth_key_prefix: bytes,
+    human_name: bytes,
+    add_all_currencies: st.bool,
+) -> Script:
+    """# Summary
+    Creates a Designated Dealer account with the provided information, and initializes it with
+    default mint tiers.
+
+    The transaction can only be sent by the Treasury Compliance account.
+
+    # Technical Description
+    Creates an account with the Designated Dealer role at `addr` with authentication key
+    `auth_key_prefix` | `addr` and a 0 balance of type `Currency`. If `add_all_currencies` is true,
+    0 balances for all available currencies in the system will also be added. This can only be
+    invoked by an account with the TreasuryCompliance role.
+
+    At the time of creation the account is also initialized with default mint tiers of (500_000,
+    5000_000, 50_000_000, 500_000_000), and preburn areas for each currency that is added to the
+    account.
+
+    # Parameters
+    | Name                 | Type         | Description                                                                                                                                         |
+    | ------               | ------       | -------------                                                                                                                                       |
+    | `Currency`           | Type         | The Move type for the `Currency` that the Designated Dealer should be initialized with. `Currency` must be an already-registered currency on-chain. |
+    | `tc_account`         | `&signer`    | The signer reference of the sending account of this transaction. Must be the Treasury Compliance account.                                           |
+    | `sliding_nonce`      | `u64`        | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                                                                          |
+    | `addr`               | `address`    | Address of the to-be-created Designated Dealer account.                                                                                             |
+    | `auth_key_prefix`    | `vector<u8>` | The authentication key prefix that will be used initially for the newly created account.                                                            |
+    | `human_name`         | `vector<u8>` | ASCII-encoded human name for the Designated Dealer.                                                                                                 |
+    | `add_all_currencies` | `bool`       | Whether to publish preburn, balance, and tier info resources for all known (SCS) currencies or just `Currency` when the account is created.         |
+
+
+    # Common Abort Conditions
+    | Error Category              | Error Reason                            | Description                                                                                |
+    | ----------------            | --------------                          | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`     | `SlidingNonce::ESLIDING_NONCE`          | A `SlidingNonce` resource is not published under `tc_account`.                             |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_TOO_OLD`          | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_TOO_NEW`          | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_ALREADY_RECORDED` | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::REQUIRES_ADDRESS`  | `CoreAddresses::ETREASURY_COMPLIANCE`   | The sending account is not the Treasury Compliance account.                                |
+    | `Errors::REQUIRES_ROLE`     | `Roles::ETREASURY_COMPLIANCE`           | The sending account is not the Treasury Compliance account.                                |
+    | `Errors::NOT_PUBLISHED`     | `Libra::ECURRENCY_INFO`                 | The `Currency` is not a registered currency on-chain.                                      |
+    | `Errors::ALREADY_PUBLISHED` | `Roles::EROLE_ID`                       | The `addr` address is already taken.                                                       |
+
+    # Related Scripts
+    * `Script::tiered_mint`
+    * `Script::peer_to_peer_with_metadata`
+    * `Script::rotate_dual_attestation_info`
+    """
+    return Script(
+        code=CREATE_DESIGNATED_DEALER_CODE,
+        ty_args=[currency],
+        args=[
+            TransactionArgument__U64(value=sliding_nonce),
+            TransactionArgument__Address(value=addr),
+            TransactionArgument__U8Vector(value=auth_key_prefix),
+            TransactionArgument__U8Vector(value=human_name),
+            TransactionArgument__Bool(value=add_all_currencies),
+        ],
+    )
+
+
+def decode_create_designated_dealer_script(script: Script) -> ScriptCall:
+    return ScriptCall__CreateDesignatedDealer(
+        currency=script.ty_args[0],
+        sliding_nonce=decode_u64_argument(script.args[0]),
+        addr=decode_address_argument(script.args[1]),
+        auth_key_prefix=decode_u8vector_argument(script.args[2]),
+        human_name=decode_u8vector_argument(script.args[3]),
+        add_all_currencies=decode_bool_argument(script.args[4]),
+    )
+
+
+CREATE_DESIGNATED_DEALER_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x06\x01\x00\x04\x03\x04\x0b\x04\x0f\x02\x05\x11\x1b\x07\x2c\x49\x08\x75\x10\x00\x00\x00\x01\x01\x02\x00\x01\x00\x00\x03\x02\x01\x01\x01\x01\x04\x02\x06\x0c\x03\x00\x05\x06\x0c\x05\x0a\x02\x0a\x02\x01\x06\x06\x0c\x03\x05\x0a\x02\x0a\x02\x01\x01\x09\x00\x0c\x4c\x69\x62\x72\x61\x41\x63\x63\x6f\x75\x6e\x74\x0c\x53\x6c\x69\x64\x69\x6e\x67\x4e\x6f\x6e\x63\x65\x15\x72\x65\x63\x6f\x72\x64\x5f\x6e\x6f\x6e\x63\x65\x5f\x6f\x72\x5f\x61\x62\x6f\x72\x74\x18\x63\x72\x65\x61\x74\x65\x5f\x64\x65\x73\x69\x67\x6e\x61\x74\x65\x64\x5f\x64\x65\x61\x6c\x65\x72\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x03\x01\x0a\x0a\x00\x0a\x01\x11\x00\x0b\x00\x0a\x02\x0b\x03\x0b\x04\x0a\x05\x38\x00\x02"
@@ -0,0 +1,152 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra import libra_types
+from libra.libra_types import (
+    Script,
+    TypeTag,
+    AccountAddress,
+    TransactionArgument__Bool,
+    TransactionArgument__U64,
+    TransactionArgument__Address,
+    TransactionArgument__U8Vector,
+)
+from libra.stdlib import (
+    ScriptCall,
+    decode_bool_argument,
+    decode_u64_argument,
+    decode_address_argument,
+    decode_u8vector_argument,
+)
+
+
+@dataclass(frozen=True)
+class ScriptCall__CreateParentVaspAccount(ScriptCall):
+    """# Summary
+    Creates a Parent VASP account with the specified human name.
+
+    Must be called by the Treasury Compliance account.
+
+    # Technical Description
+    Creates an account with the Parent VASP role at `address` with authentication key
+    `auth_key_prefix` | `new_account_address` and a 0 balance of type `CoinType`. If
+    `add_all_currencies` is true, 0 balances for all available currencies in the system will
+    also be added. This can only be invoked by an TreasuryCompliance account.
+    `sliding_nonce` is a unique nonce for operation, see `SlidingNonce` for details.
+
+    # Parameters
+    | Name                  | Type         | Description                                                                                                                                                    |
+    | ------                | ------       | -------------                                                                                                                                                  |
+    | `CoinType`            | Type         | The Move type for the `CoinType` currency that the Parent VASP account should be initialized with. `CoinType` must be an already-registered currency on-chain. |
+    | `tc_account`          | `&signer`    | The signer reference of the sending account of this transaction. Must be the Treasury Compliance account.                                                      |
+    | `sliding_nonce`       | `u64`        | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                                                                                     |
+    | `new_account_address` | `address`    | Address of the to-be-created Parent VASP account.                                                                                                              |
+    | `auth_key_prefix`     | `vector<u8>` | The authentication key prefix that will be used initially for the newly created account.                                                                       |
+    | `human_name`          | `vector<u8>` | ASCII-encoded human name for the Parent VASP.                                                                                                                  |
+    | `add_all_currencies`  | `bool`       | Whether to publish balance resources for all known currencies when the account is created.                                                                     |
+
+    # Common Abort Conditions
+    | Error Category              | Error Reason                            | Description                                                                                |
+    | ----------------            | --------------                          | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`     | `SlidingNonce::ESLIDING_NONCE`          | A `SlidingNonce` resource is not published under `tc_account`.                             |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_TOO_OLD`          | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_TOO_NEW`          | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_ALREADY_RECORDED` | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::REQUIRES_ADDRESS`  | `CoreAddresses::ETREASURY_COMPLIANCE`   | The sending account is not the Treasury Compliance account.                                |
+    | `Errors::REQUIRES_ROLE`     | `Roles::ETREASURY_COMPLIANCE`           | The sending account is not the Treasury Compliance account.                                |
+    | `Errors::NOT_PUBLISHED`     | `Libra::ECURRENCY_INFO`                 | The `CoinType` is not a registered currency on-chain.                                      |
+    | `Errors::ALREADY_PUBLISHED` | `Roles::EROLE_ID`                       | The `new_account_address` address is already taken.                                        |
+
+    # Related Scripts
+    * `Script::create_child_vasp_account`
+    * `Script::add_currency_to_account`
+    * `Script::rotate_authentication_key`
+    * `Script::add_recovery_rotation_capability`
+    * `Script::create_recovery_address`
+    * `Script::rotate_dual_attestation_info`
+    """
+
+    coin_type: libra_types.TypeTag
+    sliding_nonce: st.uint64
+    new_account_address: libra_types.AccountAddress
+    auth_key_prefix: bytes
+    human_name: bytes
+    add_all_currencies: st.bool
+
+
+def encode_create_parent_vasp_account_script(
+    coin_type: TypeTag,
+    sliding_nonce: st.uint64,
+    new_account_address: AccountAddress,
+    auth_key_prefix: bytes,
+    human_name: bytes,
+    add_all_currencies: st.bool,
+) -> Script:
+    """# Summary
+    Creates a Parent VASP account with the specified human name.
+
+    Must be called by the Treasury Compliance account.
+
+    # Technical Description
+    Creates an account with the Parent VASP role at `address` with authentication key
+    `auth_key_prefix` | `new_account_address` and a 0 balance of type `CoinType`. If
+    `add_all_currencies` is true, 0 balances for all available currencies in the system will
+    also be added. This can only be invoked by an TreasuryCompliance account.
+    `sliding_nonce` is a unique nonce for operation, see `SlidingNonce` for details.
+
+    # Parameters
+    | Name                  | Type         | Description                                                                                                                                                    |
+    | ------                | ------       | -------------                                                                                                                                                  |
+    | `CoinType`            | Type         | The Move type for the `CoinType` currency that the Parent VASP account should be initialized with. `CoinType` must be an already-registered currency on-chain. |
+    | `tc_account`          | `&signer`    | The signer reference of the sending account of this transaction. Must be the Treasury Compliance account.                                                      |
+    | `sliding_nonce`       | `u64`        | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                                                                                     |
+    | `new_account_address` | `address`    | Address of the to-be-created Parent VASP account.                                                                                                              |
+    | `auth_key_prefix`     | `vector<u8>` | The authentication key prefix that will be used initially for the newly created account.                                                                       |
+    | `human_name`          | `vector<u8>` | ASCII-encoded human name for the Parent VASP.                                                                                                                  |
+    | `add_all_currencies`  | `bool`       | Whether to publish balance resources for all known currencies when the account is created.                                                                     |
+
+    # Common Abort Conditions
+    | Error Category              | Error Reason                            | Description                                                                                |
+    | ----------------            | --------------                          | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`     | `SlidingNonce::ESLIDING_NONCE`          | A `SlidingNonce` resource is not published under `tc_account`.                             |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_TOO_OLD`          | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_TOO_NEW`          | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_ALREADY_RECORDED` | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::REQUIRES_ADDRESS`  | `CoreAddresses::ETREASURY_COMPLIANCE`   | The sending account is not the Treasury Compliance account.                                |
+    | `Errors::REQUIRES_ROLE`     | `Roles::ETREASURY_COMPLIANCE`           | The sending account is not the Treasury Compliance account.                                |
+    | `Errors::NOT_PUBLISHED`     | `Libra::ECURRENCY_INFO`                 | The `CoinType` is not a registered currency on-chain.                                      |
+    | `Errors::ALREADY_PUBLISHED` | `Roles::EROLE_ID`                       | The `new_account_address` address is already taken.                                        |
+
+    # Related Scripts
+    * `Script::create_child_vasp_account`
+    * `Script::add_currency_to_account`
+    * `Script::rotate_authentication_key`
+    * `Script::add_recovery_rotation_capability`
+    * `Script::create_recovery_address`
+    * `Script::rotate_dual_attestation_info`
+    """
+    return Script(
+        code=CREATE_PARENT_VASP_ACCOUNT_CODE,
+        ty_args=[coin_type],
+        args=[
+            TransactionArgument__U64(value=sliding_nonce),
+            TransactionArgument__Address(value=new_account_address),
+            TransactionArgument__U8Vector(value=auth_key_prefix),
+            TransactionArgument__U8Vector(value=human_name),
+            TransactionArgument__Bool(value=add_all_currencies),
+        ],
+    )
+
+
+def decode_create_parent_vasp_account_script(script: Script) -> ScriptCall:
+    return ScriptCall__CreateParentVaspAccount(
+        coin_type=script.ty_args[0],
+        sliding_nonce=decode_u64_argument(script.args[0]),
+        new_account_address=decode_address_argument(script.args[1]),
+        auth_key_prefix=decode_u8vector_argument(script.args[2]),
+        human_name=decode_u8vector_argument(script.args[3]),
+        add_all_currencies=decode_bool_argument(script.args[4]),
+    )
+
+
+CREATE_PARENT_VASP_ACCOUNT_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x06\x01\x00\x04\x03\x04\x0b\x04\x0f\x02\x05\x11\x1b\x07\x2c\x4b\x08\x77\x10\x00\x00\x00\x01\x01\x02\x00\x01\x00\x00\x03\x02\x01\x01\x01\x01\x04\x02\x06\x0c\x03\x00\x05\x06\x0c\x05\x0a\x02\x0a\x02\x01\x06\x06\x0c\x03\x05\x0a\x02\x0a\x02\x01\x01\x09\x00\x0c\x4c\x69\x62\x72\x61\x41\x63\x63\x6f\x75\x6e\x74\x0c\x53\x6c\x69\x64\x69\x6e\x67\x4e\x6f\x6e\x63\x65\x15\x72\x65\x63\x6f\x72\x64\x5f\x6e\x6f\x6e\x63\x65\x5f\x6f\x72\x5f\x61\x62\x6f\x72\x74\x1a\x63\x72\x65\x61\x74\x65\x5f\x70\x61\x72\x65\x6e\x74\x5f\x76\x61\x73\x70\x5f\x61\x63\x63\x6f\x75\x6e\x74\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x03\x01\x0a\x0a\x00\x0a\x01\x11\x00\x0b\x00\x0a\x02\x0b\x03\x0b\x04\x0a\x05\x38\x00\x02"
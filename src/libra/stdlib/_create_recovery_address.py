@@ -0,0 +1,89 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra.libra_types import Script
+from libra.stdlib import ScriptCall
+
+
+@dataclass(frozen=True)
+class ScriptCall__CreateRecoveryAddress(ScriptCall):
+    """# Summary
+    Initializes the sending account as a recovery address that may be used by
+    the VASP that it belongs to.
+
+    The sending account must be a VASP account.
+    Multiple recovery addresses can exist for a single VASP, but accounts in
+    each must be disjoint.
+
+    # Technical Description
+    Publishes a `RecoveryAddress::RecoveryAddress` resource under `account`. It then
+    extracts the `LibraAccount::KeyRotationCapability` for `account` and adds
+    it to the resource. After the successful execution of this transaction
+    other accounts may add their key rotation to this resource so that `account`
+    may be used as a recovery account for those accounts.
+
+    # Parameters
+    | Name      | Type      | Description                                           |
+    | ------    | ------    | -------------                                         |
+    | `account` | `&signer` | The signer of the sending account of the transaction. |
+
+    # Common Abort Conditions
+    | Error Category              | Error Reason                                               | Description                                                                                   |
+    | ----------------            | --------------                                             | -------------                                                                                 |
+    | `Errors::INVALID_STATE`     | `LibraAccount::EKEY_ROTATION_CAPABILITY_ALREADY_EXTRACTED` | `account` has already delegated/extracted its `LibraAccount::KeyRotationCapability`.          |
+    | `Errors::INVALID_ARGUMENT`  | `RecoveryAddress::ENOT_A_VASP`                             | `account` is not a VASP account.                                                              |
+    | `Errors::INVALID_ARGUMENT`  | `RecoveryAddress::EKEY_ROTATION_DEPENDENCY_CYCLE`          | A key rotation recovery cycle would be created by adding `account`'s key rotation capability. |
+    | `Errors::ALREADY_PUBLISHED` | `RecoveryAddress::ERECOVERY_ADDRESS`                       | A `RecoveryAddress::RecoveryAddress` resource has already been published under `account`.     |
+
+    # Related Scripts
+    * `Script::add_recovery_rotation_capability`
+    * `Script::rotate_authentication_key_with_recovery_address`
+    """
+
+    pass
+
+
+def encode_create_recovery_address_script() -> Script:
+    """# Summary
+    Initializes the sending account as a recovery address that may be used by
+    the VASP that it belongs to.
+
+    The sending account must be a VASP account.
+    Multiple recovery addresses can exist for a single VASP, but accounts in
+    each must be disjoint.
+
+    # Technical Description
+    Publishes a `RecoveryAddress::RecoveryAddress` resource under `account`. It then
+    extracts the `LibraAccount::KeyRotationCapability` for `account` and adds
+    it to the resource. After the successful execution of this transaction
+    other accounts may add their key rotation to this resource so that `account`
+    may be used as a recovery account for those accounts.
+
+    # Parameters
+    | Name      | Type      | Description                                           |
+    | ------    | ------    | -------------                                         |
+    | `account` | `&signer` | The signer of the sending account of the transaction. |
+
+    # Common Abort Conditions
+    | Error Category              | Error Reason                                               | Description                                                                                   |
+    | ----------------            | --------------                                             | -------------                                                                                 |
+    | `Errors::INVALID_STATE`     | `LibraAccount::EKEY_ROTATION_CAPABILITY_ALREADY_EXTRACTED` | `account` has already delegated/extracted its `LibraAccount::KeyRotationCapability`.          |
+    | `Errors::INVALID_ARGUMENT`  | `RecoveryAddress::ENOT_A_VASP`                             | `account` is not a VASP account.                                                              |
+    | `Errors::INVALID_ARGUMENT`  | `RecoveryAddress::EKEY_ROTATION_DEPENDENCY_CYCLE`          | A key rotation recovery cycle would be created by adding `account`'s key rotation capability. |
+    | `Errors::ALREADY_PUBLISHED` | `RecoveryAddress::ERECOVERY_ADDRESS`                       | A `RecoveryAddress::RecoveryAddress` resource has already been published under `account`.     |
+
+    # Related Scripts
+    * `Script::add_recovery_rotation_capability`
+    * `Script::rotate_authentication_key_with_recovery_address`
+    """
+    return Script(
+        code=CREATE_RECOVERY_ADDRESS_CODE,
+        ty_args=[],
+        args=[],
+    )
+
+
+def decode_create_recovery_address_script(_script: Script) -> ScriptCall:
+    return ScriptCall__CreateRecoveryAddress()
+
+
+CREATE_RECOVERY_ADDRESS_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x06\x01\x00\x04\x02\x04\x04\x03\x08\x0a\x05\x12\x0c\x07\x1e\x5b\x08\x79\x10\x00\x00\x00\x01\x00\x02\x01\x00\x00\x03\x00\x01\x00\x01\x04\x02\x03\x00\x01\x06\x0c\x01\x08\x00\x02\x06\x0c\x08\x00\x00\x0c\x4c\x69\x62\x72\x61\x41\x63\x63\x6f\x75\x6e\x74\x0f\x52\x65\x63\x6f\x76\x65\x72\x79\x41\x64\x64\x72\x65\x73\x73\x15\x4b\x65\x79\x52\x6f\x74\x61\x74\x69\x6f\x6e\x43\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x1f\x65\x78\x74\x72\x61\x63\x74\x5f\x6b\x65\x79\x5f\x72\x6f\x74\x61\x74\x69\x6f\x6e\x5f\x63\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x07\x70\x75\x62\x6c\x69\x73\x68\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x03\x05\x0a\x00\x0b\x00\x11\x00\x11\x01\x02"
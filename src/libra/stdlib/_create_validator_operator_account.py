@@ -0,0 +1,130 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra import libra_types
+from libra.libra_types import (
+    Script,
+    AccountAddress,
+    TransactionArgument__U64,
+    TransactionArgument__Address,
+    TransactionArgument__U8Vector,
+)
+from libra.stdlib import ScriptCall, decode_u64_argument, decode_address_argument, decode_u8vector_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__CreateValidatorOperatorAccount(ScriptCall):
+    """# Summary
+    Creates a Validator Operator account.
+
+    This transaction can only be sent by the Libra
+    Root account.
+
+    # Technical Description
+    Creates an account with a Validator Operator role at `new_account_address`, with authentication key
+    `auth_key_prefix` | `new_account_address`. It publishes a
+    `ValidatorOperatorConfig::ValidatorOperatorConfig` resource with the specified `human_name`.
+    This script does not assign the validator operator to any validator accounts but only creates the account.
+
+    # Parameters
+    | Name                  | Type         | Description                                                                                     |
+    | ------                | ------       | -------------                                                                                   |
+    | `lr_account`          | `&signer`    | The signer reference of the sending account of this transaction. Must be the Libra Root signer. |
+    | `sliding_nonce`       | `u64`        | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                      |
+    | `new_account_address` | `address`    | Address of the to-be-created Validator account.                                                 |
+    | `auth_key_prefix`     | `vector<u8>` | The authentication key prefix that will be used initially for the newly created account.        |
+    | `human_name`          | `vector<u8>` | ASCII-encoded human name for the validator.                                                     |
+
+    # Common Abort Conditions
+    | Error Category              | Error Reason                            | Description                                                                                |
+    | ----------------            | --------------                          | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`     | `SlidingNonce::ESLIDING_NONCE`          | A `SlidingNonce` resource is not published under `lr_account`.                             |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_TOO_OLD`          | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_TOO_NEW`          | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_ALREADY_RECORDED` | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::REQUIRES_ADDRESS`  | `CoreAddresses::ELIBRA_ROOT`            | The sending account is not the Libra Root account.                                         |
+    | `Errors::REQUIRES_ROLE`     | `Roles::ELIBRA_ROOT`                    | The sending account is not the Libra Root account.                                         |
+    | `Errors::ALREADY_PUBLISHED` | `Roles::EROLE_ID`                       | The `new_account_address` address is already taken.                                        |
+
+    # Related Scripts
+    * `Script::create_validator_account`
+    * `Script::add_validator_and_reconfigure`
+    * `Script::register_validator_config`
+    * `Script::remove_validator_and_reconfigure`
+    * `Script::set_validator_operator`
+    * `Script::set_validator_operator_with_nonce_admin`
+    * `Script::set_validator_config_and_reconfigure`
+    """
+
+    sliding_nonce: st.uint64
+    new_account_address: libra_types.AccountAddress
+    auth_key_prefix: bytes
+    human_name: bytes
+
+
+def encode_create_validator_operator_account_script(
+    sliding_nonce: st.uint64, new_account_address: AccountAddress, auth_key_prefix: bytes, human_name: bytes
+) -> Script:
+    """# Summary
+    Creates a Validator Operator account.
+
+    This transaction can only be sent by the Libra
+    Root account.
+
+    # Technical Description
+    Creates an account with a Validator Operator role at `new_account_address`, with authentication key
+    `auth_key_prefix` | `new_account_address`. It publishes a
+    `ValidatorOperatorConfig::ValidatorOperatorConfig` resource with the specified `human_name`.
+    This script does not assign the validator operator to any validator accounts but only creates the account.
+
+    # Parameters
+    | Name                  | Type         | Description                                                                                     |
+    | ------                | ------       | -------------                                                                                   |
+    | `lr_account`          | `&signer`    | The signer reference of the sending account of this transaction. Must be the Libra Root signer. |
+    | `sliding_nonce`       | `u64`        | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                      |
+    | `new_account_address` | `address`    | Address of the to-be-created Validator account.                                                 |
+    | `auth_key_prefix`     | `vector<u8>` | The authentication key prefix that will be used initially for the newly created account.        |
+    | `human_name`          | `vector<u8>` | ASCII-encoded human name for the validator.                                                     |
+
+    # Common Abort Conditions
+    | Error Category              | Error Reason                            | Description                                                                                |
+    | ----------------            | --------------                          | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`     | `SlidingNonce::ESLIDING_NONCE`          | A `SlidingNonce` resource is not published under `lr_account`.                             |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_TOO_OLD`          | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_TOO_NEW`          | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT`  | `SlidingNonce::ENONCE_ALREADY_RECORDED` | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::REQUIRES_ADDRESS`  | `CoreAddresses::ELIBRA_ROOT`            | The sending account is not the Libra Root account.                                         |
+    | `Errors::REQUIRES_ROLE`     | `Roles::ELIBRA_ROOT`                    | The sending account is not the Libra Root account.                                         |
+    | `Errors::ALREADY_PUBLISHED` | `Roles::EROLE_ID`                       | The `new_account_address` address is already taken.                                        |
+
+    # Related Scripts
+    * `Script::create_validator_account`
+    * `Script::add_validator_and_reconfigure`
+    * `Script::register_validator_config`
+    * `Script::remove_validator_and_reconfigure`
+    * `Script::set_validator_operator`
+    * `Script::set_validator_operator_with_nonce_admin`
+    * `Script::set_validator_config_and_reconfigure`
+    """
+    return Script(
+        code=CREATE_VALIDATOR_OPERATOR_ACCOUNT_CODE,
+        ty_args=[],
+        args=[
+            TransactionArgument__U64(value=sliding_nonce),
+            TransactionArgument__Address(value=new_account_address),
+            TransactionArgument__U8Vector(value=auth_key_prefix),
+            TransactionArgument__U8Vector(value=human_name),
+        ],
+    )
+
+
+def decode_create_validator_operator_account_script(script: Script) -> ScriptCall:
+    return ScriptCall__CreateValidatorOperatorAccount(
+        sliding_nonce=decode_u64_argument(script.args[0]),
+        new_account_address=decode_address_argument(script.args[1]),
+        auth_key_prefix=decode_u8vector_argument(script.args[2]),
+        human_name=decode_u8vector_argument(script.args[3]),
+    )
+
+
+CREATE_VALIDATOR_OPERATOR_ACCOUNT_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x05\x01\x00\x04\x03\x04\x0a\x05\x0e\x16\x07\x24\x52\x08\x76\x10\x00\x00\x00\x01\x01\x02\x00\x01\x00\x00\x03\x02\x01\x00\x02\x06\x0c\x03\x00\x04\x06\x0c\x05\x0a\x02\x0a\x02\x05\x06\x0c\x03\x05\x0a\x02\x0a\x02\x0c\x4c\x69\x62\x72\x61\x41\x63\x63\x6f\x75\x6e\x74\x0c\x53\x6c\x69\x64\x69\x6e\x67\x4e\x6f\x6e\x63\x65\x15\x72\x65\x63\x6f\x72\x64\x5f\x6e\x6f\x6e\x63\x65\x5f\x6f\x72\x5f\x61\x62\x6f\x72\x74\x21\x63\x72\x65\x61\x74\x65\x5f\x76\x61\x6c\x69\x64\x61\x74\x6f\x72\x5f\x6f\x70\x65\x72\x61\x74\x6f\x72\x5f\x61\x63\x63\x6f\x75\x6e\x74\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x03\x01\x09\x0a\x00\x0a\x01\x11\x00\x0b\x00\x0a\x02\x0b\x03\x0b\x04\x11\x01\x02"
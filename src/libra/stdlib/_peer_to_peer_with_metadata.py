@@ -0,0 +1,157 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra import libra_types
+from libra.libra_types import (
+    Script,
+    TypeTag,
+    AccountAddress,
+    TransactionArgument__U64,
+    TransactionArgument__Address,
+    TransactionArgument__U8Vector,
+)
+from libra.stdlib import ScriptCall, decode_u64_argument, decode_address_argument, decode_u8vector_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__PeerToPeerWithMetadata(ScriptCall):
+    """# Summary
+    Transfers a given number of coins in a specified currency from one account to another.
+
+    Transfers over a specified amount defined on-chain that are between two different VASPs, or
+    other accounts that have opted-in will be subject to on-chain checks to ensure the receiver has
+    agreed to receive the coins.  This transaction can be sent by any account that can hold a
+    balance, and to any account that can hold a balance. Both accounts must hold balances in the
+    currency being transacted.
+
+    # Technical Description
+
+    Transfers `amount` coins of type `Currency` from `payer` to `payee` with (optional) associated
+    `metadata` and an (optional) `metadata_signature` on the message
+    `metadata` | `Signer::address_of(payer)` | `amount` | `DualAttestation::DOMAIN_SEPARATOR`.
+    The `metadata` and `metadata_signature` parameters are only required if `amount` >=
+    `DualAttestation::get_cur_microlibra_limit` LBR and `payer` and `payee` are distinct VASPs.
+    However, a transaction sender can opt in to dual attestation even when it is not required
+    (e.g., a DesignatedDealer -> VASP payment) by providing a non-empty `metadata_signature`.
+    Standardized `metadata` LCS format can be found in `libra_types::transaction::metadata::Metadata`.
+
+    ## Events
+    Successful execution of this script emits two events:
+    * A `LibraAccount::SentPaymentEvent` on `payer`'s `LibraAccount::LibraAccount` `sent_events` handle; and
+    * A `LibraAccount::ReceivedPaymentEvent` on `payee`'s `LibraAccount::LibraAccount` `received_events` handle.
+
+    # Parameters
+    | Name                 | Type         | Description                                                                                                                  |
+    | ------               | ------       | -------------                                                                                                                |
+    | `Currency`           | Type         | The Move type for the `Currency` being sent in this transaction. `Currency` must be an already-registered currency on-chain. |
+    | `payer`              | `&signer`    | The signer reference of the sending account that coins are being transferred from.                                           |
+    | `payee`              | `address`    | The address of the account the coins are being transferred to.                                                               |
+    | `metadata`           | `vector<u8>` | Optional metadata about this payment.                                                                                        |
+    | `metadata_signature` | `vector<u8>` | Optional signature over `metadata` and payment information. See                                                              |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                     | Description                                                                                                                         |
+    | ----------------           | --------------                                   | -------------                                                                                                                       |
+    | `Errors::NOT_PUBLISHED`    | `LibraAccount::EPAYER_DOESNT_HOLD_CURRENCY`      | `payer` doesn't hold a balance in `Currency`.                                                                                       |
+    | `Errors::LIMIT_EXCEEDED`   | `LibraAccount::EINSUFFICIENT_BALANCE`            | `amount` is greater than `payer`'s balance in `Currency`.                                                                           |
+    | `Errors::INVALID_ARGUMENT` | `LibraAccount::ECOIN_DEPOSIT_IS_ZERO`            | `amount` is zero.                                                                                                                   |
+    | `Errors::NOT_PUBLISHED`    | `LibraAccount::EPAYEE_DOES_NOT_EXIST`            | No account exists at the `payee` address.                                                                                           |
+    | `Errors::INVALID_ARGUMENT` | `LibraAccount::EPAYEE_CANT_ACCEPT_CURRENCY_TYPE` | An account exists at `payee`, but it does not accept payments in `Currency`.                                                        |
+    | `Errors::INVALID_STATE`    | `AccountFreezing::EACCOUNT_FROZEN`               | The `payee` account is frozen.                                                                                                      |
+    | `Errors::INVALID_ARGUMENT` | `DualAttestation::EMALFORMED_METADATA_SIGNATURE` | `metadata_signature` is not 64 bytes.                                                                                               |
+    | `Errors::INVALID_ARGUMENT` | `DualAttestation::EINVALID_METADATA_SIGNATURE`   | `metadata_signature` does not verify on the against the `payee'`s `DualAttestation::Credential` `compliance_public_key` public key. |
+    | `Errors::LIMIT_EXCEEDED`   | `LibraAccount::EWITHDRAWAL_EXCEEDS_LIMITS`       | `payer` has exceeded its daily withdrawal limits for the backing coins of LBR.                                                      |
+    | `Errors::LIMIT_EXCEEDED`   | `LibraAccount::EDEPOSIT_EXCEEDS_LIMITS`          | `payee` has exceeded its daily deposit limits for LBR.                                                                              |
+
+    # Related Scripts
+    * `Script::create_child_vasp_account`
+    * `Script::create_parent_vasp_account`
+    * `Script::add_currency_to_account`
+    """
+
+    currency: libra_types.TypeTag
+    payee: libra_types.AccountAddress
+    amount: st.uint64
+    metadata: bytes
+    metadata_signature: bytes
+
+
+def encode_peer_to_peer_with_metadata_script(
+    currency: TypeTag, payee: AccountAddress, amount: st.uint64, metadata: bytes, metadata_signature: bytes
+) -> Script:
+    """# Summary
+    Transfers a given number of coins in a specified currency from one account to another.
+
+    Transfers over a specified amount defined on-chain that are between two different VASPs, or
+    other accounts that have opted-in will be subject to on-chain checks to ensure the receiver has
+    agreed to receive the coins.  This transaction can be sent by any account that can hold a
+    balance, and to any account that can hold a balance. Both accounts must hold balances in the
+    currency being transacted.
+
+    # Technical Description
+
+    Transfers `amount` coins of type `Currency` from `payer` to `payee` with (optional) associated
+    `metadata` and an (optional) `metadata_signature` on the message
+    `metadata` | `Signer::address_of(payer)` | `amount` | `DualAttestation::DOMAIN_SEPARATOR`.
+    The `metadata` and `metadata_signature` parameters are only required if `amount` >=
+    `DualAttestation::get_cur_microlibra_limit` LBR and `payer` and `payee` are distinct VASPs.
+    However, a transaction sender can opt in to dual attestation even when it is not required
+    (e.g., a DesignatedDealer -> VASP payment) by providing a non-empty `metadata_signature`.
+    Standardized `metadata` LCS format can be found in `libra_types::transaction::metadata::Metadata`.
+
+    ## Events
+    Successful execution of this script emits two events:
+    * A `LibraAccount::SentPaymentEvent` on `payer`'s `LibraAccount::LibraAccount` `sent_events` handle; and
+    * A `LibraAccount::ReceivedPaymentEvent` on `payee`'s `LibraAccount::LibraAccount` `received_events` handle.
+
+    # Parameters
+    | Name                 | Type         | Description                                                                                                                  |
+    | ------               | ------       | -------------                                                                                                                |
+    | `Currency`           | Type         | The Move type for the `Currency` being sent in this transaction. `Currency` must be an already-registered currency on-chain. |
+    | `payer`              | `&signer`    | The signer reference of the sending account that coins are being transferred from.                                           |
+    | `payee`              | `address`    | The address of the account the coins are being transferred to.                                                               |
+    | `metadata`           | `vector<u8>` | Optional metadata about this payment.                                                                                        |
+    | `metadata_signature` | `vector<u8>` | Optional signature over `metadata` and payment information. See                                                              |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                     | Description                                                                                                                         |
+    | ----------------           | --------------                                   | -------------                                                                                                                       |
+    | `Errors::NOT_PUBLISHED`    | `LibraAccount::EPAYER_DOESNT_HOLD_CURRENCY`      | `payer` doesn't hold a balance in `Currency`.                                                                                       |
+    | `Errors::LIMIT_EXCEEDED`   | `LibraAccount::EINSUFFICIENT_BALANCE`            | `amount` is greater than `payer`'s balance in `Currency`.                                                                           |
+    | `Errors::INVALID_ARGUMENT` | `LibraAccount::ECOIN_DEPOSIT_IS_ZERO`            | `amount` is zero.                                                                                                                   |
+    | `Errors::NOT_PUBLISHED`    | `LibraAccount::EPAYEE_DOES_NOT_EXIST`            | No account exists at the `payee` address.                                                                                           |
+    | `Errors::INVALID_ARGUMENT` | `LibraAccount::EPAYEE_CANT_ACCEPT_CURRENCY_TYPE` | An account exists at `payee`, but it does not accept payments in `Currency`.                                                        |
+    | `Errors::INVALID_STATE`    | `AccountFreezing::EACCOUNT_FROZEN`               | The `payee` account is frozen.                                                                                                      |
+    | `Errors::INVALID_ARGUMENT` | `DualAttestation::EMALFORMED_METADATA_SIGNATURE` | `metadata_signature` is not 64 bytes.                                                                                               |
+    | `Errors::INVALID_ARGUMENT` | `DualAttestation::EINVALID_METADATA_SIGNATURE`   | `metadata_signature` does not verify on the against the `payee'`s `DualAttestation::Credential` `compliance_public_key` public key. |
+    | `Errors::LIMIT_EXCEEDED`   | `LibraAccount::EWITHDRAWAL_EXCEEDS_LIMITS`       | `payer` has exceeded its daily withdrawal limits for the backing coins of LBR.                                                      |
+    | `Errors::LIMIT_EXCEEDED`   | `LibraAccount::EDEPOSIT_EXCEEDS_LIMITS`          | `payee` has exceeded its daily deposit limits for LBR.                                                                              |
+
+    # Related Scripts
+    * `Script::create_child_vasp_account`
+    * `Script::create_parent_vasp_account`
+    * `Script::add_currency_to_account`
+    """
+    return Script(
+        code=PEER_TO_PEER_WITH_METADATA_CODE,
+        ty_args=[currency],
+        args=[
+            TransactionArgument__Address(value=payee),
+            TransactionArgument__U64(value=amount),
+            TransactionArgument__U8Vector(value=metadata),
+            TransactionArgument__U8Vector(value=metadata_signature),
+        ],
+    )
+
+
+def decode_peer_to_peer_with_metadata_script(script: Script) -> ScriptCall:
+    return ScriptCall__PeerToPeerWithMetadata(
+        currency=script.ty_args[0],
+        payee=decode_address_argument(script.args[0]),
+        amount=decode_u64_argument(script.args[1]),
+        metadata=decode_u8vector_argument(script.args[2]),
+        metadata_signature=decode_u8vector_argument(script.args[3]),
+    )
+
+
+PEER_TO_PEER_WITH_METADATA_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x07\x01\x00\x02\x02\x02\x04\x03\x06\x10\x04\x16\x02\x05\x18\x1d\x07\x35\x61\x08\x96\x01\x10\x00\x00\x00\x01\x01\x00\x00\x02\x00\x01\x00\x00\x03\x02\x03\x01\x01\x00\x04\x01\x03\x00\x01\x05\x01\x06\x0c\x01\x08\x00\x05\x06\x08\x00\x05\x03\x0a\x02\x0a\x02\x00\x05\x06\x0c\x05\x03\x0a\x02\x0a\x02\x01\x09\x00\x0c\x4c\x69\x62\x72\x61\x41\x63\x63\x6f\x75\x6e\x74\x12\x57\x69\x74\x68\x64\x72\x61\x77\x43\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x1b\x65\x78\x74\x72\x61\x63\x74\x5f\x77\x69\x74\x68\x64\x72\x61\x77\x5f\x63\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x08\x70\x61\x79\x5f\x66\x72\x6f\x6d\x1b\x72\x65\x73\x74\x6f\x72\x65\x5f\x77\x69\x74\x68\x64\x72\x61\x77\x5f\x63\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x04\x01\x0c\x0b\x00\x11\x00\x0c\x05\x0e\x05\x0a\x01\x0a\x02\x0b\x03\x0b\x04\x38\x00\x0b\x05\x11\x02\x02"
@@ -0,0 +1,119 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra import libra_types
+from libra.libra_types import Script, TypeTag, TransactionArgument__U64
+from libra.stdlib import ScriptCall, decode_u64_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__Preburn(ScriptCall):
+    """# Summary
+    Moves a specified number of coins in a given currency from the account's
+    balance to its preburn area after which the coins may be burned.
+
+    This
+    transaction may be sent by any account that holds a balance and preburn area
+    in the specified currency.
+
+    # Technical Description
+    Moves the specified `amount` of coins in `Token` currency from the sending `account`'s
+    `LibraAccount::Balance<Token>` to the `Libra::Preburn<Token>` published under the same
+    `account`. `account` must have both of these resources published under it at the start of this
+    transaction in order for it to execute successfully.
+
+    ## Events
+    Successful execution of this script emits two events:
+    * `LibraAccount::SentPaymentEvent ` on `account`'s `LibraAccount::LibraAccount` `sent_events`
+    handle with the `payee` and `payer` fields being `account`'s address; and
+    * A `Libra::PreburnEvent` with `Token`'s currency code on the
+    `Libra::CurrencyInfo<Token`'s `preburn_events` handle for `Token` and with
+    `preburn_address` set to `account`'s address.
+
+    # Parameters
+    | Name      | Type      | Description                                                                                                                      |
+    | ------    | ------    | -------------                                                                                                                    |
+    | `Token`   | Type      | The Move type for the `Token` currency being moved to the preburn area. `Token` must be an already-registered currency on-chain. |
+    | `account` | `&signer` | The signer reference of the sending account.                                                                                     |
+    | `amount`  | `u64`     | The amount in `Token` to be moved to the preburn area.                                                                           |
+
+    # Common Abort Conditions
+    | Error Category           | Error Reason                                             | Description                                                                             |
+    | ----------------         | --------------                                           | -------------                                                                           |
+    | `Errors::NOT_PUBLISHED`  | `Libra::ECURRENCY_INFO`                                  | The `Token` is not a registered currency on-chain.                                      |
+    | `Errors::INVALID_STATE`  | `LibraAccount::EWITHDRAWAL_CAPABILITY_ALREADY_EXTRACTED` | The withdrawal capability for `account` has already been extracted.                     |
+    | `Errors::LIMIT_EXCEEDED` | `LibraAccount::EINSUFFICIENT_BALANCE`                    | `amount` is greater than `payer`'s balance in `Token`.                                  |
+    | `Errors::NOT_PUBLISHED`  | `LibraAccount::EPAYER_DOESNT_HOLD_CURRENCY`              | `account` doesn't hold a balance in `Token`.                                            |
+    | `Errors::NOT_PUBLISHED`  | `Libra::EPREBURN`                                        | `account` doesn't have a `Libra::Preburn<Token>` resource published under it.           |
+    | `Errors::INVALID_STATE`  | `Libra::EPREBURN_OCCUPIED`                               | The `value` field in the `Libra::Preburn<Token>` resource under the sender is non-zero. |
+
+    # Related Scripts
+    * `Script::cancel_burn`
+    * `Script::burn`
+    * `Script::burn_txn_fees`
+    """
+
+    token: libra_types.TypeTag
+    amount: st.uint64
+
+
+def encode_preburn_script(token: TypeTag, amount: st.uint64) -> Script:
+    """# Summary
+    Moves a specified number of coins in a given currency from the account's
+    balance to its preburn area after which the coins may be burned.
+
+    This
+    transaction may be sent by any account that holds a balance and preburn area
+    in the specified currency.
+
+    # Technical Description
+    Moves the specified `amount` of coins in `Token` currency from the sending `account`'s
+    `LibraAccount::Balance<Token>` to the `Libra::Preburn<Token>` published under the same
+    `account`. `account` must have both of these resources published under it at the start of this
+    transaction in order for it to execute successfully.
+
+    ## Events
+    Successful execution of this script emits two events:
+    * `LibraAccount::SentPaymentEvent ` on `account`'s `LibraAccount::LibraAccount` `sent_events`
+    handle with the `payee` and `payer` fields being `account`'s address; and
+    * A `Libra::PreburnEvent` with `Token`'s currency code on the
+    `Libra::CurrencyInfo<Token`'s `preburn_events` handle for `Token` and with
+    `preburn_address` set to `account`'s address.
+
+    # Parameters
+    | Name      | Type      | Description                                                                                                                      |
+    | ------    | ------    | -------------                                                                                                                    |
+    | `Token`   | Type      | The Move type for the `Token` currency being moved to the preburn area. `Token` must be an already-registered currency on-chain. |
+    | `account` | `&signer` | The signer reference of the sending account.                                                                                     |
+    | `amount`  | `u64`     | The amount in `Token` to be moved to the preburn area.                                                                           |
+
+    # Common Abort Conditions
+    | Error Category           | Error Reason                                             | Description                                                                             |
+    | ----------------         | --------------                                           | -------------                                                                           |
+    | `Errors::NOT_PUBLISHED`  | `Libra::ECURRENCY_INFO`                                  | The `Token` is not a registered currency on-chain.                                      |
+    | `Errors::INVALID_STATE`  | `LibraAccount::EWITHDRAWAL_CAPABILITY_ALREADY_EXTRACTED` | The withdrawal capability for `account` has already been extracted.                     |
+    | `Errors::LIMIT_EXCEEDED` | `LibraAccount::EINSUFFICIENT_BALANCE`                    | `amount` is greater than `payer`'s balance in `Token`.                                  |
+    | `Errors::NOT_PUBLISHED`  | `LibraAccount::EPAYER_DOESNT_HOLD_CURRENCY`              | `account` doesn't hold a balance in `Token`.                                            |
+    | `Errors::NOT_PUBLISHED`  | `Libra::EPREBURN`                                        | `account` doesn't have a `Libra::Preburn<Token>` resource published under it.           |
+    | `Errors::INVALID_STATE`  | `Libra::EPREBURN_OCCUPIED`                               | The `value` field in the `Libra::Preburn<Token>` resource under the sender is non-zero. |
+
+    # Related Scripts
+    * `Script::cancel_burn`
+    * `Script::burn`
+    * `Script::burn_txn_fees`
+    """
+    return Script(
+        code=PREBURN_CODE,
+        ty_args=[token],
+        args=[TransactionArgument__U64(value=amount)],
+    )
+
+
+def decode_preburn_script(script: Script) -> ScriptCall:
+    return ScriptCall__Preburn(
+        token=script.ty_args[0],
+        amount=decode_u64_argument(script.args[0]),
+    )
+
+
+PREBURN_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x07\x01\x00\x02\x02\x02\x04\x03\x06\x10\x04\x16\x02\x05\x18\x15\x07\x2d\x60\x08\x8d\x01\x10\x00\x00\x00\x01\x01\x00\x00\x02\x00\x01\x00\x00\x03\x02\x03\x01\x01\x00\x04\x01\x03\x00\x01\x05\x01\x06\x0c\x01\x08\x00\x03\x06\x0c\x06\x08\x00\x03\x00\x02\x06\x0c\x03\x01\x09\x00\x0c\x4c\x69\x62\x72\x61\x41\x63\x63\x6f\x75\x6e\x74\x12\x57\x69\x74\x68\x64\x72\x61\x77\x43\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x1b\x65\x78\x74\x72\x61\x63\x74\x5f\x77\x69\x74\x68\x64\x72\x61\x77\x5f\x63\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x07\x70\x72\x65\x62\x75\x72\x6e\x1b\x72\x65\x73\x74\x6f\x72\x65\x5f\x77\x69\x74\x68\x64\x72\x61\x77\x5f\x63\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x04\x01\x0a\x0a\x00\x11\x00\x0c\x02\x0b\x00\x0e\x02\x0a\x01\x38\x00\x0b\x02\x11\x02\x02"
@@ -0,0 +1,85 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra.libra_types import Script, TransactionArgument__U8Vector
+from libra.stdlib import ScriptCall, decode_u8vector_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__PublishSharedEd25519PublicKey(ScriptCall):
+    """# Summary
+    Rotates the authentication key of the sending account to the
+    newly-specified public key and publishes a new shared authentication key
+    under the sender's account.
+
+    Any account can send this transaction.
+
+    # Technical Description
+    Rotates the authentication key of the sending account to `public_key`,
+    and publishes a `SharedEd25519PublicKey::SharedEd25519PublicKey` resource
+    containing the 32-byte ed25519 `public_key` and the `LibraAccount::KeyRotationCapability` for
+    `account` under `account`.
+
+    # Parameters
+    | Name         | Type         | Description                                                                               |
+    | ------       | ------       | -------------                                                                             |
+    | `account`    | `&signer`    | The signer reference of the sending account of the transaction.                           |
+    | `public_key` | `vector<u8>` | 32-byte Ed25519 public key for `account`' authentication key to be rotated to and stored. |
+
+    # Common Abort Conditions
+    | Error Category              | Error Reason                                               | Description                                                                                         |
+    | ----------------            | --------------                                             | -------------                                                                                       |
+    | `Errors::INVALID_STATE`     | `LibraAccount::EKEY_ROTATION_CAPABILITY_ALREADY_EXTRACTED` | `account` has already delegated/extracted its `LibraAccount::KeyRotationCapability` resource.       |
+    | `Errors::ALREADY_PUBLISHED` | `SharedEd25519PublicKey::ESHARED_KEY`                      | The `SharedEd25519PublicKey::SharedEd25519PublicKey` resource is already published under `account`. |
+    | `Errors::INVALID_ARGUMENT`  | `SharedEd25519PublicKey::EMALFORMED_PUBLIC_KEY`            | `public_key` is an invalid ed25519 public key.                                                      |
+
+    # Related Scripts
+    * `Script::rotate_shared_ed25519_public_key`
+    """
+
+    public_key: bytes
+
+
+def encode_publish_shared_ed25519_public_key_script(public_key: bytes) -> Script:
+    """# Summary
+    Rotates the authentication key of the sending account to the
+    newly-specified public key and publishes a new shared authentication key
+    under the sender's account.
+
+    Any account can send this transaction.
+
+    # Technical Description
+    Rotates the authentication key of the sending account to `public_key`,
+    and publishes a `SharedEd25519PublicKey::SharedEd25519PublicKey` resource
+    containing the 32-byte ed25519 `public_key` and the `LibraAccount::KeyRotationCapability` for
+    `account` under `account`.
+
+    # Parameters
+    | Name         | Type         | Description                                                                               |
+    | ------       | ------       | -------------                                                                             |
+    | `account`    | `&signer`    | The signer reference of the sending account of the transaction.                           |
+    | `public_key` | `vector<u8>` | 32-byte Ed25519 public key for `account`' authentication key to be rotated to and stored. |
+
+    # Common Abort Conditions
+    | Error Category              | Error Reason                                               | Description                                                                                         |
+    | ----------------            | --------------                                             | -------------                                                                                       |
+    | `Errors::INVALID_STATE`     | `LibraAccount::EKEY_ROTATION_CAPABILITY_ALREADY_EXTRACTED` | `account` has already delegated/extracted its `LibraAccount::KeyRotationCapability` resource.       |
+    | `Errors::ALREADY_PUBLISHED` | `SharedEd25519PublicKey::ESHARED_KEY`                      | The `SharedEd25519PublicKey::SharedEd25519PublicKey` resource is already published under `account`. |
+    | `Errors::INVALID_ARGUMENT`  | `SharedEd25519PublicKey::EMALFORMED_PUBLIC_KEY`            | `public_key` is an invalid ed25519 public key.                                                      |
+
+    # Related Scripts
+    * `Script::rotate_shared_ed25519_public_key`
+    """
+    return Script(
+        code=PUBLISH_SHARED_ED25519_PUBLIC_KEY_CODE,
+        ty_args=[],
+        args=[TransactionArgument__U8Vector(value=public_key)],
+    )
+
+
+def decode_publish_shared_ed25519_public_key_script(script: Script) -> ScriptCall:
+    return ScriptCall__PublishSharedEd25519PublicKey(
+        public_key=decode_u8vector_argument(script.args[0]),
+    )
+
+
+PUBLISH_SHARED_ED25519_PUBLIC_KEY_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x05\x01\x00\x02\x03\x02\x05\x05\x07\x06\x07\x0d\x1f\x08\x2c\x10\x00\x00\x00\x01\x00\x01\x00\x02\x06\x0c\x0a\x02\x00\x16\x53\x68\x61\x72\x65\x64\x45\x64\x32\x35\x35\x31\x39\x50\x75\x62\x6c\x69\x63\x4b\x65\x79\x07\x70\x75\x62\x6c\x69\x73\x68\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x01\x04\x0b\x00\x0b\x01\x11\x00\x02"
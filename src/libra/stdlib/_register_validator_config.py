@@ -0,0 +1,122 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import libra_types
+from libra.libra_types import Script, AccountAddress, TransactionArgument__Address, TransactionArgument__U8Vector
+from libra.stdlib import ScriptCall, decode_address_argument, decode_u8vector_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__RegisterValidatorConfig(ScriptCall):
+    """# Summary
+    Updates a validator's configuration.
+
+    This does not reconfigure the system and will not update
+    the configuration in the validator set that is seen by other validators in the network. Can
+    only be successfully sent by a Validator Operator account that is already registered with a
+    validator.
+
+    # Technical Description
+    This updates the fields with corresponding names held in the `ValidatorConfig::ValidatorConfig`
+    config resource held under `validator_account`. It does not emit a `LibraConfig::NewEpochEvent`
+    so the copy of this config held in the validator set will not be updated, and the changes are
+    only "locally" under the `validator_account` account address.
+
+    # Parameters
+    | Name                          | Type         | Description                                                                                                                  |
+    | ------                        | ------       | -------------                                                                                                                |
+    | `validator_operator_account`  | `&signer`    | Signer reference of the sending account. Must be the registered validator operator for the validator at `validator_address`. |
+    | `validator_account`           | `address`    | The address of the validator's `ValidatorConfig::ValidatorConfig` resource being updated.                                    |
+    | `consensus_pubkey`            | `vector<u8>` | New Ed25519 public key to be used in the updated `ValidatorConfig::ValidatorConfig`.                                         |
+    | `validator_network_addresses` | `vector<u8>` | New set of `validator_network_addresses` to be used in the updated `ValidatorConfig::ValidatorConfig`.                       |
+    | `fullnode_network_addresses`  | `vector<u8>` | New set of `fullnode_network_addresses` to be used in the updated `ValidatorConfig::ValidatorConfig`.                        |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                   | Description                                                                                           |
+    | ----------------           | --------------                                 | -------------                                                                                         |
+    | `Errors::NOT_PUBLISHED`    | `ValidatorConfig::EVALIDATOR_CONFIG`           | `validator_address` does not have a `ValidatorConfig::ValidatorConfig` resource published under it.   |
+    | `Errors::INVALID_ARGUMENT` | `ValidatorConfig::EINVALID_TRANSACTION_SENDER` | `validator_operator_account` is not the registered operator for the validator at `validator_address`. |
+    | `Errors::INVALID_ARGUMENT` | `ValidatorConfig::EINVALID_CONSENSUS_KEY`      | `consensus_pubkey` is not a valid ed25519 public key.                                                 |
+
+    # Related Scripts
+    * `Script::create_validator_account`
+    * `Script::create_validator_operator_account`
+    * `Script::add_validator_and_reconfigure`
+    * `Script::remove_validator_and_reconfigure`
+    * `Script::set_validator_operator`
+    * `Script::set_validator_operator_with_nonce_admin`
+    * `Script::set_validator_config_and_reconfigure`
+    """
+
+    validator_account: libra_types.AccountAddress
+    consensus_pubkey: bytes
+    validator_network_addresses: bytes
+    fullnode_network_addresses: bytes
+
+
+def encode_register_validator_config_script(
+    validator_account: AccountAddress,
+    consensus_pubkey: bytes,
+    validator_network_addresses: bytes,
+    fullnode_network_addresses: bytes,
+) -> Script:
+    """# Summary
+    Updates a validator's configuration.
+
+    This does not reconfigure the system and will not update
+    the configuration in the validator set that is seen by other validators in the network. Can
+    only be successfully sent by a Validator Operator account that is already registered with a
+    validator.
+
+    # Technical Description
+    This updates the fields with corresponding names held in the `ValidatorConfig::ValidatorConfig`
+    config resource held under `validator_account`. It does not emit a `LibraConfig::NewEpochEvent`
+    so the copy of this config held in the validator set will not be updated, and the changes are
+    only "locally" under the `validator_account` account address.
+
+    # Parameters
+    | Name                          | Type         | Description                                                                                                                  |
+    | ------                        | ------       | -------------                                                                                                                |
+    | `validator_operator_account`  | `&signer`    | Signer reference of the sending account. Must be the registered validator operator for the validator at `validator_address`. |
+    | `validator_account`           | `address`    | The address of the validator's `ValidatorConfig::ValidatorConfig` resource being updated.                                    |
+    | `consensus_pubkey`            | `vector<u8>` | New Ed25519 public key to be used in the updated `ValidatorConfig::ValidatorConfig`.                                         |
+    | `validator_network_addresses` | `vector<u8>` | New set of `validator_network_addresses` to be used in the updated `ValidatorConfig::ValidatorConfig`.                       |
+    | `fullnode_network_addresses`  | `vector<u8>` | New set of `fullnode_network_addresses` to be used in the updated `ValidatorConfig::ValidatorConfig`.                        |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                   | Description                                                                                           |
+    | ----------------           | --------------                                 | -------------                                                                                         |
+    | `Errors::NOT_PUBLISHED`    | `ValidatorConfig::EVALIDATOR_CONFIG`           | `validator_address` does not have a `ValidatorConfig::ValidatorConfig` resource published under it.   |
+    | `Errors::INVALID_ARGUMENT` | `ValidatorConfig::EINVALID_TRANSACTION_SENDER` | `validator_operator_account` is not the registered operator for the validator at `validator_address`. |
+    | `Errors::INVALID_ARGUMENT` | `ValidatorConfig::EINVALID_CONSENSUS_KEY`      | `consensus_pubkey` is not a valid ed25519 public key.                                                 |
+
+    # Related Scripts
+    * `Script::create_validator_account`
+    * `Script::create_validator_operator_account`
+    * `Script::add_validator_and_reconfigure`
+    * `Script::remove_validator_and_reconfigure`
+    * `Script::set_validator_operator`
+    * `Script::set_validator_operator_with_nonce_admin`
+    * `Script::set_validator_config_and_reconfigure`
+    """
+    return Script(
+        code=REGISTER_VALIDATOR_CONFIG_CODE,
+        ty_args=[],
+        args=[
+            TransactionArgument__Address(value=validator_account),
+            TransactionArgument__U8Vector(value=consensus_pubkey),
+            TransactionArgument__U8Vector(value=validator_network_addresses),
+            TransactionArgument__U8Vector(value=fullnode_network_addresses),
+        ],
+    )
+
+
+def decode_register_validator_config_script(script: Script) -> ScriptCall:
+    return ScriptCall__RegisterValidatorConfig(
+        validator_account=decode_address_argument(script.args[0]),
+        consensus_pubkey=decode_u8vector_argument(script.args[1]),
+        validator_network_addresses=decode_u8vector_argument(script.args[2]),
+        fullnode_network_addresses=decode_u8vector_argument(script.args[3]),
+    )
+
+
+REGISTER_VALIDATOR_CONFIG_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x05\x01\x00\x02\x03\x02\x05\x05\x07\x0b\x07\x12\x1b\x08\x2d\x10\x00\x00\x00\x01\x00\x01\x00\x05\x06\x0c\x05\x0a\x02\x0a\x02\x0a\x02\x00\x0f\x56\x61\x6c\x69\x64\x61\x74\x6f\x72\x43\x6f\x6e\x66\x69\x67\x0a\x73\x65\x74\x5f\x63\x6f\x6e\x66\x69\x67\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x01\x07\x0b\x00\x0a\x01\x0b\x02\x0b\x03\x0b\x04\x11\x00\x02"
@@ -0,0 +1,98 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra.libra_types import Script, TransactionArgument__U64, TransactionArgument__U8Vector
+from libra.stdlib import ScriptCall, decode_u64_argument, decode_u8vector_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__RotateAuthenticationKeyWithNonce(ScriptCall):
+    """# Summary
+    Rotates the sender's authentication key to the supplied new authentication key.
+
+    May be sent by
+    any account that has a sliding nonce resource published under it (usually this is Treasury
+    Compliance or Libra Root accounts).
+
+    # Technical Description
+    Rotates the `account`'s `LibraAccount::LibraAccount` `authentication_key` field to `new_key`.
+    `new_key` must be a valid ed25519 public key, and `account` must not have previously delegated
+    its `LibraAccount::KeyRotationCapability`.
+
+    # Parameters
+    | Name            | Type         | Description                                                                |
+    | ------          | ------       | -------------                                                              |
+    | `account`       | `&signer`    | Signer reference of the sending account of the transaction.                |
+    | `sliding_nonce` | `u64`        | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction. |
+    | `new_key`       | `vector<u8>` | New ed25519 public key to be used for `account`.                           |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                               | Description                                                                                |
+    | ----------------           | --------------                                             | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`                             | A `SlidingNonce` resource is not published under `account`.                                |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_OLD`                             | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_NEW`                             | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_ALREADY_RECORDED`                    | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::INVALID_STATE`    | `LibraAccount::EKEY_ROTATION_CAPABILITY_ALREADY_EXTRACTED` | `account` has already delegated/extracted its `LibraAccount::KeyRotationCapability`.       |
+    | `Errors::INVALID_ARGUMENT` | `LibraAccount::EMALFORMED_AUTHENTICATION_KEY`              | `new_key` was an invalid length.                                                           |
+
+    # Related Scripts
+    * `Script::rotate_authentication_key`
+    * `Script::rotate_authentication_key_with_nonce_admin`
+    * `Script::rotate_authentication_key_with_recovery_address`
+    """
+
+    sliding_nonce: st.uint64
+    new_key: bytes
+
+
+def encode_rotate_authentication_key_with_nonce_script(sliding_nonce: st.uint64, new_key: bytes) -> Script:
+    """# Summary
+    Rotates the sender's authentication key to the supplied new authentication key.
+
+    May be sent by
+    any account that has a sliding nonce resource published under it (usually this is Treasury
+    Compliance or Libra Root accounts).
+
+    # Technical Description
+    Rotates the `account`'s `LibraAccount::LibraAccount` `authentication_key` field to `new_key`.
+    `new_key` must be a valid ed25519 public key, and `account` must not have previously delegated
+    its `LibraAccount::KeyRotationCapability`.
+
+    # Parameters
+    | Name            | Type         | Description                                                                |
+    | ------          | ------       | -------------                                                              |
+    | `account`       | `&signer`    | Signer reference of the sending account of the transaction.                |
+    | `sliding_nonce` | `u64`        | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction. |
+    | `new_key`       | `vector<u8>` | New ed25519 public key to be used for `account`.                           |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                               | Description                                                                                |
+    | ----------------           | --------------                                             | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`                             | A `SlidingNonce` resource is not published under `account`.                                |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_OLD`                             | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_NEW`                             | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_ALREADY_RECORDED`                    | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::INVALID_STATE`    | `LibraAccount::EKEY_ROTATION_CAPABILITY_ALREADY_EXTRACTED` | `account` has already delegated/extracted its `LibraAccount::KeyRotationCapability`.       |
+    | `Errors::INVALID_ARGUMENT` | `LibraAccount::EMALFORMED_AUTHENTICATION_KEY`              | `new_key` was an invalid length.                                                           |
+
+    # Related Scripts
+    * `Script::rotate_authentication_key`
+    * `Script::rotate_authentication_key_with_nonce_admin`
+    * `Script::rotate_authentication_key_with_recovery_address`
+    """
+    return Script(
+        code=ROTATE_AUTHENTICATION_KEY_WITH_NONCE_CODE,
+        ty_args=[],
+        args=[TransactionArgument__U64(value=sliding_nonce), TransactionArgument__U8Vector(value=new_key)],
+    )
+
+
+def decode_rotate_authentication_key_with_nonce_script(script: Script) -> ScriptCall:
+    return ScriptCall__RotateAuthenticationKeyWithNonce(
+        sliding_nonce=decode_u64_argument(script.args[0]),
+        new_key=decode_u8vector_argument(script.args[1]),
+    )
+
+
+ROTATE_AUTHENTICATION_KEY_WITH_NONCE_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x06\x01\x00\x04\x02\x04\x04\x03\x08\x14\x05\x1c\x17\x07\x33\xa0\x01\x08\xd3\x01\x10\x00\x00\x00\x01\x00\x03\x01\x00\x01\x02\x00\x01\x00\x00\x04\x02\x03\x00\x00\x05\x03\x01\x00\x00\x06\x04\x01\x00\x02\x06\x0c\x03\x00\x01\x06\x0c\x01\x08\x00\x02\x06\x08\x00\x0a\x02\x03\x06\x0c\x03\x0a\x02\x0c\x4c\x69\x62\x72\x61\x41\x63\x63\x6f\x75\x6e\x74\x0c\x53\x6c\x69\x64\x69\x6e\x67\x4e\x6f\x6e\x63\x65\x15\x72\x65\x63\x6f\x72\x64\x5f\x6e\x6f\x6e\x63\x65\x5f\x6f\x72\x5f\x61\x62\x6f\x72\x74\x15\x4b\x65\x79\x52\x6f\x74\x61\x74\x69\x6f\x6e\x43\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x1f\x65\x78\x74\x72\x61\x63\x74\x5f\x6b\x65\x79\x5f\x72\x6f\x74\x61\x74\x69\x6f\x6e\x5f\x63\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x1f\x72\x65\x73\x74\x6f\x72\x65\x5f\x6b\x65\x79\x5f\x72\x6f\x74\x61\x74\x69\x6f\x6e\x5f\x63\x61\x70\x61\x62\x69\x6c\x69\x74\x79\x19\x72\x6f\x74\x61\x74\x65\x5f\x61\x75\x74\x68\x65\x6e\x74\x69\x63\x61\x74\x69\x6f\x6e\x5f\x6b\x65\x79\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x05\x03\x0c\x0a\x00\x0a\x01\x11\x00\x0b\x00\x11\x01\x0c\x03\x0e\x03\x0b\x02\x11\x03\x0b\x03\x11\x02\x02"
@@ -0,0 +1,108 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import libra_types
+from libra.libra_types import Script, AccountAddress, TransactionArgument__Address, TransactionArgument__U8Vector
+from libra.stdlib import ScriptCall, decode_address_argument, decode_u8vector_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__RotateAuthenticationKeyWithRecoveryAddress(ScriptCall):
+    """# Summary
+    Rotates the authentication key of a specified account that is part of a recovery address to a
+    new authentication key.
+
+    Only used for accounts that are part of a recovery address (see
+    `Script::add_recovery_rotation_capability` for account restrictions).
+
+    # Technical Description
+    Rotates the authentication key of the `to_recover` account to `new_key` using the
+    `LibraAccount::KeyRotationCapability` stored in the `RecoveryAddress::RecoveryAddress` resource
+    published under `recovery_address`. This transaction can be sent either by the `to_recover`
+    account, or by the account where the `RecoveryAddress::RecoveryAddress` resource is published
+    that contains `to_recover`'s `LibraAccount::KeyRotationCapability`.
+
+    # Parameters
+    | Name               | Type         | Description                                                                                                                    |
+    | ------             | ------       | -------------                                                                                                                  |
+    | `account`          | `&signer`    | Signer reference of the sending account of the transaction.                                                                    |
+    | `recovery_address` | `address`    | Address where `RecoveryAddress::RecoveryAddress` that holds `to_recover`'s `LibraAccount::KeyRotationCapability` is published. |
+    | `to_recover`       | `address`    | The address of the account whose authentication key will be updated.                                                           |
+    | `new_key`          | `vector<u8>` | New ed25519 public key to be used for the account at the `to_recover` address.                                                 |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                  | Description                                                                                                                                          |
+    | ----------------           | --------------                                | -------------                                                                                                                                        |
+    | `Errors::NOT_PUBLISHED`    | `RecoveryAddress::ERECOVERY_ADDRESS`          | `recovery_address` does not have a `RecoveryAddress::RecoveryAddress` resource published under it.                                                   |
+    | `Errors::INVALID_ARGUMENT` | `RecoveryAddress::ECANNOT_ROTATE_KEY`         | The address of `account` is not `recovery_address` or `to_recover`.                                                                                  |
+    | `Errors::INVALID_ARGUMENT` | `RecoveryAddress::EACCOUNT_NOT_RECOVERABLE`   | `to_recover`'s `LibraAccount::KeyRotationCapability`  is not in the `RecoveryAddress::RecoveryAddress`  resource published under `recovery_address`. |
+    | `Errors::INVALID_ARGUMENT` | `LibraAccount::EMALFORMED_AUTHENTICATION_KEY` | `new_key` was an invalid length.                                                                                                                     |
+
+    # Related Scripts
+    * `Script::rotate_authentication_key`
+    * `Script::rotate_authentication_key_with_nonce`
+    * `Script::rotate_authentication_key_with_nonce_admin`
+    """
+
+    recovery_address: libra_types.AccountAddress
+    to_recover: libra_types.AccountAddress
+    new_key: bytes
+
+
+def encode_rotate_authentication_key_with_recovery_address_script(
+    recovery_address: AccountAddress, to_recover: AccountAddress, new_key: bytes
+) -> Script:
+    """# Summary
+    Rotates the authentication key of a specified account that is part of a recovery address to a
+    new authentication key.
+
+    Only used for accounts that are part of a recovery address (see
+    `Script::add_recovery_rotation_capability` for account restrictions).
+
+    # Technical Description
+    Rotates the authentication key of the `to_recover` account to `new_key` using the
+    `LibraAccount::KeyRotationCapability` stored in the `RecoveryAddress::RecoveryAddress` resource
+    published under `recovery_address`. This transaction can be sent either by the `to_recover`
+    account, or by the account where the `RecoveryAddress::RecoveryAddress` resource is published
+    that contains `to_recover`'s `LibraAccount::KeyRotationCapability`.
+
+    # Parameters
+    | Name               | Type         | Description                                                                                                                    |
+    | ------             | ------       | -------------                                                                                                                  |
+    | `account`          | `&signer`    | Signer reference of the sending account of the transaction.                                                                    |
+    | `recovery_address` | `address`    | Address where `RecoveryAddress::RecoveryAddress` that holds `to_recover`'s `LibraAccount::KeyRotationCapability` is published. |
+    | `to_recover`       | `address`    | The address of the account whose authentication key will be updated.                                                           |
+    | `new_key`          | `vector<u8>` | New ed25519 public key to be used for the account at the `to_recover` address.                                                 |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                  | Description                                                                                                                                          |
+    | ----------------           | --------------                                | -------------                                                                                                                                        |
+    | `Errors::NOT_PUBLISHED`    | `RecoveryAddress::ERECOVERY_ADDRESS`          | `recovery_address` does not have a `RecoveryAddress::RecoveryAddress` resource published under it.                                                   |
+    | `Errors::INVALID_ARGUMENT` | `RecoveryAddress::ECANNOT_ROTATE_KEY`         | The address of `account` is not `recovery_address` or `to_recover`.                                                                                  |
+    | `Errors::INVALID_ARGUMENT` | `RecoveryAddress::EACCOUNT_NOT_RECOVERABLE`   | `to_recover`'s `LibraAccount::KeyRotationCapability`  is not in the `RecoveryAddress::RecoveryAddress`  resource published under `recovery_address`. |
+    | `Errors::INVALID_ARGUMENT` | `LibraAccount::EMALFORMED_AUTHENTICATION_KEY` | `new_key` was an invalid length.                                                                                                                     |
+
+    # Related Scripts
+    * `Script::rotate_authentication_key`
+    * `Script::rotate_authentication_key_with_nonce`
+    * `Script::rotate_authentication_key_with_nonce_admin`
+    """
+    return Script(
+        code=ROTATE_AUTHENTICATION_KEY_WITH_RECOVERY_ADDRESS_CODE,
+        ty_args=[],
+        args=[
+            TransactionArgument__Address(value=recovery_address),
+            TransactionArgument__Address(value=to_recover),
+            TransactionArgument__U8Vector(value=new_key),
+        ],
+    )
+
+
+def decode_rotate_authentication_key_with_recovery_address_script(script: Script) -> ScriptCall:
+    return ScriptCall__RotateAuthenticationKeyWithRecoveryAddress(
+        recovery_address=decode_address_argument(script.args[0]),
+        to_recover=decode_address_argument(script.args[1]),
+        new_key=decode_u8vector_argument(script.args[2]),
+    )
+
+
+ROTATE_AUTHENTICATION_KEY_WITH_RECOVERY_ADDRESS_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x05\x01\x00\x02\x03\x02\x05\x05\x07\x08\x07\x0f\x2a\x08\x39\x10\x00\x00\x00\x01\x00\x01\x00\x04\x06\x0c\x05\x05\x0a\x02\x00\x0f\x52\x65\x63\x6f\x76\x65\x72\x79\x41\x64\x64\x72\x65\x73\x73\x19\x72\x6f\x74\x61\x74\x65\x5f\x61\x75\x74\x68\x65\x6e\x74\x69\x63\x61\x74\x69\x6f\x6e\x5f\x6b\x65\x79\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x01\x06\x0b\x00\x0a\x01\x0a\x02\x0b\x03\x11\x00\x02"
@@ -0,0 +1,107 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra.libra_types import Script, TransactionArgument__U8Vector
+from libra.stdlib import ScriptCall, decode_u8vector_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__RotateDualAttestationInfo(ScriptCall):
+    """# Summary
+    Updates the url used for off-chain communication, and the public key used to verify dual
+    attestation on-chain.
+
+    Transaction can be sent by any account that has dual attestation
+    information published under it. In practice the only such accounts are Designated Dealers and
+    Parent VASPs.
+
+    # Technical Description
+    Updates the `base_url` and `compliance_public_key` fields of the `DualAttestation::Credential`
+    resource published under `account`. The `new_key` must be a valid ed25519 public key.
+
+    ## Events
+    Successful execution of this transaction emits two events:
+    * A `DualAttestation::ComplianceKeyRotationEvent` containing the new compliance public key, and
+    the blockchain time at which the key was updated emitted on the `DualAttestation::Credential`
+    `compliance_key_rotation_events` handle published under `account`; and
+    * A `DualAttestation::BaseUrlRotationEvent` containing the new base url to be used for
+    off-chain communication, and the blockchain time at which the url was updated emitted on the
+    `DualAttestation::Credential` `base_url_rotation_events` handle published under `account`.
+
+    # Parameters
+    | Name      | Type         | Description                                                               |
+    | ------    | ------       | -------------                                                             |
+    | `account` | `&signer`    | Signer reference of the sending account of the transaction.               |
+    | `new_url` | `vector<u8>` | ASCII-encoded url to be used for off-chain communication with `account`.  |
+    | `new_key` | `vector<u8>` | New ed25519 public key to be used for on-chain dual attestation checking. |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                           | Description                                                                |
+    | ----------------           | --------------                         | -------------                                                              |
+    | `Errors::NOT_PUBLISHED`    | `DualAttestation::ECREDENTIAL`         | A `DualAttestation::Credential` resource is not published under `account`. |
+    | `Errors::INVALID_ARGUMENT` | `DualAttestation::EINVALID_PUBLIC_KEY` | `new_key` is not a valid ed25519 public key.                               |
+
+    # Related Scripts
+    * `Script::create_parent_vasp_account`
+    * `Script::create_designated_dealer`
+    * `Script::rotate_dual_attestation_info`
+    """
+
+    new_url: bytes
+    new_key: bytes
+
+
+def encode_rotate_dual_attestation_info_script(new_url: bytes, new_key: bytes) -> Script:
+    """# Summary
+    Updates the url used for off-chain communication, and the public key used to verify dual
+    attestation on-chain.
+
+    Transaction can be sent by any account that has dual attestation
+    information published under it. In practice the only such accounts are Designated Dealers and
+    Parent VASPs.
+
+    # Technical Description
+    Updates the `base_url` and `compliance_public_key` fields of the `DualAttestation::Credential`
+    resource published under `account`. The `new_key` must be a valid ed25519 public key.
+
+    ## Events
+    Successful execution of this transaction emits two events:
+    * A `DualAttestation::ComplianceKeyRotationEvent` containing the new compliance public key, and
+    the blockchain time at which the key was updated emitted on the `DualAttestation::Credential`
+    `compliance_key_rotation_events` handle published under `account`; and
+    * A `DualAttestation::BaseUrlRotationEvent` containing the new base url to be used for
+    off-chain communication, and the blockchain time at which the url was updated emitted on the
+    `DualAttestation::Credential` `base_url_rotation_events` handle published under `account`.
+
+    # Parameters
+    | Name      | Type         | Description                                                               |
+    | ------    | ------       | -------------                                                             |
+    | `account` | `&signer`    | Signer reference of the sending account of the transaction.               |
+    | `new_url` | `vector<u8>` | ASCII-encoded url to be used for off-chain communication with `account`.  |
+    | `new_key` | `vector<u8>` | New ed25519 public key to be used for on-chain dual attestation checking. |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                           | Description                                                                |
+    | ----------------           | --------------                         | -------------                                                              |
+    | `Errors::NOT_PUBLISHED`    | `DualAttestation::ECREDENTIAL`         | A `DualAttestation::Credential` resource is not published under `account`. |
+    | `Errors::INVALID_ARGUMENT` | `DualAttestation::EINVALID_PUBLIC_KEY` | `new_key` is not a valid ed25519 public key.                               |
+
+    # Related Scripts
+    * `Script::create_parent_vasp_account`
+    * `Script::create_designated_dealer`
+    * `Script::rotate_dual_attestation_info`
+    """
+    return Script(
+        code=ROTATE_DUAL_ATTESTATION_INFO_CODE,
+        ty_args=[],
+        args=[TransactionArgument__U8Vector(value=new_url), TransactionArgument__U8Vector(value=new_key)],
+    )
+
+
+def decode_rotate_dual_attestation_info_script(script: Script) -> ScriptCall:
+    return ScriptCall__RotateDualAttestationInfo(
+        new_url=decode_u8vector_argument(script.args[0]),
+        new_key=decode_u8vector_argument(script.args[1]),
+    )
+
+
+ROTATE_DUAL_ATTESTATION_INFO_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x05\x01\x00\x02\x03\x02\x0a\x05\x0c\x0d\x07\x19\x3d\x08\x56\x10\x00\x00\x00\x01\x00\x01\x00\x00\x02\x00\x01\x00\x02\x06\x0c\x0a\x02\x00\x03\x06\x0c\x0a\x02\x0a\x02\x0f\x44\x75\x61\x6c\x41\x74\x74\x65\x73\x74\x61\x74\x69\x6f\x6e\x0f\x72\x6f\x74\x61\x74\x65\x5f\x62\x61\x73\x65\x5f\x75\x72\x6c\x1c\x72\x6f\x74\x61\x74\x65\x5f\x63\x6f\x6d\x70\x6c\x69\x61\x6e\x63\x65\x5f\x70\x75\x62\x6c\x69\x63\x5f\x6b\x65\x79\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x02\x01\x07\x0a\x00\x0b\x01\x11\x00\x0b\x00\x0b\x02\x11\x01\x02"
@@ -0,0 +1,83 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra.libra_types import Script, TransactionArgument__U8Vector
+from libra.stdlib import ScriptCall, decode_u8vector_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__RotateSharedEd25519PublicKey(ScriptCall):
+    """# Summary
+    Rotates the authentication key in a `SharedEd25519PublicKey`.
+
+    This transaction can be sent by
+    any account that has previously published a shared ed25519 public key using
+    `Script::publish_shared_ed25519_public_key`.
+
+    # Technical Description
+    This first rotates the public key stored in `account`'s
+    `SharedEd25519PublicKey::SharedEd25519PublicKey` resource to `public_key`, after which it
+    rotates the authentication key using the capability stored in `account`'s
+    `SharedEd25519PublicKey::SharedEd25519PublicKey` to a new value derived from `public_key`
+
+    # Parameters
+    | Name         | Type         | Description                                                     |
+    | ------       | ------       | -------------                                                   |
+    | `account`    | `&signer`    | The signer reference of the sending account of the transaction. |
+    | `public_key` | `vector<u8>` | 32-byte Ed25519 public key.                                     |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                    | Description                                                                                   |
+    | ----------------           | --------------                                  | -------------                                                                                 |
+    | `Errors::NOT_PUBLISHED`    | `SharedEd25519PublicKey::ESHARED_KEY`           | A `SharedEd25519PublicKey::SharedEd25519PublicKey` resource is not published under `account`. |
+    | `Errors::INVALID_ARGUMENT` | `SharedEd25519PublicKey::EMALFORMED_PUBLIC_KEY` | `public_key` is an invalid ed25519 public key.                                                |
+
+    # Related Scripts
+    * `Script::publish_shared_ed25519_public_key`
+    """
+
+    public_key: bytes
+
+
+def encode_rotate_shared_ed25519_public_key_script(public_key: bytes) -> Script:
+    """# Summary
+    Rotates the authentication key in a `SharedEd25519PublicKey`.
+
+    This transaction can be sent by
+    any account that has previously published a shared ed25519 public key using
+    `Script::publish_shared_ed25519_public_key`.
+
+    # Technical Description
+    This first rotates the public key stored in `account`'s
+    `SharedEd25519PublicKey::SharedEd25519PublicKey` resource to `public_key`, after which it
+    rotates the authentication key using the capability stored in `account`'s
+    `SharedEd25519PublicKey::SharedEd25519PublicKey` to a new value derived from `public_key`
+
+    # Parameters
+    | Name         | Type         | Description                                                     |
+    | ------       | ------       | -------------                                                   |
+    | `account`    | `&signer`    | The signer reference of the sending account of the transaction. |
+    | `public_key` | `vector<u8>` | 32-byte Ed25519 public key.                                     |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                    | Description                                                                                   |
+    | ----------------           | --------------                                  | -------------                                                                                 |
+    | `Errors::NOT_PUBLISHED`    | `SharedEd25519PublicKey::ESHARED_KEY`           | A `SharedEd25519PublicKey::SharedEd25519PublicKey` resource is not published under `account`. |
+    | `Errors::INVALID_ARGUMENT` | `SharedEd25519PublicKey::EMALFORMED_PUBLIC_KEY` | `public_key` is an invalid ed25519 public key.                                                |
+
+    # Related Scripts
+    * `Script::publish_shared_ed25519_public_key`
+    """
+    return Script(
+        code=ROTATE_SHARED_ED25519_PUBLIC_KEY_CODE,
+        ty_args=[],
+        args=[TransactionArgument__U8Vector(value=public_key)],
+    )
+
+
+def decode_rotate_shared_ed25519_public_key_script(script: Script) -> ScriptCall:
+    return ScriptCall__RotateSharedEd25519PublicKey(
+        public_key=decode_u8vector_argument(script.args[0]),
+    )
+
+
+ROTATE_SHARED_ED25519_PUBLIC_KEY_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x05\x01\x00\x02\x03\x02\x05\x05\x07\x06\x07\x0d\x22\x08\x2f\x10\x00\x00\x00\x01\x00\x01\x00\x02\x06\x0c\x0a\x02\x00\x16\x53\x68\x61\x72\x65\x64\x45\x64\x32\x35\x35\x31\x39\x50\x75\x62\x6c\x69\x63\x4b\x65\x79\x0a\x72\x6f\x74\x61\x74\x65\x5f\x6b\x65\x79\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x01\x04\x0b\x00\x0b\x01\x11\x00\x02"
@@ -0,0 +1,124 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import libra_types
+from libra.libra_types import Script, AccountAddress, TransactionArgument__Address, TransactionArgument__U8Vector
+from libra.stdlib import ScriptCall, decode_address_argument, decode_u8vector_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__SetValidatorConfigAndReconfigure(ScriptCall):
+    """# Summary
+    Updates a validator's configuration, and triggers a reconfiguration of the system to update the
+    validator set with this new validator configuration.
+
+    Can only be successfully sent by a
+    Validator Operator account that is already registered with a validator.
+
+    # Technical Description
+    This updates the fields with corresponding names held in the `ValidatorConfig::ValidatorConfig`
+    config resource held under `validator_account`. It then emits a `LibraConfig::NewEpochEvent` to
+    trigger a reconfiguration of the system.  This reconfiguration will update the validator set
+    on-chain with the updated `ValidatorConfig::ValidatorConfig`.
+
+    # Parameters
+    | Name                          | Type         | Description                                                                                                                  |
+    | ------                        | ------       | -------------                                                                                                                |
+    | `validator_operator_account`  | `&signer`    | Signer reference of the sending account. Must be the registered validator operator for the validator at `validator_address`. |
+    | `validator_account`           | `address`    | The address of the validator's `ValidatorConfig::ValidatorConfig` resource being updated.                                    |
+    | `consensus_pubkey`            | `vector<u8>` | New Ed25519 public key to be used in the updated `ValidatorConfig::ValidatorConfig`.                                         |
+    | `validator_network_addresses` | `vector<u8>` | New set of `validator_network_addresses` to be used in the updated `ValidatorConfig::ValidatorConfig`.                       |
+    | `fullnode_network_addresses`  | `vector<u8>` | New set of `fullnode_network_addresses` to be used in the updated `ValidatorConfig::ValidatorConfig`.                        |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                   | Description                                                                                           |
+    | ----------------           | --------------                                 | -------------                                                                                         |
+    | `Errors::NOT_PUBLISHED`    | `ValidatorConfig::EVALIDATOR_CONFIG`           | `validator_address` does not have a `ValidatorConfig::ValidatorConfig` resource published under it.   |
+    | `Errors::REQUIRES_ROLE`    | `Roles::EVALIDATOR_OPERATOR`                   | `validator_operator_account` does not have a Validator Operator role.                                 |
+    | `Errors::INVALID_ARGUMENT` | `ValidatorConfig::EINVALID_TRANSACTION_SENDER` | `validator_operator_account` is not the registered operator for the validator at `validator_address`. |
+    | `Errors::INVALID_ARGUMENT` | `ValidatorConfig::EINVALID_CONSENSUS_KEY`      | `consensus_pubkey` is not a valid ed25519 public key.                                                 |
+    | `Errors::INVALID_STATE`    | `LibraConfig::EINVALID_BLOCK_TIME`             | An invalid time value was encountered in reconfiguration. Unlikely to occur.                          |
+
+    # Related Scripts
+    * `Script::create_validator_account`
+    * `Script::create_validator_operator_account`
+    * `Script::add_validator_and_reconfigure`
+    * `Script::remove_validator_and_reconfigure`
+    * `Script::set_validator_operator`
+    * `Script::set_validator_operator_with_nonce_admin`
+    * `Script::register_validator_config`
+    """
+
+    validator_account: libra_types.AccountAddress
+    consensus_pubkey: bytes
+    validator_network_addresses: bytes
+    fullnode_network_addresses: bytes
+
+
+def encode_set_validator_config_and_reconfigure_script(
+    validator_account: AccountAddress,
+    consensus_pubkey: bytes,
+    validator_network_addresses: bytes,
+    fullnode_network_addresses: bytes,
+) -> Script:
+    """# Summary
+    Updates a validator's configuration, and triggers a reconfiguration of the system to update the
+    validator set with this new validator configuration.
+
+    Can only be successfully sent by a
+    Validator Operator account that is already registered with a validator.
+
+    # Technical Description
+    This updates the fields with corresponding names held in the `ValidatorConfig::ValidatorConfig`
+    config resource held under `validator_account`. It then emits a `LibraConfig::NewEpochEvent` to
+    trigger a reconfiguration of the system.  This reconfiguration will update the validator set
+    on-chain with the updated `ValidatorConfig::ValidatorConfig`.
+
+    # Parameters
+    | Name                          | Type         | Description                                                                                                                  |
+    | ------                        | ------       | -------------                                                                                                                |
+    | `validator_operator_account`  | `&signer`    | Signer reference of the sending account. Must be the registered validator operator for the validator at `validator_address`. |
+    | `validator_account`           | `address`    | The address of the validator's `ValidatorConfig::ValidatorConfig` resource being updated.                                    |
+    | `consensus_pubkey`            | `vector<u8>` | New Ed25519 public key to be used in the updated `ValidatorConfig::ValidatorConfig`.                                         |
+    | `validator_network_addresses` | `vector<u8>` | New set of `validator_network_addresses` to be used in the updated `ValidatorConfig::ValidatorConfig`.                       |
+    | `fullnode_network_addresses`  | `vector<u8>` | New set of `fullnode_network_addresses` to be used in the updated `ValidatorConfig::ValidatorConfig`.                        |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                   | Description                                                                                           |
+    | ----------------           | --------------                                 | -------------                                                                                         |
+    | `Errors::NOT_PUBLISHED`    | `ValidatorConfig::EVALIDATOR_CONFIG`           | `validator_address` does not have a `ValidatorConfig::ValidatorConfig` resource published under it.   |
+    | `Errors::REQUIRES_ROLE`    | `Roles::EVALIDATOR_OPERATOR`                   | `validator_operator_account` does not have a Validator Operator role.                                 |
+    | `Errors::INVALID_ARGUMENT` | `ValidatorConfig::EINVALID_TRANSACTION_SENDER` | `validator_operator_account` is not the registered operator for the validator at `validator_address`. |
+    | `Errors::INVALID_ARGUMENT` | `ValidatorConfig::EINVALID_CONSENSUS_KEY`      | `consensus_pubkey` is not a valid ed25519 public key.                                                 |
+    | `Errors::INVALID_STATE`    | `LibraConfig::EINVALID_BLOCK_TIME`             | An invalid time value was encountered in reconfiguration. Unlikely to occur.                          |
+
+    # Related Scripts
+    * `Script::create_validator_account`
+    * `Script::create_validator_operator_account`
+    * `Script::add_validator_and_reconfigure`
+    * `Script::remove_validator_and_reconfigure`
+    * `Script::set_validator_operator`
+    * `Script::set_validator_operator_with_nonce_admin`
+    * `Script::register_validator_config`
+    """
+    return Script(
+        code=SET_VALIDATOR_CONFIG_AND_RECONFIGURE_CODE,
+        ty_args=[],
+        args=[
+            TransactionArgument__Address(value=validator_account),
+            TransactionArgument__U8Vector(value=consensus_pubkey),
+            TransactionArgument__U8Vector(value=validator_network_addresses),
+            TransactionArgument__U8Vector(value=fullnode_network_addresses),
+        ],
+    )
+
+
+def decode_set_validator_config_and_reconfigure_script(script: Script) -> ScriptCall:
+    return ScriptCall__SetValidatorConfigAndReconfigure(
+        validator_account=decode_address_argument(script.args[0]),
+        consensus_pubkey=decode_u8vector_argument(script.args[1]),
+        validator_network_addresses=decode_u8vector_argument(script.args[2]),
+        fullnode_network_addresses=decode_u8vector_argument(script.args[3]),
+    )
+
+
+SET_VALIDATOR_CONFIG_AND_RECONFIGURE_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x05\x01\x00\x04\x03\x04\x0a\x05\x0e\x0f\x07\x1d\x45\x08\x62\x10\x00\x00\x00\x01\x01\x02\x00\x01\x00\x00\x03\x02\x01\x00\x05\x06\x0c\x05\x0a\x02\x0a\x02\x0a\x02\x00\x02\x06\x0c\x05\x0b\x4c\x69\x62\x72\x61\x53\x79\x73\x74\x65\x6d\x0f\x56\x61\x6c\x69\x64\x61\x74\x6f\x72\x43\x6f\x6e\x66\x69\x67\x0a\x73\x65\x74\x5f\x63\x6f\x6e\x66\x69\x67\x1d\x75\x70\x64\x61\x74\x65\x5f\x63\x6f\x6e\x66\x69\x67\x5f\x61\x6e\x64\x5f\x72\x65\x63\x6f\x6e\x66\x69\x67\x75\x72\x65\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x01\x0a\x0a\x00\x0a\x01\x0b\x02\x0b\x03\x0b\x04\x11\x00\x0b\x00\x0a\x01\x11\x01\x02"
@@ -0,0 +1,141 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra import libra_types
+from libra.libra_types import (
+    Script,
+    AccountAddress,
+    TransactionArgument__U64,
+    TransactionArgument__Address,
+    TransactionArgument__U8Vector,
+)
+from libra.stdlib import ScriptCall, decode_u64_argument, decode_address_argument, decode_u8vector_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__SetValidatorOperatorWithNonceAdmin(ScriptCall):
+    """# Summary
+    Sets the validator operator for a validator in the validator's configuration resource "locally"
+    and does not reconfigure the system.
+
+    Changes from this transaction will not picked up by the
+    system until a reconfiguration of the system is triggered. May only be sent by the Libra Root
+    account as a write set transaction.
+
+    # Technical Description
+    Sets the account at `operator_account` address and with the specified `human_name` as an
+    operator for the validator `account`. The account at `operator_account` address must have a
+    Validator Operator role and have a `ValidatorOperatorConfig::ValidatorOperatorConfig` resource
+    published under it. The account represented by the `account` signer must be a Validator and
+    have a `ValidatorConfig::ValidatorConfig` resource published under it. No reconfiguration of
+    the system is initiated by this script.
+
+    # Parameters
+    | Name               | Type         | Description                                                                                                  |
+    | ------             | ------       | -------------                                                                                                |
+    | `lr_account`       | `&signer`    | The signer reference of the sending account of the write set transaction. May only be the Libra Root signer. |
+    | `account`          | `&signer`    | Signer reference of account specified in the `execute_as` field of the write set transaction.                |
+    | `sliding_nonce`    | `u64`        | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction for Libra Root.                    |
+    | `operator_name`    | `vector<u8>` | Validator operator's human name.                                                                             |
+    | `operator_account` | `address`    | Address of the validator operator account to be added as the `account` validator's operator.                 |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                          | Description                                                                                                                                                  |
+    | ----------------           | --------------                                        | -------------                                                                                                                                                |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`                        | A `SlidingNonce` resource is not published under `lr_account`.                                                                                               |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_OLD`                        | The `sliding_nonce` in `lr_account` is too old and it's impossible to determine if it's duplicated or not.                                                   |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_NEW`                        | The `sliding_nonce` in `lr_account` is too far in the future.                                                                                                |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_ALREADY_RECORDED`               | The `sliding_nonce` in` lr_account` has been previously recorded.                                                                                            |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`                        | The sending account is not the Libra Root account or Treasury Compliance account                                                                             |
+    | `Errors::NOT_PUBLISHED`    | `ValidatorOperatorConfig::EVALIDATOR_OPERATOR_CONFIG` | The `ValidatorOperatorConfig::ValidatorOperatorConfig` resource is not published under `operator_account`.                                                   |
+    | 0                          | 0                                                     | The `human_name` field of the `ValidatorOperatorConfig::ValidatorOperatorConfig` resource under `operator_account` does not match the provided `human_name`. |
+    | `Errors::REQUIRES_ROLE`    | `Roles::EVALIDATOR`                                   | `account` does not have a Validator account role.                                                                                                            |
+    | `Errors::INVALID_ARGUMENT` | `ValidatorConfig::ENOT_A_VALIDATOR_OPERATOR`          | The account at `operator_account` does not have a `ValidatorOperatorConfig::ValidatorOperatorConfig` resource.                                               |
+    | `Errors::NOT_PUBLISHED`    | `ValidatorConfig::EVALIDATOR_CONFIG`                  | A `ValidatorConfig::ValidatorConfig` is not published under `account`.                                                                                       |
+
+    # Related Scripts
+    * `Script::create_validator_account`
+    * `Script::create_validator_operator_account`
+    * `Script::register_validator_config`
+    * `Script::remove_validator_and_reconfigure`
+    * `Script::add_validator_and_reconfigure`
+    * `Script::set_validator_operator`
+    * `Script::set_validator_config_and_reconfigure`
+    """
+
+    sliding_nonce: st.uint64
+    operator_name: bytes
+    operator_account: libra_types.AccountAddress
+
+
+def encode_set_validator_operator_with_nonce_admin_script(
+    sliding_nonce: st.uint64, operator_name: bytes, operator_account: AccountAddress
+) -> Script:
+    """# Summary
+    Sets the validator operator for a validator in the validator's configuration resource "locally"
+    and does not reconfigure the system.
+
+    Changes from this transaction will not picked up by the
+    system until a reconfiguration of the system is triggered. May only be sent by the Libra Root
+    account as a write set transaction.
+
+    # Technical Description
+    Sets the account at `operator_account` address and with the specified `human_name` as an
+    operator for the validator `account`. The account at `operator_account` address must have a
+    Validator Operator role and have a `ValidatorOperatorConfig::ValidatorOperatorConfig` resource
+    published under it. The account represented by the `account` signer must be a Validator and
+    have a `ValidatorConfig::ValidatorConfig` resource published under it. No reconfiguration of
+    the system is initiated by this script.
+
+    # Parameters
+    | Name               | Type         | Description                                                                                                  |
+    | ------             | ------       | -------------                                                                                                |
+    | `lr_account`       | `&signer`    | The signer reference of the sending account of the write set transaction. May only be the Libra Root signer. |
+    | `account`          | `&signer`    | Signer reference of account specified in the `execute_as` field of the write set transaction.                |
+    | `sliding_nonce`    | `u64`        | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction for Libra Root.                    |
+    | `operator_name`    | `vector<u8>` | Validator operator's human name.                                                                             |
+    | `operator_account` | `address`    | Address of the validator operator account to be added as the `account` validator's operator.                 |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                          | Description                                                                                                                                                  |
+    | ----------------           | --------------                                        | -------------                                                                                                                                                |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`                        | A `SlidingNonce` resource is not published under `lr_account`.                                                                                               |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_OLD`                        | The `sliding_nonce` in `lr_account` is too old and it's impossible to determine if it's duplicated or not.                                                   |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_NEW`                        | The `sliding_nonce` in `lr_account` is too far in the future.                                                                                                |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_ALREADY_RECORDED`               | The `sliding_nonce` in` lr_account` has been previously recorded.                                                                                            |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`                        | The sending account is not the Libra Root account or Treasury Compliance account                                                                             |
+    | `Errors::NOT_PUBLISHED`    | `ValidatorOperatorConfig::EVALIDATOR_OPERATOR_CONFIG` | The `ValidatorOperatorConfig::ValidatorOperatorConfig` resource is not published under `operator_account`.                                                   |
+    | 0                          | 0                                                     | The `human_name` field of the `ValidatorOperatorConfig::ValidatorOperatorConfig` resource under `operator_account` does not match the provided `human_name`. |
+    | `Errors::REQUIRES_ROLE`    | `Roles::EVALIDATOR`                                   | `account` does not have a Validator account role.                                                                                                            |
+    | `Errors::INVALID_ARGUMENT` | `ValidatorConfig::ENOT_A_VALIDATOR_OPERATOR`          | The account at `operator_account` does not have a `ValidatorOperatorConfig::ValidatorOperatorConfig` resource.                                               |
+    | `Errors::NOT_PUBLISHED`    | `ValidatorConfig::EVALIDATOR_CONFIG`                  | A `ValidatorConfig::ValidatorConfig` is not published under `account`.                                                                                       |
+
+    # Related Scripts
+    * `Script::create_validator_account`
+    * `Script::create_validator_operator_account`
+    * `Script::register_validator_config`
+    * `Script::remove_validator_and_reconfigure`
+    * `Script::add_validator_and_reconfigure`
+    * `Script::set_validator_operator`
+    * `Script::set_validator_config_and_reconfigure`
+    """
+    return Script(
+        code=SET_VALIDATOR_OPERATOR_WITH_NONCE_ADMIN_CODE,
+        ty_args=[],
+        args=[
+            TransactionArgument__U64(value=sliding_nonce),
+            TransactionArgument__U8Vector(value=operator_name),
+            TransactionArgument__Address(value=operator_account),
+        ],
+    )
+
+
+def decode_set_validator_operator_with_nonce_admin_script(script: Script) -> ScriptCall:
+    return ScriptCall__SetValidatorOperatorWithNonceAdmin(
+        sliding_nonce=decode_u64_argument(script.args[0]),
+        operator_name=decode_u8vector_argument(script.args[1]),
+        operator_account=decode_address_argument(script.args[2]),
+    )
+
+
+SET_VALIDATOR_OPERATOR_WITH_NONCE_ADMIN_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x05\x01\x00\x06\x03\x06\x0f\x05\x15\x1a\x07\x2f\x67\x08\x96\x01\x10\x00\x00\x00\x01\x00\x02\x00\x03\x00\x01\x00\x02\x04\x02\x03\x00\x01\x05\x04\x01\x00\x02\x06\x0c\x03\x00\x01\x05\x01\x0a\x02\x02\x06\x0c\x05\x05\x06\x0c\x06\x0c\x03\x0a\x02\x05\x02\x01\x03\x0c\x53\x6c\x69\x64\x69\x6e\x67\x4e\x6f\x6e\x63\x65\x0f\x56\x61\x6c\x69\x64\x61\x74\x6f\x72\x43\x6f\x6e\x66\x69\x67\x17\x56\x61\x6c\x69\x64\x61\x74\x6f\x72\x4f\x70\x65\x72\x61\x74\x6f\x72\x43\x6f\x6e\x66\x69\x67\x15\x72\x65\x63\x6f\x72\x64\x5f\x6e\x6f\x6e\x63\x65\x5f\x6f\x72\x5f\x61\x62\x6f\x72\x74\x0e\x67\x65\x74\x5f\x68\x75\x6d\x61\x6e\x5f\x6e\x61\x6d\x65\x0c\x73\x65\x74\x5f\x6f\x70\x65\x72\x61\x74\x6f\x72\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x05\x06\x12\x0b\x00\x0a\x02\x11\x00\x0a\x04\x11\x01\x0b\x03\x21\x0c\x05\x0b\x05\x03\x0e\x0b\x01\x01\x06\x00\x00\x00\x00\x00\x00\x00\x00\x27\x0b\x01\x0a\x04\x11\x02\x02"
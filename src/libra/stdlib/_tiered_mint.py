@@ -0,0 +1,162 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra import libra_types
+from libra.libra_types import Script, TypeTag, AccountAddress, TransactionArgument__U64, TransactionArgument__Address
+from libra.stdlib import ScriptCall, decode_u64_argument, decode_address_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__TieredMint(ScriptCall):
+    """# Summary
+    Mints a specified number of coins in a currency to a Designated Dealer.
+
+    The sending account
+    must be the Treasury Compliance account, and coins can only be minted to a Designated Dealer
+    account.
+
+    # Technical Description
+    Mints `mint_amount` of coins in the `CoinType` currency to Designated Dealer account at
+    `designated_dealer_address`. The `tier_index` parameter specifies which tier should be used to
+    check verify the off-chain approval policy, and is based in part on the on-chain tier values
+    for the specific Designated Dealer, and the number of `CoinType` coins that have been minted to
+    the dealer over the past 24 hours. Every Designated Dealer has 4 tiers for each currency that
+    they support. The sending `tc_account` must be the Treasury Compliance account, and the
+    receiver an authorized Designated Dealer account.
+
+    ## Events
+    Successful execution of the transaction will emit two events:
+    * A `Libra::MintEvent` with the amount and currency code minted is emitted on the
+    `mint_event_handle` in the stored `Libra::CurrencyInfo<CoinType>` resource stored under
+    `0xA550C18`; and
+    * A `DesignatedDealer::ReceivedMintEvent` with the amount, currency code, and Designated
+    Dealer's address is emitted on the `mint_event_handle` in the stored `DesignatedDealer::Dealer`
+    resource published under the `designated_dealer_address`.
+
+    # Parameters
+    | Name                        | Type      | Description                                                                                                |
+    | ------                      | ------    | -------------                                                                                              |
+    | `CoinType`                  | Type      | The Move type for the `CoinType` being minted. `CoinType` must be an already-registered currency on-chain. |
+    | `tc_account`                | `&signer` | The signer reference of the sending account of this transaction. Must be the Treasury Compliance account.  |
+    | `sliding_nonce`             | `u64`     | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                                 |
+    | `designated_dealer_address` | `address` | The address of the Designated Dealer account being minted to.                                              |
+    | `mint_amount`               | `u64`     | The number of coins to be minted.                                                                          |
+    | `tier_index`                | `u64`     | The mint tier index to use for the Designated Dealer account.                                              |
+
+    # Common Abort Conditions
+    | Error Category                | Error Reason                                 | Description                                                                                                                  |
+    | ----------------              | --------------                               | -------------                                                                                                                |
+    | `Errors::NOT_PUBLISHED`       | `SlidingNonce::ESLIDING_NONCE`               | A `SlidingNonce` resource is not published under `tc_account`.                                                               |
+    | `Errors::INVALID_ARGUMENT`    | `SlidingNonce::ENONCE_TOO_OLD`               | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not.                                   |
+    | `Errors::INVALID_ARGUMENT`    | `SlidingNonce::ENONCE_TOO_NEW`               | The `sliding_nonce` is too far in the future.                                                                                |
+    | `Errors::INVALID_ARGUMENT`    | `SlidingNonce::ENONCE_ALREADY_RECORDED`      | The `sliding_nonce` has been previously recorded.                                                                            |
+    | `Errors::REQUIRES_ADDRESS`    | `CoreAddresses::ETREASURY_COMPLIANCE`        | `tc_account` is not the Treasury Compliance account.                                                                         |
+    | `Errors::REQUIRES_ROLE`       | `Roles::ETREASURY_COMPLIANCE`                | `tc_account` is not the Treasury Compliance account.                                                                         |
+    | `Errors::INVALID_ARGUMENT`    | `DesignatedDealer::EINVALID_MINT_AMOUNT`     | `mint_amount` is zero.                                                                                                       |
+    | `Errors::NOT_PUBLISHED`       | `DesignatedDealer::EDEALER`                  | `DesignatedDealer::Dealer` or `DesignatedDealer::TierInfo<CoinType>` resource does not exist at `designated_dealer_address`. |
+    | `Errors::INVALID_ARGUMENT`    | `DesignatedDealer::EINVALID_TIER_INDEX`      | The `tier_index` is out of bounds.                                                                                           |
+    | `Errors::INVALID_ARGUMENT`    | `DesignatedDealer::EINVALID_AMOUNT_FOR_TIER` | `mint_amount` exceeds the maximum allowed amount for `tier_index`.                                                           |
+    | `Errors::REQUIRES_CAPABILITY` | `Libra::EMINT_CAPABILITY`                    | `tc_account` does not have a `Libra::MintCapability<CoinType>` resource published under it.                                  |
+    | `Errors::INVALID_STATE`       | `Libra::EMINTING_NOT_ALLOWED`                | Minting is not currently allowed for `CoinType` coins.                                                                       |
+    | `Errors::LIMIT_EXCEEDED`      | `LibraAccount::EDEPOSIT_EXCEEDS_LIMITS`      | The depositing of the funds would exceed the `account`'s account limits.                                                     |
+
+    # Related Scripts
+    * `Script::create_designated_dealer`
+    * `Script::peer_to_peer_with_metadata`
+    * `Script::rotate_dual_attestation_info`
+    """
+
+    coin_type: libra_types.TypeTag
+    sliding_nonce: st.uint64
+    designated_dealer_address: libra_types.AccountAddress
+    mint_amount: st.uint64
+    tier_index: st.uint64
+
+
+def encode_tiered_mint_script(
+    coin_type: TypeTag,
+    sliding_nonce: st.uint64,
+    designated_dealer_address: AccountAddress,
+    mint_amount: st.uint64,
+    tier_index: st.uint64,
+) -> Script:
+    """# Summary
+    Mints a specified number of coins in a currency to a Designated Dealer.
+
+    The sending account
+    must be the Treasury Compliance account, and coins can only be minted to a Designated Dealer
+    account.
+
+    # Technical Description
+    Mints `mint_amount` of coins in the `CoinType` currency to Designated Dealer account at
+    `designated_dealer_address`. The `tier_index` parameter specifies which tier should be used to
+    check verify the off-chain approval policy, and is based in part on the on-chain tier values
+    for the specific Designated Dealer, and the number of `CoinType` coins that have been minted to
+    the dealer over the past 24 hours. Every Designated Dealer has 4 tiers for each currency that
+    they support. The sending `tc_account` must be the Treasury Compliance account, and the
+    receiver an authorized Designated Dealer account.
+
+    ## Events
+    Successful execution of the transaction will emit two events:
+    * A `Libra::MintEvent` with the amount and currency code minted is emitted on the
+    `mint_event_handle` in the stored `Libra::CurrencyInfo<CoinType>` resource stored under
+    `0xA550C18`; and
+    * A `DesignatedDealer::ReceivedMintEvent` with the amount, currency code, and Designated
+    Dealer's address is emitted on the `mint_event_handle` in the stored `DesignatedDealer::Dealer`
+    resource published under the `designated_dealer_address`.
+
+    # Parameters
+    | Name                        | Type      | Description                                                                                                |
+    | ------                      | ------    | -------------                                                                                              |
+    | `CoinType`                  | Type      | The Move type for the `CoinType` being minted. `CoinType` must be an already-registered currency on-chain. |
+    | `tc_account`                | `&signer` | The signer reference of the sending account of this transaction. Must be the Treasury Compliance account.  |
+    | `sliding_nonce`             | `u64`     | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                                 |
+    | `designated_dealer_address` | `address` | The address of the Designated Dealer account being minted to.                                              |
+    | `mint_amount`               | `u64`     | The number of coins to be minted.                                                                          |
+    | `tier_index`                | `u64`     | The mint tier index to use for the Designated Dealer account.                                              |
+
+    # Common Abort Conditions
+    | Error Category                | Error Reason                                 | Description                                                                                                                  |
+    | ----------------              | --------------                               | -------------                                                                                                                |
+    | `Errors::NOT_PUBLISHED`       | `SlidingNonce::ESLIDING_NONCE`               | A `SlidingNonce` resource is not published under `tc_account`.                                                               |
+    | `Errors::INVALID_ARGUMENT`    | `SlidingNonce::ENONCE_TOO_OLD`               | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not.                                   |
+    | `Errors::INVALID_ARGUMENT`    | `SlidingNonce::ENONCE_TOO_NEW`               | The `sliding_nonce` is too far in the future.                                                                                |
+    | `Errors::INVALID_ARGUMENT`    | `SlidingNonce::ENONCE_ALREADY_RECORDED`      | The `sliding_nonce` has been previously recorded.                                                                            |
+    | `Errors::REQUIRES_ADDRESS`    | `CoreAddresses::ETREASURY_COMPLIANCE`        | `tc_account` is not the Treasury Compliance account.                                                                         |
+    | `Errors::REQUIRES_ROLE`       | `Roles::ETREASURY_COMPLIANCE`                | `tc_account` is not the Treasury Compliance account.                                                                         |
+    | `Errors::INVALID_ARGUMENT`    | `DesignatedDealer::EINVALID_MINT_AMOUNT`     | `mint_amount` is zero.                                                                                                       |
+    | `Errors::NOT_PUBLISHED`       | `DesignatedDealer::EDEALER`                  | `DesignatedDealer::Dealer` or `DesignatedDealer::TierInfo<CoinType>` resource does not exist at `designated_dealer_address`. |
+    | `Errors::INVALID_ARGUMENT`    | `DesignatedDealer::EINVALID_TIER_INDEX`      | The `tier_index` is out of bounds.                                                                                           |
+    | `Errors::INVALID_ARGUMENT`    | `DesignatedDealer::EINVALID_AMOUNT_FOR_TIER` | `mint_amount` exceeds the maximum allowed amount for `tier_index`.                                                           |
+    | `Errors::REQUIRES_CAPABILITY` | `Libra::EMINT_CAPABILITY`                    | `tc_account` does not have a `Libra::MintCapability<CoinType>` resource published under it.                                  |
+    | `Errors::INVALID_STATE`       | `Libra::EMINTING_NOT_ALLOWED`                | Minting is not currently allowed for `CoinType` coins.                                                                       |
+    | `Errors::LIMIT_EXCEEDED`      | `LibraAccount::EDEPOSIT_EXCEEDS_LIMITS`      | The depositing of the funds would exceed the `account`'s account limits.                                                     |
+
+    # Related Scripts
+    * `Script::create_designated_dealer`
+    * `Script::peer_to_peer_with_metadata`
+    * `Script::rotate_dual_attestation_info`
+    """
+    return Script(
+        code=TIERED_MINT_CODE,
+        ty_args=[coin_type],
+        args=[
+            TransactionArgument__U64(value=sliding_nonce),
+            TransactionArgument__Address(value=designated_dealer_address),
+            TransactionArgument__U64(value=mint_amount),
+            TransactionArgument__U64(value=tier_index),
+        ],
+    )
+
+
+def decode_tiered_mint_script(script: Script) -> ScriptCall:
+    return ScriptCall__TieredMint(
+        coin_type=script.ty_args[0],
+        sliding_nonce=decode_u64_argument(script.args[0]),
+        designated_dealer_address=decode_address_argument(script.args[1]),
+        mint_amount=decode_u64_argument(script.args[2]),
+        tier_index=decode_u64_argument(script.args[3]),
+    )
+
+
+TIERED_MINT_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x06\x01\x00\x04\x03\x04\x0b\x04\x0f\x02\x05\x11\x15\x07\x26\x3c\x08\x62\x10\x00\x00\x00\x01\x01\x02\x00\x01\x00\x00\x03\x02\x01\x01\x01\x01\x04\x02\x06\x0c\x03\x00\x04\x06\x0c\x05\x03\x03\x05\x06\x0c\x03\x05\x03\x03\x01\x09\x00\x0c\x4c\x69\x62\x72\x61\x41\x63\x63\x6f\x75\x6e\x74\x0c\x53\x6c\x69\x64\x69\x6e\x67\x4e\x6f\x6e\x63\x65\x15\x72\x65\x63\x6f\x72\x64\x5f\x6e\x6f\x6e\x63\x65\x5f\x6f\x72\x5f\x61\x62\x6f\x72\x74\x0b\x74\x69\x65\x72\x65\x64\x5f\x6d\x69\x6e\x74\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x03\x01\x09\x0a\x00\x0a\x01\x11\x00\x0b\x00\x0a\x02\x0a\x03\x0a\x04\x38\x00\x02"
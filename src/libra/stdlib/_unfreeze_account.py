@@ -0,0 +1,103 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra import libra_types
+from libra.libra_types import Script, AccountAddress, TransactionArgument__U64, TransactionArgument__Address
+from libra.stdlib import ScriptCall, decode_u64_argument, decode_address_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__UnfreezeAccount(ScriptCall):
+    """# Summary
+    Unfreezes the account at `address`.
+
+    The sending account of this transaction must be the
+    Treasury Compliance account. After the successful execution of this transaction transactions
+    may be sent from the previously frozen account, and coins may be sent and received.
+
+    # Technical Description
+    Sets the `AccountFreezing::FreezingBit` to `false` and emits a
+    `AccountFreezing::UnFreezeAccountEvent`. The transaction sender must be the Treasury Compliance
+    account. Note that this is a per-account property so unfreezing a Parent VASP will not effect
+    the status any of its child accounts and vice versa.
+
+    ## Events
+    Successful execution of this script will emit a `AccountFreezing::UnFreezeAccountEvent` with
+    the `unfrozen_address` set the `to_unfreeze_account`'s address.
+
+    # Parameters
+    | Name                  | Type      | Description                                                                                               |
+    | ------                | ------    | -------------                                                                                             |
+    | `tc_account`          | `&signer` | The signer reference of the sending account of this transaction. Must be the Treasury Compliance account. |
+    | `sliding_nonce`       | `u64`     | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                                |
+    | `to_unfreeze_account` | `address` | The account address to be frozen.                                                                         |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                            | Description                                                                                |
+    | ----------------           | --------------                          | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`          | A `SlidingNonce` resource is not published under `account`.                                |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_OLD`          | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_NEW`          | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_ALREADY_RECORDED` | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::REQUIRES_ADDRESS` | `CoreAddresses::ETREASURY_COMPLIANCE`   | The sending account is not the Treasury Compliance account.                                |
+
+    # Related Scripts
+    * `Scripts::freeze_account`
+    """
+
+    sliding_nonce: st.uint64
+    to_unfreeze_account: libra_types.AccountAddress
+
+
+def encode_unfreeze_account_script(sliding_nonce: st.uint64, to_unfreeze_account: AccountAddress) -> Script:
+    """# Summary
+    Unfreezes the account at `address`.
+
+    The sending account of this transaction must be the
+    Treasury Compliance account. After the successful execution of this transaction transactions
+    may be sent from the previously frozen account, and coins may be sent and received.
+
+    # Technical Description
+    Sets the `AccountFreezing::FreezingBit` to `false` and emits a
+    `AccountFreezing::UnFreezeAccountEvent`. The transaction sender must be the Treasury Compliance
+    account. Note that this is a per-account property so unfreezing a Parent VASP will not effect
+    the status any of its child accounts and vice versa.
+
+    ## Events
+    Successful execution of this script will emit a `AccountFreezing::UnFreezeAccountEvent` with
+    the `unfrozen_address` set the `to_unfreeze_account`'s address.
+
+    # Parameters
+    | Name                  | Type      | Description                                                                                               |
+    | ------                | ------    | -------------                                                                                             |
+    | `tc_account`          | `&signer` | The signer reference of the sending account of this transaction. Must be the Treasury Compliance account. |
+    | `sliding_nonce`       | `u64`     | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                                |
+    | `to_unfreeze_account` | `address` | The account address to be frozen.                                                                         |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                            | Description                                                                                |
+    | ----------------           | --------------                          | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`          | A `SlidingNonce` resource is not published under `account`.                                |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_OLD`          | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_NEW`          | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_ALREADY_RECORDED` | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::REQUIRES_ADDRESS` | `CoreAddresses::ETREASURY_COMPLIANCE`   | The sending account is not the Treasury Compliance account.                                |
+
+    # Related Scripts
+    * `Scripts::freeze_account`
+    """
+    return Script(
+        code=UNFREEZE_ACCOUNT_CODE,
+        ty_args=[],
+        args=[TransactionArgument__U64(value=sliding_nonce), TransactionArgument__Address(value=to_unfreeze_account)],
+    )
+
+
+def decode_unfreeze_account_script(script: Script) -> ScriptCall:
+    return ScriptCall__UnfreezeAccount(
+        sliding_nonce=decode_u64_argument(script.args[0]),
+        to_unfreeze_account=decode_address_argument(script.args[1]),
+    )
+
+
+UNFREEZE_ACCOUNT_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x05\x01\x00\x04\x03\x04\x0a\x05\x0e\x0e\x07\x1c\x44\x08\x60\x10\x00\x00\x00\x01\x00\x02\x00\x01\x00\x01\x03\x02\x01\x00\x02\x06\x0c\x05\x00\x02\x06\x0c\x03\x03\x06\x0c\x03\x05\x0f\x41\x63\x63\x6f\x75\x6e\x74\x46\x72\x65\x65\x7a\x69\x6e\x67\x0c\x53\x6c\x69\x64\x69\x6e\x67\x4e\x6f\x6e\x63\x65\x10\x75\x6e\x66\x72\x65\x65\x7a\x65\x5f\x61\x63\x63\x6f\x75\x6e\x74\x15\x72\x65\x63\x6f\x72\x64\x5f\x6e\x6f\x6e\x63\x65\x5f\x6f\x72\x5f\x61\x62\x6f\x72\x74\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x03\x01\x07\x0a\x00\x0a\x01\x11\x01\x0b\x00\x0a\x02\x11\x00\x02"
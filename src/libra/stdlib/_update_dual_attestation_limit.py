@@ -0,0 +1,92 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra.libra_types import Script, TransactionArgument__U64
+from libra.stdlib import ScriptCall, decode_u64_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__UpdateDualAttestationLimit(ScriptCall):
+    """# Summary
+    Update the dual attestation limit on-chain.
+
+    Defined in terms of micro-LBR.  The transaction can
+    only be sent by the Treasury Compliance account.  After this transaction all inter-VASP
+    payments over this limit must be checked for dual attestation.
+
+    # Technical Description
+    Updates the `micro_lbr_limit` field of the `DualAttestation::Limit` resource published under
+    `0xA550C18`. The amount is set in micro-LBR.
+
+    # Parameters
+    | Name                  | Type      | Description                                                                                               |
+    | ------                | ------    | -------------                                                                                             |
+    | `tc_account`          | `&signer` | The signer reference of the sending account of this transaction. Must be the Treasury Compliance account. |
+    | `sliding_nonce`       | `u64`     | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                                |
+    | `new_micro_lbr_limit` | `u64`     | The new dual attestation limit to be used on-chain.                                                       |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                            | Description                                                                                |
+    | ----------------           | --------------                          | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`          | A `SlidingNonce` resource is not published under `tc_account`.                             |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_OLD`          | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_NEW`          | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_ALREADY_RECORDED` | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::REQUIRES_ADDRESS` | `CoreAddresses::ETREASURY_COMPLIANCE`   | `tc_account` is not the Treasury Compliance account.                                       |
+
+    # Related Scripts
+    * `Scripts::update_exchange_rate`
+    * `Scripts::update_minting_ability`
+    """
+
+    sliding_nonce: st.uint64
+    new_micro_lbr_limit: st.uint64
+
+
+def encode_update_dual_attestation_limit_script(sliding_nonce: st.uint64, new_micro_lbr_limit: st.uint64) -> Script:
+    """# Summary
+    Update the dual attestation limit on-chain.
+
+    Defined in terms of micro-LBR.  The transaction can
+    only be sent by the Treasury Compliance account.  After this transaction all inter-VASP
+    payments over this limit must be checked for dual attestation.
+
+    # Technical Description
+    Updates the `micro_lbr_limit` field of the `DualAttestation::Limit` resource published under
+    `0xA550C18`. The amount is set in micro-LBR.
+
+    # Parameters
+    | Name                  | Type      | Description                                                                                               |
+    | ------                | ------    | -------------                                                                                             |
+    | `tc_account`          | `&signer` | The signer reference of the sending account of this transaction. Must be the Treasury Compliance account. |
+    | `sliding_nonce`       | `u64`     | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction.                                |
+    | `new_micro_lbr_limit` | `u64`     | The new dual attestation limit to be used on-chain.                                                       |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                            | Description                                                                                |
+    | ----------------           | --------------                          | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`          | A `SlidingNonce` resource is not published under `tc_account`.                             |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_OLD`          | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_NEW`          | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_ALREADY_RECORDED` | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::REQUIRES_ADDRESS` | `CoreAddresses::ETREASURY_COMPLIANCE`   | `tc_account` is not the Treasury Compliance account.                                       |
+
+    # Related Scripts
+    * `Scripts::update_exchange_rate`
+    * `Scripts::update_minting_ability`
+    """
+    return Script(
+        code=UPDATE_DUAL_ATTESTATION_LIMIT_CODE,
+        ty_args=[],
+        args=[TransactionArgument__U64(value=sliding_nonce), TransactionArgument__U64(value=new_micro_lbr_limit)],
+    )
+
+
+def decode_update_dual_attestation_limit_script(script: Script) -> ScriptCall:
+    return ScriptCall__UpdateDualAttestationLimit(
+        sliding_nonce=decode_u64_argument(script.args[0]),
+        new_micro_lbr_limit=decode_u64_argument(script.args[1]),
+    )
+
+
+UPDATE_DUAL_ATTESTATION_LIMIT_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x05\x01\x00\x04\x03\x04\x0a\x05\x0e\x0a\x07\x18\x48\x08\x60\x10\x00\x00\x00\x01\x00\x02\x00\x01\x00\x01\x03\x00\x01\x00\x02\x06\x0c\x03\x00\x03\x06\x0c\x03\x03\x0f\x44\x75\x61\x6c\x41\x74\x74\x65\x73\x74\x61\x74\x69\x6f\x6e\x0c\x53\x6c\x69\x64\x69\x6e\x67\x4e\x6f\x6e\x63\x65\x14\x73\x65\x74\x5f\x6d\x69\x63\x72\x6f\x6c\x69\x62\x72\x61\x5f\x6c\x69\x6d\x69\x74\x15\x72\x65\x63\x6f\x72\x64\x5f\x6e\x6f\x6e\x63\x65\x5f\x6f\x72\x5f\x61\x62\x6f\x72\x74\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x02\x01\x07\x0a\x00\x0a\x01\x11\x01\x0b\x00\x0a\x02\x11\x00\x02"
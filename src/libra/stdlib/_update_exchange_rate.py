@@ -0,0 +1,120 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra import libra_types
+from libra.libra_types import Script, TypeTag, TransactionArgument__U64
+from libra.stdlib import ScriptCall, decode_u64_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__UpdateExchangeRate(ScriptCall):
+    """# Summary
+    Update the rough on-chain exchange rate between a specified currency and LBR (as a conversion
+    to micro-LBR).
+
+    The transaction can only be sent by the Treasury Compliance account. After this
+    transaction the updated exchange rate will be used for normalization of gas prices, and for
+    dual attestation checking.
+
+    # Technical Description
+    Updates the on-chain exchange rate from the given `Currency` to micro-LBR.  The exchange rate
+    is given by `new_exchange_rate_numerator/new_exchange_rate_denominator`.
+
+    # Parameters
+    | Name                            | Type      | Description                                                                                                                        |
+    | ------                          | ------    | -------------                                                                                                                      |
+    | `Currency`                      | Type      | The Move type for the `Currency` whose exchange rate is being updated. `Currency` must be an already-registered currency on-chain. |
+    | `tc_account`                    | `&signer` | The signer reference of the sending account of this transaction. Must be the Treasury Compliance account.                          |
+    | `sliding_nonce`                 | `u64`     | The `sliding_nonce` (see: `SlidingNonce`) to be used for the transaction.                                                          |
+    | `new_exchange_rate_numerator`   | `u64`     | The numerator for the new to micro-LBR exchange rate for `Currency`.                                                               |
+    | `new_exchange_rate_denominator` | `u64`     | The denominator for the new to micro-LBR exchange rate for `Currency`.                                                             |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                            | Description                                                                                |
+    | ----------------           | --------------                          | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`          | A `SlidingNonce` resource is not published under `tc_account`.                             |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_OLD`          | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_NEW`          | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_ALREADY_RECORDED` | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::REQUIRES_ADDRESS` | `CoreAddresses::ETREASURY_COMPLIANCE`   | `tc_account` is not the Treasury Compliance account.                                       |
+    | `Errors::REQUIRES_ROLE`    | `Roles::ETREASURY_COMPLIANCE`           | `tc_account` is not the Treasury Compliance account.                                       |
+    | `Errors::INVALID_ARGUMENT` | `FixedPoint32::EDENOMINATOR`            | `new_exchange_rate_denominator` is zero.                                                   |
+    | `Errors::INVALID_ARGUMENT` | `FixedPoint32::ERATIO_OUT_OF_RANGE`     | The quotient is unrepresentable as a `FixedPoint32`.                                       |
+    | `Errors::LIMIT_EXCEEDED`   | `FixedPoint32::ERATIO_OUT_OF_RANGE`     | The quotient is unrepresentable as a `FixedPoint32`.                                       |
+
+    # Related Scripts
+    * `Scripts::update_dual_attestation_limit`
+    * `Scripts::update_minting_ability`
+    """
+
+    currency: libra_types.TypeTag
+    sliding_nonce: st.uint64
+    new_exchange_rate_numerator: st.uint64
+    new_exchange_rate_denominator: st.uint64
+
+
+def encode_update_exchange_rate_script(
+    currency: TypeTag,
+    sliding_nonce: st.uint64,
+    new_exchange_rate_numerator: st.uint64,
+    new_exchange_rate_denominator: st.uint64,
+) -> Script:
+    """# Summary
+    Update the rough on-chain exchange rate between a specified currency and LBR (as a conversion
+    to micro-LBR).
+
+    The transaction can only be sent by the Treasury Compliance account. After this
+    transaction the updated exchange rate will be used for normalization of gas prices, and for
+    dual attestation checking.
+
+    # Technical Description
+    Updates the on-chain exchange rate from the given `Currency` to micro-LBR.  The exchange rate
+    is given by `new_exchange_rate_numerator/new_exchange_rate_denominator`.
+
+    # Parameters
+    | Name                            | Type      | Description                                                                                                                        |
+    | ------                          | ------    | -------------                                                                                                                      |
+    | `Currency`                      | Type      | The Move type for the `Currency` whose exchange rate is being updated. `Currency` must be an already-registered currency on-chain. |
+    | `tc_account`                    | `&signer` | The signer reference of the sending account of this transaction. Must be the Treasury Compliance account.                          |
+    | `sliding_nonce`                 | `u64`     | The `sliding_nonce` (see: `SlidingNonce`) to be used for the transaction.                                                          |
+    | `new_exchange_rate_numerator`   | `u64`     | The numerator for the new to micro-LBR exchange rate for `Currency`.                                                               |
+    | `new_exchange_rate_denominator` | `u64`     | The denominator for the new to micro-LBR exchange rate for `Currency`.                                                             |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                            | Description                                                                                |
+    | ----------------           | --------------                          | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`          | A `SlidingNonce` resource is not published under `tc_account`.                             |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_OLD`          | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_NEW`          | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_ALREADY_RECORDED` | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::REQUIRES_ADDRESS` | `CoreAddresses::ETREASURY_COMPLIANCE`   | `tc_account` is not the Treasury Compliance account.                                       |
+    | `Errors::REQUIRES_ROLE`    | `Roles::ETREASURY_COMPLIANCE`           | `tc_account` is not the Treasury Compliance account.                                       |
+    | `Errors::INVALID_ARGUMENT` | `FixedPoint32::EDENOMINATOR`            | `new_exchange_rate_denominator` is zero.                                                   |
+    | `Errors::INVALID_ARGUMENT` | `FixedPoint32::ERATIO_OUT_OF_RANGE`     | The quotient is unrepresentable as a `FixedPoint32`.                                       |
+    | `Errors::LIMIT_EXCEEDED`   | `FixedPoint32::ERATIO_OUT_OF_RANGE`     | The quotient is unrepresentable as a `FixedPoint32`.                                       |
+
+    # Related Scripts
+    * `Scripts::update_dual_attestation_limit`
+    * `Scripts::update_minting_ability`
+    """
+    return Script(
+        code=UPDATE_EXCHANGE_RATE_CODE,
+        ty_args=[currency],
+        args=[
+            TransactionArgument__U64(value=sliding_nonce),
+            TransactionArgument__U64(value=new_exchange_rate_numerator),
+            TransactionArgument__U64(value=new_exchange_rate_denominator),
+        ],
+    )
+
+
+def decode_update_exchange_rate_script(script: Script) -> ScriptCall:
+    return ScriptCall__UpdateExchangeRate(
+        currency=script.ty_args[0],
+        sliding_nonce=decode_u64_argument(script.args[0]),
+        new_exchange_rate_numerator=decode_u64_argument(script.args[1]),
+        new_exchange_rate_denominator=decode_u64_argument(script.args[2]),
+    )
+
+
+UPDATE_EXCHANGE_RATE_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x07\x01\x00\x06\x02\x06\x04\x03\x0a\x10\x04\x1a\x02\x05\x1c\x19\x07\x35\x64\x08\x99\x01\x10\x00\x00\x00\x01\x00\x02\x00\x00\x02\x00\x00\x03\x00\x01\x00\x02\x04\x02\x03\x00\x01\x05\x04\x03\x01\x01\x02\x06\x02\x03\x03\x01\x08\x00\x02\x06\x0c\x03\x00\x02\x06\x0c\x08\x00\x04\x06\x0c\x03\x03\x03\x01\x09\x00\x0c\x46\x69\x78\x65\x64\x50\x6f\x69\x6e\x74\x33\x32\x05\x4c\x69\x62\x72\x61\x0c\x53\x6c\x69\x64\x69\x6e\x67\x4e\x6f\x6e\x63\x65\x14\x63\x72\x65\x61\x74\x65\x5f\x66\x72\x6f\x6d\x5f\x72\x61\x74\x69\x6f\x6e\x61\x6c\x15\x72\x65\x63\x6f\x72\x64\x5f\x6e\x6f\x6e\x63\x65\x5f\x6f\x72\x5f\x61\x62\x6f\x72\x74\x18\x75\x70\x64\x61\x74\x65\x5f\x6c\x62\x72\x5f\x65\x78\x63\x68\x61\x6e\x67\x65\x5f\x72\x61\x74\x65\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x05\x01\x0b\x0a\x00\x0a\x01\x11\x01\x0a\x02\x0a\x03\x11\x00\x0c\x04\x0b\x00\x0b\x04\x38\x00\x02"
@@ -0,0 +1,88 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra.libra_types import Script, TransactionArgument__U64
+from libra.stdlib import ScriptCall, decode_u64_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__UpdateLibraVersion(ScriptCall):
+    """# Summary
+    Updates the Libra major version that is stored on-chain and is used by the VM.
+
+    This
+    transaction can only be sent from the Libra Root account.
+
+    # Technical Description
+    Updates the `LibraVersion` on-chain config and emits a `LibraConfig::NewEpochEvent` to trigger
+    a reconfiguration of the system. The `major` version that is passed in must be strictly greater
+    than the current major version held on-chain. The VM reads this information and can use it to
+    preserve backwards compatibility with previous major versions of the VM.
+
+    # Parameters
+    | Name            | Type      | Description                                                                |
+    | ------          | ------    | -------------                                                              |
+    | `account`       | `&signer` | Signer reference of the sending account. Must be the Libra Root account.   |
+    | `sliding_nonce` | `u64`     | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction. |
+    | `major`         | `u64`     | The `major` version of the VM to be used from this transaction on.         |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                  | Description                                                                                |
+    | ----------------           | --------------                                | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`                | A `SlidingNonce` resource is not published under `account`.                                |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_OLD`                | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_NEW`                | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_ALREADY_RECORDED`       | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::REQUIRES_ADDRESS` | `CoreAddresses::ELIBRA_ROOT`                  | `account` is not the Libra Root account.                                                   |
+    | `Errors::INVALID_ARGUMENT` | `LibraVersion::EINVALID_MAJOR_VERSION_NUMBER` | `major` is less-than or equal to the current major version stored on-chain.                |
+    """
+
+    sliding_nonce: st.uint64
+    major: st.uint64
+
+
+def encode_update_libra_version_script(sliding_nonce: st.uint64, major: st.uint64) -> Script:
+    """# Summary
+    Updates the Libra major version that is stored on-chain and is used by the VM.
+
+    This
+    transaction can only be sent from the Libra Root account.
+
+    # Technical Description
+    Updates the `LibraVersion` on-chain config and emits a `LibraConfig::NewEpochEvent` to trigger
+    a reconfiguration of the system. The `major` version that is passed in must be strictly greater
+    than the current major version held on-chain. The VM reads this information and can use it to
+    preserve backwards compatibility with previous major versions of the VM.
+
+    # Parameters
+    | Name            | Type      | Description                                                                |
+    | ------          | ------    | -------------                                                              |
+    | `account`       | `&signer` | Signer reference of the sending account. Must be the Libra Root account.   |
+    | `sliding_nonce` | `u64`     | The `sliding_nonce` (see: `SlidingNonce`) to be used for this transaction. |
+    | `major`         | `u64`     | The `major` version of the VM to be used from this transaction on.         |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                                  | Description                                                                                |
+    | ----------------           | --------------                                | -------------                                                                              |
+    | `Errors::NOT_PUBLISHED`    | `SlidingNonce::ESLIDING_NONCE`                | A `SlidingNonce` resource is not published under `account`.                                |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_OLD`                | The `sliding_nonce` is too old and it's impossible to determine if it's duplicated or not. |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_TOO_NEW`                | The `sliding_nonce` is too far in the future.                                              |
+    | `Errors::INVALID_ARGUMENT` | `SlidingNonce::ENONCE_ALREADY_RECORDED`       | The `sliding_nonce` has been previously recorded.                                          |
+    | `Errors::REQUIRES_ADDRESS` | `CoreAddresses::ELIBRA_ROOT`                  | `account` is not the Libra Root account.                                                   |
+    | `Errors::INVALID_ARGUMENT` | `LibraVersion::EINVALID_MAJOR_VERSION_NUMBER` | `major` is less-than or equal to the current major version stored on-chain.                |
+    """
+    return Script(
+        code=UPDATE_LIBRA_VERSION_CODE,
+        ty_args=[],
+        args=[TransactionArgument__U64(value=sliding_nonce), TransactionArgument__U64(value=major)],
+    )
+
+
+def decode_update_libra_version_script(script: Script) -> ScriptCall:
+    return ScriptCall__UpdateLibraVersion(
+        sliding_nonce=decode_u64_argument(script.args[0]),
+        major=decode_u64_argument(script.args[1]),
+    )
+
+
+UPDATE_LIBRA_VERSION_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x05\x01\x00\x04\x03\x04\x0a\x05\x0e\x0a\x07\x18\x34\x08\x4c\x10\x00\x00\x00\x01\x00\x02\x00\x01\x00\x01\x03\x00\x01\x00\x02\x06\x0c\x03\x00\x03\x06\x0c\x03\x03\x0c\x4c\x69\x62\x72\x61\x56\x65\x72\x73\x69\x6f\x6e\x0c\x53\x6c\x69\x64\x69\x6e\x67\x4e\x6f\x6e\x63\x65\x03\x73\x65\x74\x15\x72\x65\x63\x6f\x72\x64\x5f\x6e\x6f\x6e\x63\x65\x5f\x6f\x72\x5f\x61\x62\x6f\x72\x74\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x02\x01\x07\x0a\x00\x0a\x01\x11\x01\x0b\x00\x0a\x02\x11\x00\x02"
@@ -0,0 +1,91 @@
+# pyre-strict
+from dataclasses import dataclass
+from libra import serde_types as st
+from libra import libra_types
+from libra.libra_types import Script, TypeTag, TransactionArgument__Bool
+from libra.stdlib import ScriptCall, decode_bool_argument
+
+
+@dataclass(frozen=True)
+class ScriptCall__UpdateMintingAbility(ScriptCall):
+    """# Summary
+    Script to allow or disallow minting of new coins in a specified currency.
+
+    This transaction can
+    only be sent by the Treasury Compliance account.  Turning minting off for a currency will have
+    no effect on coins already in circulation, and coins may still be removed from the system.
+
+    # Technical Description
+    This transaction sets the `can_mint` field of the `Libra::CurrencyInfo<Currency>` resource
+    published under `0xA550C18` to the value of `allow_minting`. Minting of coins if allowed if
+    this field is set to `true` and minting of new coins in `Currency` is disallowed otherwise.
+    This transaction needs to be sent by the Treasury Compliance account.
+
+    # Parameters
+    | Name            | Type      | Description                                                                                                                          |
+    | ------          | ------    | -------------                                                                                                                        |
+    | `Currency`      | Type      | The Move type for the `Currency` whose minting ability is being updated. `Currency` must be an already-registered currency on-chain. |
+    | `account`       | `&signer` | Signer reference of the sending account. Must be the Libra Root account.                                                             |
+    | `allow_minting` | `bool`    | Whether to allow minting of new coins in `Currency`.                                                                                 |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                          | Description                                          |
+    | ----------------           | --------------                        | -------------                                        |
+    | `Errors::REQUIRES_ADDRESS` | `CoreAddresses::ETREASURY_COMPLIANCE` | `tc_account` is not the Treasury Compliance account. |
+    | `Errors::NOT_PUBLISHED`    | `Libra::ECURRENCY_INFO`               | `Currency` is not a registered currency on-chain.    |
+
+    # Related Scripts
+    * `Scripts::update_dual_attestation_limit`
+    * `Scripts::update_exchange_rate`
+    """
+
+    currency: libra_types.TypeTag
+    allow_minting: st.bool
+
+
+def encode_update_minting_ability_script(currency: TypeTag, allow_minting: st.bool) -> Script:
+    """# Summary
+    Script to allow or disallow minting of new coins in a specified currency.
+
+    This transaction can
+    only be sent by the Treasury Compliance account.  Turning minting off for a currency will have
+    no effect on coins already in circulation, and coins may still be removed from the system.
+
+    # Technical Description
+    This transaction sets the `can_mint` field of the `Libra::CurrencyInfo<Currency>` resource
+    published under `0xA550C18` to the value of `allow_minting`. Minting of coins if allowed if
+    this field is set to `true` and minting of new coins in `Currency` is disallowed otherwise.
+    This transaction needs to be sent by the Treasury Compliance account.
+
+    # Parameters
+    | Name            | Type      | Description                                                                                                                          |
+    | ------          | ------    | -------------                                                                                                                        |
+    | `Currency`      | Type      | The Move type for the `Currency` whose minting ability is being updated. `Currency` must be an already-registered currency on-chain. |
+    | `account`       | `&signer` | Signer reference of the sending account. Must be the Libra Root account.                                                             |
+    | `allow_minting` | `bool`    | Whether to allow minting of new coins in `Currency`.                                                                                 |
+
+    # Common Abort Conditions
+    | Error Category             | Error Reason                          | Description                                          |
+    | ----------------           | --------------                        | -------------                                        |
+    | `Errors::REQUIRES_ADDRESS` | `CoreAddresses::ETREASURY_COMPLIANCE` | `tc_account` is not the Treasury Compliance account. |
+    | `Errors::NOT_PUBLISHED`    | `Libra::ECURRENCY_INFO`               | `Currency` is not a registered currency on-chain.    |
+
+    # Related Scripts
+    * `Scripts::update_dual_attestation_limit`
+    * `Scripts::update_exchange_rate`
+    """
+    return Script(
+        code=UPDATE_MINTING_ABILITY_CODE,
+        ty_args=[currency],
+        args=[TransactionArgument__Bool(value=allow_minting)],
+    )
+
+
+def decode_update_minting_ability_script(script: Script) -> ScriptCall:
+    return ScriptCall__UpdateMintingAbility(
+        currency=script.ty_args[0],
+        allow_minting=decode_bool_argument(script.args[0]),
+    )
+
+
+UPDATE_MINTING_ABILITY_CODE = b"\xa1\x1c\xeb\x0b\x01\x00\x00\x00\x06\x01\x00\x02\x03\x02\x06\x04\x08\x02\x05\x0a\x08\x07\x12\x1d\x08\x2f\x10\x00\x00\x00\x01\x00\x01\x01\x01\x00\x02\x02\x06\x0c\x01\x00\x01\x09\x00\x05\x4c\x69\x62\x72\x61\x16\x75\x70\x64\x61\x74\x65\x5f\x6d\x69\x6e\x74\x69\x6e\x67\x5f\x61\x62\x69\x6c\x69\x74\x79\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x00\x01\x04\x0b\x00\x0a\x01\x38\x00\x02"
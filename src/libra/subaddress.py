@@ -0,0 +1,266 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Sub-address registry for custodial accounts.
+
+Allocates collision-free random sub-addresses for users and resolves incoming payments to users by the
+`to_subaddress` of the payment's general metadata (https://lip.libra.org/lip-4):
+
+```python
+from libra import subaddress
+
+registry = subaddress.SubAddressRegistry(path="subaddresses.bin")
+sub_addresses = registry.generate([1001, 1002, 1003])  # one new sub-address for each user id
+
+events = client.get_events(account.received_events_key, 0, 100)
+user_ids = registry.resolve_events(events, receiver=account.address)
+```
+
+The index is an open addressing hash table (linear probing) stored in one `numpy.uint64` array of
+(sub-address, user id) pairs, 16 bytes per slot. Batch operations probe the table with vectorized NumPy
+operations. Give `path` to keep the table in a memory-mapped file. The registry can be reopened from the same
+file later.
+
+User ids are unsigned 64-bit integers. Zero sub-address (`identifier.LIBRA_ZERO_SUBADDRESS`) means no
+sub-address, so it is never allocated or registered.
+"""
+
+import os
+import secrets
+import typing
+
+import numpy as np
+
+from . import jsonrpc, libra_types, utils, identifier
+
+
+DEFAULT_CAPACITY = 1024
+# the table grows (doubles capacity) when the number of entries exceeds capacity * MAX_LOAD_FACTOR
+MAX_LOAD_FACTOR = 0.5
+
+# Metadata::GeneralMetadata, GeneralMetadata::GeneralMetadataVersion0, to_subaddress: Some(8 bytes)
+_GENERAL_METADATA_V0_TO_SUBADDRESS_PREFIX = b"\x01\x00\x01\x08"
+
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+_KEY_DTYPE = np.dtype("<u8")
+
+SubAddress = typing.Union[str, bytes]
+
+
+class DuplicateSubAddressError(Exception):
+    pass
+
+
+class SubAddressRegistry:
+    """SubAddressRegistry maps sub-addresses to user ids"""
+
+    _table: np.ndarray
+    _path: typing.Optional[str]
+    _size: int
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, path: typing.Optional[str] = None) -> None:
+        """Create an empty in-memory registry, or a memory-mapped registry if `path` is given.
+
+        An existing file at `path` is opened, and `capacity` is ignored.
+        """
+
+        self._path = path
+        if path is not None and os.path.exists(path):
+            self._table = np.memmap(path, dtype=_KEY_DTYPE, mode="r+").reshape((-1, 2))
+            if not _is_power_of_two(len(self._table)):
+                raise ValueError(f"invalid sub-address registry file {path}: capacity {len(self._table)}")
+            self._size = int(np.count_nonzero(self._table[:, 0]))
+        else:
+            self._table = _allocate(_capacity(capacity), path)
+            self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._table)
+
+    def generate(self, user_ids: typing.Iterable[int]) -> typing.List[bytes]:
+        """Generate and register a new random sub-address for each user id
+
+        Generated sub-addresses are unique within the registry and never the zero sub-address.
+        """
+
+        values = np.array(list(user_ids), dtype=np.uint64)
+        keys = np.zeros(len(values), dtype=_KEY_DTYPE)
+        retry = np.arange(len(values))
+        while len(retry):
+            keys[retry] = np.frombuffer(secrets.token_bytes(8 * len(retry)), dtype=_KEY_DTYPE)
+            retry = np.flatnonzero((keys == 0) | (self._find(keys) >= 0) | _duplicated(keys))
+
+        self._reserve(len(keys))
+        self._insert(keys, values)
+        return _to_sub_addresses(keys)
+
+    def register(self, sub_addresses: typing.Iterable[SubAddress], user_ids: typing.Iterable[int]) -> None:
+        """Register existing sub-addresses (bytes or hex-encoded) of users
+
+        Raises `InvalidSubAddressError` for an invalid or zero sub-address, and `DuplicateSubAddressError`
+        if a sub-address is given twice or is registered already; nothing is registered in both cases.
+        """
+
+        keys = _to_keys(sub_addresses)
+        values = np.array(list(user_ids), dtype=np.uint64)
+        if len(keys) != len(values):
+            raise ValueError(f"got {len(keys)} sub-addresses, but {len(values)} user ids")
+        if np.any(keys == 0):
+            raise utils.InvalidSubAddressError("zero sub-address can't be registered")
+
+        duplicated = _duplicated(keys) | (self._find(keys) >= 0)
+        if np.any(duplicated):
+            raise DuplicateSubAddressError(f"duplicated sub-addresses: {_to_hex(keys[duplicated])}")
+
+        self._reserve(len(keys))
+        self._insert(keys, values)
+
+    def get(self, sub_address: SubAddress) -> typing.Optional[int]:
+        """Returns user id of the sub-address, None if it is not registered"""
+
+        return self.lookup([sub_address])[0]
+
+    def lookup(self, sub_addresses: typing.Iterable[typing.Optional[SubAddress]]) -> typing.List[typing.Optional[int]]:
+        """Returns user id for each sub-address, None for None or sub-address not registered
+
+        Raises `InvalidSubAddressError` if a sub-address is not 8 bytes.
+        """
+
+        keys = _to_keys(sub_addresses)
+        slots = self._find(keys)
+        user_ids = self._table[slots, 1].tolist()
+        return [user_id if slot >= 0 else None for slot, user_id in zip(slots.tolist(), user_ids)]
+
+    def resolve_events(
+        self,
+        events: typing.Iterable[jsonrpc.Event],
+        receiver: typing.Union[None, str, libra_types.AccountAddress] = None,
+    ) -> typing.List[typing.Optional[int]]:
+        """Returns user id for each event by the `to_subaddress` of the event's general metadata
+
+        The user id is None if the event is not a "receivedpayment" event, is not received by the given
+        `receiver` account address, has no `to_subaddress`, or the sub-address is not registered.
+        """
+
+        address = utils.account_address_hex(receiver) if receiver is not None else None
+        return self.lookup([_event_to_subaddress(event, address) for event in events])
+
+    def flush(self) -> None:
+        """Write changes to the file for memory-mapped registry, no-op for in-memory registry"""
+
+        if isinstance(self._table, np.memmap):
+            self._table.flush()
+
+    def _slots(self, keys: np.ndarray) -> np.ndarray:
+        shift = np.uint64(64 - (len(self._table).bit_length() - 1))
+        return ((keys * _HASH_MULTIPLIER) >> shift).astype(np.int64)
+
+    def _find(self, keys: np.ndarray) -> np.ndarray:
+        """Returns slot of each key, -1 for key not found"""
+
+        mask = len(self._table) - 1
+        slots = self._slots(keys)
+        found = np.full(len(keys), -1, dtype=np.int64)
+        pending = np.flatnonzero(keys)
+        while len(pending):
+            stored = self._table[slots[pending], 0]
+            hit = stored == keys[pending]
+            found[pending[hit]] = slots[pending[hit]]
+            pending = pending[~hit & (stored != 0)]
+            slots[pending] = (slots[pending] + 1) & mask
+        return found
+
+    def _insert(self, keys: np.ndarray, values: np.ndarray) -> None:
+        """Insert unique keys that are not in the table, capacity should be reserved"""
+
+        mask = len(self._table) - 1
+        slots = self._slots(keys)
+        pending = np.arange(len(keys))
+        while len(pending):
+            empty = self._table[slots[pending], 0] == 0
+            # the first key targeting an empty slot takes it, others probe next slot in next round
+            claimants = pending[empty]
+            _, first = np.unique(slots[claimants], return_index=True)
+            taken = claimants[first]
+            self._table[slots[taken], 0] = keys[taken]
+            self._table[slots[taken], 1] = values[taken]
+            self._size += len(taken)
+
+            occupied = pending[~empty]
+            slots[occupied] = (slots[occupied] + 1) & mask
+            pending = np.setdiff1d(pending, taken, assume_unique=True)
+
+    def _reserve(self, count: int) -> None:
+        capacity = len(self._table)
+        while self._size + count > capacity * MAX_LOAD_FACTOR:
+            capacity *= 2
+        if capacity == len(self._table):
+            return
+
+        old = self._table
+        used = old[:, 0] != 0
+        tmp_path = f"{self._path}.tmp" if self._path is not None else None
+        self._table = _allocate(capacity, tmp_path)
+        self._size = 0
+        self._insert(np.array(old[used, 0]), np.array(old[used, 1]))
+        if tmp_path is not None and self._path is not None:
+            self._table.flush()
+            del old
+            os.replace(tmp_path, self._path)
+
+
+def _event_to_subaddress(event: jsonrpc.Event, receiver: typing.Optional[str]) -> typing.Optional[bytes]:
+    data = event.data
+    if data.type != jsonrpc.EVENT_DATA_RECEIVED_PAYMENT:
+        return None
+    if receiver is not None and data.receiver != receiver:
+        return None
+    try:
+        metadata = bytes.fromhex(data.metadata)
+    except ValueError:
+        return None
+    start = len(_GENERAL_METADATA_V0_TO_SUBADDRESS_PREFIX)
+    end = start + utils.SUB_ADDRESS_LEN
+    if len(metadata) >= end and metadata.startswith(_GENERAL_METADATA_V0_TO_SUBADDRESS_PREFIX):
+        return metadata[start:end]
+    return None
+
+
+def _allocate(capacity: int, path: typing.Optional[str]) -> np.ndarray:
+    if path is None:
+        return np.zeros((capacity, 2), dtype=_KEY_DTYPE)
+    return np.memmap(path, dtype=_KEY_DTYPE, mode="w+", shape=(capacity, 2))
+
+
+def _capacity(capacity: int) -> int:
+    return 1 << max(int(capacity) - 1, 1).bit_length()
+
+
+def _is_power_of_two(n: int) -> bool:
+    return n > 1 and n & (n - 1) == 0
+
+
+def _duplicated(keys: np.ndarray) -> np.ndarray:
+    _, first = np.unique(keys, return_index=True)
+    ret = np.ones(len(keys), dtype=bool)
+    ret[first] = False
+    return ret
+
+
+def _to_keys(sub_addresses: typing.Iterable[typing.Optional[SubAddress]]) -> np.ndarray:
+    buf = b"".join([identifier.LIBRA_ZERO_SUBADDRESS if s is None else utils.sub_address(s) for s in sub_addresses])
+    return np.frombuffer(buf, dtype=_KEY_DTYPE)
+
+
+def _to_sub_addresses(keys: np.ndarray) -> typing.List[bytes]:
+    buf = keys.astype(_KEY_DTYPE).tobytes()
+    size = utils.SUB_ADDRESS_LEN
+    return [buf[i : i + size] for i in range(0, len(buf), size)]
+
+
+def _to_hex(keys: np.ndarray) -> typing.List[str]:
+    return [s.hex() for s in _to_sub_addresses(keys)]
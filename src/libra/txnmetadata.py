@@ -6,12 +6,25 @@
 
 This module implements utility functions for application to create transaction metadata and metadata signature.
 See https://lip.libra.org/lip-4 for more details
-"""
 
+`general_metadata` and `travel_rule` write the LCS bytes of the metadata directly (variant indexes, option
+flags, uleb128 length prefixes), without building the `libra_types.Metadata` object graph;
+`batch_general_metadata` and `batch_travel_rule` create metadata for many payments at once.
+
+`decode_metadata` and `decode_events_metadata` decode metadata bytes the other way around.
 
+`verify_travel_rule_signatures` verifies dual attestation metadata signatures of peer to peer transactions
+on chain, optionally in a `concurrent.futures` executor.
+"""
+
+from concurrent.futures import Executor
 from dataclasses import dataclass
+import struct
 import typing
 
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+
 from . import libra_types, serde_types, lcs, jsonrpc, utils
 
 
@@ -30,6 +43,26 @@ class Attest:
         return lcs.serialize(self, Attest)
 
 
+# Metadata::TravelRuleMetadata, TravelRuleMetadata::TravelRuleMetadataVersion0
+_TRAVEL_RULE_METADATA_V0_PREFIX = b"\x02\x00"
+# Metadata::GeneralMetadata, GeneralMetadata::GeneralMetadataVersion0
+_GENERAL_METADATA_V0_PREFIX = b"\x01\x00"
+_OPTION_NONE = b"\x00"
+_OPTION_SOME = b"\x01"
+_OPTION_SOME_SUB_ADDRESS = _OPTION_SOME + lcs.uleb128(utils.SUB_ADDRESS_LEN)
+_ATTEST_SUFFIX = b"@@$$LIBRA_ATTEST$$@@"
+_U64 = struct.Struct("<Q")
+
+Address = typing.Union[libra_types.AccountAddress, str]
+
+
+def _u64(value: int) -> bytes:
+    try:
+        return _U64.pack(value)
+    except struct.error:
+        raise serde_types.SerializationError("Wrong Value for the type", value, serde_types.uint64)
+
+
 def travel_rule(
     off_chain_reference_id: str, sender_address: libra_types.AccountAddress, amount: int
 ) -> typing.Tuple[(bytes, bytes)]:
@@ -38,17 +71,34 @@ def travel_rule(
     This is used for peer to peer transfer between 2 custodial accounts.
     """
 
-    metadata = libra_types.Metadata__TravelRuleMetadata(
-        value=libra_types.TravelRuleMetadata__TravelRuleMetadataVersion0(
-            value=libra_types.TravelRuleMetadataV0(off_chain_reference_id=off_chain_reference_id)
-        )
-    )
+    return _travel_rule(off_chain_reference_id, utils.account_address_bytes(sender_address), amount)
 
-    # receiver_lcs_data = lcs(metadata, sender_address, amount) + "@@$$LIBRA_ATTEST$$@@" /*ASCII-encoded string*/
-    attest = Attest(metadata=metadata, sender_address=sender_address, amount=serde_types.uint64(amount))  # pyre-ignore
-    signing_msg = attest.lcs_serialize() + b"@@$$LIBRA_ATTEST$$@@"
 
-    return (metadata.lcs_serialize(), signing_msg)
+def batch_travel_rule(
+    payments: typing.Iterable[typing.Tuple[str, Address, int]],
+) -> typing.List[typing.Tuple[bytes, bytes]]:
+    """Create travel rule metadata bytes and signature message bytes for many payments
+
+    Each payment is a tuple of (off_chain_reference_id, sender_address, amount), returns same result with
+    calling `travel_rule` for each payment.
+    """
+
+    address_bytes: typing.Dict[Address, bytes] = {}
+    ret = []
+    for off_chain_reference_id, sender_address, amount in payments:
+        sender = address_bytes.get(sender_address)
+        if sender is None:
+            sender = address_bytes.setdefault(sender_address, utils.account_address_bytes(sender_address))
+        ret.append(_travel_rule(off_chain_reference_id, sender, amount))
+    return ret
+
+
+def _travel_rule(off_chain_reference_id: str, sender_address: bytes, amount: int) -> typing.Tuple[bytes, bytes]:
+    # receiver_lcs_data = lcs(metadata, sender_address, amount) + "@@$$LIBRA_ATTEST$$@@" /*ASCII-encoded string*/
+    reference_id = off_chain_reference_id.encode()
+    metadata = b"".join([_TRAVEL_RULE_METADATA_V0_PREFIX, _OPTION_SOME, lcs.uleb128(len(reference_id)), reference_id])
+    signing_msg = b"".join([metadata, sender_address, _u64(amount), _ATTEST_SUFFIX])
+    return (metadata, signing_msg)
 
 
 def general_metadata(
@@ -70,16 +120,34 @@ def general_metadata(
     if from_subaddress is None and to_subaddress is None:
         return b""
 
-    metadata = libra_types.Metadata__GeneralMetadata(
-        value=libra_types.GeneralMetadata__GeneralMetadataVersion0(
-            value=libra_types.GeneralMetadataV0(  # pyre-ignore
-                from_subaddress=from_subaddress,
-                to_subaddress=to_subaddress,
-                referenced_event=serde_types.uint64(referenced_event) if referenced_event else None,
-            )
-        )
+    return b"".join(
+        [
+            _GENERAL_METADATA_V0_PREFIX,
+            _option_bytes(to_subaddress),
+            _option_bytes(from_subaddress),
+            _OPTION_SOME + _u64(referenced_event) if referenced_event else _OPTION_NONE,
+        ]
     )
-    return metadata.lcs_serialize()
+
+
+def batch_general_metadata(
+    payments: typing.Iterable[typing.Tuple[typing.Optional[bytes], typing.Optional[bytes], typing.Optional[int]]],
+) -> typing.List[bytes]:
+    """Create general metadata for many payments
+
+    Each payment is a tuple of (from_subaddress, to_subaddress, referenced_event), returns same result with
+    calling `general_metadata` for each payment.
+    """
+
+    return [general_metadata(from_sub, to_sub, ref) for from_sub, to_sub, ref in payments]
+
+
+def _option_bytes(value: typing.Optional[bytes]) -> bytes:
+    if value is None:
+        return _OPTION_NONE
+    if len(value) == utils.SUB_ADDRESS_LEN:
+        return _OPTION_SOME_SUB_ADDRESS + value
+    return _OPTION_SOME + lcs.uleb128(len(value)) + value
 
 
 def find_refund_reference_event(
@@ -107,6 +175,40 @@ def find_refund_reference_event(
     return None
 
 
+def find_refund_reference_events(
+    txns: typing.Iterable[typing.Optional[jsonrpc.Transaction]],
+    receivers: typing.Iterable[typing.Union[libra_types.AccountAddress, str]],
+) -> typing.List[typing.Optional[jsonrpc.Event]]:
+    """Find refund reference events from many transactions received by any of the given receivers
+
+    Returns a list aligned with given transactions, the item is the first "receivedpayment" event of the
+    transaction that is received by one of the receivers, or None if the transaction is None or the event is
+    not found; i.e. same with calling `find_refund_reference_event` for each transaction when there is one
+    receiver.
+    Receiver addresses are converted once, and "receivedpayment" events of all transactions are indexed by
+    receiver address once, then looked up for each receiver.
+    """
+
+    txns = list(txns)
+    # receiver address => [(transaction index, event index, event)] of "receivedpayment" events
+    index: typing.Dict[str, typing.List[typing.Tuple[int, int, jsonrpc.Event]]] = {}
+    for i, txn in enumerate(txns):
+        if txn is None:
+            continue
+        for j, event in enumerate(txn.events):
+            data = event.data
+            if data.type == jsonrpc.EVENT_DATA_RECEIVED_PAYMENT:
+                index.setdefault(data.receiver, []).append((i, j, event))
+
+    # transaction index => (event index, event) of the first event received by one of the receivers
+    found: typing.Dict[int, typing.Tuple[int, jsonrpc.Event]] = {}
+    for address in {utils.account_address_hex(receiver) for receiver in receivers}:
+        for i, j, event in index.get(address, []):
+            if i not in found or j < found[i][0]:
+                found[i] = (j, event)
+    return [found[i][1] if i in found else None for i in range(len(txns))]
+
+
 def refund_metadata_from_event(event: jsonrpc.Event) -> typing.Optional[bytes]:
     """create refund metadat for the event
 
@@ -127,8 +229,7 @@ def refund_metadata_from_event(event: jsonrpc.Event) -> typing.Optional[bytes]:
         return b""
 
     try:
-        metadata_bytes = bytes.fromhex(event.data.metadata)
-        metadata = libra_types.Metadata.lcs_deserialize(metadata_bytes)
+        metadata = decode_metadata(event.data.metadata)
 
         if isinstance(metadata, libra_types.Metadata__GeneralMetadata):
             if isinstance(metadata.value, libra_types.GeneralMetadata__GeneralMetadataVersion0):
@@ -140,3 +241,198 @@ def refund_metadata_from_event(event: jsonrpc.Event) -> typing.Optional[bytes]:
         raise InvalidEventMetadataForRefundError(f"unknown metadata type: {metadata}")
     except ValueError as e:
         raise InvalidEventMetadataForRefundError(f"invalid event metadata for refund: {e}, event: {event}")
+
+
+def decode_metadata(metadata: typing.Union[bytes, str]) -> libra_types.Metadata:
+    """Decode LCS bytes or hex-encoded string into `libra_types.Metadata`
+
+    Same with `libra_types.Metadata.lcs_deserialize`, but GeneralMetadata v0, TravelRuleMetadata v0 and
+    UnstructuredBytesMetadata are decoded from their fixed layout directly. Other metadata, and fields longer
+    than 127 bytes (multi-byte uleb128 length prefix) are decoded by the reflective LCS deserializer.
+
+    Raises ValueError (`serde_types.DeserializationError`) if given metadata is invalid.
+    """
+
+    data = bytes.fromhex(metadata) if isinstance(metadata, str) else metadata
+    try:
+        ret = _decode_metadata(data)
+    except (IndexError, ValueError):
+        ret = None
+    return ret if ret is not None else libra_types.Metadata.lcs_deserialize(data)
+
+
+def decode_events_metadata(
+    events: typing.Iterable[jsonrpc.Event],
+) -> typing.List[typing.Optional[libra_types.Metadata]]:
+    """Decode metadata of events
+
+    Returns decoded `libra_types.Metadata` for each event, None if the event has no metadata, or the metadata
+    is invalid. Use `decode_metadata` for the error of invalid metadata.
+    """
+
+    ret: typing.List[typing.Optional[libra_types.Metadata]] = []
+    for event in events:
+        metadata = event.data.metadata
+        try:
+            ret.append(decode_metadata(metadata) if metadata else None)
+        except ValueError:
+            ret.append(None)
+    return ret
+
+
+def _decode_metadata(data: bytes) -> typing.Optional[libra_types.Metadata]:
+    """Returns None if the metadata is not one of the fixed layout variants, raises IndexError or ValueError
+    if the fixed layout does not match; the caller falls back to the reflective LCS deserializer for both cases.
+    """
+
+    variant = data[0]
+    if variant == 3:
+        value, offset = _read_option_bytes(data, 1)
+        if offset != len(data):
+            return None
+        return libra_types.Metadata__UnstructuredBytesMetadata(
+            value=libra_types.UnstructuredBytesMetadata(metadata=value)
+        )
+
+    if data[1] != 0:  # version 0
+        return None
+    if variant == 1:
+        to_subaddress, offset = _read_option_bytes(data, 2)
+        from_subaddress, offset = _read_option_bytes(data, offset)
+        referenced_event, offset = _read_option_u64(data, offset)
+        if offset != len(data):
+            return None
+        return libra_types.Metadata__GeneralMetadata(
+            value=libra_types.GeneralMetadata__GeneralMetadataVersion0(
+                value=libra_types.GeneralMetadataV0(  # pyre-ignore
+                    to_subaddress=to_subaddress,
+                    from_subaddress=from_subaddress,
+                    referenced_event=referenced_event,
+                )
+            )
+        )
+    if variant == 2:
+        reference_id, offset = _read_option_bytes(data, 2)
+        if offset != len(data):
+            return None
+        return libra_types.Metadata__TravelRuleMetadata(
+            value=libra_types.TravelRuleMetadata__TravelRuleMetadataVersion0(
+                value=libra_types.TravelRuleMetadataV0(
+                    off_chain_reference_id=reference_id.decode() if reference_id is not None else None
+                )
+            )
+        )
+    return None
+
+
+def _read_option_bytes(data: bytes, offset: int) -> typing.Tuple[typing.Optional[bytes], int]:
+    tag = data[offset]
+    if tag == 0:
+        return (None, offset + 1)
+    length = data[offset + 1]
+    end = offset + 2 + length
+    if tag != 1 or length >= 0x80 or end > len(data):
+        raise ValueError("not fixed layout")
+    return (data[offset + 2 : end], end)
+
+
+def _read_option_u64(data: bytes, offset: int) -> typing.Tuple[typing.Optional[serde_types.uint64], int]:  # pyre-ignore
+    tag = data[offset]
+    if tag == 0:
+        return (None, offset + 1)
+    end = offset + 1 + _U64.size
+    if tag != 1 or end > len(data):
+        raise ValueError("not fixed layout")
+    return (serde_types.uint64(_U64.unpack_from(data, offset + 1)[0]), end)
+
+
+DEFAULT_VERIFY_BATCH_SIZE: int = 500
+
+# (public key, signature, message)
+SignatureItem = typing.Tuple[bytes, bytes, bytes]
+
+
+def travel_rule_signing_msg(txn: jsonrpc.Transaction) -> bytes:
+    """Rebuild travel rule metadata signing message from a peer to peer with metadata transaction
+
+    The message is `lcs(metadata, sender_address, amount) + "@@$$LIBRA_ATTEST$$@@"`, same with the signing
+    message created by `travel_rule`.
+    """
+
+    script = txn.transaction.script
+    sender = utils.account_address_bytes(txn.transaction.sender)
+    return b"".join([bytes.fromhex(script.metadata), sender, _u64(script.amount), _ATTEST_SUFFIX])
+
+
+def verify_travel_rule_signatures(
+    txns: typing.Iterable[jsonrpc.Transaction],
+    compliance_keys: typing.Mapping[typing.Union[libra_types.AccountAddress, str], typing.Union[bytes, str]],
+    executor: typing.Optional[Executor] = None,
+    batch_size: int = DEFAULT_VERIFY_BATCH_SIZE,
+) -> typing.List[typing.Optional[bool]]:
+    """Verify metadata signatures of peer to peer with metadata transactions
+
+    `compliance_keys` maps receiver account address to the receiver VASP's Ed25519 compliance public key
+    (bytes or hex-encoded); for a child VASP receiver, give the compliance key of its parent VASP.
+
+    Returns a list aligned with given transactions: True for valid signature, False for invalid signature, and
+    None if the transaction has no metadata signature to verify, or the compliance key of the receiver is not
+    given.
+
+    Signatures are verified in batches of `batch_size`. When `executor` is provided, batches are verified by
+    the executor; `ThreadPoolExecutor` scales as `cryptography` releases the GIL while verifying, and
+    `ProcessPoolExecutor` works too.
+    """
+
+    keys = {utils.account_address_hex(address): _key_bytes(key) for address, key in compliance_keys.items()}
+    results: typing.List[typing.Optional[bool]] = []
+    positions: typing.List[int] = []
+    items: typing.List[SignatureItem] = []
+    for txn in txns:
+        script = txn.transaction.script
+        key = keys.get(script.receiver)
+        results.append(None)
+        if not script.metadata_signature or key is None:
+            continue
+        try:
+            signature = bytes.fromhex(script.metadata_signature)
+            item = (key, signature, travel_rule_signing_msg(txn))
+        except (ValueError, utils.InvalidAccountAddressError, utils.InvalidSubAddressError):
+            results[-1] = False
+            continue
+        positions.append(len(results) - 1)
+        items.append(item)
+
+    batches = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+    if executor is None:
+        verified = [_verify_signatures(batch) for batch in batches]
+    else:
+        verified = [f.result() for f in [executor.submit(_verify_signatures, batch) for batch in batches]]
+    for position, valid in zip(positions, (valid for batch in verified for valid in batch)):
+        results[position] = valid
+    return results
+
+
+def _key_bytes(key: typing.Union[bytes, str]) -> bytes:
+    return bytes.fromhex(key) if isinstance(key, str) else key
+
+
+def _verify_signatures(items: typing.List[SignatureItem]) -> typing.List[bool]:
+    public_keys: typing.Dict[bytes, typing.Optional[Ed25519PublicKey]] = {}
+    ret = []
+    for key, signature, message in items:
+        if key not in public_keys:
+            try:
+                public_keys[key] = Ed25519PublicKey.from_public_bytes(key)
+            except ValueError:
+                public_keys[key] = None
+        public_key = public_keys[key]
+        if public_key is None:
+            ret.append(False)
+            continue
+        try:
+            public_key.verify(signature, message)
+            ret.append(True)
+        except InvalidSignature:
+            ret.append(False)
+    return ret
@@ -5,10 +5,15 @@
 
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+import functools
 import hashlib
 import typing
 
-from . import libra_types, serde_types, jsonrpc, stdlib
+from . import libra_types, serde_types
+
+if typing.TYPE_CHECKING:
+    # imported by `decode_transaction_script` on first call, for fast `import libra.utils`
+    from . import jsonrpc, stdlib  # noqa: F401
 
 
 ACCOUNT_ADDRESS_LEN: int = libra_types.AccountAddress.LENGTH
@@ -19,6 +24,17 @@ TREASURY_ADDRESS: str = "0000000000000000000000000b1e55ed"
 CORE_CODE_ADDRESS: str = "00000000000000000000000000000001"
 
 
+KNOWN_CURRENCY_CODES: typing.List[str] = ["Coin1", "Coin2", "LBR"]
+# max number of unregistered currency codes cached by `currency_code` and `currency_code_lcs`
+MAX_CACHED_CURRENCY_CODES: int = 256
+
+_CURRENCY_TYPE_TAGS: typing.Dict[str, libra_types.TypeTag] = {}
+_CURRENCY_TYPE_TAG_LCS: typing.Dict[str, bytes] = {}
+_CURRENCY_CODES_BY_LCS: typing.Dict[bytes, str] = {}
+# id of interned TypeTag => currency code; interned tags are never released, so their ids are never reused
+_CURRENCY_CODES_BY_TAG_ID: typing.Dict[int, str] = {}
+
+
 class InvalidAccountAddressError(Exception):
     pass
 
@@ -85,20 +101,87 @@ def public_key_bytes(public_key: Ed25519PublicKey) -> bytes:
 
 
 def currency_code(code: str) -> libra_types.TypeTag:
-    """converts currency code string to libra_types.TypeTag"""
+    """converts currency code string to libra_types.TypeTag
+
+    Returned TypeTag is shared: registered currency codes (see `register_currency_code`) always return the
+    same interned instance, other codes are cached in a bounded LRU cache; hence it should never be mutated.
+    """
+
+    tag = _CURRENCY_TYPE_TAGS.get(code)
+    if tag is None:
+        tag = _unregistered_currency_code(code)[0]
+    return tag
+
+
+def currency_code_lcs(code: str) -> bytes:
+    """returns LCS bytes of the currency code TypeTag, see `currency_code`"""
+
+    ret = _CURRENCY_TYPE_TAG_LCS.get(code)
+    if ret is None:
+        ret = _unregistered_currency_code(code)[1]
+    return ret
+
+
+def currency_code_from_lcs(data: bytes) -> typing.Optional[str]:
+    """reverse lookup of `currency_code_lcs`
+
+    Returns None if given bytes do not match any registered currency code TypeTag LCS bytes.
+    """
 
-    return libra_types.TypeTag.from_currency_code(code)
+    return _CURRENCY_CODES_BY_LCS.get(bytes(data))
+
+
+def register_currency_code(code: str) -> libra_types.TypeTag:
+    """interns the TypeTag and its LCS bytes for the given currency code
+
+    Registering an already registered currency code is a no-op, which returns the interned TypeTag.
+    Registered currency codes are kept for the lifetime of the process, so only register currency codes
+    from trusted sources, e.g. pre-populate currency codes from the server:
+
+    ```python
+    for currency in client.get_currencies():
+        utils.register_currency_code(currency.code)
+    ```
+    """
+
+    tag = _CURRENCY_TYPE_TAGS.get(code)
+    if tag is not None:
+        return tag
+
+    tag, lcs_bytes = _unregistered_currency_code(code)
+    # setdefault keeps the first registered instance when racing with another thread
+    tag = _CURRENCY_TYPE_TAGS.setdefault(code, tag)
+    _CURRENCY_TYPE_TAG_LCS.setdefault(code, lcs_bytes)
+    _CURRENCY_CODES_BY_LCS.setdefault(lcs_bytes, code)
+    _CURRENCY_CODES_BY_TAG_ID.setdefault(id(tag), code)
+    return tag
+
+
+@functools.lru_cache(maxsize=MAX_CACHED_CURRENCY_CODES)
+def _unregistered_currency_code(code: str) -> typing.Tuple[libra_types.TypeTag, bytes]:
+    tag = libra_types.TypeTag.from_currency_code(code)
+    return (tag, tag.lcs_serialize())
 
 
 def type_tag_to_str(code: libra_types.TypeTag) -> str:
-    """converts currency code TypeTag into string"""
+    """converts currency code TypeTag into string
+
+    Interned TypeTags (see `currency_code`) are looked up without reading the struct tag.
+    """
 
+    ret = _CURRENCY_CODES_BY_TAG_ID.get(id(code))
+    if ret is not None:
+        return ret
     if isinstance(code, libra_types.TypeTag__Struct):
         return code.to_currency_code()
 
     raise TypeError(f"unknown currency code type: {code}")
 
 
+for _code in KNOWN_CURRENCY_CODES:
+    register_currency_code(_code)
+
+
 def create_signed_transaction(
     txn: libra_types.RawTransaction, public_key: bytes, signature: bytes
 ) -> libra_types.SignedTransaction:
@@ -136,8 +219,8 @@ def hash(b1: bytes, b2: bytes) -> bytes:
 
 
 def decode_transaction_script(
-    txn: typing.Union[str, jsonrpc.TransactionData, jsonrpc.Transaction]
-) -> stdlib.ScriptCall:
+    txn: typing.Union[str, "jsonrpc.TransactionData", "jsonrpc.Transaction"]
+) -> "stdlib.ScriptCall":
     """decode jsonrpc.Transaction#transaction#script_bytes
 
     Returns `stdlib.ScriptCall`, which is same object we created for `libra_types.RawTransaction`
@@ -146,9 +229,10 @@ def decode_transaction_script(
     See libra.stdlib documentation for more details.
     """
 
+    from . import jsonrpc, script_codec
+
     if isinstance(txn, str):
-        script = libra_types.Script.lcs_deserialize(bytes.fromhex(txn))
-        return stdlib.decode_script(script)
+        return script_codec.decode_script(txn)
     if isinstance(txn, jsonrpc.Transaction):
         return decode_transaction_script(txn.transaction.script_bytes)
     if isinstance(txn, jsonrpc.TransactionData):
@@ -2,8 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from libra import jsonrpc
+from libra import jsonrpc, mocknet, LocalAccount
+import json
 import pytest
+import requests
+import time
 
 
 def test_update_last_known_state():
@@ -43,3 +46,179 @@ def test_invalid_server_url():
     client = jsonrpc.Client("url")
     with pytest.raises(jsonrpc.NetworkError):
         client.get_currencies()
+
+
+def test_requests_transport_default_timeout():
+    with mocknet.FullNode() as node:
+        session = requests.Session()
+        timeouts = []
+        post = session.post
+        session.post = lambda *args, **kwargs: timeouts.append(kwargs["timeout"]) or post(*args, **kwargs)
+        jsonrpc.RequestsTransport(node.url, session).send({"jsonrpc": "2.0", "method": "get_metadata", "id": 1})
+    assert timeouts == [(jsonrpc.client.DEFAULT_CONNECT_TIMEOUT_SECS, jsonrpc.client.DEFAULT_TIMEOUT_SECS)]
+
+
+def test_record_and_replay_responses(tmp_path):
+    path = str(tmp_path / "recording.jsonl")
+    with mocknet.FullNode() as node:
+        node.ledger.mint(LocalAccount.generate().account_address, 1, "Coin1")
+        transport = jsonrpc.RecordingTransport(jsonrpc.RequestsTransport(node.url), path)
+        client = jsonrpc.Client(node.url, transport=transport)
+        metadata = client.get_metadata()
+        currencies = client.get_currencies()
+        with pytest.raises(jsonrpc.JsonRpcError):
+            client.execute("unknown", [])
+
+    client = jsonrpc.Client("url", transport=jsonrpc.ReplayTransport.load(path))
+    for _ in range(2):
+        assert client.get_metadata() == metadata
+        assert client.get_currencies() == currencies
+        with pytest.raises(jsonrpc.JsonRpcError):
+            client.execute("unknown", [])
+    with pytest.raises(jsonrpc.RecordNotFoundError):
+        client.get_metadata(1)
+
+
+def test_replay_responses_in_recorded_order():
+    def record(version):
+        response = {"libra_chain_id": 4, "libra_ledger_version": version, "libra_ledger_timestampusec": version}
+        response["result"] = {"version": version, "timestamp": version, "chain_id": 4}
+        return jsonrpc.Record({"method": "get_metadata", "params": []}, json.dumps(response))
+
+    client = jsonrpc.Client("url", transport=jsonrpc.ReplayTransport([record(1), record(2)]))
+    assert client.get_metadata().version == 1
+    assert client.get_metadata().version == 2
+    # the last response is returned once recorded responses are exhausted
+    assert client.get_metadata().version == 2
+    assert client.get_metadata().version == 2
+
+
+def test_invalid_server_response_body():
+    record = jsonrpc.Record({"method": "get_metadata", "params": []}, "not json")
+    client = jsonrpc.Client("url", transport=jsonrpc.ReplayTransport([record]))
+    with pytest.raises(jsonrpc.InvalidServerResponse, match="not json"):
+        client.get_metadata()
+
+
+def test_hooks():
+    calls = []
+
+    class Hook(jsonrpc.ClientHook):
+        def pre_request(self, call):
+            calls.append(("pre_request", call.method))
+
+        def post_response(self, call):
+            calls.append(("post_response", call.method, call.response_bytes > 0))
+
+        def on_error(self, call, error):
+            calls.append(("on_error", call.method, type(error)))
+
+        def on_retry(self, method, error, tries):
+            calls.append(("on_retry", method, tries))
+
+    with mocknet.FullNode() as node:
+        client = node.create_client(hooks=[Hook()], retry=jsonrpc.Retry(2, 0, jsonrpc.JsonRpcError))
+        client.get_metadata()
+        with pytest.raises(jsonrpc.JsonRpcError):
+            client.execute("unknown", [])
+
+    assert calls == [
+        ("pre_request", "get_metadata"),
+        ("post_response", "get_metadata", True),
+        ("pre_request", "unknown"),
+        ("on_error", "unknown", jsonrpc.JsonRpcError),
+        ("on_retry", "unknown", 1),
+        ("pre_request", "unknown"),
+        ("on_error", "unknown", jsonrpc.JsonRpcError),
+    ]
+
+
+def test_hook_timings_exclude_pre_request_hooks():
+    calls = []
+
+    class SlowHook(jsonrpc.ClientHook):
+        def pre_request(self, call):
+            time.sleep(0.2)
+
+        def post_response(self, call):
+            calls.append(call)
+
+    response = {"libra_chain_id": 4, "libra_ledger_version": 1, "libra_ledger_timestampusec": 1, "result": []}
+    record = jsonrpc.Record({"method": "get_currencies", "params": []}, json.dumps(response))
+    client = jsonrpc.Client("url", transport=jsonrpc.ReplayTransport([record]), hooks=[SlowHook()])
+    client.get_currencies()
+
+    assert len(calls) == 1
+    assert calls[0].network_secs + calls[0].parse_secs < 0.2
+
+
+def test_hook_errors_are_ignored(caplog):
+    class FailingHook(jsonrpc.ClientHook):
+        def pre_request(self, call):
+            raise RuntimeError("pre_request")
+
+        def post_response(self, call):
+            raise RuntimeError("post_response")
+
+        def on_error(self, call, error):
+            raise RuntimeError("on_error")
+
+        def on_retry(self, method, error, tries):
+            raise RuntimeError("on_retry")
+
+    metrics = jsonrpc.MetricsCollector()
+    with mocknet.FullNode() as node:
+        client = node.create_client(hooks=[FailingHook(), metrics], retry=jsonrpc.Retry(2, 0, jsonrpc.JsonRpcError))
+        assert client.get_metadata().version == 0
+        with pytest.raises(jsonrpc.JsonRpcError):
+            client.execute("unknown", [])
+
+    assert metrics.latency("get_metadata").count == 1
+    assert metrics.latency("unknown").count == 2
+    assert [r.exc_info[1].args[0] for r in caplog.records] == [
+        "pre_request",
+        "post_response",
+        "pre_request",
+        "on_error",
+        "on_retry",
+        "pre_request",
+        "on_error",
+    ]
+
+
+def test_metrics_collector():
+    metrics = jsonrpc.MetricsCollector()
+    with mocknet.FullNode() as node:
+        client = node.create_client(hooks=[metrics], retry=jsonrpc.Retry(3, 0, jsonrpc.JsonRpcError))
+        for _ in range(3):
+            client.get_metadata()
+        with pytest.raises(jsonrpc.JsonRpcError):
+            client.execute("unknown", [])
+
+    assert metrics.methods() == ["get_metadata", "unknown"]
+    latency = metrics.latency("get_metadata")
+    assert latency.count == 3
+    assert 0 < latency.quantile(0.5) <= latency.quantile(0.99) <= jsonrpc.metrics.DEFAULT_BUCKETS[-1]
+    assert metrics.latency("get_account").count == 0
+
+    text = metrics.to_prometheus()
+    assert "# TYPE libra_jsonrpc_client_request_duration_seconds histogram" in text
+    assert 'libra_jsonrpc_client_request_duration_seconds_bucket{method="get_metadata",le="+Inf"} 3' in text
+    assert 'libra_jsonrpc_client_request_duration_seconds_count{method="unknown"} 3' in text
+    assert 'libra_jsonrpc_client_requests_total{method="get_metadata"} 3' in text
+    assert 'libra_jsonrpc_client_retries_total{method="unknown"} 2' in text
+    assert 'libra_jsonrpc_client_errors_total{method="unknown",error="JsonRpcError"} 3' in text
+
+    metrics.reset()
+    assert metrics.methods() == []
+
+
+def test_histogram_quantile():
+    histogram = jsonrpc.Histogram([1.0, 2.0, 4.0])
+    for value in [0.5, 1.5, 1.5, 3.0, 10.0]:
+        histogram.observe(value)
+    assert histogram.cumulative_counts() == [1, 3, 4, 5]
+    assert histogram.quantile(0.2) == 1.0
+    assert histogram.quantile(0.4) == 1.5
+    assert histogram.quantile(1) == 4.0
+    assert jsonrpc.Histogram().quantile(0.5) == 0.0
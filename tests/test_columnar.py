@@ -0,0 +1,140 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from libra import columnar, jsonrpc
+
+import google.protobuf.json_format as parser
+import numpy as np
+import pytest
+
+
+sender = "f72589b71ff4f8d139674a3f7369c69b"
+receiver = "000000000000000000000000000000dd"
+
+transactions = [
+    {
+        "version": 1,
+        "transaction": {"type": "blockmetadata", "timestamp_usecs": 12},
+        "vm_status": {"type": "executed"},
+        "gas_used": 0,
+    },
+    {
+        "version": 2,
+        "transaction": {
+            "type": "user",
+            "sender": sender,
+            "sequence_number": 3,
+            "gas_currency": "Coin1",
+            "script": {"type": "peer_to_peer_with_metadata", "receiver": receiver, "amount": 1000, "currency": "LBR"},
+        },
+        "events": [],
+        "vm_status": {"type": "executed"},
+        "gas_used": 450,
+    },
+]
+
+events = [
+    {
+        "key": "0000000000000000000000000000000000000000000000dd",
+        "sequence_number": 5,
+        "transaction_version": 2,
+        "data": {"type": "receivedpayment", "amount": {"amount": 1000, "currency": "LBR"}, "sender": sender},
+    },
+    {
+        "key": "0000000000000000000000000000000000000000000000dd",
+        "sequence_number": 6,
+        "transaction_version": 8,
+        "data": {"type": "mint", "amount": {"amount": 18446744073709551615, "currency": "Coin1"}},
+    },
+]
+
+
+def test_transactions_to_columns():
+    cols = columnar.transactions_to_columns(transactions)
+    assert len(cols) == 2
+    assert cols.version.dtype == np.uint64
+    assert cols.version.tolist() == [1, 2]
+    assert cols.gas_used.tolist() == [0, 450]
+    assert cols.type.values() == ["blockmetadata", "user"]
+    assert cols.vm_status.categories == ["executed"]
+    assert cols.sender.shape == (2, 16)
+    assert cols.sender[0].tobytes() == b"\x00" * 16
+    assert cols.sender[1].tobytes().hex() == sender
+    assert cols.receiver[1].tobytes().hex() == receiver
+    assert cols.sequence_number.tolist() == [0, 3]
+    assert cols.amount.tolist() == [0, 1000]
+    assert cols.currency.values() == ["", "LBR"]
+    assert cols.gas_currency.values() == ["", "Coin1"]
+    assert cols.script_type.values() == ["", "peer_to_peer_with_metadata"]
+
+
+def test_transactions_to_columns_from_jsonrpc_objects():
+    txns = [parser.ParseDict(txn, jsonrpc.Transaction(), ignore_unknown_fields=True) for txn in transactions]
+    from_objects = columnar.transactions_to_columns(txns)
+    from_json = columnar.transactions_to_columns(transactions)
+    for name in columnar.TRANSACTION_COLUMNS:
+        col = getattr(from_objects, name)
+        if isinstance(col, columnar.Categorical):
+            assert col.values() == getattr(from_json, name).values()
+        else:
+            assert np.array_equal(col, getattr(from_json, name))
+
+
+def test_events_to_columns():
+    cols = columnar.events_to_columns(events)
+    assert len(cols) == 2
+    assert cols.transaction_version.tolist() == [2, 8]
+    assert cols.sequence_number.tolist() == [5, 6]
+    assert cols.key.categories == ["0000000000000000000000000000000000000000000000dd"]
+    assert cols.type.values() == ["receivedpayment", "mint"]
+    assert cols.amount.tolist() == [1000, 18446744073709551615]
+    assert cols.currency.values() == ["LBR", "Coin1"]
+    assert cols.sender[0].tobytes().hex() == sender
+    assert cols.receiver.tobytes() == b"\x00" * 32
+
+
+def test_concat():
+    pages = [columnar.events_to_columns(events[1:]), columnar.events_to_columns([]), columnar.events_to_columns(events)]
+    cols = columnar.EventColumns.concat(pages)
+    assert len(cols) == 3
+    assert cols.currency.categories == ["Coin1", "LBR"]
+    assert cols.currency.values() == ["Coin1", "LBR", "Coin1"]
+    assert cols.sender.shape == (3, 16)
+
+    assert len(columnar.TransactionColumns.concat([])) == 0
+    assert len(columnar.TransactionColumns.concat([columnar.transactions_to_columns(transactions)] * 2)) == 4
+
+
+def test_invalid_address():
+    with pytest.raises(ValueError):
+        columnar.events_to_columns([{"data": {"sender": "aa"}}])
+    # lengths of invalid addresses add up to a valid total length
+    with pytest.raises(ValueError):
+        columnar.events_to_columns([{"data": {"sender": "aa" * 15}}, {"data": {"sender": "aa" * 17}}])
+
+
+def test_empty_result():
+    assert len(columnar.transactions_to_columns(None)) == 0
+    assert columnar.events_to_columns(None).sender.shape == (0, 16)
+
+
+class FakeClient:
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def execute(self, method, params, result_parser):
+        self.calls.append((method, params))
+        return result_parser(self.result)
+
+
+def test_get_transactions_and_events():
+    client = FakeClient(transactions)
+    assert len(columnar.get_transactions(client, 1, 2)) == 2
+    assert client.calls == [("get_transactions", [1, 2, False])]
+
+    client = FakeClient(events)
+    assert len(columnar.get_events(client, "key", 5, 10)) == 2
+    assert client.calls == [("get_events", ["key", 5, 10])]
+
+    assert len(columnar.get_events(FakeClient(None), "key", 5, 10)) == 0
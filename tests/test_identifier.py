@@ -2,9 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
+import secrets
 from libra import identifier, utils, InvalidSubAddressError, InvalidAccountAddressError
 
-
 test_onchain_address = "f72589b71ff4f8d139674a3f7369c69b"
 test_sub_address = "cf64428bdeb62af2"
 none_sub_address = None
@@ -170,3 +170,68 @@ def test_intent_identifier_decode_errors():
     # hrp not match
     with pytest.raises(identifier.InvalidIntentIdentifierError):
         identifier.decode_intent("libra://%s?am=2&c=Coin1" % (enocded_addr_with_none_subaddr), "tlb")
+
+
+def test_encode_decode_accounts():
+    accounts = [(test_onchain_address, None), (test_onchain_address, test_sub_address)]
+    encoded = identifier.encode_accounts(accounts, "lbr")
+    assert encoded == [enocded_addr_with_none_subaddr, enocded_addr_with_subaddr]
+
+    decoded = identifier.decode_accounts(encoded, "lbr")
+    assert [(addr.to_hex(), sub) for addr, sub in decoded] == [
+        (test_onchain_address, None),
+        (test_onchain_address, bytes.fromhex(test_sub_address)),
+    ]
+
+    assert identifier.encode_accounts([], "lbr") == []
+    with pytest.raises(ValueError):
+        identifier.decode_accounts(
+            [enocded_addr_with_subaddr, "lbr1p7ujcndcl7nudzwt8fglhx6wxn08kgs5tm6mz4usw5p72p"], "lbr"
+        )
+
+
+def test_bech32_base_conversion():
+    for _ in range(100):
+        data = secrets.token_bytes(24)
+        five_bit = identifier._address_to_five_bit(data)
+        assert five_bit == identifier._convertbits(data, 8, 5, True)
+        assert identifier._five_bit_to_address(five_bit) == data
+
+    assert identifier._five_bit_to_address([31] * 39) is None
+    assert identifier._five_bit_to_address([0] * 38) is None
+
+
+def test_bech32_hrp_state():
+    for hrp in [identifier.LBR, identifier.TLB, identifier.PLB, "abc"]:
+        assert identifier._bech32_hrp_state(hrp) == identifier._bech32_polymod(identifier._bech32_hrp_expand(hrp))
+
+    # upper case identifier is decoded with the same lookup table
+    addr, subaddr = identifier.decode_account(enocded_addr_with_subaddr.upper(), "lbr")
+    assert addr.to_hex() == test_onchain_address
+    assert subaddr.hex() == test_sub_address
+
+
+def test_decode_intents():
+    account_ids = [enocded_addr_with_none_subaddr, enocded_addr_with_subaddr]
+    intent_ids = [identifier.encode_intent(account_id, "Coin1", 123) for account_id in account_ids]
+    intent_ids += [
+        "LIBRA://%s?am=5&c=Coin2#fragment" % enocded_addr_with_subaddr,
+        "libra://%s/path?c=Coin%%31&x=&am=7&y" % enocded_addr_with_none_subaddr,
+    ]
+
+    intents = identifier.decode_intents(intent_ids, "lbr")
+    assert [(i.account_address.to_hex(), i.sub_address, i.currency_code, i.amount) for i in intents] == [
+        (test_onchain_address, None, "Coin1", 123),
+        (test_onchain_address, bytes.fromhex(test_sub_address), "Coin1", 123),
+        (test_onchain_address, bytes.fromhex(test_sub_address), "Coin2", 5),
+        (test_onchain_address, None, "Coin1", 7),
+    ]
+
+    # cached decoding result, but a new Intent object for every call
+    intent = identifier.decode_intent(intent_ids[0], "lbr")
+    assert intent is not identifier.decode_intent(intent_ids[0], "lbr")
+    intent.amount = 1
+    assert identifier.decode_intent(intent_ids[0], "lbr").amount == 123
+
+    with pytest.raises(identifier.InvalidIntentIdentifierError):
+        identifier.decode_intents([intent_ids[0], "libra://%s?c=Coin1" % enocded_addr_with_none_subaddr], "lbr")
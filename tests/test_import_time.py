@@ -0,0 +1,62 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import subprocess
+import sys
+import typing
+
+import libra
+import pytest
+
+IMPORT_SCRIPT = """
+import json, sys
+import %s
+print(json.dumps({"modules": sorted(sys.modules)}))
+"""
+
+HEAVY_MODULES = ["libra.jsonrpc", "libra.stdlib", "requests", "google.protobuf"]
+
+
+def import_in_subprocess(modules: str) -> typing.Dict[str, typing.Any]:  # pyre-ignore
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT % modules], env=env, stdout=subprocess.PIPE, check=True
+    ).stdout
+    return json.loads(output)
+
+
+def test_import_libra_is_lazy():
+    ret = import_in_subprocess("libra")
+    assert [m for m in ret["modules"] if m.startswith("libra")] == ["libra"]
+
+
+@pytest.mark.parametrize("module", ["libra.identifier", "libra.libra_types", "libra.utils"])
+def test_import_module_without_jsonrpc_and_stdlib(module):
+    ret = import_in_subprocess(module)
+    assert [m for m in HEAVY_MODULES if m in ret["modules"]] == []
+
+
+def test_lazy_exports():
+    assert libra.LocalAccount is libra.local_account.LocalAccount
+    assert libra.AuthKey is libra.auth_key.AuthKey
+    assert libra.InvalidAccountAddressError is libra.utils.InvalidAccountAddressError
+    assert "jsonrpc" in dir(libra)
+    assert "LocalAccount" in libra.__all__ and "jsonrpc" in libra.__all__
+    assert [name for name in ["mocknet", "pipeline", "testnet"] if name in libra.__all__] == []
+    with pytest.raises(AttributeError):
+        libra.unknown
+
+
+def test_submodules_are_loaded_on_first_access():
+    lazy = import_in_subprocess("libra.identifier")["modules"]
+    assert "libra.jsonrpc" not in lazy and "libra.stdlib" not in lazy
+
+    loaded = import_in_subprocess("libra.identifier; libra.jsonrpc; libra.stdlib")["modules"]
+    assert "libra.jsonrpc" in loaded and "libra.stdlib" in loaded
+
+
+def test_star_import_leaves_out_testing_networks_and_pipeline():
+    modules = import_in_subprocess("libra; from libra import *")["modules"]
+    assert [m for m in ["libra.mocknet", "libra.pipeline", "libra.testnet"] if m in modules] == []
@@ -0,0 +1,198 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from libra import lcs, libra_types, serde_binary, serde_types as st, script_codec, utils, chain_ids, LocalAccount
+
+import dataclasses
+import io
+import mmap
+import struct
+import typing
+import pytest
+
+
+def signed_transaction() -> libra_types.SignedTransaction:
+    script = script_codec.encode_peer_to_peer_with_metadata_script(
+        "Coin1", "f72589b71ff4f8d139674a3f7369c69b", 1_000, b"\x01\x02"
+    )
+    raw_txn = libra_types.RawTransaction(
+        sender=utils.account_address("1b72d1171ee6e3b2c85d8ec2a5e2ba85"),
+        sequence_number=12,
+        payload=libra_types.TransactionPayload__Script(libra_types.Script.lcs_deserialize(script)),
+        max_gas_amount=1_000_000,
+        gas_unit_price=0,
+        gas_currency_code="Coin1",
+        expiration_timestamp_secs=1_601_492_942,
+        chain_id=chain_ids.TESTNET,
+    )
+    return LocalAccount.generate().sign(raw_txn)
+
+
+def test_profiler():
+    txn = signed_transaction()
+    data = txn.lcs_serialize()
+    original = serde_binary.BinarySerializer.serialize_any
+
+    with serde_binary.Profiler() as profiler:
+        assert serde_binary.BinarySerializer.serialize_any is not original
+        with pytest.raises(RuntimeError):
+            serde_binary.Profiler().start()
+        assert lcs.serialize(txn, libra_types.SignedTransaction) == data
+        assert lcs.deserialize(data, libra_types.SignedTransaction) == (txn, b"")
+    assert serde_binary.BinarySerializer.serialize_any is original
+
+    profiles = {(p.operation, p.type_name): p for p in profiler.report()}
+    signed = profiles[("serialize", "SignedTransaction")]
+    assert signed.calls == 1
+    assert signed.bytes == len(data)
+    assert signed.total_secs >= signed.self_secs > 0
+    assert profiles[("deserialize", "SignedTransaction")].bytes == len(data)
+    assert profiles[("serialize", "Sequence[TransactionArgument]")].calls == 1
+    assert profiles[("serialize", "TransactionArgument")].calls == 4
+    assert profiles[("serialize", "AccountAddress")].bytes == 3 * 16  # sender, payee and currency type tag
+    assert ("serialize", "uint64") not in profiles  # fixed-width fields are packed by the enclosing struct
+
+    serialize_only = profiler.report("serialize")
+    assert all(p.operation == "serialize" for p in serialize_only)
+    assert serialize_only == sorted(serialize_only, key=lambda p: p.self_secs, reverse=True)
+    report = profiler.format_report(limit=3)
+    assert len(report.splitlines()) == 4
+
+    profiler.reset()
+    assert profiler.report() == []
+
+
+def test_type_name():
+    assert serde_binary.type_name(libra_types.AccountAddress) == "AccountAddress"
+    assert serde_binary.type_name(st.uint64) == "uint64"
+    assert serde_binary.type_name(typing.Sequence[libra_types.TransactionArgument]) == "Sequence[TransactionArgument]"
+    assert serde_binary.type_name(typing.Optional[bytes]) == "Optional[bytes]"
+    assert serde_binary.type_name(typing.Tuple[st.uint8, st.uint8]) == "Tuple[uint8, uint8]"
+    assert serde_binary.type_name(typing.Tuple[st.uint8, st.uint8, st.uint8]) == "Tuple[uint8 * 3]"
+    assert serde_binary.type_name(typing.Dict[str, bytes]) == "Dict[str, bytes]"
+
+
+def test_deserialize_stream(tmp_path):
+    txns = [signed_transaction() for _ in range(5)]
+    data = b"".join(txn.lcs_serialize() for txn in txns)
+    path = str(tmp_path / "txns.lcs")
+    with open(path, "wb") as f:
+        f.write(data)
+
+    assert list(lcs.deserialize_stream(data, libra_types.SignedTransaction)) == txns
+    assert list(lcs.deserialize_stream(memoryview(data), libra_types.SignedTransaction)) == txns
+    assert list(lcs.deserialize_stream(path, libra_types.SignedTransaction)) == txns
+    assert list(lcs.deserialize_stream(io.BytesIO(data), libra_types.SignedTransaction)) == txns
+    with open(path, "rb") as f:
+        f.seek(len(txns[0].lcs_serialize()))
+        assert list(lcs.deserialize_stream(f, libra_types.SignedTransaction)) == txns[1:]
+        assert f.tell() == len(data)
+    for f in [open(path, "rb"), io.BytesIO(data)]:
+        with f:
+            stream = lcs.deserialize_stream(f, libra_types.SignedTransaction)
+            assert [next(stream) for _ in range(2)] == txns[:2]
+            stream.close()
+            assert f.tell() == len(txns[0].lcs_serialize()) + len(txns[1].lcs_serialize())
+            assert list(lcs.deserialize_stream(f, libra_types.SignedTransaction)) == txns[2:]
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        stream = lcs.deserialize_stream(mapped, libra_types.SignedTransaction)
+        assert next(stream) == txns[0]
+        stream.close()
+
+    assert list(lcs.deserialize_stream(b"", libra_types.SignedTransaction)) == []
+    with open(str(tmp_path / "empty.lcs"), "wb"):
+        pass
+    assert list(lcs.deserialize_stream(str(tmp_path / "empty.lcs"), libra_types.SignedTransaction)) == []
+
+    stream = lcs.deserialize_stream(data[:-1], libra_types.SignedTransaction)
+    assert [next(stream) for _ in range(4)] == txns[:4]
+    with pytest.raises(st.DeserializationError, match=f"offset {len(data) - len(txns[4].lcs_serialize())}"):
+        next(stream)
+    truncated = io.BytesIO(data[:-1])
+    with pytest.raises(st.DeserializationError):
+        list(lcs.deserialize_stream(truncated, libra_types.SignedTransaction))
+    assert truncated.tell() == len(data) - len(txns[4].lcs_serialize())
+
+
+def test_serialize_into():
+    txn = signed_transaction()
+    data = txn.lcs_serialize()
+    buffer = bytearray(b"prefix")
+    assert lcs.serialize_into(txn, libra_types.SignedTransaction, buffer) == len(data)
+    assert lcs.serialize_into(txn.raw_txn.sender, libra_types.AccountAddress, buffer) == 16
+    assert bytes(buffer) == b"prefix" + data + txn.raw_txn.sender.to_bytes()
+
+    with pytest.raises(st.SerializationError):
+        lcs.serialize_into(txn, libra_types.RawTransaction, buffer)
+    assert len(buffer) == len(b"prefix") + len(data) + 16
+    # the serializer reused by serialize_into does not keep writing into the buffer
+    assert lcs.serialize(txn, libra_types.SignedTransaction) == data
+    assert bytes(buffer) == b"prefix" + data + txn.raw_txn.sender.to_bytes()
+
+
+def test_serializer_reuse():
+    serializer = lcs.LcsSerializer()
+    serializer.serialize_any(b"\x01\x02", bytes)
+    assert serializer.get_buffer() == b"\x02\x01\x02"
+    serializer.reset()
+    serializer.serialize_any({b"b": 1, b"a": 2}, typing.Dict[bytes, st.uint8])
+    assert serializer.get_buffer() == b"\x02\x01a\x02\x01b\x01"
+
+    with pytest.raises(st.SerializationError):
+        lcs.serialize(1, libra_types.AccountAddress)
+    assert lcs.serialize(300, st.uint64) == (300).to_bytes(8, "little")
+    assert lcs.serialize([300] * 200, typing.Sequence[st.uint16]) == b"\xc8\x01" + b"\x2c\x01" * 200
+
+
+def test_fixed_width_runs():
+    layout = serde_binary.struct_layout(libra_types.RawTransaction)
+    runs = [field for field in layout if isinstance(field, serde_binary.FixedWidthRun)]
+    assert [run.names for run in runs] == [
+        ("sequence_number",),
+        ("max_gas_amount", "gas_unit_price"),
+        ("expiration_timestamp_secs",),
+    ]
+    assert runs[1].packer.format == "<QQ"
+    assert serde_binary.tuple_run(typing.Tuple[st.uint8, st.uint16]).packer.format == "<BH"
+    assert serde_binary.tuple_run(typing.Tuple[st.uint8, bytes]) is None
+
+    txn = signed_transaction()
+    decoded = libra_types.SignedTransaction.lcs_deserialize(txn.lcs_serialize())
+    assert decoded == txn
+    assert type(decoded.raw_txn.max_gas_amount) is st.uint64
+    assert type(decoded.raw_txn.sender.value[0]) is st.uint8
+
+    data = lcs.serialize([(1, -2), (3, -4)], typing.Sequence[typing.Tuple[st.uint16, st.int32]])
+    assert data == b"\x02" + struct.pack("<Hi", 1, -2) + struct.pack("<Hi", 3, -4)
+    assert lcs.deserialize(data, typing.Sequence[typing.Tuple[st.uint16, st.int32]]) == ([(1, -2), (3, -4)], b"")
+    with pytest.raises(st.DeserializationError):
+        lcs.deserialize(data[:-1], typing.Sequence[typing.Tuple[st.uint16, st.int32]])
+
+
+def test_serialize_out_of_range_integers():
+    raw_txn = signed_transaction().raw_txn
+    with pytest.raises(st.SerializationError, match="Wrong Value") as e:
+        lcs.serialize(dataclasses.replace(raw_txn, gas_unit_price=-1), libra_types.RawTransaction)
+    assert e.value.args[1:] == (-1, st.uint64)
+    with pytest.raises(st.SerializationError):
+        lcs.serialize(dataclasses.replace(raw_txn, sequence_number=1 << 64), libra_types.RawTransaction)
+
+    with pytest.raises(st.SerializationError) as e:
+        lcs.serialize(-1, st.uint64)
+    assert e.value.args[1:] == (-1, st.uint64)
+    with pytest.raises(st.SerializationError) as e:
+        lcs.serialize(128, st.int8)
+    assert e.value.args[1:] == (128, st.int8)
+    with pytest.raises(st.SerializationError) as e:
+        lcs.serialize((1, 256), typing.Tuple[st.uint16, st.uint8])
+    assert e.value.args[1:] == (256, st.uint8)
+    with pytest.raises(st.SerializationError):
+        lcs.serialize((1,), typing.Tuple[st.uint16, st.uint8])
+
+
+def test_serialize_non_bool_value():
+    assert lcs.serialize(True, st.bool) == b"\x01"
+    for value in [1, 0, "false", None]:
+        with pytest.raises(st.SerializationError) as e:
+            lcs.serialize(value, st.bool)
+        assert e.value.args[1:] == (value, st.bool)
@@ -0,0 +1,198 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from libra import jsonrpc, libra_types, mocknet, script_codec, utils, LocalAccount
+
+import dataclasses
+import time
+import pytest
+
+
+def create_transaction(
+    sender: LocalAccount, receiver: LocalAccount, seq: int, amount: int, expiration_secs: int = 30
+) -> libra_types.SignedTransaction:
+    script = script_codec.encode_peer_to_peer_with_metadata_script(
+        "Coin1", receiver.account_address.to_hex(), amount, b""
+    )
+    raw_txn = libra_types.RawTransaction(
+        sender=sender.account_address,
+        sequence_number=seq,
+        payload=libra_types.TransactionPayload__Script(libra_types.Script.lcs_deserialize(script)),
+        max_gas_amount=1_000_000,
+        gas_unit_price=0,
+        gas_currency_code="Coin1",
+        expiration_timestamp_secs=int(time.time()) + expiration_secs,
+        chain_id=mocknet.CHAIN_ID,
+    )
+    return sender.sign(raw_txn)
+
+
+@pytest.fixture
+def node():
+    with mocknet.FullNode() as node:
+        yield node
+
+
+def test_peer_to_peer_transfer(node):
+    client = node.create_client()
+    sender, receiver = LocalAccount.generate(), LocalAccount.generate()
+    node.ledger.create_account(sender.account_address, sender.auth_key.data)
+    node.ledger.mint(sender.account_address, 1_000, "Coin1")
+
+    txn = create_transaction(sender, receiver, 0, 300)
+    client.submit(txn)
+    executed = client.wait_for_transaction(txn, timeout_secs=5)
+    assert executed.version == 1
+    assert executed.hash == utils.transaction_hash(txn)
+    assert executed.transaction.script.type == "peer_to_peer_with_metadata"
+    assert executed.vm_status.type == jsonrpc.VM_STATUS_EXECUTED
+
+    sender_account = client.get_account(sender.account_address)
+    assert sender_account.sequence_number == 1
+    assert sender_account.authentication_key == sender.auth_key.hex()
+    assert client.get_account(receiver.account_address).balances[0].amount == 300
+    assert client.get_account(LocalAccount.generate().account_address) is None
+
+    events = client.get_events(sender_account.sent_events_key, 0, 10)
+    assert [e.data.type for e in events] == ["sentpayment"]
+    assert events[0].data.amount.amount == 300
+    assert events[0].transaction_version == 1
+
+    txns = client.get_account_transactions(sender.account_address, 0, 10, include_events=True)
+    assert len(txns) == 1
+    assert len(txns[0].events) == 2
+    assert len(client.get_account_transaction(sender.account_address, 0).events) == 0
+    assert [t.version for t in client.get_transactions(0, 10)] == [0, 1]
+    assert client.get_metadata().version == 1
+    assert [c.code for c in client.get_currencies()] == mocknet.CURRENCIES
+
+
+def test_insufficient_balance_aborts(node):
+    client = node.create_client()
+    sender, receiver = LocalAccount.generate(), LocalAccount.generate()
+
+    txn = create_transaction(sender, receiver, 0, 300)
+    client.submit(txn)
+    with pytest.raises(jsonrpc.TransactionExecutionFailed):
+        client.wait_for_transaction(txn, timeout_secs=5)
+    assert client.get_account_sequence(sender.account_address) == 1
+
+
+def test_submit_validation_errors(node):
+    client = node.create_client()
+    sender, receiver = LocalAccount.generate(), LocalAccount.generate()
+    node.ledger.mint(sender.account_address, 1_000, "Coin1")
+    client.submit(create_transaction(sender, receiver, 0, 1))
+
+    with pytest.raises(jsonrpc.JsonRpcError) as e:
+        client.submit(create_transaction(sender, receiver, 0, 1))
+    assert jsonrpc.is_sequence_number_error(e.value)
+
+    with pytest.raises(jsonrpc.JsonRpcError, match="TRANSACTION_EXPIRED"):
+        client.submit(create_transaction(sender, receiver, 1, 1, expiration_secs=-1))
+
+    with pytest.raises(jsonrpc.JsonRpcError, match="-32602"):
+        client.submit("invalid")
+
+    with pytest.raises(jsonrpc.JsonRpcError, match="-32601"):
+        client.execute("unknown", [])
+
+
+def test_verify_signatures():
+    ledger = mocknet.Ledger(verify_signatures=True)
+    sender, receiver = LocalAccount.generate(), LocalAccount.generate()
+    ledger.create_account(sender.account_address, sender.auth_key.data)
+    txn = create_transaction(sender, receiver, 0, 0)
+    ledger.submit(txn)
+    assert ledger.version == 1
+
+    txn = create_transaction(sender, receiver, 1, 0)
+    signature = libra_types.Ed25519Signature(value=b"\x00" * 64)
+    invalid = dataclasses.replace(txn, authenticator=dataclasses.replace(txn.authenticator, signature=signature))
+    with pytest.raises(mocknet.RpcError, match="INVALID_SIGNATURE"):
+        ledger.submit(invalid)
+
+    ledger.create_account(receiver.account_address)
+    with pytest.raises(mocknet.RpcError, match="INVALID_AUTH_KEY"):
+        ledger.submit(create_transaction(receiver, sender, 0, 0))
+
+
+def test_commit_executes_transactions_in_sequence_order():
+    ledger = mocknet.Ledger(auto_commit=False)
+    sender, receiver = LocalAccount.generate(), LocalAccount.generate()
+    ledger.mint(sender.account_address, 1_000, "Coin1")
+
+    ledger.submit(create_transaction(sender, receiver, 1, 1))
+    assert ledger.commit() == 0
+    ledger.submit(create_transaction(sender, receiver, 0, 1))
+    assert ledger.version == 0
+    assert ledger.commit() == 2
+    assert ledger.execute("get_account", [sender.account_address.to_hex()])["sequence_number"] == 2
+
+
+def test_account_transactions_and_unsupported_payload():
+    ledger = mocknet.Ledger()
+    sender, receiver = LocalAccount.generate(), LocalAccount.generate()
+    ledger.mint(sender.account_address, 1_000, "Coin1")
+    for seq in range(3):
+        ledger.submit(create_transaction(sender, receiver, seq, 1))
+    ledger.submit(create_transaction(receiver, sender, 0, 1))
+
+    raw_txn = dataclasses.replace(
+        create_transaction(sender, receiver, 3, 0).raw_txn,
+        payload=libra_types.TransactionPayload__Module(libra_types.Module(code=b"\x00")),
+    )
+    ledger.submit(sender.sign(raw_txn))
+    txns = ledger.execute("get_account_transactions", [sender.account_address.to_hex(), 1, 10])
+    assert [txn["transaction"]["sequence_number"] for txn in txns] == [1, 2, 3]
+    assert txns[-1]["vm_status"]["type"] == jsonrpc.VM_STATUS_MISC_ERROR
+    assert ledger.execute("get_account", [sender.account_address.to_hex()])["sequence_number"] == 4
+    assert ledger.execute("get_account_transactions", [receiver.account_address.to_hex(), 0, 10])[0]["version"] == 4
+    assert ledger.execute("get_account_transactions", [LocalAccount.generate().account_address.to_hex(), 0, 1]) == []
+
+
+def test_batch_request():
+    node = mocknet.FullNode()
+    responses = node.handle(
+        [
+            {"jsonrpc": "2.0", "id": 1, "method": "get_metadata", "params": []},
+            {"jsonrpc": "2.0", "id": 2, "method": "get_account", "params": ["invalid"]},
+            {"jsonrpc": "2.0", "id": 3},
+        ]
+    )
+    assert [r["id"] for r in responses] == [1, 2, 3]
+    assert responses[0]["result"]["chain_id"] == mocknet.CHAIN_ID.to_int()
+    assert responses[1]["error"]["code"] == mocknet.INVALID_PARAMS
+    assert responses[2]["error"]["code"] == mocknet.INVALID_REQUEST
+
+
+def test_fault_http_error():
+    with mocknet.FullNode(faults=mocknet.Faults(http_error_rate=1)) as node:
+        with pytest.raises(jsonrpc.NetworkError):
+            node.create_client().execute_without_retry("get_metadata", [])
+
+
+def test_fault_jsonrpc_error():
+    with mocknet.FullNode(faults=mocknet.Faults(jsonrpc_error_rate=1)) as node:
+        with pytest.raises(jsonrpc.JsonRpcError, match="injected"):
+            node.create_client().get_metadata()
+
+
+def test_fault_stale_response(node):
+    client = node.create_client()
+    node.ledger.mint(LocalAccount.generate().account_address, 1, "Coin1")
+    sender, receiver = LocalAccount.generate(), LocalAccount.generate()
+    client.submit(create_transaction(sender, receiver, 0, 0))
+    client.get_metadata()
+
+    node.faults.stale_rate = 1
+    with pytest.raises(jsonrpc.StaleResponseError):
+        client.execute_without_retry("get_metadata", [])
+
+
+def test_fault_latency():
+    with mocknet.FullNode(faults=mocknet.Faults(latency_secs=0.05, latency_jitter_secs=0.01, seed=1)) as node:
+        client = node.create_client()
+        start = time.time()
+        client.get_metadata()
+        assert time.time() - start >= 0.05
@@ -0,0 +1,236 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from libra import pipeline, script_codec, libra_types, jsonrpc, utils, chain_ids, stdlib, LocalAccount
+
+import asyncio
+import pytest
+import threading
+import time
+import typing
+
+payee = utils.account_address("f72589b71ff4f8d139674a3f7369c69b")
+
+
+class FakeLedgerClient:
+    """executes submitted transactions in sequence number order when polled"""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.sequences: typing.Dict[str, int] = {}
+        self.mempool: typing.Dict[typing.Tuple[str, int], str] = {}
+        self.executed: typing.Dict[str, typing.List[jsonrpc.Transaction]] = {}
+        self.polls = 0
+
+    def get_account_sequence(self, address: str) -> int:
+        with self.lock:
+            return self.sequences.get(address, 0)
+
+    def submit(self, txn: str) -> None:
+        signed = libra_types.SignedTransaction.lcs_deserialize(bytes.fromhex(txn))
+        with self.lock:
+            self.mempool[(signed.raw_txn.sender.to_hex(), int(signed.raw_txn.sequence_number))] = txn
+
+    def get_last_known_state(self) -> jsonrpc.State:
+        return jsonrpc.State(chain_id=2, version=1, timestamp_usecs=int(time.time() * 1_000_000))
+
+    def get_account_transactions(self, address: str, seq: int, limit: int) -> typing.List[jsonrpc.Transaction]:
+        with self.lock:
+            self.polls += 1
+            while (address, self.sequences.get(address, 0)) in self.mempool:
+                next_seq = self.sequences.get(address, 0)
+                txn = self.mempool.pop((address, next_seq))
+                signed = libra_types.SignedTransaction.lcs_deserialize(bytes.fromhex(txn))
+                if signed.raw_txn.expiration_timestamp_secs <= time.time():
+                    continue
+                self.executed.setdefault(address, []).append(
+                    jsonrpc.Transaction(
+                        hash=script_codec.signed_transaction_hash(bytes.fromhex(txn)),
+                        transaction=jsonrpc.TransactionData(sequence_number=next_seq),
+                        vm_status=jsonrpc.VMStatus(type="executed"),
+                    )
+                )
+                self.sequences[address] = next_seq + 1
+            return self.executed.get(address, [])[seq : seq + limit]
+
+
+def p2p_request(sender: LocalAccount, amount: int, **kwargs) -> pipeline.TransactionRequest:  # pyre-ignore
+    script = script_codec.encode_peer_to_peer_with_metadata_script("Coin1", payee, amount)
+    return pipeline.TransactionRequest(sender, script, **kwargs)
+
+
+def test_run():
+    client = FakeLedgerClient()
+    senders = [LocalAccount.generate() for _ in range(3)]
+    requests = [p2p_request(senders[i % 3], i) for i in range(60)]
+    script = stdlib.encode_peer_to_peer_with_metadata_script(utils.currency_code("Coin1"), payee, 1, b"", b"")
+    requests.append(pipeline.TransactionRequest(senders[0], script))
+
+    completed = []
+    txn_pipeline = pipeline.TransactionPipeline(
+        client, chain_ids.TESTNET, max_in_flight=10, poll_interval_secs=0.01, callback=completed.append
+    )
+    results = list(txn_pipeline.run(iter(requests)))
+
+    assert results == completed
+    assert len(results) == 61
+    assert all(r.success for r in results), [r.error for r in results if r.error]
+    assert sorted(r.sequence_number for r in results) == sorted(list(range(21)) + list(range(20)) * 2)
+    assert all(r.transaction.hash == r.hash for r in results)
+    # confirmed by shared polling: much less polling calls than transactions
+    assert client.polls < 61
+
+
+def test_run_failures_and_resync():
+    client = FakeLedgerClient()
+    sender = LocalAccount.generate()
+    txn_pipeline = pipeline.TransactionPipeline(client, chain_ids.TESTNET, poll_interval_secs=0.01)
+
+    results = list(txn_pipeline.run([p2p_request(sender, 1, expiration_secs=-1)]))
+    assert isinstance(results[0].error, jsonrpc.TransactionExpired)
+
+    results = list(txn_pipeline.run([p2p_request(sender, 2)]))
+    assert results[0].success
+    assert results[0].sequence_number == 0
+
+    raw_txn = libra_types.RawTransaction(
+        sender=sender.account_address,
+        sequence_number=1,
+        payload=libra_types.TransactionPayload__Script(
+            stdlib.encode_peer_to_peer_with_metadata_script(utils.currency_code("Coin1"), payee, 1, b"", b"")
+        ),
+        max_gas_amount=1_000_000,
+        gas_unit_price=0,
+        gas_currency_code="Coin1",
+        expiration_timestamp_secs=int(time.time()) + 30,
+        chain_id=chain_ids.TESTNET,
+    )
+    results = list(txn_pipeline.run([pipeline.TransactionRequest(sender, raw_txn)]))
+    assert results[0].success
+    assert results[0].hash == utils.transaction_hash(sender.sign(raw_txn))
+
+
+def test_run_expired_transaction_with_later_sequence_numbers_in_flight():
+    client = FakeLedgerClient()
+    sender = LocalAccount.generate()
+    expired = threading.Event()
+
+    def on_result(result: pipeline.TransactionResult) -> None:
+        if isinstance(result.error, jsonrpc.TransactionExpired):
+            expired.set()
+
+    def requests() -> typing.Iterator[pipeline.TransactionRequest]:
+        yield p2p_request(sender, 0, expiration_secs=-1)
+        for i in range(1, 4):
+            yield p2p_request(sender, i)
+        # submit more transactions after seq 0 expired, while seq 1 to 3 are waiting for it in the mempool
+        assert expired.wait(5)
+        for i in range(4, 7):
+            yield p2p_request(sender, i)
+
+    txn_pipeline = pipeline.TransactionPipeline(client, chain_ids.TESTNET, poll_interval_secs=0.01, callback=on_result)
+    results: typing.List[pipeline.TransactionResult] = []
+    runner = threading.Thread(target=lambda: results.extend(txn_pipeline.run(requests())), daemon=True)
+    runner.start()
+    runner.join(10)
+    assert not runner.is_alive(), "pipeline run did not complete"
+
+    assert len(results) == 7
+    assert [r.request.payload for r in results if not r.success] == [p2p_request(sender, 0).payload]
+    assert sorted(r.sequence_number for r in results) == [0, 0, 1, 2, 3, 4, 5]
+    assert client.get_account_sequence(sender.account_address.to_hex()) == 6
+
+
+def test_run_submit_error():
+    class FailedSubmitClient(FakeLedgerClient):
+        def submit(self, txn: str) -> None:
+            raise jsonrpc.JsonRpcError("VM Validation error: SEQUENCE_NUMBER_TOO_OLD")
+
+    client = FailedSubmitClient()
+    results = list(pipeline.TransactionPipeline(client, 2).run([p2p_request(LocalAccount.generate(), 1)]))
+    assert isinstance(results[0].error, jsonrpc.JsonRpcError)
+
+
+def test_run_async():
+    client = FakeLedgerClient()
+    sender = LocalAccount.generate()
+    txn_pipeline = pipeline.TransactionPipeline(client, chain_ids.TESTNET, poll_interval_secs=0.01)
+
+    async def run() -> typing.List[pipeline.TransactionResult]:
+        return [result async for result in txn_pipeline.run_async(p2p_request(sender, i) for i in range(5))]
+
+    results = asyncio.run(run())
+    assert sorted(r.sequence_number for r in results) == list(range(5))
+
+
+class SlowSubmitClient(FakeLedgerClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.submits = 0
+
+    def submit(self, txn: str) -> None:
+        time.sleep(0.05)
+        with self.lock:
+            self.submits += 1
+        super().submit(txn)
+
+
+def test_run_stopped_early_cancels_queued_submits():
+    client = SlowSubmitClient()
+    sender = LocalAccount.generate()
+    txn_pipeline = pipeline.TransactionPipeline(
+        client, chain_ids.TESTNET, max_in_flight=50, submit_workers=1, poll_interval_secs=0.01
+    )
+    results = txn_pipeline.run(p2p_request(sender, i) for i in range(50))
+    assert next(results).success
+    results.close()
+
+    with client.lock:
+        submits = client.submits
+    time.sleep(0.3)
+    # at most the submit running on close completes
+    assert client.submits <= submits + 1 < 50
+
+
+def test_run_async_cancelled():
+    client = SlowSubmitClient()
+    sender = LocalAccount.generate()
+    txn_pipeline = pipeline.TransactionPipeline(client, chain_ids.TESTNET, submit_workers=1, poll_interval_secs=0.01)
+
+    async def consume() -> None:
+        async for _ in txn_pipeline.run_async(p2p_request(sender, i) for i in range(50)):
+            pass
+
+    async def run() -> None:
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.1)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(run())
+    time.sleep(0.1)
+    submits = client.submits
+    time.sleep(0.3)
+    assert client.submits <= submits + 1 < 50
+
+
+def test_poll_account_pages_in_flight_sequence_numbers():
+    class RecordingClient(FakeLedgerClient):
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls: typing.List[typing.Tuple[int, int]] = []
+
+        def get_account_transactions(self, address: str, seq: int, limit: int) -> typing.List[jsonrpc.Transaction]:
+            self.calls.append((seq, limit))
+            return []
+
+    client = RecordingClient()
+    run = pipeline._Run(pipeline.TransactionPipeline(client, chain_ids.TESTNET), [])
+    expiration = int(time.time()) + 30
+    txns = {
+        str(seq): pipeline._InFlight(pipeline.TransactionResult(request=None), seq, expiration)  # pyre-ignore
+        for seq in [0, 5, 999, 1000, 2500, 2501, 3600]
+    }
+    run._poll_account("address", txns)
+    assert client.calls == [(0, 1000), (1000, 1000), (2500, 1000), (3600, 1)]
@@ -0,0 +1,184 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from libra import lcs, script_codec, stdlib, utils, libra_types, serde_types, chain_ids, jsonrpc, LocalAccount
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+payee = utils.account_address("f72589b71ff4f8d139674a3f7369c69b")
+
+
+def test_uleb128():
+    assert lcs.uleb128(0) == b"\x00"
+    assert lcs.uleb128(127) == b"\x7f"
+    assert lcs.uleb128(128) == b"\x80\x01"
+    assert lcs.uleb128(16384) == b"\x80\x80\x01"
+    assert script_codec.uleb128 is lcs.uleb128
+
+
+@pytest.mark.parametrize("metadata, signature", [(b"", b""), (b"\x01\x00\x00", b"s" * 64), (b"m" * 300, b"")])
+def test_encode_peer_to_peer_with_metadata_script(metadata, signature):
+    expected = stdlib.encode_peer_to_peer_with_metadata_script(
+        utils.currency_code("Coin1"), payee, 1_000_000, metadata, signature
+    ).lcs_serialize()
+
+    ret = script_codec.encode_peer_to_peer_with_metadata_script("Coin1", payee, 1_000_000, metadata, signature)
+    assert ret == expected
+    assert (
+        script_codec.encode_peer_to_peer_with_metadata_script(
+            utils.currency_code("Coin1"), payee.to_hex(), 1_000_000, metadata, signature
+        )
+        == expected
+    )
+
+
+def test_encode_create_child_vasp_account_script():
+    for add_all_currencies in [True, False]:
+        expected = stdlib.encode_create_child_vasp_account_script(
+            utils.currency_code("LBR"), payee, b"\xaa" * 16, add_all_currencies, 2_000_000_000
+        ).lcs_serialize()
+        ret = script_codec.encode_create_child_vasp_account_script(
+            "LBR", payee.to_bytes(), b"\xaa" * 16, add_all_currencies, 2_000_000_000
+        )
+        assert ret == expected
+
+
+def test_encode_rotate_dual_attestation_info_script():
+    expected = stdlib.encode_rotate_dual_attestation_info_script(b"http://helloworld.org", b"k" * 32).lcs_serialize()
+    assert script_codec.encode_rotate_dual_attestation_info_script(b"http://helloworld.org", b"k" * 32) == expected
+
+
+def test_encode_raw_and_signed_transaction():
+    account = LocalAccount(Ed25519PrivateKey.from_private_bytes(b"\x01" * 32))
+    script = stdlib.encode_peer_to_peer_with_metadata_script(utils.currency_code("Coin1"), payee, 100, b"", b"")
+    txn = libra_types.RawTransaction(
+        sender=account.account_address,
+        sequence_number=12,
+        payload=libra_types.TransactionPayload__Script(script),
+        max_gas_amount=1_000_000,
+        gas_unit_price=0,
+        gas_currency_code="Coin1",
+        expiration_timestamp_secs=1_600_000_000,
+        chain_id=chain_ids.TESTNET,
+    )
+
+    raw_txn = script_codec.encode_raw_transaction(
+        account.account_address,
+        12,
+        script_codec.encode_peer_to_peer_with_metadata_script("Coin1", payee, 100),
+        1_000_000,
+        0,
+        "Coin1",
+        1_600_000_000,
+        chain_ids.TESTNET,
+    )
+    assert raw_txn == txn.lcs_serialize()
+    assert script_codec.raw_transaction_signing_msg(raw_txn) == utils.raw_transaction_signing_msg(txn)
+
+    signature = account.private_key.sign(script_codec.raw_transaction_signing_msg(raw_txn))
+    signed_txn = script_codec.encode_signed_transaction(raw_txn, account.public_key_bytes, signature)
+    assert signed_txn == account.sign(txn).lcs_serialize()
+    assert script_codec.signed_transaction_hash(signed_txn) == utils.transaction_hash(account.sign(txn))
+
+
+def test_encode_out_of_range_integers():
+    with pytest.raises(serde_types.SerializationError) as e:
+        script_codec.encode_peer_to_peer_with_metadata_script("Coin1", payee, -1)
+    assert e.value.args[1:] == (-1, serde_types.uint64)
+    with pytest.raises(serde_types.SerializationError):
+        script_codec.encode_create_child_vasp_account_script("LBR", payee, b"\xaa" * 16, True, 1 << 64)
+
+    script = script_codec.encode_peer_to_peer_with_metadata_script("Coin1", payee, 100)
+    args = [payee, 0, script, 1_000_000, 0, "Coin1", 1_600_000_000, chain_ids.TESTNET]
+    for index, value in [(1, -1), (3, 1 << 64), (4, -1), (6, -1), (7, 256)]:
+        invalid = list(args)
+        invalid[index] = value
+        with pytest.raises(serde_types.SerializationError) as e:
+            script_codec.encode_raw_transaction(*invalid)
+        assert e.value.args[1] == value
+
+
+def test_decode_script():
+    scripts = [
+        stdlib.encode_peer_to_peer_with_metadata_script(utils.currency_code("Coin1"), payee, 100, b"meta", b"sig"),
+        stdlib.encode_peer_to_peer_with_metadata_script(
+            libra_types.TypeTag__Vector(value=libra_types.TypeTag__U8()), payee, 100, b"", b""
+        ),
+        stdlib.encode_create_child_vasp_account_script(utils.currency_code("Coin9"), payee, b"\xaa" * 16, True, 10),
+        stdlib.encode_rotate_dual_attestation_info_script(b"http://helloworld.org", b"k" * 32),
+        stdlib.encode_tiered_mint_script(utils.currency_code("LBR"), 1, payee, 2**63, 3),
+        stdlib.encode_create_recovery_address_script(),
+    ]
+    for script in scripts:
+        expected = stdlib.decode_script(libra_types.Script.lcs_deserialize(script.lcs_serialize()))
+        assert script_codec.decode_script(script.lcs_serialize()) == expected
+        assert script_codec.decode_script(script.lcs_serialize().hex()) == expected
+
+
+def test_decode_script_errors():
+    script = stdlib.encode_peer_to_peer_with_metadata_script(utils.currency_code("Coin1"), payee, 100, b"", b"")
+    data = script.lcs_serialize()
+
+    with pytest.raises(ValueError, match="Unknown script bytecode"):
+        script_codec.decode_script(libra_types.Script(code=b"unknown", ty_args=[], args=[]).lcs_serialize())
+    with pytest.raises(serde_types.DeserializationError):
+        script_codec.decode_script(data[:-1])
+    with pytest.raises(serde_types.DeserializationError):
+        script_codec.decode_script(data + b"\x00")
+    with pytest.raises(ValueError):
+        script_codec.decode_script(b"")
+
+
+def make_transaction(version: int, script: libra_types.Script) -> jsonrpc.Transaction:
+    return jsonrpc.Transaction(
+        version=version,
+        transaction=jsonrpc.TransactionData(
+            type="user", sender="000000000000000000000000000000dd", script_bytes=script.lcs_serialize().hex()
+        ),
+    )
+
+
+def test_decode_scripts():
+    p2p = stdlib.encode_peer_to_peer_with_metadata_script(utils.currency_code("Coin1"), payee, 100, b"meta", b"")
+    rotate = stdlib.encode_rotate_dual_attestation_info_script(b"http://helloworld.org", b"k" * 32)
+    unknown = libra_types.Script(code=b"unknown", ty_args=[], args=[])
+    txns = [
+        make_transaction(1, p2p),
+        jsonrpc.Transaction(version=2, transaction=jsonrpc.TransactionData(type="blockmetadata")),
+        make_transaction(3, rotate),
+        make_transaction(4, unknown),
+        p2p.lcs_serialize().hex(),
+        rotate.lcs_serialize(),
+    ]
+    expected = [stdlib.decode_script(p2p), None, stdlib.decode_script(rotate), None]
+    expected += [stdlib.decode_script(p2p), stdlib.decode_script(rotate)]
+
+    assert list(script_codec.decode_scripts(txns)) == expected
+    assert list(script_codec.decode_scripts(iter(txns), batch_size=4)) == expected
+    with ThreadPoolExecutor(2) as executor:
+        assert list(script_codec.decode_scripts(txns, executor, batch_size=1)) == expected
+
+    with pytest.raises(TypeError):
+        list(script_codec.decode_scripts([False]))
+
+
+def test_peer_to_peer_table():
+    coin1, lbr = utils.currency_code("Coin1"), utils.currency_code("LBR")
+    txns = [
+        make_transaction(10, stdlib.encode_peer_to_peer_with_metadata_script(coin1, payee, 100, b"m", b"")),
+        make_transaction(11, stdlib.encode_rotate_dual_attestation_info_script(b"http://helloworld.org", b"k" * 32)),
+        make_transaction(12, stdlib.encode_peer_to_peer_with_metadata_script(lbr, payee, 200, b"", b"")),
+        make_transaction(
+            13, stdlib.encode_peer_to_peer_with_metadata_script(libra_types.TypeTag__U64(), payee, 1, b"", b"")
+        ),
+    ]
+    table = script_codec.peer_to_peer_table(txns, batch_size=2)
+    assert len(table) == 2
+    assert table.version == [10, 12]
+    assert table.sender == ["000000000000000000000000000000dd"] * 2
+    assert table.payee == [payee.to_hex()] * 2
+    assert table.amount == [100, 200]
+    assert table.currency == ["Coin1", "LBR"]
+    assert table.metadata == [b"m", b""]
@@ -0,0 +1,107 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from libra import jsonrpc, utils
+from concurrent.futures import ThreadPoolExecutor
+
+import asyncio
+import pytest
+
+
+sender = "f72589b71ff4f8d139674a3f7369c69b"
+
+
+class FakeClient:
+    def __init__(self, seq: int) -> None:
+        self.seq = seq
+        self.calls = 0
+
+    def get_account_sequence(self, address: str) -> int:
+        self.calls += 1
+        return self.seq
+
+
+def test_allocate_confirm_release():
+    client = FakeClient(5)
+    allocator = jsonrpc.SequenceNumberAllocator(client)
+
+    assert [allocator.allocate(sender) for _ in range(3)] == [5, 6, 7]
+    assert allocator.allocate(utils.account_address(sender)) == 8
+    assert client.calls == 1
+    assert allocator.pending(sender) == [5, 6, 7, 8]
+
+    allocator.confirm(sender, 5)
+    allocator.release(sender, 7)
+    allocator.release(sender, 6)
+    allocator.release(sender, 100)
+    assert allocator.pending(sender) == [8]
+    assert [allocator.allocate(sender) for _ in range(3)] == [6, 7, 9]
+    assert client.calls == 1
+
+
+def test_resync():
+    client = FakeClient(1)
+    allocator = jsonrpc.SequenceNumberAllocator(client)
+    assert [allocator.allocate(sender) for _ in range(3)] == [1, 2, 3]
+
+    client.seq = 2
+    assert allocator.handle_error(sender, jsonrpc.TransactionExpired()) is True
+    assert allocator.pending(sender) == []
+    assert allocator.allocate(sender) == 2
+    assert allocator.handle_error(sender, jsonrpc.JsonRpcError("VM Validation error: SEQUENCE_NUMBER_TOO_OLD"))
+    assert allocator.handle_error(sender, jsonrpc.JsonRpcError("other")) is False
+    assert allocator.handle_error(sender, jsonrpc.NetworkError("SEQUENCE_NUMBER_TOO_OLD")) is False
+    assert client.calls == 3
+
+
+def test_allocation_context():
+    client = FakeClient(0)
+    allocator = jsonrpc.SequenceNumberAllocator(client)
+
+    with allocator.allocation(sender) as seq:
+        assert seq == 0
+    with pytest.raises(ValueError):
+        with allocator.allocation(sender) as seq:
+            assert seq == 1
+            raise ValueError("sign failed")
+    assert allocator.pending(sender) == [0]
+
+    client.seq = 1
+    with pytest.raises(jsonrpc.JsonRpcError):
+        with allocator.allocation(sender) as seq:
+            assert seq == 1
+            raise jsonrpc.JsonRpcError("SEQUENCE_NUMBER_TOO_NEW")
+    assert allocator.pending(sender) == []
+    assert allocator.allocate(sender) == 1
+
+
+def test_allocate_concurrently():
+    client = FakeClient(10)
+    allocator = jsonrpc.SequenceNumberAllocator(client)
+    with ThreadPoolExecutor(8) as executor:
+        seqs = list(executor.map(lambda _: allocator.allocate(sender), range(1000)))
+    assert sorted(seqs) == list(range(10, 1010))
+    assert client.calls == 1
+
+    async def allocate_all():
+        return await asyncio.gather(*[allocator.allocate_async(sender) for _ in range(10)])
+
+    assert sorted(asyncio.run(allocate_all())) == list(range(1010, 1020))
+    assert asyncio.run(allocator.resync_async(sender)) == 10
+
+
+def test_allocate_async_waits_for_held_lock_in_executor():
+    allocator = jsonrpc.SequenceNumberAllocator(FakeClient(3))
+    assert allocator.allocate(sender) == 3
+    lock = allocator._account(sender).lock
+    lock.acquire()
+
+    async def release():
+        await asyncio.sleep(0.05)
+        lock.release()
+
+    async def allocate_while_locked():
+        seq, _ = await asyncio.gather(allocator.allocate_async(sender), release())
+        return seq
+
+    assert asyncio.run(allocate_while_locked()) == 4
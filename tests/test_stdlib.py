@@ -0,0 +1,60 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from libra import stdlib, utils, libra_types
+
+import os
+import subprocess
+import sys
+import pytest
+
+
+def test_script_modules_are_imported_on_first_use():
+    code = """
+import sys
+from libra import stdlib, utils
+stdlib.encode_peer_to_peer_with_metadata_script(utils.currency_code("Coin1"), utils.account_address(b"1" * 16), 1, b"", b"")
+print(",".join(sorted(m for m in sys.modules if m.startswith("libra.stdlib."))))
+"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run([sys.executable, "-c", code], env=env, stdout=subprocess.PIPE, check=True).stdout
+    assert output.decode().strip() == "libra.stdlib._peer_to_peer_with_metadata"
+
+
+def test_lazy_names():
+    assert stdlib.ScriptCall__Burn.__name__ == "ScriptCall__Burn"
+    assert issubclass(stdlib.ScriptCall__Burn, stdlib.ScriptCall)
+    assert (
+        stdlib.BURN_CODE
+        == stdlib.encode_burn_script(utils.currency_code("Coin1"), 1, utils.account_address(b"1" * 16)).code
+    )
+    assert "encode_tiered_mint_script" in dir(stdlib)
+    with pytest.raises(AttributeError):
+        stdlib.encode_unknown_script
+
+
+def test_script_maps():
+    assert len(stdlib.SCRIPT_ENCODER_MAP) == len(stdlib.SCRIPT_DECODER_MAP) == 34
+    for call, encoder in stdlib.SCRIPT_ENCODER_MAP.items():
+        assert issubclass(call, stdlib.ScriptCall)
+        assert encoder is getattr(stdlib, encoder.__name__)
+    for code, decoder in stdlib.SCRIPT_DECODER_MAP.items():
+        assert code in stdlib.SCRIPT_DECODER_MAP
+        assert decoder is getattr(stdlib, decoder.__name__)
+        tail = code[-stdlib.SCRIPT_FINGERPRINT_TAIL_SIZE :]
+        assert stdlib.find_script_code(len(code), tail) is code
+
+    assert stdlib.SCRIPT_DECODER_MAP.get(stdlib.BURN_CODE[:-1] + b"\x00") is None
+    assert stdlib.find_script_code(len(stdlib.BURN_CODE), b"") is None
+    with pytest.raises(KeyError):
+        stdlib.SCRIPT_ENCODER_MAP[stdlib.ScriptCall]
+
+
+def test_decode_script():
+    call = stdlib.ScriptCall__UpdateLibraVersion(sliding_nonce=1, major=2)
+    script = stdlib.encode_update_libra_version_script(1, 2)
+    assert script.code == stdlib.UPDATE_LIBRA_VERSION_CODE
+    assert stdlib.decode_script(script) == call
+
+    with pytest.raises(ValueError):
+        stdlib.decode_script(libra_types.Script(code=b"unknown", ty_args=[], args=[]))
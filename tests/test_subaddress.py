@@ -0,0 +1,78 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from libra import subaddress, txnmetadata, identifier, jsonrpc, utils, InvalidSubAddressError
+
+import pytest
+
+
+receiver = "f72589b71ff4f8d139674a3f7369c69b"
+
+
+def test_generate_and_lookup():
+    registry = subaddress.SubAddressRegistry(capacity=4)
+    user_ids = list(range(1, 1001))
+    sub_addresses = registry.generate(user_ids)
+
+    assert len(registry) == 1000
+    assert registry.capacity >= 2000
+    assert len(set(sub_addresses)) == 1000
+    assert all(len(s) == utils.SUB_ADDRESS_LEN and s != identifier.LIBRA_ZERO_SUBADDRESS for s in sub_addresses)
+    assert registry.lookup(sub_addresses) == user_ids
+    assert registry.lookup([s.hex() for s in sub_addresses[:3]]) == user_ids[:3]
+    assert registry.get(sub_addresses[10]) == 11
+
+    assert registry.lookup([None, identifier.LIBRA_ZERO_SUBADDRESS, b"\xff" * 8]) == [None, None, None]
+    assert registry.lookup([]) == []
+    with pytest.raises(InvalidSubAddressError):
+        registry.lookup([b"\x01"])
+
+
+def test_register():
+    registry = subaddress.SubAddressRegistry()
+    registry.register(["0000000000000001", b"\x00" * 7 + b"\x02"], [2 ** 64 - 1, 0])
+    assert registry.lookup(["0000000000000001", "0000000000000002"]) == [2 ** 64 - 1, 0]
+
+    with pytest.raises(subaddress.DuplicateSubAddressError):
+        registry.register(["0000000000000001"], [3])
+    with pytest.raises(subaddress.DuplicateSubAddressError):
+        registry.register(["0000000000000003", "0000000000000003"], [3, 4])
+    with pytest.raises(InvalidSubAddressError):
+        registry.register([identifier.LIBRA_ZERO_SUBADDRESS], [3])
+    with pytest.raises(ValueError):
+        registry.register(["0000000000000003"], [3, 4])
+    assert len(registry) == 2
+
+
+def test_memory_mapped_registry(tmp_path):
+    path = str(tmp_path / "subaddresses.bin")
+    registry = subaddress.SubAddressRegistry(capacity=8, path=path)
+    sub_addresses = registry.generate(range(100))
+    registry.flush()
+
+    reopened = subaddress.SubAddressRegistry(path=path)
+    assert len(reopened) == 100
+    assert reopened.capacity == registry.capacity
+    assert reopened.lookup(sub_addresses) == list(range(100))
+
+
+def make_event(type: str, metadata: bytes, receiver: str = receiver) -> jsonrpc.Event:
+    return jsonrpc.Event(data=jsonrpc.EventData(type=type, receiver=receiver, metadata=metadata.hex()))
+
+
+def test_resolve_events():
+    registry = subaddress.SubAddressRegistry()
+    sub1, sub2 = registry.generate([1, 2])
+
+    events = [
+        make_event("receivedpayment", txnmetadata.general_metadata(None, sub1)),
+        make_event("receivedpayment", txnmetadata.general_metadata(b"\x01" * 8, sub2, 5)),
+        make_event("sentpayment", txnmetadata.general_metadata(None, sub1)),
+        make_event("receivedpayment", txnmetadata.general_metadata(sub1, None)),
+        make_event("receivedpayment", txnmetadata.general_metadata(None, b"\x01" * 8)),
+        make_event("receivedpayment", txnmetadata.travel_rule("ref", utils.account_address(receiver), 10)[0]),
+        make_event("receivedpayment", b""),
+        make_event("receivedpayment", txnmetadata.general_metadata(None, sub1), "00" * 16),
+    ]
+    assert registry.resolve_events(events) == [1, 2, None, None, None, None, None, 1]
+    assert registry.resolve_events(events, utils.account_address(receiver)) == [1, 2] + [None] * 6
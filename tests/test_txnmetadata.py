@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
-from libra import utils, txnmetadata, jsonrpc, libra_types
+from concurrent.futures import ThreadPoolExecutor
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from libra import utils, txnmetadata, jsonrpc, libra_types, serde_types
 
 
 def test_travel_rule_metadata():
@@ -43,6 +45,53 @@ def test_new_general_metadata_from_to_sub_address():
     assert ret.hex() == "01000108111111153010a11101088f8b82153010a1bd00"
 
 
+def test_general_metadata_matches_lcs_serialize():
+    sub1, sub2 = utils.sub_address("8f8b82153010a1bd"), utils.sub_address("111111153010a111")
+    payments = [(sub1, None, None), (None, sub2, 5), (sub1, sub2, 2**64 - 1), (b"s" * 200, None, 0)]
+    for from_sub, to_sub, ref in payments:
+        expected = libra_types.Metadata__GeneralMetadata(
+            value=libra_types.GeneralMetadata__GeneralMetadataVersion0(
+                value=libra_types.GeneralMetadataV0(
+                    to_subaddress=to_sub,
+                    from_subaddress=from_sub,
+                    referenced_event=serde_types.uint64(ref) if ref else None,
+                )
+            )
+        ).lcs_serialize()
+        assert txnmetadata.general_metadata(from_sub, to_sub, ref) == expected
+
+    expected = [txnmetadata.general_metadata(*payment) for payment in payments + [(None, None, None)]]
+    assert txnmetadata.batch_general_metadata(payments + [(None, None, None)]) == expected
+
+
+def test_travel_rule_matches_lcs_serialize():
+    address = utils.account_address("f72589b71ff4f8d139674a3f7369c69b")
+    for reference_id, amount in [("", 0), ("ref", 2**64 - 1), ("\u00e9" * 100, 1)]:
+        metadata = libra_types.Metadata__TravelRuleMetadata(
+            value=libra_types.TravelRuleMetadata__TravelRuleMetadataVersion0(
+                value=libra_types.TravelRuleMetadataV0(off_chain_reference_id=reference_id)
+            )
+        )
+        attest = txnmetadata.Attest(metadata=metadata, sender_address=address, amount=serde_types.uint64(amount))
+        expected = (metadata.lcs_serialize(), attest.lcs_serialize() + b"@@$$LIBRA_ATTEST$$@@")
+        assert txnmetadata.travel_rule(reference_id, address, amount) == expected
+
+    payments = [("ref1", address, 1), ("ref2", address.to_hex(), 2), ("ref3", "00" * 16, 3)]
+    assert txnmetadata.batch_travel_rule(payments) == [txnmetadata.travel_rule(*p) for p in payments]
+
+
+def test_out_of_range_integers():
+    address = utils.account_address("f72589b71ff4f8d139674a3f7369c69b")
+    for amount in [-1, 2**64]:
+        with pytest.raises(serde_types.SerializationError) as e:
+            txnmetadata.travel_rule("ref", address, amount)
+        assert e.value.args[1:] == (amount, serde_types.uint64)
+        with pytest.raises(serde_types.SerializationError):
+            txnmetadata.batch_travel_rule([("ref", address, amount)])
+        with pytest.raises(serde_types.SerializationError):
+            txnmetadata.general_metadata(utils.sub_address("8f8b82153010a1bd"), None, amount)
+
+
 def test_find_refund_reference_event():
     # None for no transaction given
     assert txnmetadata.find_refund_reference_event(None, None) is None
@@ -63,6 +112,33 @@ def test_find_refund_reference_event():
     assert event.data.receiver == "f72589b71ff4f8d139674a3f7369c69b"
 
 
+def test_find_refund_reference_events():
+    receiver1 = utils.account_address("f72589b71ff4f8d139674a3f7369c69b")
+    receiver2 = "000000000000000000000000000000dd"
+
+    txn1 = jsonrpc.Transaction()
+    txn1.events.add(data=jsonrpc.EventData(type="sentpayment", receiver=receiver2))
+    txn1.events.add(data=jsonrpc.EventData(type="receivedpayment", receiver=receiver2, metadata="01"))
+    txn2 = jsonrpc.Transaction()
+    txn2.events.add(data=jsonrpc.EventData(type="receivedpayment", receiver="f72589b71ff4f8d139674a3f7369c69b"))
+    txn3 = jsonrpc.Transaction()
+    txn3.events.add(data=jsonrpc.EventData(type="receivedpayment", receiver="unknown"))
+
+    events = txnmetadata.find_refund_reference_events([txn1, None, txn2, txn3], [receiver1, receiver2])
+    assert events == [txn1.events[1], None, txn2.events[0], None]
+    assert txnmetadata.find_refund_reference_events([txn1, txn2], [receiver1]) == [
+        txnmetadata.find_refund_reference_event(txn, receiver1) for txn in [txn1, txn2]
+    ]
+    assert txnmetadata.find_refund_reference_events([txn1], []) == [None]
+
+    # the first event received by any of the receivers
+    txn4 = jsonrpc.Transaction()
+    txn4.events.add(data=jsonrpc.EventData(type="receivedpayment", receiver=receiver2))
+    txn4.events.add(data=jsonrpc.EventData(type="receivedpayment", receiver=receiver1.to_hex()))
+    for receivers in [[receiver1, receiver2], [receiver2, receiver1]]:
+        assert txnmetadata.find_refund_reference_events([txn4, txn2], receivers) == [txn4.events[0], txn2.events[0]]
+
+
 def test_refund_metadata_from_event():
     from_sub_address = "8f8b82153010a1bd"
     to_sub_address = "111111153010a111"
@@ -168,3 +244,89 @@ def test_event_metadata_is_none_or_empty():
         sequence_number=32,
     )
     assert txnmetadata.refund_metadata_from_event(event) == b""
+
+
+def test_decode_metadata():
+    address = utils.account_address("f72589b71ff4f8d139674a3f7369c69b")
+    sub = utils.sub_address("8f8b82153010a1bd")
+    samples = [
+        txnmetadata.general_metadata(sub, None),
+        txnmetadata.general_metadata(None, sub, 2**64 - 1),
+        txnmetadata.general_metadata(b"s" * 200, sub, 3),
+        txnmetadata.travel_rule("ref", address, 10)[0],
+        txnmetadata.travel_rule("r" * 300, address, 10)[0],
+        libra_types.Metadata__TravelRuleMetadata(
+            value=libra_types.TravelRuleMetadata__TravelRuleMetadataVersion0(
+                value=libra_types.TravelRuleMetadataV0(off_chain_reference_id=None)
+            )
+        ).lcs_serialize(),
+        libra_types.Metadata__UnstructuredBytesMetadata(
+            value=libra_types.UnstructuredBytesMetadata(metadata=b"hello")
+        ).lcs_serialize(),
+        libra_types.Metadata__UnstructuredBytesMetadata(
+            value=libra_types.UnstructuredBytesMetadata(metadata=None)
+        ).lcs_serialize(),
+        libra_types.Metadata__Undefined().lcs_serialize(),
+    ]
+    for data in samples:
+        expected = libra_types.Metadata.lcs_deserialize(data)
+        assert txnmetadata.decode_metadata(data) == expected
+        assert txnmetadata.decode_metadata(data.hex()) == expected
+
+    for invalid in [b"", b"\x01\x00\x01\x08\x00", b"\x01\x00\x00\x00\x00\x00", b"\x01\x00\x02\x00\x00", b"\x09"]:
+        with pytest.raises(ValueError):
+            txnmetadata.decode_metadata(invalid)
+
+
+def test_decode_events_metadata():
+    sub = utils.sub_address("8f8b82153010a1bd")
+    events = [
+        jsonrpc.Event(data=jsonrpc.EventData(metadata=txnmetadata.general_metadata(None, sub).hex())),
+        jsonrpc.Event(data=jsonrpc.EventData(metadata="")),
+        jsonrpc.Event(data=jsonrpc.EventData(metadata="0100")),
+        jsonrpc.Event(data=jsonrpc.EventData(metadata="zz")),
+    ]
+    metadata = txnmetadata.decode_events_metadata(events)
+    assert metadata[0].value.value.to_subaddress == sub
+    assert metadata[1:] == [None, None, None]
+
+
+def make_p2p_transaction(sender: str, receiver: str, amount: int, metadata: bytes, signature: bytes):
+    return jsonrpc.Transaction(
+        transaction=jsonrpc.TransactionData(
+            sender=sender,
+            script=jsonrpc.Script(
+                receiver=receiver, amount=amount, metadata=metadata.hex(), metadata_signature=signature.hex()
+            ),
+        )
+    )
+
+
+def test_verify_travel_rule_signatures():
+    compliance_key = Ed25519PrivateKey.generate()
+    public_key = utils.public_key_bytes(compliance_key.public_key())
+    sender, receiver, other = "f72589b71ff4f8d139674a3f7369c69b", "00" * 15 + "dd", "00" * 15 + "ee"
+
+    metadata, signing_msg = txnmetadata.travel_rule("ref", utils.account_address(sender), 1000)
+    signature = compliance_key.sign(signing_msg)
+    valid = make_p2p_transaction(sender, receiver, 1000, metadata, signature)
+    assert txnmetadata.travel_rule_signing_msg(valid) == signing_msg
+
+    txns = [
+        valid,
+        make_p2p_transaction(sender, receiver, 1001, metadata, signature),
+        make_p2p_transaction(sender, receiver, 10, txnmetadata.general_metadata(None, b"\x01" * 8), b""),
+        make_p2p_transaction(sender, other, 1000, metadata, signature),
+        make_p2p_transaction(sender, receiver, 1000, metadata, b"invalid"),
+        make_p2p_transaction("zz" * 16, receiver, 1000, metadata, signature),
+        make_p2p_transaction(sender[:-2], receiver, 1000, metadata, signature),
+    ]
+    expected = [True, False, None, None, False, False, False]
+    keys = {receiver: public_key}
+    assert txnmetadata.verify_travel_rule_signatures(txns, keys) == expected
+    hex_keys = {utils.account_address(receiver): public_key.hex()}
+    assert txnmetadata.verify_travel_rule_signatures(txns, hex_keys) == expected
+    with ThreadPoolExecutor(2) as executor:
+        assert txnmetadata.verify_travel_rule_signatures(txns * 3, keys, executor, batch_size=2) == expected * 3
+
+    assert txnmetadata.verify_travel_rule_signatures(txns[:1], {receiver: b"\x00" * 31}) == [False]
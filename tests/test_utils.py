@@ -52,6 +52,39 @@ def test_currency_code():
         utils.type_tag_to_str(False)
 
 
+def test_currency_code_is_interned():
+    ccode = utils.currency_code("Coin1")
+    assert utils.currency_code("Coin1") is ccode
+    assert ccode == libra_types.TypeTag.from_currency_code("Coin1")
+
+    new_code = utils.currency_code("Coin9")
+    assert utils.currency_code("Coin9") is new_code
+    assert utils.type_tag_to_str(new_code) == "Coin9"
+
+    assert utils._CURRENCY_CODES_BY_TAG_ID[id(ccode)] == "Coin1"
+    assert utils.type_tag_to_str(libra_types.TypeTag.from_currency_code("Coin1")) == "Coin1"
+
+
+def test_currency_code_lcs():
+    for code in ["Coin1", "LBR", "Coin8"]:
+        lcs_bytes = utils.currency_code_lcs(code)
+        assert lcs_bytes == libra_types.TypeTag.from_currency_code(code).lcs_serialize()
+
+    assert utils.currency_code_from_lcs(utils.currency_code_lcs("LBR")) == "LBR"
+    assert utils.currency_code_from_lcs(utils.currency_code_lcs("Coin8")) is None
+    assert utils.currency_code_from_lcs(b"unknown") is None
+    assert utils.register_currency_code("Coin1") is utils.currency_code("Coin1")
+    assert utils.register_currency_code("Coin8") is utils.currency_code("Coin8")
+    assert utils.currency_code_from_lcs(utils.currency_code_lcs("Coin8")) == "Coin8"
+
+
+def test_unregistered_currency_codes_are_bounded():
+    for i in range(utils.MAX_CACHED_CURRENCY_CODES * 2):
+        assert utils.type_tag_to_str(utils.currency_code(f"X{i}")) == f"X{i}"
+    assert "X0" not in utils._CURRENCY_TYPE_TAGS
+    assert utils._unregistered_currency_code.cache_info().currsize <= utils.MAX_CACHED_CURRENCY_CODES
+
+
 def test_decode_transaction_script():
     script_bytes = "e101a11ceb0b010000000701000202020403061004160205181d0735610896011000000001010000020001000003020301010004010300010501060c0108000506080005030a020a020005060c05030a020a020109000c4c696272614163636f756e741257697468647261774361706162696c6974791b657874726163745f77697468647261775f6361706162696c697479087061795f66726f6d1b726573746f72655f77697468647261775f6361706162696c69747900000000000000000000000000000001010104010c0b0011000c050e050a010a020b030b0438000b05110202010700000000000000000000000000000001034c4252034c42520004031f4ed0531ff357402ac222b01f7c67860140420f000000000004000400"
 
@@ -0,0 +1,272 @@
+# Copyright (c) The Libra Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Split generated `libra.stdlib` module into one private module per script
+
+The transaction builder generator writes all Move stdlib scripts (`ScriptCall__*` class, `encode_*_script`,
+`decode_*_script` and `*_CODE` bytecode) into `stdlib/__init__.py`. This tool moves each script into
+`stdlib/_<script name>.py` and rewrites `stdlib/__init__.py` to import script modules on first use.
+
+Run: `python tools/split_stdlib.py src/libra/stdlib` after generating code (see `make libratypes`).
+"""
+
+import ast
+import glob
+import os
+import sys
+import typing
+
+FINGERPRINT_TAIL_SIZE = 16
+
+HEADER = """# pyre-strict
+"""
+
+FACADE_DOC = '''"""Move stdlib transaction script builders and decoders (generated code).
+
+Each script's `ScriptCall__*` class, `encode_*_script` and `decode_*_script` functions and `*_CODE` bytecode
+are defined in a private sub-module, which is imported on first access of any of these names, or on first
+lookup of the script in `SCRIPT_ENCODER_MAP` / `SCRIPT_DECODER_MAP`. Iterating the maps imports all scripts.
+"""
+'''
+
+FACADE_LAZY_LOADING = '''
+# script module name => ScriptCall class name
+_SCRIPTS: typing.Dict[str, str] = {
+%(scripts)s
+}
+
+# script code fingerprint: (code length, last SCRIPT_FINGERPRINT_TAIL_SIZE bytes of code) => script module name
+SCRIPT_FINGERPRINT_TAIL_SIZE: int = %(tail_size)d
+_SCRIPT_FINGERPRINTS: typing.Dict[typing.Tuple[int, bytes], str] = {
+%(fingerprints)s
+}
+
+# exported name => script module name
+_SCRIPT_NAMES: typing.Dict[str, str] = {
+    name: script
+    for script, call in _SCRIPTS.items()
+    for name in (call, f"encode_{script}_script", f"decode_{script}_script", f"{script.upper()}_CODE")
+}
+_CALL_SCRIPTS: typing.Dict[str, str] = {call: script for script, call in _SCRIPTS.items()}
+
+
+def _load_script(script: str) -> typing.Tuple[typing.Type[ScriptCall], typing.Callable, typing.Callable, bytes]:
+    """import script module, returns (ScriptCall class, encoder, decoder, code)"""
+
+    module = importlib.import_module(f"._{script}", __name__)
+    names = (_SCRIPTS[script], f"encode_{script}_script", f"decode_{script}_script", f"{script.upper()}_CODE")
+    values = tuple(getattr(module, name) for name in names)
+    globals().update(zip(names, values))
+    return values  # pyre-ignore
+
+
+def __getattr__(name: str) -> typing.Any:  # pyre-ignore
+    script = _SCRIPT_NAMES.get(name)
+    if script is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _load_script(script)
+    return globals()[name]
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(_SCRIPT_NAMES))
+
+
+def find_script_code(code_len: int, code_tail: bytes) -> typing.Optional[bytes]:
+    """Find known script code by fingerprint: code length and last `SCRIPT_FINGERPRINT_TAIL_SIZE` bytes of code.
+
+    Only the found script module is imported.
+    """
+
+    script = _SCRIPT_FINGERPRINTS.get((code_len, code_tail))
+    if script is None:
+        return None
+    return _load_script(script)[3]
+
+
+K = typing.TypeVar("K")
+V = typing.TypeVar("V")
+
+
+class _ScriptMap(typing.Mapping[K, V]):
+    """Read-only mapping imports the script module of a key on lookup."""
+
+    def __init__(
+        self, find_script: typing.Callable[[K], typing.Optional[str]], key: int, value: int
+    ) -> None:
+        self._find_script = find_script
+        self._key = key
+        self._value = value
+
+    def __getitem__(self, key: K) -> V:
+        script = self._find_script(key)
+        if script is not None:
+            values = _load_script(script)
+            if values[self._key] == key:
+                return values[self._value]
+        raise KeyError(key)
+
+    def __iter__(self) -> typing.Iterator[K]:
+        return (_load_script(script)[self._key] for script in _SCRIPTS)
+
+    def __len__(self) -> int:
+        return len(_SCRIPTS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+def _find_call_script(call: typing.Type[ScriptCall]) -> typing.Optional[str]:
+    return _CALL_SCRIPTS.get(getattr(call, "__name__", None))  # pyre-ignore
+
+
+def _find_code_script(code: bytes) -> typing.Optional[str]:
+    return _SCRIPT_FINGERPRINTS.get((len(code), code[-SCRIPT_FINGERPRINT_TAIL_SIZE:]))
+
+
+'''
+
+FACADE_MAPS = """
+SCRIPT_ENCODER_MAP: typing.Mapping[typing.Type[ScriptCall], typing.Callable[[ScriptCall], Script]] = _ScriptMap(
+    _find_call_script, 0, 1
+)
+
+
+SCRIPT_DECODER_MAP: typing.Mapping[bytes, typing.Callable[[Script], ScriptCall]] = _ScriptMap(_find_code_script, 3, 2)
+
+"""
+
+
+class Script(typing.NamedTuple):
+    name: str
+    call: ast.ClassDef
+    encoder: ast.FunctionDef
+    decoder: ast.FunctionDef
+    code: ast.Assign
+
+
+def camel_case(name: str) -> str:
+    return "".join(part.capitalize() for part in name.split("_"))
+
+
+def segment(source: str, node: ast.AST) -> str:
+    lines = source.splitlines(keepends=True)
+    start = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+    return "".join(lines[start - 1 : node.end_lineno])
+
+
+def used_names(nodes: typing.Iterable[ast.AST]) -> typing.Set[str]:
+    return {n.id for node in nodes for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def import_names(tree: ast.Module, module: str) -> typing.List[str]:
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module == module:
+            return [alias.name for alias in node.names]
+    raise ValueError(f"import from {module} not found")
+
+
+def split(source: str) -> typing.Dict[str, str]:
+    tree = ast.parse(source)
+    nodes = {}
+    for node in tree.body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+            nodes[node.name] = node
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            target = node.targets[0] if isinstance(node, ast.Assign) else node.target
+            nodes[target.id] = node  # pyre-ignore
+
+    scripts = []
+    for name in list(nodes):
+        if name.startswith("encode_") and name.endswith("_script") and name != "encode_script":
+            script = name[len("encode_") : -len("_script")]
+            scripts.append(
+                Script(
+                    script,
+                    nodes.pop(f"ScriptCall__{camel_case(script)}"),
+                    nodes[name],
+                    nodes.pop(f"decode_{script}_script"),
+                    nodes.pop(f"{script.upper()}_CODE"),
+                )
+            )
+    if not scripts:
+        raise ValueError("no script found, module is already split?")
+    for script in scripts:
+        del nodes[script.encoder.name]
+
+    libra_types_names = import_names(tree, "libra.libra_types")
+    stdlib_names = [name for name in nodes if name not in ("SCRIPT_ENCODER_MAP", "SCRIPT_DECODER_MAP")]
+
+    modules = {}
+    fingerprints = {}
+    for script in scripts:
+        defs = [script.call, script.encoder, script.decoder, script.code]
+        names = used_names(defs)
+        imports = []
+        if "dataclass" in names:
+            imports.append("from dataclasses import dataclass")
+        if "typing" in names:
+            imports.append("import typing")
+        if "st" in names:
+            imports.append("from libra import serde_types as st")
+        if "libra_types" in names:
+            imports.append("from libra import libra_types")
+        types = [name for name in libra_types_names if name in names]
+        if types:
+            imports.append(f"from libra.libra_types import {', '.join(types)}")
+        helpers = [name for name in stdlib_names if name in names]
+        if helpers:
+            imports.append(f"from libra.stdlib import {', '.join(helpers)}")
+        body = "\n\n".join(segment(source, node) for node in defs)
+        modules[f"_{script.name}.py"] = HEADER + "\n".join(imports) + "\n\n\n" + body
+
+        code = ast.literal_eval(script.code.value)
+        key = (len(code), code[-FINGERPRINT_TAIL_SIZE:])
+        if key in fingerprints:
+            raise ValueError(f"duplicated script code fingerprint: {script.name}, {fingerprints[key]}")
+        fingerprints[key] = script.name
+
+    type_checking_imports = "".join(
+        f"    from ._{s.name} import {s.call.name}, {s.encoder.name}, {s.decoder.name}, {s.code.targets[0].id}\n"
+        for s in scripts
+    )
+    lazy_loading = FACADE_LAZY_LOADING % {
+        "scripts": "\n".join(f'    "{s.name}": "{s.call.name}",' for s in scripts),
+        "tail_size": FINGERPRINT_TAIL_SIZE,
+        "fingerprints": "\n".join(f"    {key!r}: {name!r}," for key, name in fingerprints.items()),
+    }
+
+    facade = [HEADER, FACADE_DOC, "import importlib\n"]
+    for node in tree.body:
+        name = getattr(node, "name", None)
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            module = getattr(node, "module", None)
+            if module != "dataclasses":
+                facade.append(segment(source, node))
+            if module == "libra.libra_types":
+                facade.append("\nif typing.TYPE_CHECKING:\n" + type_checking_imports + "\n")
+        elif name == "ScriptCall":
+            facade.append("\n\n" + segment(source, node) + lazy_loading)
+        elif name in stdlib_names:
+            facade.append("\n\n" + segment(source, node))
+        elif node is nodes.get("SCRIPT_ENCODER_MAP"):
+            facade.append("\n\n# pyre-ignore" + FACADE_MAPS)
+    modules["__init__.py"] = "".join(facade)
+    return modules
+
+
+def main(path: str) -> None:
+    init_file = os.path.join(path, "__init__.py")
+    with open(init_file) as f:
+        modules = split(f.read())
+
+    for old in glob.glob(os.path.join(path, "_*.py")):
+        if os.path.basename(old) != "__init__.py":
+            os.remove(old)
+    for name, source in modules.items():
+        with open(os.path.join(path, name), "w") as f:
+            f.write(source)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])